@@ -0,0 +1,58 @@
+"""Add daily_performance_rollups table for analytics aggregation
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+Per-user-per-day rollup of closed trades and equity points so the analytics
+endpoints no longer load every Trade/Equity row of a user. Populate existing
+history after upgrading with:
+
+    python -m src.services.performance_rollup --backfill
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_performance_rollups',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('trade_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('winning_trades', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('losing_trades', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('gross_profit', sa.Numeric(20, 8), nullable=False, server_default='0'),
+        sa.Column('gross_loss', sa.Numeric(20, 8), nullable=False, server_default='0'),
+        sa.Column('best_trade_id', sa.Integer(), nullable=True),
+        sa.Column('best_pnl', sa.Numeric(18, 8), nullable=True),
+        sa.Column('worst_trade_id', sa.Integer(), nullable=True),
+        sa.Column('worst_pnl', sa.Numeric(18, 8), nullable=True),
+        sa.Column('return_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('return_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('return_sq_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('open_equity', sa.Numeric(18, 8), nullable=True),
+        sa.Column('high_equity', sa.Numeric(18, 8), nullable=True),
+        sa.Column('low_equity', sa.Numeric(18, 8), nullable=True),
+        sa.Column('closing_equity', sa.Numeric(18, 8), nullable=True),
+        sa.Column('intraday_max_drawdown', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint('user_id', 'day', name='uq_daily_rollup_user_day'),
+    )
+
+    op.create_index('idx_daily_rollup_user_day', 'daily_performance_rollups', ['user_id', 'day'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_daily_rollup_user_day', table_name='daily_performance_rollups')
+    op.drop_table('daily_performance_rollups')
@@ -0,0 +1,47 @@
+"""Partition bot_logs, trading_signals and equities by month
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+PostgreSQL only: rebuilds the three high-volume time-series tables as
+RANGE-partitioned tables (one partition per month plus a DEFAULT partition).
+Data, indexes, foreign keys and id sequences are preserved; the primary key
+becomes (id, <time column>) because PostgreSQL requires the partition key in
+every unique constraint.
+
+Other dialects (SQLite tests/local) keep plain tables; retention is then done
+with range DELETEs by src/services/retention_service.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.partitioning import (
+    PARTITIONED_TABLES,
+    convert_to_partitioned,
+    convert_to_plain,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    for spec in PARTITIONED_TABLES.values():
+        convert_to_partitioned(bind, spec)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    for spec in PARTITIONED_TABLES.values():
+        convert_to_plain(bind, spec)
@@ -4,6 +4,8 @@ Binance 과거 캔들 데이터 다운로드 스크립트
 
 바이낸스 Futures API를 사용하여 백테스트용 과거 캔들 데이터를 수집합니다.
 
+수년치 1m 등 대량 수집은 scripts/download_history.py (병렬, 재시작 가능, 컬럼형 저장소) 사용을 권장합니다.
+
 사용법:
     # BTC, ETH만 다운로드 (권장, 테스트용)
     python3 download_binance_data.py --btc-eth
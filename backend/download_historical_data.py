@@ -3,6 +3,8 @@
 메이저 코인 과거 캔들 데이터 다운로드 스크립트 (안정화 버전)
 
 각 코인별 실제 상장일을 고려하여 다운로드합니다.
+
+수년치 1m 등 대량 수집은 scripts/download_history.py (병렬, 재시작 가능, 컬럼형 저장소) 사용을 권장합니다.
 """
 
 import asyncio
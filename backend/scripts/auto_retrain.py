@@ -3,12 +3,14 @@
 ML Model Auto-Retraining Script
 
 매일 새로운 데이터로 모델을 재학습하고 성능을 모니터링합니다.
-성능이 기준치 이하로 떨어지면 알림을 보냅니다.
+교차 검증(워크포워드/Purged K-Fold) 폴드 평균 지표가 기준치를 만족할 때만 배포하고,
+기준치 이하면 알림을 보냅니다.
 
 Usage:
     python scripts/auto_retrain.py                    # 기본 재학습
     python scripts/auto_retrain.py --validate-only    # 검증만 (학습 안함)
-    python scripts/auto_retrain.py --force            # 성능 상관없이 강제 학습
+    python scripts/auto_retrain.py --force            # 성능 상관없이 강제 학습/배포
+    python scripts/auto_retrain.py --cv-method purged_kfold --cv-folds 5
 
 Cron 설정 예시 (매일 오전 6시):
     0 6 * * * cd /root/auto-dashboard/backend && python3 scripts/auto_retrain.py >> logs/retrain.log 2>&1
@@ -21,13 +23,16 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import json
 
 # 프로젝트 경로 추가
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+if TYPE_CHECKING:
+    from src.ml.training.train_all_models import ModelTrainer
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -72,10 +77,20 @@ def save_training_state(state: Dict):
         json.dump(state, f, indent=2, default=str)
 
 
-async def collect_training_data(symbol: str = "ETHUSDT", days: int = 60) -> Tuple[list, list]:
-    """학습 데이터 수집 (공개 API 사용)"""
+async def collect_training_data(
+    symbol: str = "ETHUSDT",
+    days: int = 60,
+    since: Optional[datetime] = None,
+) -> Tuple[list, list]:
+    """
+    학습 데이터 수집 (공개 API 사용)
+
+    since가 주어지면 그 시각 이후 캔들까지만 거슬러 올라갑니다 (피처 캐시 증분 갱신).
+    """
     import aiohttp
 
+    since_ms = int(since.timestamp() * 1000) if since is not None else None
+
     async def fetch_candles(granularity: str, limit: int) -> list:
         url = "https://api.bitget.com/api/v2/mix/market/candles"
         all_candles = []
@@ -114,13 +129,18 @@ async def collect_training_data(symbol: str = "ETHUSDT", days: int = 60) -> Tupl
                         })
 
                     end_time = int(candles[-1][0]) - 1
+                    if since_ms is not None and end_time <= since_ms:
+                        break
                     await asyncio.sleep(0.2)  # Rate limiting
 
         # 시간순 정렬
         all_candles.sort(key=lambda x: x["timestamp"])
         return all_candles
 
-    logger.info(f"Collecting {days} days of {symbol} data...")
+    if since is not None:
+        logger.info(f"Collecting {symbol} data since {since}...")
+    else:
+        logger.info(f"Collecting {days} days of {symbol} data...")
 
     candles_5m = await fetch_candles("5m", 1000)
     candles_1h = await fetch_candles("1H", 1000)
@@ -129,42 +149,73 @@ async def collect_training_data(symbol: str = "ETHUSDT", days: int = 60) -> Tupl
     return candles_5m, candles_1h
 
 
-def train_models(candles_5m: list, candles_1h: list) -> Dict:
-    """모델 학습 실행"""
-    import pandas as pd
-    from src.ml.features import FeaturePipeline
-    from src.ml.training.labeler import DataLabeler
+def train_models(
+    candles_5m: list,
+    candles_1h: list,
+    symbol: str = "ETHUSDT",
+    days: int = 60,
+    cv_method: str = "walk_forward",
+    cv_folds: int = 5,
+) -> Tuple[Dict, "ModelTrainer"]:
+    """
+    모델 학습 실행 (배포는 호출 측에서 성능 확인 후 save_all)
+
+    새 캔들은 피처 캐시에 이어 붙이고, 최근 days일 구간의 학습 행렬로
+    교차 검증(폴드별 지표 + 하이퍼파라미터 선택, 선택에 쓰지 않은 마지막 구간 홀드아웃 평가) 후
+    최종 모델을 학습합니다.
+
+    Returns:
+        (학습 결과 - results['cross_validation']에 폴드별 리포트, 학습된 ModelTrainer)
+    """
+    from src.ml.training.feature_cache import (
+        FeatureMatrixCache,
+        candles_to_frame,
+        training_feature_columns,
+    )
+    from src.ml.training.labeler import Labeler
     from src.ml.training.train_all_models import ModelTrainer
+    from src.ml.validation import CrossValidator
 
-    logger.info("Extracting features...")
-    pipeline = FeaturePipeline()
-    features_df = pipeline.extract_features(candles_5m, candles_1h)
+    logger.info("Updating feature cache...")
+    cache = FeatureMatrixCache()
+    added = cache.update(symbol, "5m", candles_to_frame(candles_5m), candles_to_frame(candles_1h))
+    end = cache.last_timestamp(symbol, "5m")
+    if end is None:
+        raise ValueError("Feature extraction failed: no cached features")
+    logger.info(f"Feature cache: +{added} rows, up to {end}")
 
-    if len(features_df) < 500:
-        raise ValueError(f"Insufficient data: {len(features_df)} rows (need at least 500)")
+    logger.info("Building training matrix...")
+    labeler = Labeler()
+    labeled_df = cache.training_matrix(symbol, "5m", labeler, start=end - timedelta(days=days))
 
-    logger.info("Generating labels...")
-    labeler = DataLabeler()
-    labeled_df = labeler.generate_labels(features_df)
+    if len(labeled_df) < 500:
+        raise ValueError(f"Insufficient data: {len(labeled_df)} rows (need at least 500)")
 
-    # NaN 제거
-    feature_cols = [c for c in labeled_df.columns if not c.startswith('label_')]
+    feature_cols = training_feature_columns(labeled_df)
     labeled_df = labeled_df.dropna(subset=feature_cols)
 
-    logger.info(f"Training with {len(labeled_df)} samples, {len(feature_cols)} features...")
+    logger.info(f"Cross-validating with {len(labeled_df)} samples, {len(feature_cols)} features...")
+    lookahead = labeler.lookahead_candles
+    report = CrossValidator(
+        method=cv_method, n_folds=cv_folds, purge=lookahead, embargo=lookahead
+    ).run(labeled_df, feature_cols)
 
+    logger.info("Training final models...")
     trainer = ModelTrainer()
     results = trainer.train_all(
         labeled_df,
         feature_cols,
         test_size=0.2,
         num_boost_round=500,
-        early_stopping_rounds=50
+        early_stopping_rounds=50,
+        model_params=report.best_params(),
     )
+    if not results:
+        raise RuntimeError("Training produced no models")
 
-    trainer.save_all()
-
-    return results
+    results['samples'] = len(labeled_df)
+    results['cross_validation'] = report.to_dict()
+    return results, trainer
 
 
 def validate_models() -> Dict:
@@ -202,7 +253,13 @@ def validate_models() -> Dict:
 
 
 def check_performance(results: Dict) -> Tuple[bool, str]:
-    """학습 결과가 기준치를 만족하는지 확인"""
+    """
+    학습 결과가 기준치를 만족하는지 확인
+
+    교차 검증 리포트가 있으면 홀드아웃 지표(후보 선택에 쓰지 않은 구간)로,
+    없으면 단일 검증 분할 지표로 판단합니다.
+    """
+    results = results.get('cross_validation', {}).get('metrics') or results
     issues = []
 
     if 'direction' in results:
@@ -253,6 +310,9 @@ def main():
     parser.add_argument('--force', action='store_true', help='Force retrain regardless of performance')
     parser.add_argument('--days', type=int, default=60, help='Days of training data')
     parser.add_argument('--symbol', type=str, default='ETHUSDT', help='Symbol to train on')
+    parser.add_argument('--cv-method', choices=['walk_forward', 'purged_kfold'], default='walk_forward',
+                        help='Cross validation method used to gate deployment')
+    parser.add_argument('--cv-folds', type=int, default=5, help='Number of cross validation folds')
     args = parser.parse_args()
 
     logger.info("=" * 50)
@@ -277,34 +337,47 @@ def main():
             return
 
     try:
-        # 1. 데이터 수집
+        # 1. 데이터 수집 (피처 캐시 이후 캔들만)
+        from src.ml.training.feature_cache import FeatureMatrixCache
+
+        since = FeatureMatrixCache().last_timestamp(args.symbol, "5m")
         candles_5m, candles_1h = asyncio.run(
-            collect_training_data(symbol=args.symbol, days=args.days)
+            collect_training_data(symbol=args.symbol, days=args.days, since=since)
         )
 
-        if len(candles_5m) < 1000:
+        if since is None and len(candles_5m) < 1000:
             raise ValueError(f"Insufficient 5m candles: {len(candles_5m)}")
 
         # 2. 모델 학습
         logger.info("Training models...")
-        results = train_models(candles_5m, candles_1h)
+        results, trainer = train_models(
+            candles_5m, candles_1h, symbol=args.symbol, days=args.days,
+            cv_method=args.cv_method, cv_folds=args.cv_folds,
+        )
 
-        # 3. 성능 검증
+        # 3. 성능 검증 (홀드아웃 지표) -> 통과 시에만 배포
         passed, message = check_performance(results)
+        cv_metrics = results['cross_validation']['metrics']
+
+        if passed or args.force:
+            # 실행 중인 서비스의 ModelRegistry가 매니페스트 변경을 감지해 핫스왑
+            results['model_version'] = trainer.save_all()
+            logger.info(f"Published model version {results['model_version']}")
 
         if passed:
-            logger.info(f"✅ Training successful!\n{json.dumps(results, indent=2, default=str)}")
+            logger.info(f"✅ Training successful!\n{json.dumps(cv_metrics, indent=2, default=str)}")
             send_notification(
                 "ML Training Complete",
                 f"Symbol: {args.symbol}\n"
-                f"Samples: {len(candles_5m)}\n"
-                f"Direction Acc: {results.get('direction', {}).get('accuracy', 0):.1%}\n"
-                f"Volatility Acc: {results.get('volatility', {}).get('accuracy', 0):.1%}"
+                f"Samples: {results.get('samples', 0)}\n"
+                f"Direction Acc (holdout): {cv_metrics.get('direction', {}).get('accuracy', 0):.1%}\n"
+                f"Volatility Acc (holdout): {cv_metrics.get('volatility', {}).get('accuracy', 0):.1%}"
             )
             state['consecutive_failures'] = 0
         else:
-            logger.warning(f"⚠️ Performance below threshold:\n{message}")
-            send_notification("ML Training Warning", message, is_error=True)
+            deployed = "deployed (--force)" if args.force else "not deployed"
+            logger.warning(f"⚠️ Performance below threshold, {deployed}:\n{message}")
+            send_notification("ML Training Warning", f"{message}\nModels {deployed}", is_error=True)
             state['consecutive_failures'] = state.get('consecutive_failures', 0) + 1
 
         # 상태 업데이트
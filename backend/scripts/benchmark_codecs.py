@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+페이로드 코덱 벤치마크
+
+Redis에 실제로 저장되는 형태의 객체로 직렬화 비용과 크기를 비교합니다.
+
+- legacy:  기존 방식 (json.dumps(cls=DecimalEncoder) / json.loads)
+- json:    utils.codec JSON 코덱 (orjson 설치 시 orjson)
+- msgpack: utils.codec msgpack 코덱 (msgpack 설치 시에만)
+
+페이로드:
+- dashboard_snapshot: snapshot_worker._build_snapshot 결과
+- market_regime:      MarketRegime.to_dict() (agent:market_regime:current:*)
+- positions:          Decimal 필드가 섞인 포지션 목록 응답 (100개)
+- ai_response:        응답 캐시에 들어가는 AI 분석 결과
+
+사용법:
+    python scripts/benchmark_codecs.py
+    python scripts/benchmark_codecs.py --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.market_regime.models import MarketRegime, RegimeType  # noqa: E402
+from src.services.snapshot_worker import (  # noqa: E402
+    UserSnapshotState,
+    _build_snapshot,
+    calculate_period_profits,
+    calculate_trade_stats,
+)
+from src.utils import codec  # noqa: E402
+from src.utils.cache_manager import DecimalEncoder  # noqa: E402
+
+
+class _Trade:
+    """calculate_trade_stats가 읽는 필드만 가진 거래"""
+
+    def __init__(self, pnl: Decimal, created_at: datetime):
+        self.pnl = pnl
+        self.exit_price = Decimal("1")
+        self.created_at = created_at
+
+
+def build_payloads() -> dict:
+    now = datetime.utcnow()
+    trades = [
+        _Trade(Decimal(f"{(i % 17) - 8}.{i % 100:02d}"), now - timedelta(hours=i))
+        for i in range(500)
+    ]
+    state = UserSnapshotState(
+        stats=calculate_trade_stats(trades),
+        profits=calculate_period_profits(trades),
+    )
+    snapshot = _build_snapshot(
+        42, state,
+        {"total": 5, "running": 3, "stopped": 2},
+        {"total": 4, "totalPnl": 123.45},
+    )
+
+    regime = MarketRegime(
+        symbol="BTCUSDT", regime_type=RegimeType.TRENDING_UP, confidence=0.82,
+        volatility=0.031, trend_strength=41.7, support_level=61250.5,
+        resistance_level=64880.0,
+    ).to_dict()
+
+    positions = {
+        "positions": [
+            {
+                "symbol": f"COIN{i}USDT",
+                "side": "long" if i % 2 else "short",
+                "size": Decimal(f"{i}.125"),
+                "entry_price": Decimal(f"{1000 + i}.5"),
+                "mark_price": Decimal(f"{1003 + i}.25"),
+                "unrealized_pnl": Decimal(f"{i % 7 - 3}.75"),
+                "leverage": 10,
+                "opened_at": now - timedelta(minutes=i),
+            }
+            for i in range(100)
+        ],
+        "updatedAt": now,
+    }
+
+    ai_response = {
+        "response": {
+            "regime": "trending_up",
+            "confidence": 0.77,
+            "reason": "상승 추세 지속, 거래량 증가. " * 20,
+            "levels": [61000.0 + 125.5 * i for i in range(50)],
+        },
+        "model": "deepseek-v3",
+        "cached_at": now.isoformat(),
+    }
+
+    return {
+        "dashboard_snapshot": snapshot,
+        "market_regime": regime,
+        "positions": positions,
+        "ai_response": ai_response,
+    }
+
+
+def _legacy_encode(obj) -> bytes:
+    return json.dumps(obj, cls=DecimalEncoder).encode()
+
+
+def _legacy_decode(data):
+    return json.loads(data)
+
+
+def _codecs() -> dict:
+    codecs = {
+        "legacy": (_legacy_encode, _legacy_decode),
+        "json": (lambda obj: codec.encode(obj, codec="json"), codec.decode),
+    }
+    if codec.MSGPACK_AVAILABLE:
+        codecs["msgpack"] = (
+            lambda obj: codec.encode(obj, binary_safe=True, codec="msgpack"),
+            codec.decode,
+        )
+    return codecs
+
+
+def _time_per_call(fn, arg, iterations: int) -> float:
+    """1회 호출 평균 (µs)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def run(iterations: int):
+    payloads = build_payloads()
+    codecs = _codecs()
+
+    info = codec.codec_info()
+    print(f"JSON backend: {info['json_backend']}, msgpack: {info['msgpack_available']}")
+    print(f"{'payload':<20} {'codec':<8} {'size(B)':>9} {'enc(µs)':>9} {'dec(µs)':>9} {'speedup':>8}")
+    print("-" * 68)
+
+    for name, obj in payloads.items():
+        baseline = None
+        for codec_name, (enc, dec) in codecs.items():
+            data = enc(obj)
+            enc_us = _time_per_call(enc, obj, iterations)
+            dec_us = _time_per_call(dec, data, iterations)
+            total = enc_us + dec_us
+            if baseline is None:
+                baseline = total
+            print(
+                f"{name:<20} {codec_name:<8} {len(data):>9} {enc_us:>9.2f} {dec_us:>9.2f} "
+                f"{baseline / total:>7.1f}x"
+            )
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Payload codec benchmark")
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
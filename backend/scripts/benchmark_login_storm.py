@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+로그인 폭주 벤치마크
+
+동시 로그인(bcrypt 검증) 폭주 중에 이벤트 루프 지연을 측정합니다.
+봇 루프처럼 주기적으로 깨어나는 틱 태스크의 지연이 곧 거래 루프 지연입니다.
+
+- inline: 기존 방식 (핸들러에서 pwd_context.verify 직접 호출)
+- pool:   인증 워커 풀 (JWTAuth.verify_password_async)
+
+사용법:
+    python scripts/benchmark_login_storm.py
+    python scripts/benchmark_login_storm.py --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.crypto_executor import auth_crypto  # noqa: E402
+from src.utils.exceptions import ServiceBusyError  # noqa: E402
+from src.utils.jwt_auth import JWTAuth, pwd_context  # noqa: E402
+
+TICK_INTERVAL = 0.01  # 봇 루프 틱 (10ms)
+
+
+async def _ticker(stop: asyncio.Event, delays: list) -> None:
+    """틱 예정 시각 대비 실제 깨어난 시각의 지연 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        delays.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _run(mode: str, password_hash: str, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        async with semaphore:
+            if mode == "inline":
+                pwd_context.verify("correct-password", password_hash)
+                await asyncio.sleep(0)
+            else:
+                try:
+                    await JWTAuth.verify_password_async("correct-password", password_hash)
+                except ServiceBusyError:
+                    rejected += 1
+
+    stop = asyncio.Event()
+    delays: list = []
+    ticker = asyncio.create_task(_ticker(stop, delays))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(logins)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+
+    delays_ms = sorted(d * 1000 for d in delays) or [0.0]
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "logins_per_s": logins / elapsed,
+        "rejected": rejected,
+        "tick_p50_ms": statistics.median(delays_ms),
+        "tick_p99_ms": delays_ms[min(len(delays_ms) - 1, int(len(delays_ms) * 0.99))],
+        "tick_max_ms": delays_ms[-1],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 이벤트 루프 지연 벤치마크")
+    parser.add_argument("--logins", type=int, default=64, help="총 로그인 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 로그인 수")
+    args = parser.parse_args()
+
+    password_hash = pwd_context.hash("correct-password")
+
+    print(f"logins={args.logins} concurrency={args.concurrency} pool={auth_crypto.get_status()}")
+    print(f"{'mode':<8}{'elapsed':>10}{'login/s':>10}{'503':>6}{'tick p50':>11}{'tick p99':>11}{'tick max':>11}")
+    for mode in ("inline", "pool"):
+        r = await _run(mode, password_hash, args.logins, args.concurrency)
+        print(
+            f"{r['mode']:<8}{r['elapsed_s']:>9.2f}s{r['logins_per_s']:>10.1f}{r['rejected']:>6}"
+            f"{r['tick_p50_ms']:>9.1f}ms{r['tick_p99_ms']:>9.1f}ms{r['tick_max_ms']:>9.1f}ms"
+        )
+
+    auth_crypto.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,6 +2,8 @@
 """
 캔들 데이터 대량 다운로드 스크립트
 
+수년치 1m 등 대량 수집은 scripts/download_history.py (병렬, 재시작 가능, 컬럼형 저장소) 사용을 권장합니다.
+
 사용법:
     python download_candle_data.py --years 3
     python download_candle_data.py --symbols BTCUSDT,ETHUSDT --timeframes 1h,4h
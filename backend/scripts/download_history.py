@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+과거 캔들 대량 다운로드 (재시작 가능, 병렬, 컬럼형 저장소)
+
+(거래소, 심볼, 타임프레임)별 월 파티션으로 candle_cache/columnar/ 에 저장합니다.
+중간에 끊겨도 다시 실행하면 완료된 월은 건너뛰고 나머지만 받습니다.
+CandleCacheManager(백테스트)는 저장소가 기간을 덮으면 API 없이 바로 사용합니다.
+
+사용법:
+    python scripts/download_history.py --symbols BTCUSDT --timeframes 1m --start 2021-01-01
+    python scripts/download_history.py --exchange bitget --symbols BTCUSDT,ETHUSDT --timeframes 1h,4h --years 3
+    python scripts/download_history.py --concurrency 16 --rps 15 --symbols SOLUSDT --timeframes 1m --years 2
+
+테스트 모드 (로컬 가짜 거래소, 429/500 주입):
+    python scripts/download_history.py --fake --symbols BTCUSDT --timeframes 1m --start 2024-01-01 --end 2024-04-01
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.candle_store import ColumnarCandleStore  # noqa: E402
+from src.services.fake_exchange import FakeExchangeServer  # noqa: E402
+from src.services.historical_downloader import (  # noqa: E402
+    HistoricalCandleDownloader,
+    create_candle_source,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def _date_ms(value: str) -> int:
+    return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+async def run(args) -> bool:
+    server = None
+    base_url = None
+    store_dir = args.store_dir
+    if args.fake:
+        server = FakeExchangeServer(rate_limit_every=25, fail_every=40)
+        base_url = await server.start()
+        store_dir = store_dir or tempfile.mkdtemp(prefix="candles-fake-")
+
+    store = ColumnarCandleStore(store_dir)
+    source = create_candle_source(args.exchange, base_url=base_url)
+    downloader = HistoricalCandleDownloader(
+        source,
+        store,
+        concurrency=args.concurrency,
+        requests_per_second=args.rps,
+    )
+
+    if args.start:
+        start_ts = _date_ms(args.start)
+    else:
+        start_ts = _date_ms((datetime.utcnow() - timedelta(days=365 * args.years)).strftime("%Y-%m-%d"))
+    end_ts = _date_ms(args.end) if args.end else None
+
+    ok = True
+    try:
+        for symbol in args.symbols.split(","):
+            for timeframe in args.timeframes.split(","):
+                result = await downloader.download(symbol.strip(), timeframe.strip(), start_ts, end_ts)
+                ok = ok and result.ok
+                if not result.ok:
+                    logger.warning(
+                        f"⚠️ {symbol} {timeframe}: {len(result.failed_partitions)} partitions failed, "
+                        f"re-run to resume: {', '.join(result.failed_partitions)}"
+                    )
+    finally:
+        await source.close()
+        if server:
+            logger.info(f"🧪 Fake exchange served {server.requests} requests -> {store.root}")
+            await server.stop()
+
+    for series, info in store.get_info().items():
+        logger.info(f"   {series}: {info['rows']:,} rows, {info['complete']}/{info['partitions']} complete months")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable parallel candle downloader")
+    parser.add_argument("--exchange", default="binance", choices=["binance", "bitget"])
+    parser.add_argument("--symbols", default="BTCUSDT,ETHUSDT")
+    parser.add_argument("--timeframes", default="1m")
+    parser.add_argument("--start", help="시작일 YYYY-MM-DD (없으면 --years)")
+    parser.add_argument("--end", help="종료일 YYYY-MM-DD, 해당일 00:00 UTC 전까지 (없으면 현재)")
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 페이지 요청 수")
+    parser.add_argument("--rps", type=float, default=10.0, help="초당 요청 수 (토큰 버킷)")
+    parser.add_argument("--store-dir", help="저장소 경로 (기본: candle_cache/columnar)")
+    parser.add_argument("--fake", action="store_true", help="로컬 가짜 거래소로 실행")
+    args = parser.parse_args()
+
+    if args.fake:
+        args.rps = max(args.rps, 200.0)
+
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -165,7 +165,8 @@ class BitgetPublicAPI:
         self,
         symbol: str,
         timeframe: str,
-        days: int
+        days: int,
+        since: Optional[datetime] = None,
     ) -> pd.DataFrame:
         """
         과거 N일 데이터 수집
@@ -174,6 +175,7 @@ class BitgetPublicAPI:
             symbol: 심볼
             timeframe: 타임프레임 (5m, 1h 등)
             days: 수집할 일수
+            since: 이 시각 이후 캔들까지만 수집 (피처 캐시 증분 갱신, days보다 우선)
 
         Returns:
             OHLCV DataFrame
@@ -196,6 +198,9 @@ class BitgetPublicAPI:
 
         all_candles = []
         current_end = int(datetime.utcnow().timestamp() * 1000)
+        since_ms = int(since.timestamp() * 1000) if since is not None else None
+        if since_ms is not None:
+            total_candles = min(total_candles, (current_end - since_ms) // (minutes_per_candle * 60000) + 1)
         collected = 0
         request_count = 0
 
@@ -273,17 +278,21 @@ class MLTrainingPipeline:
         self.feature_pipeline = None
         self.labeler = None
         self.trainer = None
+        self.feature_cache = None
 
     def _init_ml_components(self):
         """ML 컴포넌트 초기화 (지연 로딩)"""
         if self.feature_pipeline is None:
             from src.ml.features import FeaturePipeline
+            from src.ml.training.feature_cache import FeatureMatrixCache
             from src.ml.training.labeler import Labeler
             from src.ml.training.train_all_models import ModelTrainer
 
             self.feature_pipeline = FeaturePipeline()
             self.labeler = Labeler()
             self.trainer = ModelTrainer(models_dir=self.models_dir)
+            # 피처/라벨 행렬 캐시 (재학습 시 새 캔들만 추가)
+            self.feature_cache = FeatureMatrixCache(self.data_dir / "feature_cache")
 
     async def run(
         self,
@@ -326,24 +335,32 @@ class MLTrainingPipeline:
             logger.info("📊 STEP 1: Data Collection")
             logger.info("-" * 40)
 
+            since = None
             if csv_path:
                 df_5m = self._load_from_csv(csv_path)
                 df_1h = None
             else:
-                df_5m, df_1h = await self._collect_data(days)
+                since = self.feature_cache.last_timestamp(self.symbol, "5m")
+                if since is not None:
+                    logger.info(f"  Feature cache found, collecting candles after {since}")
+                df_5m, df_1h = await self._collect_data(days, since)
 
-            if df_5m.empty:
+            if df_5m.empty and since is None:
                 logger.error("❌ No data collected. Aborting.")
                 return False
 
             # Save raw data
-            self._save_raw_data(df_5m, df_1h, days)
+            if since is None:
+                self._save_raw_data(df_5m, df_1h, days)
 
             # Step 2: Feature Extraction
             logger.info("\n🔧 STEP 2: Feature Extraction")
             logger.info("-" * 40)
 
-            df_features = self._extract_features(df_5m, df_1h)
+            if csv_path:
+                df_features = self._extract_features(df_5m, df_1h)
+            else:
+                df_features = self._update_feature_cache(df_5m, df_1h, days)
 
             if df_features.empty:
                 logger.error("❌ Feature extraction failed. Aborting.")
@@ -355,7 +372,13 @@ class MLTrainingPipeline:
             logger.info("\n🏷️  STEP 3: Label Generation")
             logger.info("-" * 40)
 
-            df_labeled = self._generate_labels(df_features)
+            if csv_path:
+                df_labeled = self._generate_labels(df_features)
+            else:
+                df_labeled = self.feature_cache.training_matrix(
+                    self.symbol, "5m", self.labeler,
+                    start=df_features.index[0], end=df_features.index[-1],
+                )
 
             if df_labeled.empty:
                 logger.error("❌ Label generation failed. Aborting.")
@@ -399,16 +422,44 @@ class MLTrainingPipeline:
         finally:
             await self.api.close()
 
-    async def _collect_data(self, days: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """5분봉과 1시간봉 데이터 수집"""
+    async def _collect_data(
+        self,
+        days: int,
+        since: Optional[datetime] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """5분봉과 1시간봉 데이터 수집 (since 이후만)"""
         # 5분봉 수집
-        df_5m = await self.api.collect_historical(self.symbol, "5m", days)
+        df_5m = await self.api.collect_historical(self.symbol, "5m", days, since=since)
 
         # 1시간봉 수집 (MTF 피처용)
-        df_1h = await self.api.collect_historical(self.symbol, "1h", days)
+        df_1h = await self.api.collect_historical(self.symbol, "1h", days, since=since)
 
         return df_5m, df_1h
 
+    def _update_feature_cache(
+        self,
+        df_5m: pd.DataFrame,
+        df_1h: Optional[pd.DataFrame],
+        days: int,
+    ) -> pd.DataFrame:
+        """새 캔들을 피처 캐시에 추가하고 최근 N일 피처 행렬 반환"""
+        try:
+            added = self.feature_cache.update(
+                self.symbol, "5m", df_5m, df_1h, pipeline=self.feature_pipeline
+            )
+            logger.info(f"  Feature cache: +{added} rows")
+
+            end = self.feature_cache.last_timestamp(self.symbol, "5m")
+            if end is None:
+                return pd.DataFrame()
+            return self.feature_cache.load_features(
+                self.symbol, "5m", start=end - timedelta(days=days)
+            )
+
+        except Exception as e:
+            logger.error(f"Feature cache update failed: {e}", exc_info=True)
+            return pd.DataFrame()
+
     def _load_from_csv(self, csv_path: str) -> pd.DataFrame:
         """CSV 파일에서 데이터 로드"""
         try:
@@ -520,14 +571,10 @@ class MLTrainingPipeline:
     ) -> dict:
         """5개 모델 학습"""
         try:
+            from src.ml.training.feature_cache import training_feature_columns
+
             # 피처 컬럼 (라벨 제외)
-            exclude_cols = [
-                'label_direction', 'label_volatility', 'label_timing',
-                'label_stop_loss', 'label_position_size',
-                'future_return', 'atr_pct', 'timing_efficiency',
-                'open', 'high', 'low', 'close', 'volume'
-            ]
-            feature_columns = [col for col in df_labeled.columns if col not in exclude_cols]
+            feature_columns = training_feature_columns(df_labeled)
 
             logger.info(f"  Training with {len(feature_columns)} features")
             logger.info(f"  Train/Val split: {int((1-test_size)*100)}/{int(test_size*100)}")
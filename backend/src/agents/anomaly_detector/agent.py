@@ -15,6 +15,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..base import AgentTask, BaseAgent
+from ..redis_client import get_batch_writer
 from .models import (
     AnomalyAlert,
     AnomalySeverity,
@@ -489,23 +490,26 @@ class AnomalyDetectionAgent(BaseAgent):
         if not self.redis_client:
             return
 
-        try:
-            key = f"agent:anomaly:alert:{alert.alert_id}"
-            await self.redis_client.setex(
-                key, 3600, alert.model_dump_json()  # 1시간 TTL
-            )
+        payload = alert.model_dump_json()
+
+        def write(pipe):
+            pipe.setex(f"agent:anomaly:alert:{alert.alert_id}", 3600, payload)  # 1시간 TTL
 
             # 사용자별 알림 리스트
             if alert.user_id:
                 list_key = f"agent:anomaly:user:{alert.user_id}:alerts"
-                await self.redis_client.lpush(list_key, alert.alert_id)
-                await self.redis_client.ltrim(list_key, 0, 99)  # 최대 100개 유지
+                pipe.lpush(list_key, alert.alert_id)
+                pipe.ltrim(list_key, 0, 99)  # 최대 100개 유지
 
             # 봇별 알림 리스트
             if alert.bot_instance_id:
                 list_key = f"agent:anomaly:bot:{alert.bot_instance_id}:alerts"
-                await self.redis_client.lpush(list_key, alert.alert_id)
-                await self.redis_client.ltrim(list_key, 0, 49)  # 최대 50개 유지
+                pipe.lpush(list_key, alert.alert_id)
+                pipe.ltrim(list_key, 0, 49)  # 최대 50개 유지
+
+        try:
+            # 봇 틱 경로이므로 버퍼에 넣고 반환 (합쳐서 왕복 1회로 전송)
+            get_batch_writer(self.redis_client).enqueue(write)
 
         except Exception as e:
             logger.error(f"Failed to save alert to Redis: {e}")
@@ -12,12 +12,15 @@
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional, Set
 
+from ..utils.metrics import agent_queue_wait_seconds, agent_service_seconds
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +56,7 @@ class AgentTask:
     retry_count: int = 0
     max_retries: int = 3
     timeout: Optional[float] = None  # seconds
+    enqueued_at: float = field(default=0.0, repr=False, compare=False)  # perf_counter, 큐 대기 계측용
 
     def __post_init__(self):
         """작업 생성 후 검증"""
@@ -165,6 +169,9 @@ class BaseAgent(ABC):
 
         # 메트릭
         self.metrics = AgentMetrics()
+        # /metrics 라벨 자식 (에이전트 이름당 한 번 바인딩)
+        self._queue_wait_metric = agent_queue_wait_seconds.labels(name)
+        self._service_metric = agent_service_seconds.labels(name)
 
         # 제어
         self._shutdown_event = asyncio.Event()
@@ -247,6 +254,7 @@ class BaseAgent(ABC):
             성공 여부
         """
         try:
+            task.enqueued_at = time.perf_counter()
             await self.task_queue.put(task)
             logger.debug(f"Task '{task.task_id}' submitted to agent '{self.name}'")
             return True
@@ -283,9 +291,12 @@ class BaseAgent(ABC):
                         continue
 
                     # 작업 처리
-                    start_time = datetime.utcnow()
+                    started = time.perf_counter()
+                    if task.enqueued_at:
+                        self._queue_wait_metric.observe(started - task.enqueued_at)
                     success = await self._execute_task(task)
-                    duration = (datetime.utcnow() - start_time).total_seconds()
+                    duration = time.perf_counter() - started
+                    self._service_metric.observe(duration)
 
                     # 메트릭 기록
                     self.metrics.record_task_completion(duration, success)
@@ -414,6 +425,7 @@ class BaseAgent(ABC):
                 try:
                     if not task_succeeded:  # 타임아웃이나 에러로 인한 재시도만
                         await asyncio.sleep(1.0)  # 재시도 전 대기
+                        task.enqueued_at = time.perf_counter()
                         await self.task_queue.put(task)
                 except Exception as retry_error:
                     logger.error(f"Failed to requeue task '{task.task_id}': {retry_error}")
@@ -34,6 +34,9 @@ class RedisConfig:
     socket_connect_timeout: float = 5.0
     retry_on_timeout: bool = True
     decode_responses: bool = True
+    # 쓰기 합치기 (RedisBatchWriter): 버퍼를 이 간격마다 / 이 개수마다 한 번의 파이프라인으로 전송
+    batch_flush_interval_ms: float = 5.0
+    batch_max_size: int = 256
 
     def get_url(self) -> str:
         """Redis 연결 URL 생성"""
@@ -11,9 +11,12 @@ Market Regime Agent (시장 환경 분석 에이전트)
 
 from .agent import MarketRegimeAgent
 from .models import MarketRegime, RegimeType
+from .regime_service import RegimeService, get_regime_service
 
 __all__ = [
     "MarketRegimeAgent",
     "MarketRegime",
     "RegimeType",
+    "RegimeService",
+    "get_regime_service",
 ]
@@ -19,9 +19,12 @@ from typing import Any, Dict, Optional
 from src.ml.features import FeaturePipeline
 from src.ml.models import EnsemblePredictor
 
+from ...utils.codec import encode
 from ..base import AgentTask, BaseAgent
+from ..redis_client import get_batch_writer
 from .indicators import RegimeIndicators
 from .models import MarketRegime, RegimeType
+from .regime_service import calculate_regime_indicators, determine_regime
 
 logger = logging.getLogger(__name__)
 
@@ -239,21 +242,18 @@ class MarketRegimeAgent(BaseAgent):
             logger.error(f"Failed to fetch candles: {e}", exc_info=True)
             return self._create_unknown_regime(symbol)
 
-        # 2. 기술적 지표 계산
+        # 2. 기술적 지표 계산 (RegimeService와 공용)
         try:
-            atr = self.indicators.calculate_atr(candles, period=14)
-            adx = self.indicators.calculate_adx(candles, period=14)
-            upper_bb, middle_bb, lower_bb = self.indicators.calculate_bollinger_bands(
-                candles, period=20
-            )
-            bb_width = self.indicators.calculate_bollinger_width(candles, period=20)
-            ema_20 = self.indicators.calculate_ema(candles, period=20)
-            ema_50 = self.indicators.calculate_ema(candles, period=50)
-            support, resistance = self.indicators.detect_support_resistance(
-                candles, lookback=50
-            )
-            avg_volume = self.indicators.calculate_average_volume(candles, period=20)
-            current_volume = candles[-1]["volume"]
+            values = calculate_regime_indicators(candles)
+            atr = values["atr"]
+            adx = values["adx"]
+            volatility = values["volatility"]  # ATR / 현재가 * 100
+            bb_width = values["bb_width"]
+            upper_bb, lower_bb = values["upper_bb"], values["lower_bb"]
+            ema_20, ema_50 = values["ema_20"], values["ema_50"]
+            support, resistance = values["support"], values["resistance"]
+            avg_volume = values["avg_volume"]
+            current_volume = values["current_volume"]
 
             logger.debug(
                 f"Indicators: ATR={atr:.2f}, ADX={adx:.2f}, "
@@ -264,24 +264,12 @@ class MarketRegimeAgent(BaseAgent):
             logger.error(f"Failed to calculate indicators: {e}", exc_info=True)
             return self._create_unknown_regime(symbol)
 
-        # 3. 변동성 계산 (ATR / 현재가 * 100)
-        volatility = (atr / current_price * 100) if current_price > 0 else 0.0
-
-        # ATR 평균 계산 (최근 20개 ATR)
-        atr_history = []
-        for i in range(max(0, len(candles) - 20), len(candles)):
-            if i >= 14:  # ATR 계산에 최소 15개 필요
-                atr_i = self.indicators.calculate_atr(candles[:i + 1], period=14)
-                atr_history.append(atr_i)
-
-        avg_atr = sum(atr_history) / len(atr_history) if atr_history else atr
-
-        # 4. 시장 환경 판단 (규칙 기반)
+        # 3. 시장 환경 판단 (규칙 기반)
         regime_type, confidence = self._determine_regime_enhanced(
             current_price=current_price,
             adx=adx,
             atr=atr,
-            avg_atr=avg_atr,
+            avg_atr=values["avg_atr"],
             volatility=volatility,
             bb_width=bb_width,
             ema_20=ema_20,
@@ -467,76 +455,27 @@ class MarketRegimeAgent(BaseAgent):
         avg_volume: float
     ) -> tuple[RegimeType, float]:
         """
-        향상된 시장 환경 결정 로직
-
-        우선순위:
-        1. LOW_VOLUME: 거래량이 평균의 30% 미만
-        2. VOLATILE: ATR이 평균의 2배 이상
-        3. TRENDING: ADX > 25
-        4. RANGING: ADX < 20
+        향상된 시장 환경 결정 로직 (regime_service.determine_regime, 에이전트 임계값 적용)
 
         Returns:
             (regime_type, confidence)
         """
-        confidence = 0.5  # 기본 신뢰도
-
-        # 1. LOW_VOLUME 체크 (최우선)
-        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
-        if volume_ratio < self.low_volume_threshold:
-            confidence = 0.8
-            logger.debug(
-                f"LOW_VOLUME detected: current={current_volume:.0f}, "
-                f"avg={avg_volume:.0f}, ratio={volume_ratio:.2f}"
-            )
-            return RegimeType.LOW_VOLUME, confidence
-
-        # 2. VOLATILE 체크 (두 번째 우선순위)
-        atr_ratio = atr / avg_atr if avg_atr > 0 else 1.0
-        if atr_ratio >= self.volatile_atr_multiplier:
-            confidence = 0.85
-            logger.debug(
-                f"VOLATILE detected: ATR={atr:.2f}, avg_ATR={avg_atr:.2f}, "
-                f"ratio={atr_ratio:.2f}"
-            )
-            return RegimeType.VOLATILE, confidence
-
-        # 3. TRENDING 체크 (ADX > 25)
-        if adx > self.trending_adx_threshold:
-            # EMA로 방향 확인
-            if ema_20 > ema_50 and current_price > ema_20:
-                confidence = min(0.9, adx / 100 + 0.5)
-                logger.debug(
-                    f"TRENDING_UP detected: ADX={adx:.2f}, "
-                    f"EMA20={ema_20:.2f}, EMA50={ema_50:.2f}, price={current_price:.2f}"
-                )
-                return RegimeType.TRENDING_UP, confidence
-
-            elif ema_20 < ema_50 and current_price < ema_20:
-                confidence = min(0.9, adx / 100 + 0.5)
-                logger.debug(
-                    f"TRENDING_DOWN detected: ADX={adx:.2f}, "
-                    f"EMA20={ema_20:.2f}, EMA50={ema_50:.2f}, price={current_price:.2f}"
-                )
-                return RegimeType.TRENDING_DOWN, confidence
-
-        # 4. RANGING 체크 (ADX < 20)
-        if adx < self.ranging_adx_threshold:
-            # 볼린저밴드 중간에 위치하는지 확인
-            price_range = upper_bb - lower_bb
-            bb_percent = (
-                (current_price - lower_bb) / price_range if price_range > 0 else 0.5
-            )
-
-            if 0.3 < bb_percent < 0.7:
-                confidence = 0.75
-                logger.debug(
-                    f"RANGING detected: ADX={adx:.2f}, BB%={bb_percent:.2f}"
-                )
-                return RegimeType.RANGING, confidence
-
-        # 5. 불명확한 시장
-        logger.debug(f"UNKNOWN regime: ADX={adx:.2f}, ATR_ratio={atr_ratio:.2f}")
-        return RegimeType.UNKNOWN, 0.4
+        return determine_regime(
+            current_price=current_price,
+            adx=adx,
+            atr=atr,
+            avg_atr=avg_atr,
+            ema_20=ema_20,
+            ema_50=ema_50,
+            upper_bb=upper_bb,
+            lower_bb=lower_bb,
+            current_volume=current_volume,
+            avg_volume=avg_volume,
+            trending_adx_threshold=self.trending_adx_threshold,
+            ranging_adx_threshold=self.ranging_adx_threshold,
+            volatile_atr_multiplier=self.volatile_atr_multiplier,
+            low_volume_threshold=self.low_volume_threshold,
+        )
 
     def _create_unknown_regime(self, symbol: str) -> MarketRegime:
         """불명확한 시장 환경 생성 (에러 시)"""
@@ -674,13 +613,12 @@ Provide your AI-based market regime analysis. Return JSON only:"""
 
         try:
             key = f"agent:market_regime:current:{regime.symbol}"
-            await self.redis_client.set(
-                key=key,
-                value=regime.to_dict(),
-                ttl=300,  # 5분
-                serialize=True
+            value = encode(regime.to_dict())
+            # 분석 경로에서는 버퍼에 넣고 반환 (합쳐서 왕복 1회로 전송)
+            get_batch_writer(self.redis_client).enqueue(
+                lambda pipe: pipe.setex(key, 300, value)  # 5분
             )
-            logger.debug(f"Saved to Redis: {key}")
+            logger.debug(f"Queued Redis save: {key}")
 
         except Exception as e:
             logger.error(f"Redis save error: {e}", exc_info=True)
@@ -0,0 +1,314 @@
+"""
+Market Regime Service (다중 심볼 시장 환경 서비스)
+
+봇별로 하나의 에이전트를 고정하는 대신, 활성 심볼 전체의 시장 환경을
+프로세스 하나에서 관리합니다.
+
+- 캔들은 공유 CandleAggregator 시리즈 사용 (regime 타임프레임, 기본 5m)
+- 캔들 마감 이벤트에서만 regime 재계산
+- get_regime(symbol)은 메모리 dict 조회 (시그널 경로 O(1))
+- REST 캔들 조회는 시리즈 최초 구독 시 백필 1회 (봇이 이미 받은 캔들이 있으면 0회)
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.services.candle_aggregator import (
+    CandleAggregator,
+    CandleSeries,
+    candle_aggregator,
+    normalize_symbol,
+)
+
+from .indicators import RegimeIndicators
+from .models import MarketRegime, RegimeType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGIME_TIMEFRAME = "5m"
+DEFAULT_MAX_CANDLES = 200
+MIN_CANDLES = 50
+
+# 판단 임계값 (MarketRegimeAgent와 동일)
+TRENDING_ADX_THRESHOLD = 25.0
+RANGING_ADX_THRESHOLD = 20.0
+VOLATILE_ATR_MULTIPLIER = 2.0
+LOW_VOLUME_THRESHOLD = 0.3  # 30%
+
+
+def calculate_regime_indicators(candles: Sequence[dict]) -> Dict[str, float]:
+    """시장 환경 판단용 지표 계산 (에이전트/서비스 공용)"""
+    ind = RegimeIndicators
+    candles = list(candles)
+    current_price = candles[-1]["close"]
+
+    atr = ind.calculate_atr(candles, period=14)
+    upper_bb, middle_bb, lower_bb = ind.calculate_bollinger_bands(candles, period=20)
+    support, resistance = ind.detect_support_resistance(candles, lookback=50)
+
+    # ATR 평균 (최근 20개 ATR)
+    atr_history = [
+        ind.calculate_atr(candles[:i + 1], period=14)
+        for i in range(max(0, len(candles) - 20), len(candles))
+        if i >= 14  # ATR 계산에 최소 15개 필요
+    ]
+
+    return {
+        "current_price": current_price,
+        "atr": atr,
+        "avg_atr": sum(atr_history) / len(atr_history) if atr_history else atr,
+        "adx": ind.calculate_adx(candles, period=14),
+        "volatility": (atr / current_price * 100) if current_price > 0 else 0.0,
+        "bb_width": ind.calculate_bollinger_width(candles, period=20),
+        "upper_bb": upper_bb,
+        "lower_bb": lower_bb,
+        "ema_20": ind.calculate_ema(candles, period=20),
+        "ema_50": ind.calculate_ema(candles, period=50),
+        "support": support,
+        "resistance": resistance,
+        "avg_volume": ind.calculate_average_volume(candles, period=20),
+        "current_volume": candles[-1]["volume"],
+    }
+
+
+def determine_regime(
+    current_price: float,
+    adx: float,
+    atr: float,
+    avg_atr: float,
+    ema_20: float,
+    ema_50: float,
+    upper_bb: float,
+    lower_bb: float,
+    current_volume: float,
+    avg_volume: float,
+    trending_adx_threshold: float = TRENDING_ADX_THRESHOLD,
+    ranging_adx_threshold: float = RANGING_ADX_THRESHOLD,
+    volatile_atr_multiplier: float = VOLATILE_ATR_MULTIPLIER,
+    low_volume_threshold: float = LOW_VOLUME_THRESHOLD,
+) -> Tuple[RegimeType, float]:
+    """
+    규칙 기반 시장 환경 결정
+
+    우선순위:
+    1. LOW_VOLUME: 거래량이 평균의 30% 미만
+    2. VOLATILE: ATR이 평균의 2배 이상
+    3. TRENDING: ADX > 25 (EMA로 방향 확인)
+    4. RANGING: ADX < 20 (볼린저밴드 중간 구간)
+
+    Returns:
+        (regime_type, confidence)
+    """
+    # 1. LOW_VOLUME 체크 (최우선)
+    volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+    if volume_ratio < low_volume_threshold:
+        logger.debug(
+            f"LOW_VOLUME detected: current={current_volume:.0f}, "
+            f"avg={avg_volume:.0f}, ratio={volume_ratio:.2f}"
+        )
+        return RegimeType.LOW_VOLUME, 0.8
+
+    # 2. VOLATILE 체크
+    atr_ratio = atr / avg_atr if avg_atr > 0 else 1.0
+    if atr_ratio >= volatile_atr_multiplier:
+        logger.debug(f"VOLATILE detected: ATR={atr:.2f}, avg_ATR={avg_atr:.2f}, ratio={atr_ratio:.2f}")
+        return RegimeType.VOLATILE, 0.85
+
+    # 3. TRENDING 체크
+    if adx > trending_adx_threshold:
+        if ema_20 > ema_50 and current_price > ema_20:
+            logger.debug(f"TRENDING_UP detected: ADX={adx:.2f}, EMA20={ema_20:.2f}, EMA50={ema_50:.2f}")
+            return RegimeType.TRENDING_UP, min(0.9, adx / 100 + 0.5)
+
+        if ema_20 < ema_50 and current_price < ema_20:
+            logger.debug(f"TRENDING_DOWN detected: ADX={adx:.2f}, EMA20={ema_20:.2f}, EMA50={ema_50:.2f}")
+            return RegimeType.TRENDING_DOWN, min(0.9, adx / 100 + 0.5)
+
+    # 4. RANGING 체크
+    if adx < ranging_adx_threshold:
+        price_range = upper_bb - lower_bb
+        bb_percent = (current_price - lower_bb) / price_range if price_range > 0 else 0.5
+        if 0.3 < bb_percent < 0.7:
+            logger.debug(f"RANGING detected: ADX={adx:.2f}, BB%={bb_percent:.2f}")
+            return RegimeType.RANGING, 0.75
+
+    # 5. 불명확한 시장
+    logger.debug(f"UNKNOWN regime: ADX={adx:.2f}, ATR_ratio={atr_ratio:.2f}")
+    return RegimeType.UNKNOWN, 0.4
+
+
+def compute_regime(symbol: str, candles: Sequence[dict]) -> MarketRegime:
+    """마감 캔들로 규칙 기반 MarketRegime 계산"""
+    if len(candles) < MIN_CANDLES:
+        return MarketRegime(
+            symbol=symbol,
+            regime_type=RegimeType.UNKNOWN,
+            confidence=0.0,
+            volatility=0.0,
+            trend_strength=0.0,
+        )
+
+    values = calculate_regime_indicators(candles)
+    regime_type, confidence = determine_regime(
+        current_price=values["current_price"],
+        adx=values["adx"],
+        atr=values["atr"],
+        avg_atr=values["avg_atr"],
+        ema_20=values["ema_20"],
+        ema_50=values["ema_50"],
+        upper_bb=values["upper_bb"],
+        lower_bb=values["lower_bb"],
+        current_volume=values["current_volume"],
+        avg_volume=values["avg_volume"],
+    )
+    return MarketRegime(
+        symbol=symbol,
+        regime_type=regime_type,
+        confidence=confidence,
+        volatility=values["volatility"],
+        trend_strength=values["adx"],
+        support_level=values["support"],
+        resistance_level=values["resistance"],
+    )
+
+
+class RegimeService:
+    """
+    다중 심볼 시장 환경 서비스
+
+    캔들은 공유 CandleAggregator의 regime 타임프레임 시리즈를 그대로 읽고,
+    캔들 마감 이벤트에서만 재계산합니다.
+
+    사용법:
+    ```python
+    service = get_regime_service()
+    await service.track("ETHUSDT", seed_candles=historical, client=bitget_client)
+    regime = service.get_regime("ETHUSDT")  # 시그널 경로
+    ```
+    """
+
+    def __init__(
+        self,
+        timeframe: str = DEFAULT_REGIME_TIMEFRAME,
+        max_candles: int = DEFAULT_MAX_CANDLES,
+        aggregator: Optional[CandleAggregator] = None,
+    ):
+        self.timeframe = timeframe
+        self.max_candles = max_candles
+        self.aggregator = aggregator or candle_aggregator
+        self.aggregator.add_close_listener(self._on_candle_close)
+
+        self._tracked: Dict[str, CandleSeries] = {}
+        self._regimes: Dict[str, MarketRegime] = {}
+
+        self.stats = {"candles_closed": 0, "recomputes": 0}
+
+    # ------------------------------------------------------------
+    # 조회 (핫패스)
+    # ------------------------------------------------------------
+
+    def get_regime(self, symbol: str) -> Optional[MarketRegime]:
+        """심볼의 최신 시장 환경 (계산 전이면 None)"""
+        return self._regimes.get(normalize_symbol(symbol))
+
+    def is_tracked(self, symbol: str) -> bool:
+        return normalize_symbol(symbol) in self._tracked
+
+    def closed_candles(self, symbol: str) -> Sequence[dict]:
+        """심볼의 마감 캔들 (읽기 전용 뷰, 진행 중 캔들 제외)"""
+        series = self._tracked.get(normalize_symbol(symbol))
+        if series is None:
+            return []
+        view = series.view(self.max_candles + 1)
+        open_bucket = series.bucket_start(time.time())
+        if len(view) and view[-1]["time"] >= open_bucket:
+            view = view[:-1]
+        return view[-self.max_candles:]
+
+    # ------------------------------------------------------------
+    # 등록 / 워밍업
+    # ------------------------------------------------------------
+
+    async def track(
+        self,
+        symbol: str,
+        seed_candles: Optional[List[dict]] = None,
+        client: Any = None,
+    ) -> Optional[MarketRegime]:
+        """
+        심볼 추적 시작 (이미 추적 중이면 아무것도 하지 않음)
+
+        Args:
+            seed_candles: regime 타임프레임의 과거 캔들 (봇이 이미 받은 것 재사용)
+            client: seed_candles가 없을 때 백필용 get_historical_candles 클라이언트
+        """
+        key = normalize_symbol(symbol)
+        if key in self._tracked:
+            return self._regimes.get(key)
+
+        series = await self.aggregator.subscribe(
+            key, self.timeframe, client=client, seed_candles=seed_candles
+        )
+        if key not in self._tracked:
+            self._tracked[key] = series
+            logger.info(f"📊 Regime tracking started: {key} @ {self.timeframe} ({len(series)} candles)")
+            self._recompute(key)
+        return self._regimes.get(key)
+
+    # ------------------------------------------------------------
+    # 캔들 마감
+    # ------------------------------------------------------------
+
+    def _on_candle_close(self, symbol: str, timeframe: str, candle: dict) -> None:
+        if timeframe != self.timeframe or symbol not in self._tracked:
+            return
+        self.stats["candles_closed"] += 1
+        self._recompute(symbol)
+
+    def _recompute(self, key: str) -> Optional[MarketRegime]:
+        candles = self.closed_candles(key)
+        if len(candles) < MIN_CANDLES:
+            return None
+        try:
+            regime = compute_regime(key, candles)
+        except Exception as e:
+            logger.error(f"Regime computation failed for {key}: {e}", exc_info=True)
+            return None
+
+        previous = self._regimes.get(key)
+        self._regimes[key] = regime
+        self.stats["recomputes"] += 1
+
+        if previous is None or previous.regime_type != regime.regime_type:
+            logger.info(
+                f"📊 Market regime: {key} -> {regime.regime_type.value} "
+                f"(confidence: {regime.confidence:.2f}, volatility: {regime.volatility:.2f}%, "
+                f"ADX: {regime.trend_strength:.2f})"
+            )
+        return regime
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "timeframe": self.timeframe,
+            "symbols": {
+                key: {
+                    "candles": len(series),
+                    "regime": self._regimes[key].regime_type.value if key in self._regimes else None,
+                }
+                for key, series in self._tracked.items()
+            },
+            **self.stats,
+        }
+
+
+# 싱글톤 인스턴스
+_regime_service: Optional[RegimeService] = None
+
+
+def get_regime_service() -> RegimeService:
+    """프로세스 공유 RegimeService 반환"""
+    global _regime_service
+    if _regime_service is None:
+        _regime_service = RegimeService()
+    return _regime_service
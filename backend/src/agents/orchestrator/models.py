@@ -78,7 +78,11 @@ class AgentAction(BaseModel):
     agent_id: str = Field(description="실행할 에이전트 ID")
     action: str = Field(description="실행할 액션")
     params: Dict[str, Any] = Field(default_factory=dict)
-    timeout_seconds: int = Field(30, description="타임아웃 (초)")
+    timeout_seconds: float = Field(30, description="타임아웃 (초)")
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="먼저 끝나야 하는 같은 규칙 내 액션의 agent_id (없으면 다른 액션과 병렬 실행)",
+    )
 
 
 class OrchestrationResult(BaseModel):
@@ -130,7 +134,7 @@ class OrchestrationRule(BaseModel):
     trigger_event_types: List[EventType]
     trigger_conditions: Dict[str, Any] = Field(default_factory=dict)
 
-    # 실행할 액션들 (순차 실행)
+    # 실행할 액션들 (depends_on 기준 DAG: 독립 액션은 병렬, 의존 액션은 선행 완료 후)
     actions: List[AgentAction]
 
     # 조건부 실행
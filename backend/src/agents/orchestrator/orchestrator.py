@@ -7,8 +7,9 @@ Agent Orchestrator (에이전트 오케스트레이터)
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set
 
+from ..redis_client import get_batch_writer
 from .models import (
     AgentAction,
     AgentHealthStatus,
@@ -33,9 +34,15 @@ class AgentOrchestrator:
 
     아키텍처:
     ```
-    Event발생 → Orchestrator → 규칙매칭 → 에이전트실행 → 결과집계
+    Event발생 → Orchestrator → 규칙매칭(이벤트 타입 인덱스) → 액션 DAG 병렬 실행 → 결과집계
     ```
 
+    실행 모델:
+    - 규칙은 add_rule 시점에 이벤트 타입별로 우선순위 정렬해 인덱싱
+    - 액션은 depends_on 기준 DAG로 실행 (독립 액션은 동시에, 의존 액션은 선행 완료 후)
+    - 매칭된 규칙들도 동시에 실행 → 지연 시간 = 가장 느린 액션 경로 (합이 아님)
+    - 구독 이벤트는 동시에 처리하되 같은 봇(없으면 같은 사용자) 이벤트는 도착 순서 보장
+
     예시 플로우:
     1. Signal Generated → SignalValidator → RiskMonitor → 최종 승인/거부
     2. Anomaly Detected → RiskMonitor → 자동 포지션 축소
@@ -46,6 +53,7 @@ class AgentOrchestrator:
         self,
         redis_client=None,
         db_session=None,
+        max_concurrent_events: int = 32,
     ):
         self.redis_client = redis_client
         self.db_session = db_session
@@ -56,6 +64,15 @@ class AgentOrchestrator:
         # 오케스트레이션 규칙들
         self._rules: List[OrchestrationRule] = []
 
+        # 이벤트 타입 → 우선순위 내림차순 규칙 / rule_id → 위상 정렬된 액션
+        self._rules_by_event: Dict[EventType, List[OrchestrationRule]] = {}
+        self._action_plans: Dict[str, List[AgentAction]] = {}
+
+        # 동시 이벤트 처리 (순서 키별 마지막 태스크, 처리 중 이벤트 수 제한)
+        self._event_slots = asyncio.Semaphore(max_concurrent_events)
+        self._ordering_tails: Dict[str, asyncio.Task] = {}
+        self._inflight: Set[asyncio.Task] = set()
+
         # 에이전트 상태
         self._agent_health: Dict[str, AgentHealthStatus] = {}
 
@@ -77,8 +94,20 @@ class AgentOrchestrator:
         logger.info(f"Agent registered: {agent_id}")
 
     def add_rule(self, rule: OrchestrationRule):
-        """오케스트레이션 규칙 추가"""
+        """
+        오케스트레이션 규칙 추가
+
+        Raises:
+            ValueError: 액션 의존성이 잘못된 경우 (중복 agent_id, 없는 대상, 순환)
+        """
+        self._action_plans[rule.rule_id] = self._plan_actions(rule)
         self._rules.append(rule)
+
+        for event_type in rule.trigger_event_types:
+            rules = self._rules_by_event.setdefault(event_type, [])
+            rules.append(rule)
+            rules.sort(key=lambda r: r.priority, reverse=True)
+
         logger.info(f"Orchestration rule added: {rule.name}")
 
     def add_event_handler(self, event_type: EventType, handler: Callable):
@@ -108,29 +137,24 @@ class AgentOrchestrator:
         )
 
         try:
-            # 1. 매칭되는 규칙 찾기
-            matching_rules = self._find_matching_rules(event)
+            # 1. 매칭되는 규칙 찾기 (이미 우선순위 순)
+            matching_rules = [r for r in self._find_matching_rules(event) if r.enabled]
 
             if not matching_rules:
                 logger.debug(f"No matching rules for event {event.event_type.value}")
                 result.final_decision = "no_action"
                 return result
 
-            # 2. 우선순위 순으로 정렬
-            matching_rules.sort(key=lambda r: r.priority, reverse=True)
-
-            # 3. 각 규칙 실행
-            for rule in matching_rules:
-                if not rule.enabled:
-                    continue
-
-                logger.debug(f"Executing rule: {rule.name}")
+            # 2. 규칙들을 동시에 실행 (규칙 내부는 액션 DAG)
+            rule_results = await asyncio.gather(
+                *(self._execute_rule(rule, event) for rule in matching_rules)
+            )
 
-                # 규칙의 액션들 순차 실행
-                for action in rule.actions:
-                    action_result = await self._execute_action(action, event)
+            # 3. 우선순위 순으로 결과 병합
+            for rule, action_results in zip(matching_rules, rule_results):
+                for action in self._action_plans[rule.rule_id]:
                     result.actions_executed.append(action)
-                    result.action_results[action.agent_id] = action_result
+                    result.action_results[action.agent_id] = action_results[action.agent_id]
 
             # 4. 결과 집계 및 최종 결정
             result.final_decision = self._aggregate_results(event, result.action_results)
@@ -195,7 +219,7 @@ class AgentOrchestrator:
                             event_data = event_data.decode("utf-8")
 
                         event = OrchestrationEvent.model_validate_json(event_data)
-                        await self.handle_event(event)
+                        await self.dispatch_event(event)
 
                     except Exception as e:
                         logger.error(f"Error processing subscribed event: {e}")
@@ -203,6 +227,38 @@ class AgentOrchestrator:
         except Exception as e:
             logger.error(f"Event subscription error: {e}")
 
+    async def dispatch_event(self, event: OrchestrationEvent) -> asyncio.Task:
+        """
+        이벤트를 백그라운드에서 처리하도록 예약
+
+        - 같은 봇(bot_instance_id, 없으면 user_id) 이벤트는 도착 순서대로 처리
+        - 다른 키/키 없는 이벤트는 동시에 처리
+        - 처리 중 이벤트가 max_concurrent_events개면 자리가 날 때까지 대기 (백프레셔)
+        """
+        await self._event_slots.acquire()
+
+        key = self._ordering_key(event)
+        previous = self._ordering_tails.get(key) if key else None
+        task = asyncio.create_task(self._handle_in_order(event, previous))
+        self._inflight.add(task)
+
+        if key:
+            self._ordering_tails[key] = task
+
+        def _done(t: asyncio.Task):
+            self._inflight.discard(t)
+            self._event_slots.release()
+            if key and self._ordering_tails.get(key) is t:
+                del self._ordering_tails[key]
+
+        task.add_done_callback(_done)
+        return task
+
+    async def drain(self):
+        """예약된 이벤트 처리가 모두 끝날 때까지 대기"""
+        while self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
     async def check_agent_health(self) -> Dict[str, AgentHealthStatus]:
         """모든 에이전트의 상태 체크"""
         for agent_id, agent in self._agents.items():
@@ -250,7 +306,7 @@ class AgentOrchestrator:
             OrchestrationRule(
                 rule_id="signal_validation_pipeline",
                 name="Signal Validation Pipeline",
-                description="전략 신호 생성 시 SignalValidator → RiskMonitor 순차 검증",
+                description="전략 신호 생성 시 SignalValidator / RiskMonitor 병렬 검증 (둘 다 통과해야 허용)",
                 trigger_event_types=[EventType.SIGNAL_GENERATED],
                 actions=[
                     AgentAction(
@@ -327,6 +383,7 @@ class AgentOrchestrator:
                         action="validate_rebalancing",
                         params={},
                         timeout_seconds=5,
+                        depends_on=["portfolio_optimizer"],
                     ),
                 ],
                 priority=3,
@@ -355,16 +412,81 @@ class AgentOrchestrator:
         logger.info(f"Initialized {len(self._rules)} default orchestration rules")
 
     def _find_matching_rules(self, event: OrchestrationEvent) -> List[OrchestrationRule]:
-        """이벤트에 매칭되는 규칙 찾기"""
-        matching = []
+        """이벤트에 매칭되는 규칙 찾기 (우선순위 내림차순)"""
+        return [
+            rule
+            for rule in self._rules_by_event.get(event.event_type, [])
+            if self._check_rule_conditions(event, rule)
+        ]
+
+    @staticmethod
+    def _plan_actions(rule: OrchestrationRule) -> List[AgentAction]:
+        """액션을 의존성 순서로 위상 정렬 (같은 단계는 정의 순서 유지)"""
+        by_agent: Dict[str, AgentAction] = {}
+        for action in rule.actions:
+            if action.agent_id in by_agent:
+                raise ValueError(f"Rule {rule.rule_id}: duplicate action for agent {action.agent_id}")
+            by_agent[action.agent_id] = action
+
+        for action in rule.actions:
+            unknown = set(action.depends_on) - set(by_agent)
+            if unknown:
+                raise ValueError(
+                    f"Rule {rule.rule_id}: {action.agent_id} depends on unknown action(s) {sorted(unknown)}"
+                )
 
-        for rule in self._rules:
-            if event.event_type in rule.trigger_event_types:
-                # 추가 조건 체크 (있으면)
-                if self._check_rule_conditions(event, rule):
-                    matching.append(rule)
+        ordered: List[AgentAction] = []
+        done: Set[str] = set()
+        pending = list(rule.actions)
+        while pending:
+            ready = [a for a in pending if set(a.depends_on) <= done]
+            if not ready:
+                raise ValueError(
+                    f"Rule {rule.rule_id}: dependency cycle among {[a.agent_id for a in pending]}"
+                )
+            ordered.extend(ready)
+            done.update(a.agent_id for a in ready)
+            pending = [a for a in pending if a.agent_id not in done]
+        return ordered
+
+    async def _execute_rule(
+        self, rule: OrchestrationRule, event: OrchestrationEvent
+    ) -> Dict[str, Any]:
+        """
+        규칙의 액션 DAG 실행
 
-        return matching
+        각 액션은 선행 액션 결과만 기다리므로 전체 지연은 가장 긴 의존 경로로 제한된다.
+        """
+        logger.debug(f"Executing rule: {rule.name}")
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(action: AgentAction) -> Any:
+            upstream = {dep: await tasks[dep] for dep in action.depends_on}
+            return await self._execute_action(action, event, upstream)
+
+        # 위상 순서로 생성하므로 선행 태스크는 항상 먼저 존재
+        for action in self._action_plans[rule.rule_id]:
+            tasks[action.agent_id] = asyncio.create_task(run(action))
+
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results))
+
+    @staticmethod
+    def _ordering_key(event: OrchestrationEvent) -> Optional[str]:
+        """처리 순서를 보장할 키 (봇 > 사용자, 둘 다 없으면 순서 무관)"""
+        if event.bot_instance_id is not None:
+            return f"bot:{event.bot_instance_id}"
+        if event.user_id is not None:
+            return f"user:{event.user_id}"
+        return None
+
+    async def _handle_in_order(
+        self, event: OrchestrationEvent, previous: Optional[asyncio.Task]
+    ) -> OrchestrationResult:
+        """같은 키의 이전 이벤트 처리가 끝난 뒤 처리"""
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        return await self.handle_event(event)
 
     def _check_rule_conditions(
         self, event: OrchestrationEvent, rule: OrchestrationRule
@@ -384,9 +506,12 @@ class AgentOrchestrator:
         return True
 
     async def _execute_action(
-        self, action: AgentAction, event: OrchestrationEvent
+        self,
+        action: AgentAction,
+        event: OrchestrationEvent,
+        upstream: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """액션 실행"""
+        """액션 실행 (upstream: depends_on 액션들의 결과)"""
         agent = self._agents.get(action.agent_id)
 
         if not agent:
@@ -402,6 +527,8 @@ class AgentOrchestrator:
                 params = {**action.params, **event.data}
                 params["event_id"] = event.event_id
                 params["event_type"] = event.event_type.value
+                if upstream:
+                    params["upstream_results"] = upstream
 
                 task = AgentTask(
                     task_id=f"{event.event_id}_{action.agent_id}",
@@ -513,14 +640,22 @@ class AgentOrchestrator:
 
         try:
             key = f"orchestration:result:{result.event_id}"
-            await self.redis_client.setex(key, 3600, result.model_dump_json())
+            payload = result.model_dump_json()
+            # 이벤트 처리 경로에서는 버퍼에 넣고 반환 (합쳐서 왕복 1회로 전송)
+            get_batch_writer(self.redis_client).enqueue(
+                lambda pipe: pipe.setex(key, 3600, payload)
+            )
         except Exception as e:
             logger.error(f"Failed to save result to Redis: {e}")
 
     async def _run_event_handlers(
         self, event: OrchestrationEvent, result: OrchestrationResult
     ):
-        """커스텀 이벤트 핸들러 실행"""
+        """
+        커스텀 이벤트 핸들러 실행
+
+        등록 순서대로 하나씩 실행합니다 (앞 핸들러의 부수 효과에 의존하는 핸들러가 있음).
+        """
         handlers = self._event_handlers.get(event.event_type, [])
 
         for handler in handlers:
@@ -6,14 +6,16 @@ Redis 클라이언트 (Redis Client)
 - 연결 풀 관리
 - 데이터 캐싱
 - Pub/Sub 메시징
+- 파이프라인 / 쓰기 합치기 (RedisBatchWriter) + 왕복(RTT) 카운터
+- 값 직렬화는 utils.codec (버전 헤더 + orjson/msgpack, 레거시 JSON 읽기 호환)
 
 관련 문서: AGENT_SYSTEM_WORK_PLAN.md
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set
 
 try:
     from redis.asyncio import ConnectionPool, Redis
@@ -23,11 +25,137 @@ except ImportError:
     Redis = None
     ConnectionPool = None
 
+from ..utils.codec import decode, encode, encode_json
 from .config import RedisConfig, get_agent_config
 
 logger = logging.getLogger(__name__)
 
 
+# 파이프라인에 명령을 쌓는 함수 (예: lambda pipe: pipe.setex(key, 60, value))
+PipelineOp = Callable[[Any], None]
+
+
+def _new_round_trip_stats() -> Dict[str, int]:
+    return {"round_trips": 0, "commands": 0, "flushes": 0, "coalesced_ops": 0, "errors": 0}
+
+
+class RedisBatchWriter:
+    """
+    Redis 파이프라인 / 쓰기 합치기 (Batching Writer)
+
+    - execute(op): 논리적 연산 하나의 명령들을 MULTI 파이프라인으로 묶어 왕복 1회
+    - enqueue(op): 결과가 필요 없는 쓰기를 버퍼에 넣고 즉시 반환 (핫 패스 왕복 0회)
+      flush_interval_ms 뒤 또는 max_batch개가 쌓이면 버퍼 전체를 왕복 1회로 전송
+
+    redis.asyncio.Redis처럼 pipeline(transaction=...)을 가진 클라이언트면 무엇이든 사용 가능.
+
+    사용 예:
+    ```python
+    writer = get_batch_writer(redis)
+    writer.enqueue(lambda pipe: pipe.hincrby("ai:cost:daily:2025-01-01", "calls", 1))
+    ```
+    """
+
+    def __init__(
+        self,
+        client,
+        flush_interval_ms: float = 5.0,
+        max_batch: int = 256,
+        transaction: bool = True,
+        stats: Optional[Dict[str, int]] = None,
+    ):
+        self.client = client
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self.transaction = transaction
+        self.stats = stats if stats is not None else _new_round_trip_stats()
+
+        self._buffer: List[PipelineOp] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    async def execute(self, op: PipelineOp) -> List[Any]:
+        """명령 그룹을 한 번의 왕복으로 실행하고 결과 반환"""
+        async with self.client.pipeline(transaction=self.transaction) as pipe:
+            op(pipe)
+            results = await pipe.execute()
+        self.stats["round_trips"] += 1
+        self.stats["commands"] += len(results)
+        return results
+
+    def enqueue(self, op: PipelineOp):
+        """쓰기 그룹을 버퍼에 추가 (실행 중인 이벤트 루프 필요)"""
+        self._buffer.append(op)
+
+        if len(self._buffer) >= self.max_batch:
+            task = asyncio.create_task(self.flush())
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """버퍼를 한 번의 파이프라인으로 전송, 보낸 그룹 수 반환 (실패 시 로그만 남김)"""
+        ops, self._buffer = self._buffer, []
+        if not ops:
+            return 0
+
+        try:
+            async with self.client.pipeline(transaction=self.transaction) as pipe:
+                for op in ops:
+                    op(pipe)
+                results = await pipe.execute()
+            self.stats["round_trips"] += 1
+            self.stats["commands"] += len(results)
+            self.stats["flushes"] += 1
+            self.stats["coalesced_ops"] += len(ops)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Redis batch flush failed ({len(ops)} ops dropped): {e}")
+
+        return len(ops)
+
+    async def close(self):
+        """대기 중인 버퍼를 모두 전송"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self.stats, "buffered": self.buffered}
+
+
+# 클라이언트별 공유 writer (같은 연결을 쓰는 컴포넌트들의 쓰기를 한 파이프라인으로 합침)
+_batch_writers: "weakref.WeakKeyDictionary[Any, RedisBatchWriter]" = weakref.WeakKeyDictionary()
+
+
+def get_batch_writer(client) -> RedisBatchWriter:
+    """
+    클라이언트에 연결된 공유 RedisBatchWriter 반환
+
+    Args:
+        client: redis.asyncio.Redis 또는 에이전트 RedisClient
+    """
+    if isinstance(client, RedisClient):
+        return client.writer
+
+    writer = _batch_writers.get(client)
+    if writer is None:
+        writer = RedisBatchWriter(client)
+        _batch_writers[client] = writer
+    return writer
+
+
 class RedisClient:
     """
     비동기 Redis 클라이언트 (Async Redis Client)
@@ -40,12 +168,19 @@ class RedisClient:
     - 해시맵 관리
     - Pub/Sub 메시징
     - TTL 관리
+    - 파이프라인 실행 / 쓰기 합치기 (writer)
+    - 왕복 카운터 (get_stats)
 
     사용 예:
     ```python
     redis_client = await get_redis_client()
     await redis_client.set("key", "value", ttl=60)
     value = await redis_client.get("key")
+
+    # 여러 명령을 왕복 1회로
+    await redis_client.execute_batch(lambda pipe: pipe.incr("a").expire("a", 60))
+    # 핫 패스: 버퍼에 넣고 바로 반환 (수 ms 후 합쳐서 전송)
+    redis_client.writer.enqueue(lambda pipe: pipe.setex("b", 60, "1"))
     ```
     """
 
@@ -63,10 +198,14 @@ class RedisClient:
             )
 
         self.config = config or get_agent_config().redis
+        # decode_responses=False면 bytes가 그대로 오므로 msgpack 사용 가능
+        self.binary_safe = not self.config.decode_responses
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[Redis] = None
         self._pubsub = None
         self._subscriptions: Dict[str, List[Callable]] = {}
+        self._writer: Optional[RedisBatchWriter] = None
+        self.stats = _new_round_trip_stats()
 
     async def connect(self):
         """Redis 서버에 연결"""
@@ -111,6 +250,11 @@ class RedisClient:
         2. 클라이언트 연결 종료 및 대기
         3. 연결 풀 정리
         """
+        # 0. 합쳐둔 쓰기 전송
+        if self._writer:
+            await self._writer.close()
+            self._writer = None
+
         # 1. Pub/Sub 정리
         if self._pubsub:
             try:
@@ -152,6 +296,44 @@ class RedisClient:
         if not self._client:
             raise RuntimeError("Redis client is not connected. Call connect() first.")
 
+    def _count_round_trip(self, commands: int = 1):
+        self.stats["round_trips"] += 1
+        self.stats["commands"] += commands
+
+    # ============================================================
+    # 파이프라인 / 쓰기 합치기
+    # ============================================================
+
+    @property
+    def writer(self) -> RedisBatchWriter:
+        """이 연결의 쓰기 합치기 버퍼 (왕복 카운터는 클라이언트와 공유)"""
+        self._ensure_connected()
+        if self._writer is None:
+            self._writer = RedisBatchWriter(
+                self._client,
+                flush_interval_ms=self.config.batch_flush_interval_ms,
+                max_batch=self.config.batch_max_size,
+                stats=self.stats,
+            )
+        return self._writer
+
+    async def execute_batch(self, op: PipelineOp) -> List[Any]:
+        """
+        명령 그룹을 MULTI 파이프라인으로 왕복 1회에 실행
+
+        Args:
+            op: 파이프라인에 명령을 쌓는 함수
+
+        Returns:
+            명령별 결과 리스트
+        """
+        return await self.writer.execute(op)
+
+    def get_stats(self) -> Dict[str, int]:
+        """왕복/명령 카운터 (writer 버퍼 포함)"""
+        buffered = self._writer.buffered if self._writer else 0
+        return {**self.stats, "buffered": buffered}
+
     # ============================================================
     # 기본 키-값 작업
     # ============================================================
@@ -170,16 +352,17 @@ class RedisClient:
             key: 키
             value: 값
             ttl: Time To Live (초)
-            serialize: JSON 직렬화 여부
+            serialize: 코덱 직렬화 여부
 
         Returns:
             성공 여부
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             if serialize and not isinstance(value, str):
-                value = json.dumps(value)
+                value = encode(value, binary_safe=self.binary_safe)
 
             if ttl:
                 await self._client.setex(key, ttl, value)
@@ -203,13 +386,14 @@ class RedisClient:
 
         Args:
             key: 키
-            deserialize: JSON 역직렬화 여부
+            deserialize: 코덱 역직렬화 여부
             default: 키가 없을 때 반환할 기본값
 
         Returns:
             값 (없으면 default)
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             value = await self._client.get(key)
@@ -217,11 +401,8 @@ class RedisClient:
             if value is None:
                 return default
 
-            if deserialize and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
+            if deserialize and isinstance(value, (str, bytes)):
+                return decode(value)
 
             return value
 
@@ -240,6 +421,7 @@ class RedisClient:
             삭제된 키 개수
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             return await self._client.delete(*keys)
@@ -258,6 +440,7 @@ class RedisClient:
             존재하는 키 개수
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             return await self._client.exists(*keys)
@@ -277,6 +460,7 @@ class RedisClient:
             성공 여부
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             return await self._client.expire(key, seconds)
@@ -302,16 +486,17 @@ class RedisClient:
             name: 해시맵 이름
             key: 필드 키
             value: 필드 값
-            serialize: JSON 직렬화 여부
+            serialize: 코덱 직렬화 여부
 
         Returns:
             새로 생성된 필드 수
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             if serialize and not isinstance(value, str):
-                value = json.dumps(value)
+                value = encode(value, binary_safe=self.binary_safe)
 
             return await self._client.hset(name, key, value)
 
@@ -332,13 +517,14 @@ class RedisClient:
         Args:
             name: 해시맵 이름
             key: 필드 키
-            deserialize: JSON 역직렬화 여부
+            deserialize: 코덱 역직렬화 여부
             default: 필드가 없을 때 반환할 기본값
 
         Returns:
             필드 값 (없으면 default)
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             value = await self._client.hget(name, key)
@@ -346,11 +532,8 @@ class RedisClient:
             if value is None:
                 return default
 
-            if deserialize and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
+            if deserialize and isinstance(value, (str, bytes)):
+                return decode(value)
 
             return value
 
@@ -368,12 +551,13 @@ class RedisClient:
 
         Args:
             name: 해시맵 이름
-            deserialize: JSON 역직렬화 여부
+            deserialize: 코덱 역직렬화 여부
 
         Returns:
             해시맵 딕셔너리
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             data = await self._client.hgetall(name)
@@ -382,8 +566,8 @@ class RedisClient:
                 result = {}
                 for key, value in data.items():
                     try:
-                        result[key] = json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
+                        result[key] = decode(value)
+                    except (ValueError, TypeError):
                         result[key] = value
                 return result
 
@@ -405,6 +589,7 @@ class RedisClient:
             삭제된 필드 수
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             return await self._client.hdel(name, *keys)
@@ -422,16 +607,17 @@ class RedisClient:
 
         Args:
             channel: 채널 이름
-            message: 메시지 (자동으로 JSON 직렬화)
+            message: 메시지 (헤더 없는 JSON으로 직렬화, 외부 구독자 호환)
 
         Returns:
             메시지를 받은 구독자 수
         """
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             if not isinstance(message, str):
-                message = json.dumps(message)
+                message = encode_json(message)
 
             return await self._client.publish(channel, message)
 
@@ -476,10 +662,10 @@ class RedisClient:
                     channel = message["channel"]
                     data = message["data"]
 
-                    # JSON 역직렬화
+                    # 역직렬화 (헤더 있는 코덱 페이로드 / 일반 JSON 모두)
                     try:
-                        data = json.loads(data)
-                    except (json.JSONDecodeError, TypeError):
+                        data = decode(data)
+                    except (ValueError, TypeError):
                         pass
 
                     # 콜백 호출
@@ -503,6 +689,7 @@ class RedisClient:
     async def ping(self) -> bool:
         """Redis 서버 핑 테스트"""
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             await self._client.ping()
@@ -514,6 +701,7 @@ class RedisClient:
     async def info(self) -> Dict[str, Any]:
         """Redis 서버 정보 조회"""
         self._ensure_connected()
+        self._count_round_trip()
 
         try:
             return await self._client.info()
@@ -6,6 +6,7 @@ FinBERT 기반 금융 뉴스 감성 분석 에이전트
 
 from .agent import SentimentAnalyzerAgent
 from .data_sources import CryptoPanicSource, RedditSource
+from .finbert_service import FinBERTService, get_finbert_service
 from .models import (
     MarketSentiment,
     NewsItem,
@@ -23,4 +24,6 @@ __all__ = [
     "SentimentStrength",
     "CryptoPanicSource",
     "RedditSource",
+    "FinBERTService",
+    "get_finbert_service",
 ]
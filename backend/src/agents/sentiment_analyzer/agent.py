@@ -4,15 +4,14 @@ Sentiment Analyzer Agent
 FinBERT를 사용한 금융 뉴스 감성 분석 에이전트
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List
 
-import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
-
 from ..base import AgentTask, BaseAgent
 from .data_sources import CryptoPanicSource, RedditSource
+from .finbert_service import FinBERTService, get_finbert_service, headline_key
 from .models import (
     MarketSentiment,
     NewsItem,
@@ -47,11 +46,9 @@ class SentimentAnalyzerAgent(BaseAgent):
 
         cfg = config or {}
 
-        # FinBERT 모델 설정
+        # FinBERT 모델 설정 (프로세스 공유 서비스, 첫 추론 시 로드)
         self.model_name = cfg.get("model_name", "ProsusAI/finbert")
-        self.model = None
-        self.tokenizer = None
-        self._load_model()
+        self.finbert: FinBERTService = get_finbert_service(self.model_name)
 
         # 데이터 소스
         self.cryptopanic = CryptoPanicSource()
@@ -66,65 +63,6 @@ class SentimentAnalyzerAgent(BaseAgent):
         self._cache: Dict[str, MarketSentiment] = {}
         self._cache_ttl = timedelta(minutes=cfg.get("cache_ttl_minutes", 30))
 
-    def _load_model(self):
-        """FinBERT 모델 로드"""
-        try:
-            logger.info(f"FinBERT 모델 로드 중: {self.model_name}")
-
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                self.model_name
-            )
-            self.model.eval()
-
-            logger.info("✅ FinBERT 모델 로드 완료")
-
-        except Exception as e:
-            logger.error(f"❌ FinBERT 모델 로드 실패: {e}")
-            self.model = None
-            self.tokenizer = None
-
-    def _analyze_text_sentiment(self, text: str) -> tuple:
-        """텍스트 감성 분석"""
-        if not self.model or not self.tokenizer:
-            return 0.0, SentimentLabel.NEUTRAL, 0.0
-
-        try:
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512
-            )
-
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-
-            logits = outputs.logits
-            probs = torch.softmax(logits, dim=1)[0]
-
-            pos_prob = probs[0].item()
-            neg_prob = probs[1].item()
-            neu_prob = probs[2].item()
-
-            score = pos_prob - neg_prob
-
-            if pos_prob > neg_prob and pos_prob > neu_prob:
-                label = SentimentLabel.POSITIVE
-                confidence = pos_prob
-            elif neg_prob > pos_prob and neg_prob > neu_prob:
-                label = SentimentLabel.NEGATIVE
-                confidence = neg_prob
-            else:
-                label = SentimentLabel.NEUTRAL
-                confidence = neu_prob
-
-            return score, label, confidence
-
-        except Exception as e:
-            logger.error(f"감성 분석 에러: {e}")
-            return 0.0, SentimentLabel.NEUTRAL, 0.0
-
     def _calculate_strength(self, score: float) -> SentimentStrength:
         """감성 점수 to 강도 변환"""
         if score >= 0.8:
@@ -147,10 +85,24 @@ class SentimentAnalyzerAgent(BaseAgent):
         symbols: List[str],
         hours: int = 24
     ) -> List[NewsItem]:
-        """모든 데이터 소스에서 뉴스 수집"""
+        """모든 데이터 소스에서 뉴스 동시 수집 (같은 헤드라인은 한 번만)"""
+        sources = [self.cryptopanic, self.reddit]
+        results = await asyncio.gather(
+            *[source.fetch_news(symbols, hours) for source in sources],
+            return_exceptions=True,
+        )
+
         all_news = []
-        cryptopanic_news = await self.cryptopanic.fetch_news(symbols, hours)
-        all_news.extend(cryptopanic_news)
+        seen = set()
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                logger.error(f"뉴스 수집 실패 ({type(source).__name__}): {result}")
+                continue
+            for news in result:
+                key = headline_key(news.title)
+                if key not in seen:
+                    seen.add(key)
+                    all_news.append(news)
         return all_news
 
     async def analyze_market_sentiment(
@@ -192,8 +144,9 @@ class SentimentAnalyzerAgent(BaseAgent):
         negative_count = 0
         neutral_count = 0
 
-        for news in news_items:
-            score, label, confidence = self._analyze_text_sentiment(news.title)
+        results = await self.finbert.score_texts([news.title for news in news_items])
+
+        for news, (score, label, confidence) in zip(news_items, results):
             news.sentiment_score = score
             news.sentiment_label = label
             news.confidence = confidence
@@ -279,8 +232,8 @@ class SentimentAnalyzerAgent(BaseAgent):
             confidence_multiplier=1.0,
         )
 
-    async def process(self, task: AgentTask) -> dict:
-        """에이전트 작업 처리"""
+    async def process_task(self, task: AgentTask) -> dict:
+        """에이전트 작업 처리 (BaseAgent 추상 메서드 구현)"""
         task_type = task.task_type
         params = task.params or {}
 
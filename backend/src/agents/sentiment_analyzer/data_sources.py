@@ -4,6 +4,7 @@ Sentiment Analyzer - Data Sources (CryptoPanic, Reddit)
 뉴스 데이터 수집을 위한 클라이언트 구현
 """
 
+import asyncio
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -81,7 +82,9 @@ class CryptoPanicSource(NewsDataSource):
 
             logger.info(f"CryptoPanic API 요청: symbols={symbols}, hours={hours}")
 
-            response = requests.get(
+            # 동기 HTTP 호출은 스레드에서 (이벤트 루프 블로킹 방지)
+            response = await asyncio.to_thread(
+                requests.get,
                 self.BASE_URL,
                 params=params,
                 timeout=10
@@ -0,0 +1,274 @@
+"""
+Sentiment Analyzer - 공유 FinBERT 서비스
+
+프로세스당 FinBERT 모델 하나를 전용 워커 스레드에서 실행합니다.
+
+- 지연 로드: 첫 추론 시 워커 스레드에서 한 번만 로드
+- 배치 추론: 길이순 정렬 후 batch_size 단위, 배치 내 최장 길이로만 패딩
+- 선택적 동적 int8 양자화 (CPU, FINBERT_QUANTIZE=true)
+- 헤드라인 결과 캐시: 정규화한 텍스트의 해시 -> (score, label, confidence)
+  같은 뉴스는 사용자/갱신 주기와 관계없이 한 번만 추론
+- 동시 요청 병합: 추론 중인 헤드라인은 새로 제출하지 않고 결과를 공유
+
+torch/transformers는 모델 로드 시점에만 import 합니다 (미설치 시 중립 점수).
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .models import SentimentLabel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "ProsusAI/finbert"
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_LENGTH = 128  # 헤드라인 기준 (기존 512는 패딩 낭비)
+DEFAULT_CACHE_SIZE = 20000
+
+SentimentResult = Tuple[float, SentimentLabel, float]
+NEUTRAL_RESULT: SentimentResult = (0.0, SentimentLabel.NEUTRAL, 0.0)
+
+
+def headline_key(text: str) -> str:
+    """헤드라인 내용 해시 (공백/대소문자 정규화)"""
+    normalized = " ".join(text.split()).lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def probs_to_result(pos_prob: float, neg_prob: float, neu_prob: float) -> SentimentResult:
+    """FinBERT 확률 [positive, negative, neutral] -> (score, label, confidence)"""
+    score = pos_prob - neg_prob
+
+    if pos_prob > neg_prob and pos_prob > neu_prob:
+        return score, SentimentLabel.POSITIVE, pos_prob
+    if neg_prob > pos_prob and neg_prob > neu_prob:
+        return score, SentimentLabel.NEGATIVE, neg_prob
+    return score, SentimentLabel.NEUTRAL, neu_prob
+
+
+class FinBERTService:
+    """
+    프로세스 공유 FinBERT 추론 서비스
+
+    사용법:
+    ```python
+    service = get_finbert_service()
+    results = await service.score_texts(["ETH ETF approved", ...])
+    ```
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH,
+        quantize: Optional[bool] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.quantize = (
+            quantize
+            if quantize is not None
+            else os.getenv("FINBERT_QUANTIZE", "false").lower() == "true"
+        )
+        self.cache_size = cache_size
+
+        self.model = None
+        self.tokenizer = None
+        self._torch = None
+        self._load_attempted = False
+        self._load_lock = threading.Lock()
+
+        # 추론 전용 워커 스레드 (이벤트 루프 블로킹 방지, 모델 동시 접근 없음)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finbert")
+
+        self._cache: "OrderedDict[str, SentimentResult]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "texts_scored": 0,
+        }
+
+    # ------------------------------------------------------------
+    # 모델 (워커 스레드에서만 호출)
+    # ------------------------------------------------------------
+
+    def _ensure_model(self) -> bool:
+        with self._load_lock:
+            if self._load_attempted:
+                return self.model is not None
+            self._load_attempted = True
+
+            try:
+                import torch
+                from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+                logger.info(f"FinBERT 모델 로드 중: {self.model_name}")
+                tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+                model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                model.eval()
+
+                if self.quantize:
+                    model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    logger.info("FinBERT 동적 int8 양자화 적용")
+
+                self._torch = torch
+                self.tokenizer = tokenizer
+                self.model = model
+                logger.info("✅ FinBERT 모델 로드 완료")
+                return True
+
+            except Exception as e:
+                logger.error(f"❌ FinBERT 모델 로드 실패: {e}")
+                return False
+
+    def _infer_probs(self, texts: List[str]) -> List[Tuple[float, float, float]]:
+        """배치 추론 -> [(positive, negative, neutral)] (입력 순서 유지)"""
+        torch = self._torch
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        probs: List[Optional[Tuple[float, float, float]]] = [None] * len(texts)
+
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            inputs = self.tokenizer(
+                [texts[i] for i in indices],
+                return_tensors="pt",
+                padding=True,  # 배치 내 최장 길이까지만
+                truncation=True,
+                max_length=self.max_length,
+            )
+            with torch.inference_mode():
+                logits = self.model(**inputs).logits
+            batch_probs = torch.softmax(logits, dim=1).tolist()
+            for i, row in zip(indices, batch_probs):
+                probs[i] = (row[0], row[1], row[2])
+            self.stats["batches"] += 1
+
+        return probs
+
+    def _score_blocking(self, texts: List[str]) -> List[SentimentResult]:
+        if not texts or not self._ensure_model():
+            return [NEUTRAL_RESULT] * len(texts)
+        try:
+            results = [probs_to_result(*p) for p in self._infer_probs(texts)]
+            self.stats["texts_scored"] += len(texts)
+            return results
+        except Exception as e:
+            logger.error(f"감성 분석 에러: {e}")
+            return [NEUTRAL_RESULT] * len(texts)
+
+    # ------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> Optional[SentimentResult]:
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+
+    def _cache_set(self, key: str, result: SentimentResult) -> None:
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------
+
+    async def score_texts(self, texts: Sequence[str]) -> List[SentimentResult]:
+        """
+        헤드라인 목록 감성 점수 (입력 순서 유지)
+
+        캐시에 있는 헤드라인은 재사용하고, 나머지만 한 번의 배치 작업으로
+        워커 스레드에 제출합니다.
+        """
+        keys = [headline_key(text) for text in texts]
+        resolved: Dict[str, SentimentResult] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        to_score: Dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+            if key in resolved or key in waiting or key in to_score:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                resolved[key] = cached
+                self.stats["cache_hits"] += 1
+            elif key in self._pending:
+                waiting[key] = self._pending[key]
+                self.stats["coalesced"] += 1
+            else:
+                to_score[key] = text
+                self.stats["cache_misses"] += 1
+
+        if to_score:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in to_score}
+            self._pending.update(futures)
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._score_blocking, list(to_score.values())
+                )
+                for key, result in zip(to_score, results):
+                    # 모델 미사용 중립 결과는 캐시하지 않음
+                    if self.model is not None:
+                        self._cache_set(key, result)
+                    resolved[key] = result
+                    futures[key].set_result(result)
+            except asyncio.CancelledError:
+                for future in futures.values():
+                    future.cancel()
+                raise
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                        future.exception()  # 대기자가 없어도 경고 방지
+                raise
+            finally:
+                for key in futures:
+                    self._pending.pop(key, None)
+
+        for key, future in waiting.items():
+            resolved[key] = await future
+
+        return [resolved[key] for key in keys]
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "model_loaded": self.model is not None,
+            "quantized": self.quantize,
+            "batch_size": self.batch_size,
+            "cache_entries": len(self._cache),
+            **self.stats,
+        }
+
+
+# 모델 이름별 싱글톤
+_services: Dict[str, FinBERTService] = {}
+
+
+def get_finbert_service(model_name: str = DEFAULT_MODEL_NAME) -> FinBERTService:
+    """프로세스 공유 FinBERT 서비스 반환"""
+    service = _services.get(model_name)
+    if service is None:
+        service = FinBERTService(model_name=model_name)
+        _services[model_name] = service
+    return service
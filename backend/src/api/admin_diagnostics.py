@@ -1,10 +1,40 @@
-from fastapi import APIRouter, Depends
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
 
 from ..utils.auth_dependencies import require_admin
 from ..utils.crypto_secrets import CryptoError, decrypt_secret, encrypt_secret, get_fernet
+from ..utils.sampling_profiler import MAX_DURATION, ProfilerBusyError, dump_tasks, run_profile
 
 router = APIRouter(prefix="/admin/system", tags=["admin_diagnostics"])
 
+# 워커가 진단 명령을 가져가기까지 여유 (스케줄러 틱 = lease_ttl / 3)
+WORKER_PICKUP_SECONDS = 15.0
+
+
+def _command_router(request: Request):
+    """분산 모드의 BotCommandRouter (아니면 400)"""
+    manager = getattr(request.app.state, "bot_manager", None)
+    if manager is None or not manager.distributed:
+        raise HTTPException(status_code=400, detail="worker_id is only available in distributed bot mode")
+    return manager.router
+
+
+async def _worker_diagnostics(request: Request, worker_id: str, op: str, timeout: float, **params) -> dict:
+    try:
+        result = await _command_router(request).request_diagnostics(worker_id, op, timeout, **params)
+    except LookupError as error:
+        raise HTTPException(status_code=404, detail=str(error)) from error
+    except asyncio.TimeoutError as error:
+        raise HTTPException(status_code=504, detail=str(error)) from error
+    if result.get("error") == "busy":
+        raise HTTPException(status_code=409, detail=result["detail"])
+    if "error" in result:
+        raise HTTPException(status_code=502, detail=result["detail"])
+    return result
+
 
 def _build_encryption_info() -> dict:
     """암호화 상태 정보를 담은 기본 딕셔너리를 생성합니다.
@@ -42,3 +72,72 @@ async def encryption_health(admin_id: int = Depends(require_admin)):
         return {"status": status, "encryption": info}
     except CryptoError as error:
         return {"status": "error", "encryption": info, "detail": str(error)}
+
+
+@router.post("/diagnostics/profile")
+async def profile_hot_paths(
+    request: Request,
+    seconds: float = Query(10.0, ge=0.5, le=MAX_DURATION),
+    interval_ms: float = Query(10.0, ge=1.0, le=100.0),
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    top: int = Query(30, ge=1, le=200),
+    worker_id: Optional[str] = Query(None, description="분산 모드 봇 워커 (없으면 API 프로세스)"),
+    admin_id: int = Depends(require_admin),
+):
+    """
+    인프로세스 샘플링 프로파일 (N초)
+
+    - format=json: 상위 함수, collapsed stack, asyncio 태스크 덤프
+    - format=collapsed: flamegraph.pl / speedscope에 바로 넣을 수 있는 텍스트
+    - worker_id: 분산 모드에서 봇(bot_runner)을 실행하는 워커 프로세스를 프로파일
+      (워커 목록은 GET /diagnostics/workers)
+    프로세스당 동시에 한 세션만 실행됩니다 (실행 중이면 409).
+    """
+    if worker_id:
+        result = await _worker_diagnostics(
+            request, worker_id, "profile", seconds + WORKER_PICKUP_SECONDS,
+            seconds=seconds, interval=interval_ms / 1000, top=top,
+        )
+        if format == "collapsed":
+            return PlainTextResponse(result["collapsed"])
+        return result
+
+    try:
+        profile = await run_profile(seconds, interval=interval_ms / 1000)
+    except ProfilerBusyError as error:
+        raise HTTPException(status_code=409, detail=str(error)) from error
+
+    if format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    return profile.to_dict(top=top)
+
+
+@router.get("/diagnostics/workers")
+async def bot_workers(request: Request, admin_id: int = Depends(require_admin)):
+    """분산 모드의 살아 있는 봇 워커와 보유 봇 수 (worker_id 선택용)"""
+    info = await _command_router(request).backend.worker_info()
+    return {
+        "workers": [
+            {"worker_id": worker_id, "bots": beat.get("bots", 0)}
+            for worker_id, beat in sorted(info.items())
+        ]
+    }
+
+
+@router.get("/diagnostics/tasks")
+async def asyncio_task_dump(
+    request: Request,
+    limit: int = Query(200, ge=1, le=2000),
+    worker_id: Optional[str] = Query(None, description="분산 모드 봇 워커 (없으면 API 프로세스)"),
+    admin_id: int = Depends(require_admin),
+):
+    """
+    현재 asyncio 태스크 덤프 (태스크별 코루틴 / 멈춘 위치 / await 대상)
+
+    wakeup 경과 시간(since_wakeup_in_session)은 /diagnostics/profile 결과의 태스크 덤프에만 있습니다.
+    """
+    if worker_id:
+        return await _worker_diagnostics(request, worker_id, "tasks", WORKER_PICKUP_SECONDS, limit=limit)
+
+    tasks = dump_tasks(limit=limit)
+    return {"count": len(tasks), "tasks": tasks}
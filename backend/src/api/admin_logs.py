@@ -1,13 +1,17 @@
 import logging
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, or_, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.db import get_session
+from ..database.db import AsyncSessionLocal, get_session
 from ..database.models import BotLog, Trade, User
 from ..utils.auth_dependencies import require_admin
+from ..utils.exceptions import AppException
+from ..utils.pagination import apply_keyset, paginate_rows, stream_ndjson
 from ..utils.structured_logging import get_logger
 
 logger = logging.getLogger(__name__)
@@ -16,67 +20,155 @@ structured_logger = get_logger(__name__)
 router = APIRouter(prefix="/admin/logs", tags=["admin-logs"])
 
 
+# ============================================================
+# 쿼리 빌더 (사용자 이메일은 JOIN으로 한 번에 조회)
+# ============================================================
+
+
+def _log_query():
+    return select(
+        BotLog.id,
+        BotLog.user_id,
+        User.email.label("user_email"),
+        BotLog.event_type,
+        BotLog.message,
+        BotLog.created_at,
+    ).outerjoin(User, User.id == BotLog.user_id)
+
+
+def _system_logs_query(level: Optional[str]):
+    # event_type에 'error', 'warning', 'critical', 'system' 등이 포함된 로그
+    query = _log_query().where(
+        or_(
+            BotLog.event_type.like('%error%'),
+            BotLog.event_type.like('%warning%'),
+            BotLog.event_type.like('%critical%'),
+            BotLog.event_type.like('%system%'),
+        )
+    )
+    if level:
+        query = query.where(BotLog.event_type.like(f'%{level.lower()}%'))
+    return query
+
+
+def _bot_logs_query(user_id: Optional[int]):
+    # event_type에 'bot', 'start', 'stop', 'trade' 등이 포함된 로그
+    query = _log_query().where(
+        or_(
+            BotLog.event_type.like('%bot%'),
+            BotLog.event_type.like('%start%'),
+            BotLog.event_type.like('%stop%'),
+            BotLog.event_type.like('%trade%'),
+            BotLog.event_type.like('%signal%'),
+        )
+    )
+    if user_id:
+        query = query.where(BotLog.user_id == user_id)
+    return query
+
+
+def _trading_logs_query(user_id: Optional[int], symbol: Optional[str]):
+    query = select(
+        Trade.id,
+        Trade.user_id,
+        User.email.label("user_email"),
+        Trade.symbol,
+        Trade.side,
+        Trade.qty,
+        Trade.entry_price,
+        Trade.exit_price,
+        Trade.pnl,
+        Trade.pnl_percent,
+        Trade.leverage,
+        Trade.exit_reason,
+        Trade.created_at,
+    ).outerjoin(User, User.id == Trade.user_id)
+    if user_id:
+        query = query.where(Trade.user_id == user_id)
+    if symbol:
+        query = query.where(Trade.symbol == symbol.upper())
+    return query
+
+
+def _time_range(query, column, start: Optional[datetime], end: Optional[datetime]):
+    if start:
+        query = query.where(column >= start)
+    if end:
+        query = query.where(column < end)
+    return query
+
+
+def _serialize_log(row) -> dict:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "user_email": row.user_email,
+        "event_type": row.event_type,
+        "message": row.message,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def _serialize_trade(row) -> dict:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "user_email": row.user_email,
+        "symbol": row.symbol,
+        "side": row.side,
+        "qty": row.qty,
+        "entry_price": float(row.entry_price) if row.entry_price else None,
+        "exit_price": float(row.exit_price) if row.exit_price else None,
+        "pnl": float(row.pnl) if row.pnl else 0.0,
+        "pnl_percent": row.pnl_percent,
+        "leverage": row.leverage,
+        "exit_reason": row.exit_reason.value if row.exit_reason else None,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def _row_key(row):
+    return row.created_at, row.id
+
+
+def _ndjson_response(query, serialize, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_ndjson(AsyncSessionLocal, query, serialize),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/system")
 async def get_system_logs(
     session: AsyncSession = Depends(get_session),
     admin_id: int = Depends(require_admin),
     level: Optional[str] = Query(None, description="Log level filter: CRITICAL, ERROR, WARNING, INFO"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     관리자 전용: 시스템 로그 조회
 
     시스템 로그 필터링:
     - 레벨별 필터 (CRITICAL, ERROR, WARNING, INFO)
-    - 최신순 정렬
-    - BotLog 테이블에서 시스템 관련 로그 조회
+    - 최신순 정렬, (created_at, id) 커서 페이지네이션
+    - BotLog 테이블에서 시스템 관련 로그 조회 (사용자 이메일 JOIN)
 
     Args:
         level: 로그 레벨 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 다음 페이지 커서 (선택)
 
     Returns:
-        시스템 로그 목록
+        시스템 로그 목록, next_cursor
     """
     try:
-        # BotLog 테이블에서 시스템 로그 조회
-        # event_type에 'error', 'warning', 'critical', 'system' 등이 포함된 로그
-        query = select(BotLog).where(
-            or_(
-                BotLog.event_type.like('%error%'),
-                BotLog.event_type.like('%warning%'),
-                BotLog.event_type.like('%critical%'),
-                BotLog.event_type.like('%system%'),
-            )
-        )
+        query = apply_keyset(_system_logs_query(level), BotLog.created_at, BotLog.id, cursor)
+        result = await session.execute(query.limit(limit + 1))
+        rows, next_cursor = paginate_rows(result.all(), limit, _row_key)
 
-        # 레벨 필터 적용
-        if level:
-            level_lower = level.lower()
-            query = query.where(BotLog.event_type.like(f'%{level_lower}%'))
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(BotLog.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        logs = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        log_list = []
-        for log in logs:
-            user_result = await session.execute(
-                select(User.email).where(User.id == log.user_id)
-            )
-            user_email = user_result.scalar()
-
-            log_list.append({
-                "id": log.id,
-                "user_id": log.user_id,
-                "user_email": user_email,
-                "event_type": log.event_type,
-                "message": log.message,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            })
+        log_list = [_serialize_log(row) for row in rows]
 
         structured_logger.info(
             "admin_system_logs_accessed",
@@ -91,8 +183,11 @@ async def get_system_logs(
             "total_count": len(log_list),
             "level_filter": level,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except AppException:
+        raise
     except Exception as e:
         structured_logger.error(
             "admin_system_logs_error",
@@ -109,61 +204,30 @@ async def get_bot_logs(
     admin_id: int = Depends(require_admin),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     관리자 전용: 봇 로그 조회
 
     봇 로그 필터링:
     - 사용자별 필터 (선택)
-    - 최신순 정렬
-    - BotLog 테이블에서 봇 관련 로그 조회
+    - 최신순 정렬, (created_at, id) 커서 페이지네이션
+    - BotLog 테이블에서 봇 관련 로그 조회 (사용자 이메일 JOIN)
 
     Args:
         user_id: 사용자 ID 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 다음 페이지 커서 (선택)
 
     Returns:
-        봇 로그 목록
+        봇 로그 목록, next_cursor
     """
     try:
-        # BotLog 테이블에서 봇 로그 조회
-        # event_type에 'bot', 'start', 'stop', 'trade' 등이 포함된 로그
-        query = select(BotLog).where(
-            or_(
-                BotLog.event_type.like('%bot%'),
-                BotLog.event_type.like('%start%'),
-                BotLog.event_type.like('%stop%'),
-                BotLog.event_type.like('%trade%'),
-                BotLog.event_type.like('%signal%'),
-            )
-        )
+        query = apply_keyset(_bot_logs_query(user_id), BotLog.created_at, BotLog.id, cursor)
+        result = await session.execute(query.limit(limit + 1))
+        rows, next_cursor = paginate_rows(result.all(), limit, _row_key)
 
-        # 사용자 필터 적용
-        if user_id:
-            query = query.where(BotLog.user_id == user_id)
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(BotLog.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        logs = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        log_list = []
-        for log in logs:
-            user_result = await session.execute(
-                select(User.email).where(User.id == log.user_id)
-            )
-            user_email = user_result.scalar()
-
-            log_list.append({
-                "id": log.id,
-                "user_id": log.user_id,
-                "user_email": user_email,
-                "event_type": log.event_type,
-                "message": log.message,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            })
+        log_list = [_serialize_log(row) for row in rows]
 
         structured_logger.info(
             "admin_bot_logs_accessed",
@@ -178,8 +242,11 @@ async def get_bot_logs(
             "total_count": len(log_list),
             "user_id_filter": user_id,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except AppException:
+        raise
     except Exception as e:
         structured_logger.error(
             "admin_bot_logs_error",
@@ -197,6 +264,7 @@ async def get_trading_logs(
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTCUSDT)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     관리자 전용: 거래 로그 조회
@@ -204,58 +272,26 @@ async def get_trading_logs(
     거래 로그 필터링:
     - 사용자별 필터 (선택)
     - 심볼별 필터 (선택)
-    - 최신순 정렬
-    - Trade 테이블에서 최근 거래 내역 조회
+    - 최신순 정렬, (created_at, id) 커서 페이지네이션
+    - Trade 테이블에서 최근 거래 내역 조회 (사용자 이메일 JOIN)
 
     Args:
         user_id: 사용자 ID 필터 (선택)
         symbol: 심볼 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 다음 페이지 커서 (선택)
 
     Returns:
-        거래 로그 목록
+        거래 로그 목록, next_cursor
     """
     try:
-        # Trade 테이블에서 거래 로그 조회
-        query = select(Trade)
-
-        # 사용자 필터 적용
-        if user_id:
-            query = query.where(Trade.user_id == user_id)
-
-        # 심볼 필터 적용
-        if symbol:
-            query = query.where(Trade.symbol == symbol.upper())
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(Trade.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        trades = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        trade_list = []
-        for trade in trades:
-            user_result = await session.execute(
-                select(User.email).where(User.id == trade.user_id)
-            )
-            user_email = user_result.scalar()
-
-            trade_list.append({
-                "id": trade.id,
-                "user_id": trade.user_id,
-                "user_email": user_email,
-                "symbol": trade.symbol,
-                "side": trade.side,
-                "qty": trade.qty,
-                "entry_price": float(trade.entry_price) if trade.entry_price else None,
-                "exit_price": float(trade.exit_price) if trade.exit_price else None,
-                "pnl": float(trade.pnl) if trade.pnl else 0.0,
-                "pnl_percent": trade.pnl_percent,
-                "leverage": trade.leverage,
-                "exit_reason": trade.exit_reason.value if trade.exit_reason else None,
-                "created_at": trade.created_at.isoformat() if trade.created_at else None,
-            })
+        query = apply_keyset(
+            _trading_logs_query(user_id, symbol), Trade.created_at, Trade.id, cursor
+        )
+        result = await session.execute(query.limit(limit + 1))
+        rows, next_cursor = paginate_rows(result.all(), limit, _row_key)
+
+        trade_list = [_serialize_trade(row) for row in rows]
 
         structured_logger.info(
             "admin_trading_logs_accessed",
@@ -272,8 +308,11 @@ async def get_trading_logs(
             "user_id_filter": user_id,
             "symbol_filter": symbol,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except AppException:
+        raise
     except Exception as e:
         structured_logger.error(
             "admin_trading_logs_error",
@@ -282,3 +321,78 @@ async def get_trading_logs(
             error=str(e)
         )
         raise HTTPException(status_code=500, detail=f"Failed to get trading logs: {str(e)}") from e
+
+
+# ============================================================
+# NDJSON 스트리밍 내보내기 (대용량 기간 조회)
+# ============================================================
+
+
+@router.get("/system/export")
+async def export_system_logs(
+    admin_id: int = Depends(require_admin),
+    level: Optional[str] = Query(None, description="Log level filter: CRITICAL, ERROR, WARNING, INFO"),
+    start: Optional[datetime] = Query(None, description="Start time (inclusive, UTC)"),
+    end: Optional[datetime] = Query(None, description="End time (exclusive, UTC)"),
+):
+    """
+    관리자 전용: 시스템 로그 NDJSON 스트리밍 내보내기
+
+    서버 사이드 커서로 한 줄에 로그 하나씩 스트리밍 (메모리 사용량 일정).
+    """
+    query = _time_range(_system_logs_query(level), BotLog.created_at, start, end)
+    query = query.order_by(BotLog.created_at.desc(), BotLog.id.desc())
+
+    structured_logger.info(
+        "admin_system_logs_exported",
+        f"Admin {admin_id} exported system logs",
+        admin_id=admin_id,
+        level_filter=level,
+    )
+    return _ndjson_response(query, _serialize_log, "system_logs.ndjson")
+
+
+@router.get("/bot/export")
+async def export_bot_logs(
+    admin_id: int = Depends(require_admin),
+    user_id: Optional[int] = Query(None, description="Filter by user ID"),
+    start: Optional[datetime] = Query(None, description="Start time (inclusive, UTC)"),
+    end: Optional[datetime] = Query(None, description="End time (exclusive, UTC)"),
+):
+    """
+    관리자 전용: 봇 로그 NDJSON 스트리밍 내보내기
+    """
+    query = _time_range(_bot_logs_query(user_id), BotLog.created_at, start, end)
+    query = query.order_by(BotLog.created_at.desc(), BotLog.id.desc())
+
+    structured_logger.info(
+        "admin_bot_logs_exported",
+        f"Admin {admin_id} exported bot logs",
+        admin_id=admin_id,
+        user_id_filter=user_id,
+    )
+    return _ndjson_response(query, _serialize_log, "bot_logs.ndjson")
+
+
+@router.get("/trading/export")
+async def export_trading_logs(
+    admin_id: int = Depends(require_admin),
+    user_id: Optional[int] = Query(None, description="Filter by user ID"),
+    symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTCUSDT)"),
+    start: Optional[datetime] = Query(None, description="Start time (inclusive, UTC)"),
+    end: Optional[datetime] = Query(None, description="End time (exclusive, UTC)"),
+):
+    """
+    관리자 전용: 거래 로그 NDJSON 스트리밍 내보내기
+    """
+    query = _time_range(_trading_logs_query(user_id, symbol), Trade.created_at, start, end)
+    query = query.order_by(Trade.created_at.desc(), Trade.id.desc())
+
+    structured_logger.info(
+        "admin_trading_logs_exported",
+        f"Admin {admin_id} exported trading logs",
+        admin_id=admin_id,
+        user_id_filter=user_id,
+        symbol_filter=symbol,
+    )
+    return _ndjson_response(query, _serialize_trade, "trading_logs.ndjson")
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from ..database.models import BacktestResult
 from ..database.session import get_session
+from ..services.write_behind import write_behind
 from ..utils.auth_dependencies import require_admin
 from ..utils.monitoring import monitor
 
@@ -111,6 +112,20 @@ async def health_check(admin_id: int = Depends(require_admin)):
     }
 
 
+@router.get("/write-behind")
+async def get_write_behind_status(admin_id: int = Depends(require_admin)):
+    """
+    Write-behind 배치 저장 상태.
+
+    Returns:
+    - pending / pending_by_table: 대기 중인 기록 수
+    - oldest_pending_seconds: 가장 오래된 대기 기록의 지연
+    - dropped: 버퍼 초과로 버려진 기록 수
+    - flushes / failed_flushes / last_flush_ms
+    """
+    return write_behind.get_status()
+
+
 @router.post("/reset-stats")
 async def reset_monitoring_stats(admin_id: int = Depends(require_admin)):
     """
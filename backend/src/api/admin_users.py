@@ -9,7 +9,10 @@ from ..database.db import get_session
 from ..database.models import ApiKey, BotStatus, Trade, User
 from ..schemas.admin_schema import ApiKeyCreate, ApiKeyUpdate, UserCreate
 from ..utils.auth_dependencies import require_admin
+from ..utils.crypto_executor import auth_crypto
 from ..utils.crypto_secrets import decrypt_secret, encrypt_secret
+from ..utils.exceptions import ServiceBusyError
+from ..utils.jwt_auth import JWTAuth
 from ..utils.structured_logging import get_logger
 
 logger = logging.getLogger(__name__)
@@ -64,10 +67,6 @@ async def create_user(
     반환:
     - 생성된 사용자 정보 (비밀번호 제외)
     """
-    from passlib.context import CryptContext
-
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
     try:
         # 이메일 중복 확인
         existing = await session.execute(
@@ -79,7 +78,7 @@ async def create_user(
         # 사용자 생성
         new_user = User(
             email=payload.email,
-            password_hash=pwd_context.hash(payload.password),
+            password_hash=await JWTAuth.get_password_hash_async(payload.password),
             role=payload.role,
             is_active=True,
         )
@@ -111,7 +110,7 @@ async def create_user(
             },
         }
 
-    except HTTPException:
+    except (HTTPException, ServiceBusyError):
         raise
     except Exception as e:
         await session.rollback()
@@ -318,6 +317,31 @@ async def get_user_comprehensive_detail(
     }
 
 
+def _masked_api_key_rows(api_keys) -> list:
+    """API 키 목록 복호화 후 마스킹 (워커 스레드에서 실행)"""
+    return [
+        {
+            "id": key.id,
+            "user_id": key.user_id,
+            "exchange": "BITGET",  # 현재는 BITGET 지원
+            "api_key": mask_api_key(decrypt_secret(key.encrypted_api_key)),
+            "secret_key": mask_api_key(
+                decrypt_secret(key.encrypted_secret_key)
+                if key.encrypted_secret_key
+                else ""
+            ),
+            "passphrase": mask_api_key(
+                decrypt_secret(key.encrypted_passphrase)
+                if key.encrypted_passphrase
+                else ""
+            ),
+            "has_secret": bool(key.encrypted_secret_key),
+            "has_passphrase": bool(key.encrypted_passphrase),
+        }
+        for key in api_keys
+    ]
+
+
 @router.get("/{user_id}/api-keys")
 async def get_user_api_keys(
     user_id: int,
@@ -330,29 +354,8 @@ async def get_user_api_keys(
     result = await session.execute(select(ApiKey).where(ApiKey.user_id == user_id))
     api_keys = result.scalars().all()
 
-    return {
-        "api_keys": [
-            {
-                "id": key.id,
-                "user_id": key.user_id,
-                "exchange": "BITGET",  # 현재는 BITGET 지원
-                "api_key": mask_api_key(decrypt_secret(key.encrypted_api_key)),
-                "secret_key": mask_api_key(
-                    decrypt_secret(key.encrypted_secret_key)
-                    if key.encrypted_secret_key
-                    else ""
-                ),
-                "passphrase": mask_api_key(
-                    decrypt_secret(key.encrypted_passphrase)
-                    if key.encrypted_passphrase
-                    else ""
-                ),
-                "has_secret": bool(key.encrypted_secret_key),
-                "has_passphrase": bool(key.encrypted_passphrase),
-            }
-            for key in api_keys
-        ]
-    }
+    # 키 개수만큼 Fernet 복호화 -> 인증 워커 풀에서 일괄 처리
+    return {"api_keys": await auth_crypto.run(_masked_api_key_rows, api_keys)}
 
 
 @router.post("/{user_id}/api-keys")
@@ -704,10 +707,6 @@ async def reset_user_password(
     import secrets
     import string
 
-    from passlib.context import CryptContext
-
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
     try:
         # 사용자 확인
         result = await session.execute(select(User).where(User.id == user_id))
@@ -727,7 +726,7 @@ async def reset_user_password(
         new_password = "".join(secrets.choice(alphabet) for _ in range(12))
 
         # 비밀번호 해시화 저장
-        user.password_hash = pwd_context.hash(new_password)
+        user.password_hash = await JWTAuth.get_password_hash_async(new_password)
         await session.commit()
 
         structured_logger.warning(
@@ -747,7 +746,7 @@ async def reset_user_password(
             "notice": "사용자에게 새 비밀번호를 안전하게 전달하세요. 이 비밀번호는 다시 조회할 수 없습니다.",
         }
 
-    except HTTPException:
+    except (HTTPException, ServiceBusyError):
         raise
     except Exception as e:
         await session.rollback()
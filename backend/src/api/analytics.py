@@ -12,7 +12,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.db import get_session
-from ..database.models import Equity, Trade
+from ..database.models import Equity
+from ..services.performance_rollup import (
+    load_rollups,
+    load_trade_tail,
+    load_window_return,
+    refresh_dirty_rollups,
+    resolve_trade_details,
+    summarize_equity_risk,
+    summarize_trades,
+)
 from ..utils.jwt_auth import get_current_user_id
 from ..utils.structured_logging import get_logger
 
@@ -61,51 +70,33 @@ async def get_dashboard_summary(
         cutoff_1w = now - timedelta(days=7)
         cutoff_1m = now - timedelta(days=30)
 
-        # 모든 거래 데이터를 한번에 조회 (가장 큰 범위로)
-        result = await session.execute(
-            select(Trade)
-            .where(
-                Trade.user_id == user_id,
-                Trade.exit_price.isnot(None),
-                Trade.pnl.isnot(None),
-            )
-            .order_by(Trade.created_at.desc())
-        )
-        all_trades = result.scalars().all()
+        # 변경된 일자 롤업 반영 후 롤업 + 경계일 원본만 조회
+        await refresh_dirty_rollups(session, user_id)
+        rollups = await load_rollups(session, user_id)
 
-        # Equity 데이터도 한번에 조회
-        equity_result = await session.execute(
-            select(Equity)
-            .where(Equity.user_id == user_id)
-            .order_by(Equity.timestamp.asc())
-        )
-        all_equities = equity_result.scalars().all()
+        windows = {"1d": cutoff_1d, "1w": cutoff_1w, "1m": cutoff_1m}
+        summaries = {"all": summarize_trades(rollups)}
+        for period, cutoff in windows.items():
+            tail = await load_trade_tail(session, user_id, cutoff)
+            summaries[period] = summarize_trades(rollups, tail, cutoff)
+        await resolve_trade_details(session, summaries.values())
 
-        def calculate_performance(trades, equities, period):
-            """기간별 거래 성과 지표를 계산합니다.
+        returns = {"all": await load_window_return(session, user_id)}
+        for period, cutoff in windows.items():
+            returns[period] = await load_window_return(session, user_id, cutoff)
 
-            주어진 거래 목록과 자산 데이터를 분석하여 총 수익률, 손익,
-            승패 거래 수, 최고/최악 거래 등의 성과 지표를 계산합니다.
+        def calculate_performance(summary, total_return):
+            """기간별 거래 성과 지표를 구성합니다.
 
             Args:
-                trades: Trade 객체들의 리스트. 각 Trade는 pnl, pnl_percent,
-                    symbol 등의 속성을 가져야 합니다. 빈 리스트 허용.
-                equities: Equity 객체들의 리스트. 시간순으로 정렬된 자산 가치
-                    기록으로, 총 수익률 계산에 사용됩니다.
-                period: 기간 식별자 문자열 (예: "1d", "1w", "1m", "all").
-                    현재는 로깅/디버깅 목적으로만 사용됩니다.
+                summary: summarize_trades() 결과 (resolve_trade_details 적용)
+                total_return: 기간 내 자산 기록 기준 총 수익률 (%)
 
             Returns:
-                dict: 성과 지표를 담은 딕셔너리.
-                    - total_return (float): 총 수익률 (%)
-                    - total_pnl (float): 총 손익 금액
-                    - total_trades (int): 총 거래 수
-                    - winning_trades (int): 수익 거래 수
-                    - losing_trades (int): 손실 거래 수
-                    - best_trade (dict|None): 최고 수익 거래 정보
-                    - worst_trade (dict|None): 최악 손실 거래 정보
+                dict: total_return, total_pnl, total_trades, winning_trades,
+                    losing_trades, best_trade, worst_trade
             """
-            if not trades:
+            if not summary["total_trades"]:
                 return {
                     "total_return": 0.0,
                     "total_pnl": 0.0,
@@ -116,72 +107,28 @@ async def get_dashboard_summary(
                     "worst_trade": None,
                 }
 
-            total_pnl = sum(float(t.pnl) for t in trades if t.pnl is not None)
-            winning = [t for t in trades if t.pnl and t.pnl > 0]
-            losing = [t for t in trades if t.pnl and t.pnl < 0]
-
-            best_trade = None
-            worst_trade = None
-            valid_trades = [t for t in trades if t.pnl is not None]
-            if valid_trades:
-                best = max(valid_trades, key=lambda t: float(t.pnl))
-                worst = min(valid_trades, key=lambda t: float(t.pnl))
-                best_trade = {
-                    "symbol": best.symbol,
-                    "pnl": float(best.pnl) if best.pnl else 0.0,
-                    "pnl_percent": float(best.pnl_percent) if best.pnl_percent else 0.0,
-                }
-                worst_trade = {
-                    "symbol": worst.symbol,
-                    "pnl": float(worst.pnl) if worst.pnl else 0.0,
-                    "pnl_percent": float(worst.pnl_percent)
-                    if worst.pnl_percent
-                    else 0.0,
-                }
-
-            # 수익률 계산
-            total_return = 0.0
-            if equities and len(equities) > 1:
-                try:
-                    initial = float(equities[0].value) if equities[0].value else 0
-                    final = float(equities[-1].value) if equities[-1].value else 0
-                    if initial > 0:
-                        total_return = ((final - initial) / initial) * 100
-                except Exception:
-                    pass
-
             return {
                 "total_return": round(total_return, 2),
-                "total_pnl": round(total_pnl, 2),
-                "total_trades": len(trades),
-                "winning_trades": len(winning),
-                "losing_trades": len(losing),
-                "best_trade": best_trade,
-                "worst_trade": worst_trade,
+                "total_pnl": round(summary["total_pnl"], 2),
+                "total_trades": summary["total_trades"],
+                "winning_trades": summary["winning_trades"],
+                "losing_trades": summary["losing_trades"],
+                "best_trade": summary["best_trade"],
+                "worst_trade": summary["worst_trade"],
             }
 
-        def calculate_risk_metrics(trades, equities):
+        def calculate_risk_metrics(summary):
             """거래 리스크 지표를 계산합니다.
 
-            거래 내역과 자산 곡선 데이터를 분석하여 최대 낙폭(MDD),
-            샤프 비율, 승률, 손익비, 일일 변동성 등의 리스크 지표를 계산합니다.
-
-            Args:
-                trades: Trade 객체들의 리스트. 각 Trade는 pnl 속성을 가져야
-                    합니다. 승률과 손익비 계산에 사용됩니다.
-                equities: Equity 객체들의 리스트. 시간순으로 정렬된 자산 가치
-                    기록으로, MDD, 변동성, 샤프 비율 계산에 사용됩니다.
+            승률/손익비는 거래 집계에서, 최대 낙폭(MDD)/변동성/샤프 비율은
+            일간 롤업의 자산 곡선 집계에서 계산합니다.
 
             Returns:
-                dict: 리스크 지표를 담은 딕셔너리.
-                    - max_drawdown (float): 최대 낙폭 (%, 음수)
-                    - sharpe_ratio (float): 샤프 비율 (평균 수익률/변동성)
-                    - win_rate (float): 승률 (%)
-                    - profit_loss_ratio (float): 평균 손익비 (평균 수익/평균 손실)
-                    - daily_volatility (float): 일일 변동성 (%, 표준편차)
-                    - total_trades (int): 총 거래 수
+                dict: max_drawdown, sharpe_ratio, win_rate, profit_loss_ratio,
+                    daily_volatility, total_trades
             """
-            if not trades:
+            total = summary["total_trades"]
+            if not total:
                 return {
                     "max_drawdown": 0.0,
                     "sharpe_ratio": 0.0,
@@ -191,83 +138,32 @@ async def get_dashboard_summary(
                     "total_trades": 0,
                 }
 
-            winning = [t for t in trades if t.pnl and t.pnl > 0]
-            losing = [t for t in trades if t.pnl and t.pnl < 0]
-            total = len(trades)
+            wins = summary["winning_trades"]
+            losses = summary["losing_trades"]
+            win_rate = (wins / total) * 100
 
-            win_rate = (len(winning) / total) * 100 if total > 0 else 0
-
-            avg_win = (
-                sum(float(t.pnl) for t in winning) / len(winning) if winning else 0
-            )
-            avg_loss = (
-                abs(sum(float(t.pnl) for t in losing) / len(losing)) if losing else 1
-            )
+            avg_win = summary["gross_profit"] / wins if wins else 0
+            avg_loss = abs(summary["gross_loss"] / losses) if losses else 1
             profit_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0
 
-            max_drawdown = 0.0
-            daily_volatility = 0.0
-            sharpe_ratio = 0.0
-
-            if equities and len(equities) > 1:
-                try:
-                    peak = float(equities[0].value) if equities[0].value else 0
-                    for eq in equities:
-                        if eq.value is None:
-                            continue
-                        val = float(eq.value)
-                        if val > peak:
-                            peak = val
-                        if peak > 0:
-                            dd = ((val - peak) / peak) * 100
-                            if dd < max_drawdown:
-                                max_drawdown = dd
-
-                    returns = []
-                    for i in range(1, len(equities)):
-                        if equities[i].value and equities[i - 1].value:
-                            prev = float(equities[i - 1].value)
-                            curr = float(equities[i].value)
-                            if prev > 0:
-                                returns.append(((curr - prev) / prev) * 100)
-
-                    if returns and len(returns) > 1:
-                        mean_ret = sum(returns) / len(returns)
-                        variance = sum((r - mean_ret) ** 2 for r in returns) / len(
-                            returns
-                        )
-                        daily_volatility = variance**0.5
-                        sharpe_ratio = (
-                            mean_ret / daily_volatility if daily_volatility > 0 else 0
-                        )
-                except Exception:
-                    pass
+            equity_risk = summarize_equity_risk(rollups)
 
             return {
-                "max_drawdown": round(max_drawdown, 2),
-                "sharpe_ratio": round(sharpe_ratio, 2),
+                "max_drawdown": round(equity_risk["max_drawdown"], 2),
+                "sharpe_ratio": round(equity_risk["sharpe_ratio"], 2),
                 "win_rate": round(win_rate, 2),
                 "profit_loss_ratio": round(profit_loss_ratio, 2),
-                "daily_volatility": round(daily_volatility, 2),
+                "daily_volatility": round(equity_risk["daily_volatility"], 2),
                 "total_trades": total,
             }
 
-        # 기간별 거래 필터링
-        trades_1d = [t for t in all_trades if t.created_at >= cutoff_1d]
-        trades_1w = [t for t in all_trades if t.created_at >= cutoff_1w]
-        trades_1m = [t for t in all_trades if t.created_at >= cutoff_1m]
-
-        # Equity 필터링
-        eq_1d = [e for e in all_equities if e.timestamp >= cutoff_1d]
-        eq_1w = [e for e in all_equities if e.timestamp >= cutoff_1w]
-        eq_1m = [e for e in all_equities if e.timestamp >= cutoff_1m]
-
+        total_trades = summaries["all"]["total_trades"]
         response = {
-            "risk_metrics": calculate_risk_metrics(all_trades, all_equities),
-            "performance_all": calculate_performance(all_trades, all_equities, "all"),
-            "performance_daily": calculate_performance(trades_1d, eq_1d, "1d"),
-            "performance_weekly": calculate_performance(trades_1w, eq_1w, "1w"),
-            "performance_monthly": calculate_performance(trades_1m, eq_1m, "1m"),
+            "risk_metrics": calculate_risk_metrics(summaries["all"]),
+            "performance_all": calculate_performance(summaries["all"], returns["all"]),
+            "performance_daily": calculate_performance(summaries["1d"], returns["1d"]),
+            "performance_weekly": calculate_performance(summaries["1w"], returns["1w"]),
+            "performance_monthly": calculate_performance(summaries["1m"], returns["1m"]),
             "cached_at": datetime.utcnow().isoformat(),
         }
 
@@ -277,9 +173,9 @@ async def get_dashboard_summary(
 
         structured_logger.info(
             "dashboard_summary_calculated",
-            f"Dashboard summary calculated: {len(all_trades)} total trades",
+            f"Dashboard summary calculated: {total_trades} total trades",
             user_id=user_id,
-            total_trades=len(all_trades),
+            total_trades=total_trades,
         )
 
         return response
@@ -485,17 +381,13 @@ async def get_risk_metrics(
             "Risk metrics calculation requested",
             user_id=user_id,
         )
-        # 거래 통계 조회 (청산 완료된 거래만)
-        result = await session.execute(
-            select(Trade).where(
-                Trade.user_id == user_id,
-                Trade.exit_price.isnot(None),  # 청산된 거래만
-                Trade.pnl.isnot(None),  # PnL이 계산된 거래만
-            )
-        )
-        trades = result.scalars().all()
+        # 거래 통계 조회 (일간 롤업 - 청산 완료된 거래만)
+        await refresh_dirty_rollups(session, user_id)
+        rollups = await load_rollups(session, user_id)
+        summary = summarize_trades(rollups)
 
-        if not trades:
+        total_trades = summary["total_trades"]
+        if not total_trades:
             return {
                 "max_drawdown": 0.0,
                 "sharpe_ratio": 0.0,
@@ -505,100 +397,22 @@ async def get_risk_metrics(
                 "total_trades": 0,
             }
 
-        # 승리/패배 거래 분리 (Null 체크 강화)
-        winning_trades = [t for t in trades if t.pnl is not None and t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl is not None and t.pnl < 0]
-
-        total_trades = len(trades)
+        winning_count = summary["winning_trades"]
+        losing_count = summary["losing_trades"]
 
         # 승률 계산
-        win_rate = (len(winning_trades) / total_trades) * 100 if total_trades > 0 else 0
+        win_rate = (winning_count / total_trades) * 100
 
         # 평균 손익비 계산 (ZeroDivisionError 방지)
-        avg_win = 0.0
-        if winning_trades:
-            try:
-                avg_win = sum(float(t.pnl) for t in winning_trades) / len(
-                    winning_trades
-                )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error calculating avg_win: {e}")
-                avg_win = 0.0
-
-        avg_loss = 1.0  # 기본값 (나누기 0 방지)
-        if losing_trades:
-            try:
-                avg_loss = abs(
-                    sum(float(t.pnl) for t in losing_trades) / len(losing_trades)
-                )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error calculating avg_loss: {e}")
-                avg_loss = 1.0
-
+        avg_win = summary["gross_profit"] / winning_count if winning_count else 0.0
+        avg_loss = abs(summary["gross_loss"] / losing_count) if losing_count else 1.0
         profit_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0.0
 
-        # Equity 데이터로 MDD 및 변동성 계산
-        equity_result = await session.execute(
-            select(Equity)
-            .where(Equity.user_id == user_id)
-            .order_by(Equity.timestamp.asc())
-        )
-        equities = equity_result.scalars().all()
-
-        max_drawdown = 0.0
-        daily_volatility = 0.0
-        sharpe_ratio = 0.0
-
-        if equities and len(equities) > 1:
-            try:
-                # MDD 계산 (Null 체크 강화)
-                peak = (
-                    float(equities[0].value) if equities[0].value is not None else 0.0
-                )
-                for equity in equities:
-                    if equity.value is None:
-                        continue
-
-                    equity_val = float(equity.value)
-                    if equity_val > peak:
-                        peak = equity_val
-
-                    if peak > 0:
-                        drawdown = ((equity_val - peak) / peak) * 100
-                        if drawdown < max_drawdown:
-                            max_drawdown = drawdown
-
-                # 일일 수익률 계산 (Null 및 0 체크)
-                returns = []
-                for i in range(1, len(equities)):
-                    if equities[i].value is None or equities[i - 1].value is None:
-                        continue
-
-                    prev_equity = float(equities[i - 1].value)
-                    curr_equity = float(equities[i].value)
-
-                    if prev_equity > 0:
-                        daily_return = ((curr_equity - prev_equity) / prev_equity) * 100
-                        returns.append(daily_return)
-
-                # 변동성 (표준편차)
-                if returns and len(returns) > 1:
-                    mean_return = sum(returns) / len(returns)
-                    variance = sum((r - mean_return) ** 2 for r in returns) / len(
-                        returns
-                    )
-                    daily_volatility = variance**0.5
-
-                    # 샤프 비율 (간단 계산: 평균 수익률 / 변동성)
-                    sharpe_ratio = (
-                        mean_return / daily_volatility if daily_volatility > 0 else 0.0
-                    )
-
-            except (ValueError, TypeError, ZeroDivisionError) as e:
-                logger.warning(f"Error calculating MDD/volatility: {e}")
-                max_drawdown = 0.0
-                daily_volatility = 0.0
-                sharpe_ratio = 0.0
+        # 롤업의 자산 곡선 집계로 MDD 및 변동성 계산
+        equity_risk = summarize_equity_risk(rollups)
+        max_drawdown = equity_risk["max_drawdown"]
+        daily_volatility = equity_risk["daily_volatility"]
+        sharpe_ratio = equity_risk["sharpe_ratio"]
 
         response = {
             "max_drawdown": round(max_drawdown, 2),
@@ -781,18 +595,14 @@ async def get_performance_metrics(
         days = period_map[period]
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        # 거래 조회 (청산 완료된 거래만)
-        result = await session.execute(
-            select(Trade).where(
-                Trade.user_id == user_id,
-                Trade.created_at >= cutoff_date,
-                Trade.exit_price.isnot(None),  # 청산된 거래만
-                Trade.pnl.isnot(None),  # PnL이 계산된 거래만
-            )
-        )
-        trades = result.scalars().all()
+        # 거래 조회 (롤업 + 경계일 원본, 청산 완료된 거래만)
+        await refresh_dirty_rollups(session, user_id)
+        rollups = await load_rollups(session, user_id, since_day=cutoff_date.date())
+        tail = await load_trade_tail(session, user_id, cutoff_date)
+        summary = summarize_trades(rollups, tail, cutoff_date)
+        total_pnl = summary["total_pnl"]
 
-        if not trades:
+        if not summary["total_trades"]:
             response = {
                 "period": period,
                 "total_return": 0.0,
@@ -807,83 +617,21 @@ async def get_performance_metrics(
             await cache_manager.set(cache_key, response, ttl=60)
             return response
 
-        # 통계 계산 (Null 체크 강화)
-        total_pnl = 0.0
-        try:
-            total_pnl = sum(float(t.pnl) for t in trades if t.pnl is not None)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Error calculating total_pnl: {e}")
-            total_pnl = 0.0
-
-        winning_trades = [t for t in trades if t.pnl is not None and t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl is not None and t.pnl < 0]
-
-        # 최고/최악 거래 (안전한 계산)
-        best_trade = None
-        worst_trade = None
-        try:
-            valid_pnl_trades = [t for t in trades if t.pnl is not None]
-            if valid_pnl_trades:
-                best_trade = max(valid_pnl_trades, key=lambda t: float(t.pnl))
-                worst_trade = min(valid_pnl_trades, key=lambda t: float(t.pnl))
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Error finding best/worst trades: {e}")
-
-        # Equity로 총 수익률 계산 (Null 및 0 체크)
-        equity_result = await session.execute(
-            select(Equity)
-            .where(
-                Equity.user_id == user_id,
-                Equity.timestamp >= cutoff_date,
-            )
-            .order_by(Equity.timestamp.asc())
-        )
-        equities = equity_result.scalars().all()
+        # 최고/최악 거래 상세 (한 번의 조회)
+        await resolve_trade_details(session, [summary])
 
-        total_return = 0.0
-        if equities and len(equities) > 1:
-            try:
-                initial_equity = equities[0].value
-                final_equity = equities[-1].value
-
-                if (
-                    initial_equity is not None
-                    and final_equity is not None
-                    and initial_equity > 0
-                ):
-                    total_return = (
-                        (float(final_equity) - float(initial_equity))
-                        / float(initial_equity)
-                    ) * 100
-            except (ValueError, TypeError, ZeroDivisionError) as e:
-                logger.warning(f"Error calculating total_return: {e}")
-                total_return = 0.0
+        # Equity로 총 수익률 계산 (기간 내 첫/마지막 기록)
+        total_return = await load_window_return(session, user_id, cutoff_date)
 
         response = {
             "period": period,
             "total_return": round(total_return, 2),
             "total_pnl": round(total_pnl, 2),
-            "total_trades": len(trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "best_trade": {
-                "symbol": best_trade.symbol,
-                "pnl": float(best_trade.pnl) if best_trade.pnl is not None else 0.0,
-                "pnl_percent": float(best_trade.pnl_percent)
-                if best_trade.pnl_percent is not None
-                else 0.0,
-            }
-            if best_trade
-            else None,
-            "worst_trade": {
-                "symbol": worst_trade.symbol,
-                "pnl": float(worst_trade.pnl) if worst_trade.pnl is not None else 0.0,
-                "pnl_percent": float(worst_trade.pnl_percent)
-                if worst_trade.pnl_percent is not None
-                else 0.0,
-            }
-            if worst_trade
-            else None,
+            "total_trades": summary["total_trades"],
+            "winning_trades": summary["winning_trades"],
+            "losing_trades": summary["losing_trades"],
+            "best_trade": summary["best_trade"],
+            "worst_trade": summary["worst_trade"],
         }
 
         # 캐시에 저장 (60초 TTL)
@@ -892,10 +640,10 @@ async def get_performance_metrics(
 
         structured_logger.info(
             "performance_metrics_calculated",
-            f"Performance metrics calculated: {len(trades)} trades",
+            f"Performance metrics calculated: {summary['total_trades']} trades",
             user_id=user_id,
             period=period,
-            total_trades=len(trades),
+            total_trades=summary["total_trades"],
             total_pnl=round(total_pnl, 2),
         )
 
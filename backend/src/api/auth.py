@@ -14,7 +14,7 @@ from ..schemas.auth_schema import (
 )
 from ..utils.auth_cookies import REFRESH_COOKIE, clear_auth_cookies, set_auth_cookies
 from ..utils.auth_dependencies import require_admin
-from ..utils.exceptions import AuthenticationError, DuplicateResourceError
+from ..utils.exceptions import AuthenticationError, DuplicateResourceError, ServiceBusyError
 from ..utils.jwt_auth import JWTAuth, get_current_user_id
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -41,7 +41,7 @@ async def register(
         raise DuplicateResourceError("User", "email", payload.email)
 
     # 비밀번호 해싱
-    hashed_password = JWTAuth.get_password_hash(payload.password)
+    hashed_password = await JWTAuth.get_password_hash_async(payload.password)
 
     user = User(
         email=payload.email,
@@ -115,7 +115,7 @@ async def login(
         )
 
     # 비밀번호 검증
-    if not user.password_hash or not JWTAuth.verify_password(
+    if not user.password_hash or not await JWTAuth.verify_password_async(
         payload.password, user.password_hash
     ):
         # 🔒 Step 2: 실패 기록 및 잠금 처리
@@ -214,7 +214,7 @@ async def change_password(
             raise AuthenticationError("사용자를 찾을 수 없습니다")
 
         # 현재 비밀번호 확인
-        if not JWTAuth.verify_password(payload.current_password, user.password_hash):
+        if not await JWTAuth.verify_password_async(payload.current_password, user.password_hash):
             raise AuthenticationError("현재 비밀번호가 일치하지 않습니다")
 
         # 새 비밀번호와 현재 비밀번호가 같은지 확인
@@ -222,12 +222,12 @@ async def change_password(
             raise AuthenticationError("새 비밀번호는 현재 비밀번호와 달라야 합니다")
 
         # 새 비밀번호 해시 및 저장
-        user.password_hash = JWTAuth.get_password_hash(payload.new_password)
+        user.password_hash = await JWTAuth.get_password_hash_async(payload.new_password)
         await session.commit()
 
         return {"message": "비밀번호가 성공적으로 변경되었습니다"}
 
-    except AuthenticationError:
+    except (AuthenticationError, ServiceBusyError):
         raise
     except Exception as e:
         await session.rollback()
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.db import get_session
 from ..database.models import Position, Trade
-from ..services.candle_generator import get_candle_generator
+from ..services.candle_aggregator import candle_aggregator
 from ..utils.jwt_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -46,14 +46,12 @@ async def get_candles(
     try:
         candles = []
 
-        # Only use candle generator for 1m timeframe (real-time updates)
-        if timeframe == "1m":
-            candle_gen = get_candle_generator()
-            candles = candle_gen.get_all_candles(
-                symbol=symbol.upper(), limit=limit, include_current=include_current
-            )
+        # Live candles shared with bots/chart service (any subscribed timeframe)
+        candles = candle_aggregator.get_candles(
+            symbol=symbol.upper(), timeframe=timeframe, limit=limit, include_current=include_current
+        )
 
-        # If no candles from generator or different timeframe, fetch from Bitget API
+        # If the timeframe is not tracked live (or still warming up), fetch from Bitget API
         if not candles or len(candles) < min(50, limit):
             logger.info(f"Fetching {timeframe} candles from Bitget API for {symbol}")
             import ccxt.async_support as ccxt
@@ -165,7 +163,20 @@ async def get_position_markers(
 
         # Query closed trades
         result = await session.execute(
-            select(Trade)
+            select(
+                Trade.id,
+                Trade.created_at,
+                Trade.side,
+                Trade.qty,
+                Trade.entry_price,
+                Trade.exit_price,
+                Trade.pnl,
+                Trade.pnl_percent,
+                Trade.exit_reason,
+                Trade.enter_tag,
+                Trade.exit_tag,
+                Trade.order_tag,
+            )
             .where(
                 and_(
                     Trade.user_id == user_id,
@@ -176,7 +187,7 @@ async def get_position_markers(
             )
             .order_by(Trade.created_at.asc())
         )
-        trades = result.scalars().all()
+        trades = result.all()
 
         # Convert trades to position markers
         markers = []
@@ -297,15 +308,14 @@ async def get_chart_status(
     Get chart data service status
 
     Returns:
-        Service status including candle generator statistics
+        Service status including candle aggregator statistics
     """
     try:
-        candle_gen = get_candle_generator()
-        status = candle_gen.get_status()
+        status = candle_aggregator.get_status()
 
         return {
             "status": "operational",
-            "candle_generator": status,
+            "candle_aggregator": status,
             "timestamp": int(datetime.utcnow().timestamp()),
         }
 
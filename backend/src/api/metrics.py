@@ -0,0 +1,18 @@
+"""
+Prometheus 메트릭 엔드포인트
+
+monitoring/prometheus.yml 이 backend:8000/metrics 를 스크레이프합니다.
+메트릭 정의와 계측 지점은 utils/metrics.py 참고.
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ..utils.metrics import CONTENT_TYPE_LATEST, render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition format (0.0.4)"""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
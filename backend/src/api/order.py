@@ -168,13 +168,22 @@ async def order_history(
 
     # 거래 내역 조회 (페이지네이션)
     result = await session.execute(
-        select(Trade)
+        select(
+            Trade.id,
+            Trade.symbol,
+            Trade.side,
+            Trade.qty,
+            Trade.entry_price,
+            Trade.exit_price,
+            Trade.pnl_percent,
+            Trade.created_at,
+        )
         .where(Trade.user_id == user_id)
-        .order_by(Trade.created_at.desc())
+        .order_by(Trade.created_at.desc(), Trade.id.desc())
         .limit(limit)
         .offset(offset)
     )
-    trades = result.scalars().all()
+    trades = result.all()
 
     return {
         "trades": [
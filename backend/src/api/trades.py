@@ -1,22 +1,122 @@
 """
 거래 포지션 API
+
+거래 내역은 필요한 컬럼만 Core select로 조회하고
+(created_at, id) 커서로 페이지네이션합니다 (OFFSET 없음).
 """
 
+from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import desc, select
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.db import get_session
+from ..config import PaginationConfig
+from ..database.db import AsyncSessionLocal, get_session
 from ..database.models import Trade
 from ..utils.jwt_auth import get_current_user_id
+from ..utils.pagination import apply_keyset, paginate_rows, stream_csv, stream_ndjson
 
 router = APIRouter(prefix="/trades", tags=["trades"])
 
+# 내보내기/히스토리 컬럼 순서 (CSV 헤더)
+EXPORT_FIELDS = [
+    "id",
+    "created_at",
+    "symbol",
+    "side",
+    "qty",
+    "entry_price",
+    "exit_price",
+    "pnl",
+    "pnl_percent",
+    "leverage",
+    "exit_reason",
+    "enter_tag",
+    "exit_tag",
+    "bot_instance_id",
+]
+
+
+# ============================================================
+# 쿼리 빌더 (ORM 엔티티 대신 필요한 컬럼만)
+# ============================================================
+
+
+def _marker_query(user_id: int):
+    return select(
+        Trade.id,
+        Trade.created_at,
+        Trade.symbol,
+        Trade.side,
+        Trade.qty,
+        Trade.entry_price,
+        Trade.exit_price,
+        Trade.pnl,
+        Trade.pnl_percent,
+    ).where(Trade.user_id == user_id)
+
+
+def _history_query(
+    user_id: int,
+    symbol: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    query = select(
+        Trade.id,
+        Trade.created_at,
+        Trade.symbol,
+        Trade.side,
+        Trade.qty,
+        Trade.entry_price,
+        Trade.exit_price,
+        Trade.pnl,
+        Trade.pnl_percent,
+        Trade.leverage,
+        Trade.exit_reason,
+        Trade.enter_tag,
+        Trade.exit_tag,
+        Trade.bot_instance_id,
+    ).where(Trade.user_id == user_id)
+    if symbol:
+        query = query.where(Trade.symbol == symbol.upper())
+    if start:
+        query = query.where(Trade.created_at >= start)
+    if end:
+        query = query.where(Trade.created_at < end)
+    return query
+
+
+def _row_key(row):
+    return row.created_at, row.id
+
+
+def _serialize_history(row) -> dict:
+    return {
+        "id": row.id,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "symbol": row.symbol,
+        "side": row.side,
+        "qty": float(row.qty) if row.qty is not None else None,
+        "entry_price": float(row.entry_price) if row.entry_price is not None else None,
+        "exit_price": float(row.exit_price) if row.exit_price is not None else None,
+        "pnl": float(row.pnl) if row.pnl is not None else None,
+        "pnl_percent": row.pnl_percent,
+        "leverage": row.leverage,
+        "exit_reason": row.exit_reason.value if row.exit_reason else None,
+        "enter_tag": row.enter_tag,
+        "exit_tag": row.exit_tag,
+        "bot_instance_id": row.bot_instance_id,
+    }
+
 
 @router.get("/positions")
 async def get_trade_positions(
-    limit: int = 100,
+    limit: int = Query(default=100, ge=1, le=PaginationConfig.TRADES_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     session: AsyncSession = Depends(get_session),
     user_id: int = Depends(get_current_user_id),
 ):
@@ -24,15 +124,11 @@ async def get_trade_positions(
     거래 포지션 목록 조회 (차트 마커용)
 
     Returns:
-        롱/숏 진입 및 청산 포지션 목록
+        롱/숏 진입 및 청산 포지션 목록, next_cursor
     """
-    result = await session.execute(
-        select(Trade)
-        .where(Trade.user_id == user_id)
-        .order_by(desc(Trade.created_at))
-        .limit(limit)
-    )
-    trades_list = result.scalars().all()
+    query = apply_keyset(_marker_query(user_id), Trade.created_at, Trade.id, cursor)
+    result = await session.execute(query.limit(limit + 1))
+    trades_list, next_cursor = paginate_rows(result.all(), limit, _row_key)
 
     positions = []
 
@@ -74,23 +170,20 @@ async def get_trade_positions(
                 }
             )
 
-    return {"positions": positions}
+    return {"positions": positions, "next_cursor": next_cursor}
 
 
 @router.get("/recent-trades")
 async def get_recent_trades(
-    limit: int = 50,
+    limit: int = Query(default=50, ge=1, le=PaginationConfig.TRADES_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     session: AsyncSession = Depends(get_session),
     user_id: int = Depends(get_current_user_id),
 ):
     """최근 거래 내역 (간단한 형식)"""
-    result = await session.execute(
-        select(Trade)
-        .where(Trade.user_id == user_id)
-        .order_by(desc(Trade.created_at))
-        .limit(limit)
-    )
-    trades_list = result.scalars().all()
+    query = apply_keyset(_marker_query(user_id), Trade.created_at, Trade.id, cursor)
+    result = await session.execute(query.limit(limit + 1))
+    trades_list, next_cursor = paginate_rows(result.all(), limit, _row_key)
 
     trades = []
     for trade in trades_list:
@@ -109,4 +202,66 @@ async def get_recent_trades(
             }
         )
 
-    return {"trades": trades}
+    return {"trades": trades, "next_cursor": next_cursor}
+
+
+@router.get("/history")
+async def get_trade_history(
+    limit: int = Query(
+        default=PaginationConfig.TRADES_DEFAULT_LIMIT,
+        ge=1,
+        le=PaginationConfig.TRADES_MAX_LIMIT,
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTCUSDT)"),
+    start: Optional[datetime] = Query(None, description="Start time (inclusive, UTC)"),
+    end: Optional[datetime] = Query(None, description="End time (exclusive, UTC)"),
+    session: AsyncSession = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    거래 내역 조회 (최신순, (created_at, id) 커서 페이지네이션)
+
+    페이지 깊이와 무관하게 인덱스 범위 스캔 한 번으로 조회합니다.
+    """
+    query = apply_keyset(
+        _history_query(user_id, symbol, start, end), Trade.created_at, Trade.id, cursor
+    )
+    result = await session.execute(query.limit(limit + 1))
+    rows, next_cursor = paginate_rows(result.all(), limit, _row_key)
+
+    return {
+        "trades": [_serialize_history(row) for row in rows],
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/export")
+async def export_trades(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="csv or ndjson"),
+    symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTCUSDT)"),
+    start: Optional[datetime] = Query(None, description="Start time (inclusive, UTC)"),
+    end: Optional[datetime] = Query(None, description="End time (exclusive, UTC)"),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    거래 내역 스트리밍 내보내기 (CSV / NDJSON)
+
+    서버 사이드 커서로 배치 단위 전송 (거래 수와 무관하게 메모리 사용량 일정).
+    """
+    query = _history_query(user_id, symbol, start, end)
+    query = query.order_by(Trade.created_at.desc(), Trade.id.desc())
+
+    if format == "ndjson":
+        body = stream_ndjson(AsyncSessionLocal, query, _serialize_history)
+        media_type = "application/x-ndjson"
+    else:
+        body = stream_csv(AsyncSessionLocal, query, _serialize_history, EXPORT_FIELDS)
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="trades.{format}"'},
+    )
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..database.db import get_session
 from ..database.models import User
 from ..services.totp_service import totp_service
+from ..utils.crypto_executor import auth_crypto
 from ..utils.jwt_auth import get_current_user_id
 
 router = APIRouter(prefix="/auth/2fa", tags=["2fa"])
@@ -103,7 +104,8 @@ async def setup_2fa(
         )
 
     # 2FA 설정 생성
-    secret, encrypted_secret, qr_code = totp_service.setup_2fa(user.email)
+    # QR 이미지 생성은 CPU 작업 -> 인증 워커 풀
+    secret, encrypted_secret, qr_code = await auth_crypto.run(totp_service.setup_2fa, user.email)
     backup_codes = totp_service.generate_backup_codes()
 
     # 시크릿을 임시로 저장 (나중에 verify에서 활성화)
@@ -207,7 +209,7 @@ async def disable_2fa(
         )
 
     # 비밀번호 확인
-    if not JWTAuth.verify_password(payload.password, user.password_hash):
+    if not await JWTAuth.verify_password_async(payload.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="비밀번호가 올바르지 않습니다",
@@ -11,7 +11,7 @@
 """
 
 import logging
-from typing import List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
@@ -80,6 +80,36 @@ class GridBacktestResponse(BaseModel):
     data_source: str = "cache"
 
 
+class GridSweepRequest(BaseModel):
+    """그리드 파라미터 스윕 요청 (모든 조합 평가)"""
+
+    symbol: str = Field(..., description="거래쌍 (예: BTCUSDT)", example="BTCUSDT")
+    timeframe: str = Field(default="1h", description="타임프레임", example="1h")
+    direction: str = Field(
+        default="long", description="방향 (long/short)", example="long"
+    )
+    lower_prices: List[float] = Field(
+        ..., min_length=1, max_length=50, description="하단 가격 후보"
+    )
+    upper_prices: List[float] = Field(
+        ..., min_length=1, max_length=50, description="상단 가격 후보"
+    )
+    grid_counts: List[int] = Field(
+        default=[10], min_length=1, max_length=50, description="그리드 개수 후보"
+    )
+    grid_modes: List[Literal["arithmetic", "geometric"]] = Field(
+        default=["arithmetic"], min_length=1, description="그리드 모드 후보"
+    )
+    investment: float = Field(
+        default=1000, gt=0, description="투자금액 (USDT)", example=1000
+    )
+    leverage: int = Field(default=5, ge=1, le=125, description="레버리지", example=5)
+    days: int = Field(
+        default=30, ge=1, le=365, description="백테스트 기간 (일)", example=30
+    )
+    top_n: int = Field(default=10, ge=1, le=100, description="반환할 상위 결과 수")
+
+
 class AvailableDataResponse(BaseModel):
     """사용 가능한 데이터 응답"""
 
@@ -209,6 +239,65 @@ async def run_grid_backtest(
         raise HTTPException(status_code=500, detail=f"백테스트 실행 중 오류: {str(e)}") from e
 
 
+@router.post("/grid/sweep")
+async def run_grid_sweep(
+    request: GridSweepRequest,
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    그리드 파라미터 스윕
+
+    lower_prices × upper_prices × grid_counts × grid_modes 전체 조합을
+    벡터화 시뮬레이터로 한 번에 평가하고 ROI 상위 결과를 반환합니다.
+
+    Returns:
+        평가한 조합 수와 ROI 기준 상위 top_n 결과
+    """
+    if any(n < 2 or n > 200 for n in request.grid_counts):
+        raise HTTPException(status_code=400, detail="grid_count는 2-200 범위여야 합니다")
+
+    logger.info(
+        f"User {user_id} running grid sweep: {request.symbol} {request.timeframe}"
+    )
+
+    direction = (
+        PositionDirection.LONG
+        if request.direction.lower() == "long"
+        else PositionDirection.SHORT
+    )
+    grid_modes = [
+        GridMode.ARITHMETIC if mode == "arithmetic" else GridMode.GEOMETRIC
+        for mode in dict.fromkeys(request.grid_modes)
+    ]
+
+    service = get_cache_backtest_service()
+
+    try:
+        return await service.run_grid_sweep(
+            symbol=request.symbol,
+            timeframe=request.timeframe,
+            direction=direction,
+            lower_prices=request.lower_prices,
+            upper_prices=request.upper_prices,
+            grid_counts=request.grid_counts,
+            grid_modes=grid_modes,
+            investment=request.investment,
+            leverage=request.leverage,
+            days=request.days,
+            top_n=request.top_n,
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=f"데이터 없음: {request.symbol} {request.timeframe}",
+        ) from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Grid sweep error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"스윕 실행 중 오류: {str(e)}") from e
+
+
 @router.get("/quick")
 async def quick_backtest(
     symbol: str = Query("BTCUSDT", description="거래쌍"),
@@ -248,11 +337,16 @@ async def quick_backtest(
 @router.get("/recommended-settings")
 async def get_recommended_settings(
     symbol: str = Query("BTCUSDT", description="거래쌍"),
+    optimize: bool = Query(
+        False, description="추천 범위 주변 파라미터 스윕으로 최적 설정 탐색"
+    ),
 ):
     """
     추천 그리드 설정 조회
 
     현재 시장 상황을 기반으로 추천 설정을 반환합니다.
+    optimize=true이면 추천 범위 주변 조합을 최근 30일 1h 데이터로
+    백테스트해 상위 설정을 함께 반환합니다.
     """
     service = get_cache_backtest_service()
 
@@ -285,6 +379,34 @@ async def get_recommended_settings(
         else:
             recommended_grids = 10
 
+        recommended_direction = (
+            "long" if current_price < (high_7d + low_7d) / 2 else "neutral"
+        )
+        recommended_leverage = 3 if volatility > 15 else 5
+
+        optimized = None
+        if optimize:
+            # 추천 범위를 ±5%, ±10% 확장/축소한 후보 × 그리드 개수 × 모드
+            scales = (-0.10, -0.05, 0.0, 0.05, 0.10)
+            sweep = await service.run_grid_sweep(
+                symbol=symbol,
+                timeframe="1h",
+                direction=PositionDirection.LONG,
+                lower_prices=[round(recommended_lower - price_range * scale, 2) for scale in scales],
+                upper_prices=[round(recommended_upper + price_range * scale, 2) for scale in scales],
+                grid_counts=[5, 10, 15, 20, 30, 50],
+                grid_modes=[GridMode.ARITHMETIC, GridMode.GEOMETRIC],
+                investment=1000,
+                leverage=recommended_leverage,
+                days=30,
+                top_n=5,
+            )
+            optimized = {
+                "evaluated": sweep["evaluated"],
+                "backtest_days": sweep["backtest_days"],
+                "top": sweep["results"],
+            }
+
         return {
             "symbol": symbol,
             "current_price": round(current_price, 2),
@@ -295,14 +417,15 @@ async def get_recommended_settings(
                 "lower_price": round(recommended_lower, 2),
                 "upper_price": round(recommended_upper, 2),
                 "grid_count": recommended_grids,
-                "direction": "long"
-                if current_price < (high_7d + low_7d) / 2
-                else "neutral",
-                "leverage": 3 if volatility > 15 else 5,
+                "direction": recommended_direction,
+                "leverage": recommended_leverage,
             },
+            "optimized": optimized,
             "note": "이 추천은 최근 7일 데이터를 기반으로 합니다. 시장 상황에 따라 조정이 필요할 수 있습니다.",
         }
 
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 없음: {symbol}") from e
     except Exception as e:
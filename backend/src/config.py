@@ -91,6 +91,20 @@ class BacktestConfig:
     MAX_INITIAL_BALANCE = 1000000.0
 
 
+class SchedulerConfig:
+    """봇 스케줄러 설정"""
+
+    # 실행 모드: "local" (API 프로세스에서 봇 실행) 또는 "distributed" (워커 프로세스가 Redis 리스로 분담)
+    MODE = os.getenv("BOT_SCHEDULER_MODE", "local")
+    DISTRIBUTED = MODE == "distributed"
+
+    # 워커 ID (비우면 hostname-pid 사용)
+    WORKER_ID = os.getenv("BOT_WORKER_ID", "")
+
+    # 리스 TTL: 워커가 죽으면 이 시간 후 다른 워커가 봇을 인수
+    LEASE_TTL_SECONDS = float(os.getenv("BOT_LEASE_TTL_SECONDS", "15"))
+
+
 class TelegramConfig:
     """텔레그램 봇 설정"""
 
@@ -4,6 +4,7 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..config import settings
+from ..utils.metrics import instrument_engine
 
 # 비동기 엔진 - 커넥션 풀 설정 (20명 기준)
 engine_args = {
@@ -24,6 +25,9 @@ if "sqlite" not in settings.database_url:
     )
 
 engine = create_async_engine(settings.database_url, **engine_args)
+# 쿼리 시간 → db_query_seconds (/metrics)
+instrument_engine(engine)
+
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -107,6 +111,36 @@ async def lifespan(app):
     asyncio.create_task(start_snapshot_worker())
     logger.info("✅ Dashboard snapshot worker started")
 
+    # Start daily performance rollup worker (analytics aggregation)
+    from ..services.performance_rollup import rollup_worker_loop
+
+    asyncio.create_task(rollup_worker_loop())
+    logger.info("✅ Performance rollup worker started")
+
+    # Start time-series retention worker (partitions, retention, equity downsampling)
+    from ..services.retention_service import retention_worker_loop
+
+    asyncio.create_task(retention_worker_loop())
+    logger.info("✅ Retention worker started")
+
+    # Start background sentiment refresher (strategies read published snapshots)
+    from ..services.sentiment_refresher import sentiment_refresh_loop
+
+    asyncio.create_task(sentiment_refresh_loop())
+    logger.info("✅ Sentiment refresher started")
+
+    # Start write-behind writer (batched signal/equity/bot stats persistence)
+    from ..services.write_behind import write_behind
+
+    write_behind.start()
+    logger.info("✅ Write-behind writer started")
+
+    # Start event loop lag monitor (/metrics event_loop_lag_seconds)
+    from ..utils.metrics import loop_lag_monitor
+
+    loop_lag_monitor.start()
+    logger.info("✅ Event loop lag monitor started")
+
     logger.info("🎉 Application startup complete!")
 
     try:
@@ -115,6 +149,10 @@ async def lifespan(app):
         # Shutdown
         logger.info("🛑 Shutting down application...")
 
+        from ..utils.metrics import loop_lag_monitor
+
+        await loop_lag_monitor.stop()
+
         # Stop price alert service
         from ..services.price_alert_service import price_alert_service
 
@@ -133,12 +171,28 @@ async def lifespan(app):
         await shutdown_ai_service()
         logger.info("✅ AI Cost Optimization Service stopped")
 
+        # Shutdown grid sweep process pool
+        from ..services.grid_simulator import shutdown_process_pool
+
+        shutdown_process_pool()
+
+        # Shutdown auth crypto worker pool
+        from ..utils.crypto_executor import auth_crypto
+
+        auth_crypto.shutdown()
+
         # Close cache manager
         from ..utils.cache_manager import cache_manager
 
         await cache_manager.close()
         logger.info("✅ Cache manager closed")
 
+        # Flush pending write-behind records before closing the engine
+        from ..services.write_behind import write_behind
+
+        await write_behind.close()
+        logger.info("✅ Write-behind writer flushed")
+
         await engine.dispose()
         logger.info("✅ Application shutdown complete")
 
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -14,6 +15,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy import (
     Enum as SQLEnum,
@@ -583,6 +585,54 @@ class Equity(Base):
     user = relationship("User", back_populates="equities")
 
 
+class DailyPerformanceRollup(Base):
+    """
+    사용자별 일간 성과 롤업
+
+    - 청산 거래 / 자산 기록 변경 시 해당 일자만 재집계
+    - 분석 API는 원본 거래/자산 대신 롤업 + 경계일 원본만 조회
+    - 일자 기준은 Trade.created_at / Equity.timestamp (UTC)
+    """
+
+    __tablename__ = "daily_performance_rollups"
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_daily_rollup_user_day"),
+        Index("idx_daily_rollup_user_day", "user_id", "day"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    day = Column(Date, nullable=False)
+
+    # 청산 거래 집계 (pnl 확정 거래만)
+    trade_count = Column(Integer, default=0, nullable=False)
+    winning_trades = Column(Integer, default=0, nullable=False)
+    losing_trades = Column(Integer, default=0, nullable=False)
+    gross_profit = Column(Numeric(20, 8), default=0, nullable=False)
+    gross_loss = Column(Numeric(20, 8), default=0, nullable=False)  # 음수 합계
+    best_trade_id = Column(Integer, nullable=True)
+    best_pnl = Column(Numeric(18, 8), nullable=True)
+    worst_trade_id = Column(Integer, nullable=True)
+    worst_pnl = Column(Numeric(18, 8), nullable=True)
+
+    # 자산 곡선 집계 (연속 기록 간 수익률 %)
+    return_count = Column(Integer, default=0, nullable=False)
+    return_sum = Column(Float, default=0.0, nullable=False)
+    return_sq_sum = Column(Float, default=0.0, nullable=False)
+    open_equity = Column(Numeric(18, 8), nullable=True)
+    high_equity = Column(Numeric(18, 8), nullable=True)
+    low_equity = Column(Numeric(18, 8), nullable=True)
+    closing_equity = Column(Numeric(18, 8), nullable=True)
+    intraday_max_drawdown = Column(Float, default=0.0, nullable=False)  # %, 음수
+
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+
 class BotLog(Base):
     __tablename__ = "bot_logs"
 
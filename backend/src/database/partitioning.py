@@ -0,0 +1,309 @@
+"""
+시계열 테이블 월 단위 파티셔닝 (PostgreSQL)
+
+bot_logs / trading_signals / equities는 봇이 계속 기록하는 고용량 테이블입니다.
+PostgreSQL에서는 시간 컬럼 기준 RANGE 파티션(월 단위)으로 관리합니다.
+
+- 시간 조건이 있는 조회는 해당 월 파티션만 스캔 (partition pruning)
+- 보존 기간이 지난 데이터는 DELETE 대신 파티션 DROP (즉시, VACUUM 부담 없음)
+- 범위를 벗어난 행은 DEFAULT 파티션으로 들어가고, 해당 월 파티션 생성 시 이동
+
+SQLite(테스트/로컬)는 파티셔닝을 지원하지 않으므로 일반 테이블 그대로 사용하고,
+보존 정책은 services/retention_service.py에서 범위 DELETE로 처리합니다.
+
+마이그레이션(007)과 유지보수 작업이 공용으로 쓰는 동기 헬퍼 모음입니다
+(비동기 코드에서는 ``await conn.run_sync(...)``로 호출).
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MONTHS_AHEAD = 2
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """파티션 대상 테이블과 파티션 키 컬럼"""
+
+    table: str
+    column: str
+
+
+PARTITIONED_TABLES: Dict[str, PartitionSpec] = {
+    "bot_logs": PartitionSpec("bot_logs", "created_at"),
+    "trading_signals": PartitionSpec("trading_signals", "timestamp"),
+    "equities": PartitionSpec("equities", "timestamp"),
+}
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+# ============================================================
+# 월 계산
+# ============================================================
+
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + (value.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def month_range(start: datetime, end: datetime) -> List[datetime]:
+    """start가 속한 월부터 end가 속한 월까지의 월 시작 시각 목록"""
+    months = []
+    current, last = month_start(start), month_start(end)
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def partition_month(table: str, name: str) -> Optional[datetime]:
+    """파티션 이름 -> 월 시작 시각 (월 파티션이 아니면 None)"""
+    if not name.startswith(f"{table}_p"):
+        return None
+    match = _PARTITION_SUFFIX.search(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+# ============================================================
+# 카탈로그 조회
+# ============================================================
+
+
+def is_postgresql(conn: Connection) -> bool:
+    return conn.dialect.name == "postgresql"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """테이블이 파티션 테이블인지 (PostgreSQL 이외에는 항상 False)"""
+    if not is_postgresql(conn):
+        return False
+    result = conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    )
+    return result.first() is not None
+
+
+def list_partitions(conn: Connection, table: str) -> List[str]:
+    result = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND pg_table_is_visible(p.oid) "
+            "ORDER BY c.relname"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result]
+
+
+# ============================================================
+# 파티션 생성 / 삭제
+# ============================================================
+
+
+def _bounds(month: datetime):
+    return f"'{month:%Y-%m-%d %H:%M:%S}'", f"'{add_months(month, 1):%Y-%m-%d %H:%M:%S}'"
+
+
+def create_month_partition(conn: Connection, spec: PartitionSpec, month: datetime) -> bool:
+    """
+    월 파티션 생성 (이미 있으면 False)
+
+    DEFAULT 파티션에 해당 월 행이 있으면 새 파티션으로 옮긴 뒤 ATTACH 합니다
+    (그대로 PARTITION OF 하면 DEFAULT 제약 위반으로 실패).
+    """
+    name = partition_name(spec.table, month)
+    if name in list_partitions(conn, spec.table):
+        return False
+
+    lower, upper = _bounds(month)
+    default = default_partition_name(spec.table)
+    in_range = f'"{spec.column}" >= {lower} AND "{spec.column}" < {upper}'
+
+    has_default = default in list_partitions(conn, spec.table)
+    stray = has_default and conn.execute(
+        text(f"SELECT 1 FROM {default} WHERE {in_range} LIMIT 1")
+    ).first() is not None
+
+    if not stray:
+        conn.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {spec.table} "
+            f"FOR VALUES FROM ({lower}) TO ({upper})"
+        ))
+    else:
+        conn.execute(text(f"CREATE TABLE {name} (LIKE {spec.table} INCLUDING DEFAULTS)"))
+        conn.execute(text(f"INSERT INTO {name} SELECT * FROM {default} WHERE {in_range}"))
+        conn.execute(text(f"DELETE FROM {default} WHERE {in_range}"))
+        conn.execute(text(
+            f"ALTER TABLE {spec.table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ({lower}) TO ({upper})"
+        ))
+        logger.info(f"Moved stray {spec.table} rows from DEFAULT into {name}")
+    return True
+
+
+def ensure_partitions(
+    conn: Connection,
+    spec: PartitionSpec,
+    start: datetime,
+    now: Optional[datetime] = None,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> List[str]:
+    """start 월부터 (now + months_ahead) 월까지 파티션 보장, 생성한 이름 반환"""
+    now = now or datetime.utcnow()
+    created = []
+    for month in month_range(start, add_months(now, months_ahead)):
+        if create_month_partition(conn, spec, month):
+            created.append(partition_name(spec.table, month))
+    return created
+
+
+def drop_partitions_before(conn: Connection, spec: PartitionSpec, cutoff: datetime) -> List[str]:
+    """
+    cutoff 이전에 완전히 끝나는 월 파티션 DETACH + DROP
+
+    cutoff가 걸친 월 파티션은 유지합니다 (월 단위 보존).
+    """
+    dropped = []
+    for name in list_partitions(conn, spec.table):
+        month = partition_month(spec.table, name)
+        if month is None or add_months(month, 1) > cutoff:
+            continue
+        conn.execute(text(f"ALTER TABLE {spec.table} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
+
+
+# ============================================================
+# 변환 (마이그레이션 007)
+# ============================================================
+
+
+def _serial_sequence(conn: Connection, table: str) -> Optional[str]:
+    return conn.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}
+    ).scalar()
+
+
+def _index_definitions(conn: Connection, table: str) -> List[str]:
+    """PK를 제외한 인덱스 정의 (CREATE INDEX 문)"""
+    rows = conn.execute(
+        text(
+            "SELECT i.indexdef FROM pg_indexes i "
+            "WHERE i.tablename = :table AND i.indexname NOT IN ("
+            "  SELECT conname FROM pg_constraint WHERE contype = 'p'"
+            ")"
+        ),
+        {"table": table},
+    ).scalars().all()
+    return list(rows)
+
+
+def _foreign_keys(conn: Connection, table: str) -> List[str]:
+    return list(conn.execute(
+        text(
+            "SELECT pg_get_constraintdef(c.oid) FROM pg_constraint c "
+            "JOIN pg_class t ON t.oid = c.conrelid "
+            "WHERE t.relname = :table AND c.contype = 'f'"
+        ),
+        {"table": table},
+    ).scalars().all())
+
+
+def _rebuild_table(conn: Connection, spec: PartitionSpec, partitioned: bool) -> None:
+    """
+    테이블을 파티션/일반 테이블로 재구성 (데이터, 인덱스, FK, id 시퀀스 유지)
+
+    파티션 테이블의 PK에는 파티션 키가 포함되어야 하므로 (id, 시간 컬럼)이 됩니다.
+    """
+    table, column = spec.table, spec.column
+    legacy = f"{table}_legacy"
+
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    sequence = _serial_sequence(conn, legacy)
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+
+    indexes = _index_definitions(conn, legacy)
+    foreign_keys = _foreign_keys(conn, legacy)
+
+    if partitioned:
+        conn.execute(text(
+            f'UPDATE {legacy} SET "{column}" = (now() AT TIME ZONE \'utc\') WHERE "{column}" IS NULL'
+        ))
+        conn.execute(text(
+            f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ("{column}")'
+        ))
+        conn.execute(text(f'ALTER TABLE {table} ALTER COLUMN "{column}" SET NOT NULL'))
+        conn.execute(text(
+            f'ALTER TABLE {table} ALTER COLUMN "{column}" SET DEFAULT (now() AT TIME ZONE \'utc\')'
+        ))
+        oldest = conn.execute(text(f'SELECT min("{column}") FROM {legacy}')).scalar()
+        conn.execute(text(
+            f"CREATE TABLE {default_partition_name(table)} PARTITION OF {table} DEFAULT"
+        ))
+        ensure_partitions(conn, spec, oldest or datetime.utcnow())
+    else:
+        conn.execute(text(f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS)"))
+
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}"))
+    conn.execute(text(f"DROP TABLE {legacy}"))
+
+    primary_key = f'id, "{column}"' if partitioned else "id"
+    conn.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})"))
+    for definition in indexes:
+        # 파티션 테이블의 인덱스 정의는 "ON ONLY"로 조회됨 -> 하위 파티션까지 생성되도록 제거
+        definition = definition.replace(" ON ONLY ", " ON ")
+        conn.execute(text(re.sub(rf"\bON (\S+\.)?{legacy}\b", rf"ON \g<1>{table}", definition)))
+    for definition in foreign_keys:
+        conn.execute(text(f"ALTER TABLE {table} ADD {definition}"))
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+
+
+def convert_to_partitioned(conn: Connection, spec: PartitionSpec) -> bool:
+    """일반 테이블 -> 월 파티션 테이블 (PostgreSQL 전용, 이미 변환됐으면 False)"""
+    if not is_postgresql(conn) or is_partitioned(conn, spec.table):
+        return False
+    _rebuild_table(conn, spec, partitioned=True)
+    logger.info(f"Partitioned {spec.table} by month on {spec.column}")
+    return True
+
+
+def convert_to_plain(conn: Connection, spec: PartitionSpec) -> bool:
+    """월 파티션 테이블 -> 일반 테이블 (다운그레이드용)"""
+    if not is_partitioned(conn, spec.table):
+        return False
+    _rebuild_table(conn, spec, partitioned=False)
+    return True
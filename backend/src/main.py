@@ -42,6 +42,7 @@ from .api import (
     grid_bot,  # 그리드 봇 API (NEW)
     grid_template,  # 그리드 템플릿 사용자 API (NEW)
     health,
+    metrics,  # Prometheus /metrics
     multibot,  # 멀티봇 트레이딩 API v2.0 (NEW)
     oauth,
     order,
@@ -309,6 +310,7 @@ def create_app() -> FastAPI:
 
     # 루트 레벨 라우터 (prefix 없음)
     app.include_router(health.router)  # /health - 헬스체크
+    app.include_router(metrics.router)  # /metrics - Prometheus
     app.include_router(ws_server.router)  # /ws - 웹소켓
 
     # Note: Startup logic has been moved to lifespan in db.py
@@ -4,13 +4,14 @@ ML Features Module - 기술적 지표 및 피처 파이프라인
 50개 기술적 피처 + 10개 시장 구조 피처 + 10개 MTF 피처 = 70개 피처
 """
 
-from .feature_pipeline import FeaturePipeline
+from .feature_pipeline import FEATURE_PIPELINE_VERSION, FeaturePipeline
 from .mtf_features import MTFFeatures
 from .structure_features import StructureFeatures
 from .technical_features import TechnicalFeatures
 
 __all__ = [
     "FeaturePipeline",
+    "FEATURE_PIPELINE_VERSION",
     "TechnicalFeatures",
     "StructureFeatures",
     "MTFFeatures",
@@ -17,6 +17,9 @@ from .technical_features import TechnicalFeatures
 
 logger = logging.getLogger(__name__)
 
+# 피처 정의가 바뀌면 올릴 것 (캐시된 학습 행렬 무효화, training/feature_cache.py)
+FEATURE_PIPELINE_VERSION = "1"
+
 
 class FeaturePipeline:
     """
@@ -170,7 +173,11 @@ class FeaturePipeline:
         if not candles or len(candles) == 0:
             return None
 
-        df = pd.DataFrame(candles)
+        # 공유 캔들 뷰(CandleView)는 컬럼 배열로 바로 생성
+        if hasattr(candles, 'as_columns'):
+            df = pd.DataFrame(candles.as_columns())
+        else:
+            df = pd.DataFrame(candles)
 
         # 컬럼 정규화
         column_mapping = {
@@ -10,6 +10,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from src.utils.candle_rollup import rollup_frame
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,38 +99,18 @@ class MTFFeatures:
         return result
 
     def _resample_to_1h(self, df_5m: pd.DataFrame) -> pd.DataFrame:
-        """5분봉 → 1시간봉 리샘플링"""
-        # timestamp가 index가 아니면 설정
-        if 'timestamp' in df_5m.columns:
-            df = df_5m.set_index('timestamp')
-        else:
-            df = df_5m.copy()
-
-        # OHLCV 리샘플링
-        ohlc_dict = {
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }
-
-        # 존재하는 컬럼만 리샘플링
-        available_cols = {k: v for k, v in ohlc_dict.items() if k in df.columns}
-
-        if len(available_cols) < 5:
-            logger.warning("Not enough OHLCV columns for resampling")
-            return df_5m
-
+        """5분봉 → 1시간봉 롤업 (numpy 집계, timestamp/time/DatetimeIndex 지원)"""
         try:
-            resampled = df[list(available_cols.keys())].resample('1h').agg(available_cols)
-            resampled = resampled.dropna()
-            resampled = resampled.reset_index()
-            return resampled
+            htf = rollup_frame(df_5m, "1h")
         except Exception as e:
-            logger.error(f"Resampling failed: {e}")
+            logger.error(f"Rollup failed: {e}")
             return df_5m
 
+        if htf is None:
+            logger.warning("Not enough OHLCV/time columns for rollup")
+            return df_5m
+        return htf
+
     def _calculate_htf_indicators(self, htf: pd.DataFrame) -> pd.DataFrame:
         """1시간봉 기술적 지표 계산"""
         if len(htf) < 20:
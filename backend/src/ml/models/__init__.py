@@ -10,8 +10,12 @@ ML Models Package - LightGBM Model Implementations
 """
 
 from .ensemble_predictor import EnsemblePredictor, MLPrediction
+from .model_registry import ModelBundle, ModelRegistry, get_model_registry
 
 __all__ = [
     "EnsemblePredictor",
     "MLPrediction",
+    "ModelBundle",
+    "ModelRegistry",
+    "get_model_registry",
 ]
@@ -15,14 +15,11 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from .model_registry import LIGHTGBM_AVAILABLE, get_model_registry
+
 logger = logging.getLogger(__name__)
 
-# LightGBM은 선택적 import (학습 시에만 필요)
-try:
-    import lightgbm as lgb
-    LIGHTGBM_AVAILABLE = True
-except ImportError:
-    LIGHTGBM_AVAILABLE = False
+if not LIGHTGBM_AVAILABLE:
     logger.warning("LightGBM not installed. ML models will use fallback predictions.")
 
 
@@ -193,6 +190,7 @@ class EnsemblePredictor:
 
     모델 저장/로드: LightGBM 네이티브 형식 (.txt)
     메타데이터: JSON 형식
+    모델 객체: ModelRegistry에서 프로세스 단위로 공유 (재학습 시 핫스왑)
 
     사용법:
     ```python
@@ -202,79 +200,31 @@ class EnsemblePredictor:
     """
 
     def __init__(self, models_dir: Optional[Path] = None):
-        self.models_dir = models_dir or Path(__file__).parent.parent / "saved_models"
-        self.models_dir.mkdir(parents=True, exist_ok=True)
-
-        # 5개 모델 (LightGBM Booster 객체)
-        self.models = {
-            "direction": None,
-            "volatility": None,
-            "timing": None,
-            "stoploss": None,
-            "position_size": None,
-        }
-
-        self.models_loaded = False
-        self.training_features: Optional[List[str]] = None  # 학습 시 사용된 피처 목록
-
-        # 모델 로드 시도
-        self._load_models()
+        # 모델은 프로세스 공유 레지스트리에서 참조 (인스턴스별 로드 없음)
+        self._registry = get_model_registry(models_dir)
+        self.models_dir = self._registry.models_dir
+        self._registry.get_bundle()
 
         logger.info(f"EnsemblePredictor initialized: models_loaded={self.models_loaded}")
 
-    def _load_models(self):
-        """
-        저장된 모델 로드
+    @property
+    def models(self) -> Dict[str, Any]:
+        """5개 모델 (LightGBM Booster 객체, 공유 읽기 전용)"""
+        return self._registry.get_bundle().models
 
-        LightGBM 네이티브 형식 (.txt) 사용
-        피처 중요도 파일에서 학습 피처 목록도 로드
-        """
-        if not LIGHTGBM_AVAILABLE:
-            logger.warning("LightGBM not available, using fallback predictions")
-            return
-
-        model_files = {
-            "direction": "lightgbm_direction.txt",
-            "volatility": "lightgbm_volatility.txt",
-            "timing": "lightgbm_timing.txt",
-            "stoploss": "lightgbm_stoploss.txt",
-            "position_size": "lightgbm_position_size.txt",
-        }
+    @property
+    def models_loaded(self) -> bool:
+        return self._registry.get_bundle().models_loaded
 
-        loaded_count = 0
-        for name, filename in model_files.items():
-            model_path = self.models_dir / filename
-            if model_path.exists():
-                try:
-                    # LightGBM 네이티브 형식으로 로드
-                    self.models[name] = lgb.Booster(model_file=str(model_path))
-                    loaded_count += 1
-                    logger.debug(f"Loaded {name} model from {filename}")
-                except Exception as e:
-                    logger.error(f"Failed to load {name}: {e}")
-
-        self.models_loaded = loaded_count == len(model_files)
-
-        # 학습 시 사용된 피처 목록 로드 (direction 모델의 피처 중요도 파일에서)
-        self._load_training_features()
-
-        logger.info(f"Loaded {loaded_count}/{len(model_files)} models")
-
-    def _load_training_features(self):
-        """피처 중요도 파일에서 학습 시 사용된 피처 목록 로드"""
-        fi_path = self.models_dir / "direction_feature_importance.csv"
-        if fi_path.exists():
-            try:
-                import csv
-                with open(fi_path, 'r') as f:
-                    reader = csv.DictReader(f)
-                    self.training_features = [row['feature'] for row in reader]
-                logger.info(f"Loaded {len(self.training_features)} training features from feature importance")
-            except Exception as e:
-                logger.warning(f"Failed to load training features: {e}")
-                self.training_features = None
-        else:
-            logger.debug("No feature importance file found")
+    @property
+    def training_features(self) -> Optional[List[str]]:
+        """학습 시 사용된 피처 목록"""
+        features = self._registry.get_bundle().training_features
+        return list(features) if features is not None else None
+
+    @property
+    def model_version(self) -> str:
+        return self._registry.get_bundle().version
 
     def predict(
         self,
@@ -297,11 +247,14 @@ class EnsemblePredictor:
             logger.warning("Empty features, using fallback prediction")
             return self._fallback_prediction(symbol, rule_based_signal)
 
+        # 예측 한 번 동안 같은 버전의 번들 사용
+        bundle = self._registry.get_bundle()
+
         # 학습 피처와 일치시키기
-        if self.training_features:
+        if bundle.training_features:
             # 학습 시 사용된 피처만 선택 (없는 피처는 0으로 채움)
             aligned_features = pd.DataFrame(index=features.index)
-            for feat in self.training_features:
+            for feat in bundle.training_features:
                 if feat in features.columns:
                     aligned_features[feat] = features[feat]
                 else:
@@ -313,7 +266,7 @@ class EnsemblePredictor:
 
         try:
             # 5개 모델 예측
-            direction = self._predict_direction(latest, rule_based_signal)
+            direction = self._predict_direction(latest, rule_based_signal, bundle.models)
             volatility = self._predict_volatility(latest)
             timing = self._predict_timing(latest)
             stoploss = self._predict_stoploss(latest, volatility)
@@ -332,7 +285,7 @@ class EnsemblePredictor:
                 stoploss=stoploss,
                 position_size=position_size,
                 combined_confidence=combined_confidence,
-                models_loaded=self.models_loaded,
+                models_loaded=bundle.models_loaded,
             )
 
             logger.info(
@@ -349,17 +302,152 @@ class EnsemblePredictor:
             logger.error(f"Prediction failed: {e}", exc_info=True)
             return self._fallback_prediction(symbol, rule_based_signal)
 
+    def predict_batch(self, features: pd.DataFrame) -> pd.DataFrame:
+        """
+        전체 히스토리 일괄 예측 (검증/백테스트용)
+
+        행마다 predict()를 호출하는 대신 방향 모델을 피처 행렬 전체에 한 번만 실행하고,
+        나머지 규칙 기반 모델은 컬럼 연산으로 계산합니다.
+        각 행의 결과는 해당 행까지의 피처로 predict()를 호출한 결과와 같습니다.
+
+        Args:
+            features: 피처 DataFrame (FeaturePipeline.extract_features() 출력)
+
+        Returns:
+            features.index 기준 DataFrame
+            (direction, direction_confidence, probability_long, probability_short,
+             volatility_level, atr_ratio, timing_good, timing_waiting, timing_score,
+             stop_loss_percent, position_size_percent, combined_confidence)
+        """
+        if features.empty:
+            return pd.DataFrame(index=features.index)
+
+        bundle = self._registry.get_bundle()
+        if bundle.training_features:
+            features = features.reindex(columns=list(bundle.training_features), fill_value=0.0)
+
+        n = len(features)
+
+        def column(name: str, default: float) -> np.ndarray:
+            if name in features.columns:
+                return features[name].to_numpy(dtype=float)
+            return np.full(n, default, dtype=float)
+
+        # Model 1: 방향 (부스터 1회 실행, 실패 시 휴리스틱)
+        direction = None
+        model = bundle.models.get("direction")
+        if model is not None and LIGHTGBM_AVAILABLE:
+            try:
+                probs = np.asarray(model.predict(features.to_numpy()))
+                direction_idx = np.argmax(probs, axis=1)
+                directions = np.array(
+                    [DirectionType.NEUTRAL.value, DirectionType.LONG.value, DirectionType.SHORT.value]
+                )
+                direction = directions[direction_idx]
+                prob_long = probs[:, 1] if probs.shape[1] > 1 else np.full(n, 0.5)
+                prob_short = probs[:, 2] if probs.shape[1] > 2 else np.full(n, 0.5)
+                direction_confidence = probs.max(axis=1)
+            except Exception as e:
+                logger.debug(f"Batch model prediction failed, using heuristic: {e}")
+                direction = None
+
+        if direction is None:
+            score = column("ema_cross_5_20", 0) * 30
+            score = score + (column("rsi_14", 50) - 50) * 0.5
+            score = score + np.sign(column("macd_histogram", 0)) * 10
+            direction = np.where(
+                score > 15, DirectionType.LONG.value,
+                np.where(score < -15, DirectionType.SHORT.value, DirectionType.NEUTRAL.value),
+            )
+            prob_long = np.where(score > 15, 0.65, np.where(score < -15, 0.35, 0.5))
+            prob_short = np.where(score > 15, 0.35, np.where(score < -15, 0.65, 0.5))
+            direction_confidence = np.maximum(prob_long, prob_short)
+
+        # Model 2: 변동성
+        atr_ratio = column("atr_ratio", 1.0)
+        volatility_level = np.select(
+            [atr_ratio >= 3.0, atr_ratio >= 2.0, atr_ratio >= 1.0],
+            [VolatilityLevel.EXTREME.value, VolatilityLevel.HIGH.value, VolatilityLevel.NORMAL.value],
+            default=VolatilityLevel.LOW.value,
+        )
+        extreme = volatility_level == VolatilityLevel.EXTREME.value
+
+        # Model 3: 타이밍
+        rsi = column("rsi_14", 50)
+        volume_ratio = column("volume_ma_ratio", 1.0)
+        bb_position = column("bb_position", 0.5)
+        timing_score = np.full(n, 50.0)
+        timing_score = timing_score + np.where(
+            (rsi > 30) & (rsi < 70), 15, np.where((rsi < 20) | (rsi > 80), -20, 0)
+        )
+        timing_score = timing_score + np.where(
+            volume_ratio > 1.2, 10, np.where(volume_ratio < 0.5, -10, 0)
+        )
+        timing_score = timing_score + np.where((bb_position > 0.2) & (bb_position < 0.8), 10, -5)
+        timing_score = timing_score + (column("mtf_score", 0.5) - 0.5) * 20
+        timing_good = timing_score > 60
+
+        # Model 4: 손절폭
+        close = column("close", 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_percent = np.where(close > 0, column("atr_14", 0) / close * 100, 1.5)
+        sl_multiplier = np.select(
+            [volatility_level == level.value for level in (VolatilityLevel.EXTREME, VolatilityLevel.HIGH, VolatilityLevel.NORMAL)],
+            [2.5, 2.0, 1.5],
+            default=1.2,
+        )
+        stop_loss = np.minimum(np.maximum(atr_percent * sl_multiplier, 0.8), 3.0)
+
+        # Model 5: 포지션 사이즈
+        position_size = np.select(
+            [volatility_level == level.value for level in (VolatilityLevel.EXTREME, VolatilityLevel.HIGH, VolatilityLevel.NORMAL)],
+            [10.0, 20.0, 30.0],
+            default=35.0,
+        )
+
+        # 종합 신뢰도 (_calculate_combined_confidence와 같은 가중치/순서)
+        combined = (
+            direction_confidence * 0.3 +
+            0.7 * 0.2 +
+            0.65 * 0.25 +
+            0.7 * 0.15 +
+            0.7 * 0.1
+        )
+        combined = np.where(extreme, combined * 0.5, combined)
+        combined = np.where(~timing_good, combined * 0.7, combined)
+        combined = np.minimum(np.maximum(combined, 0.0), 1.0)
+
+        return pd.DataFrame(
+            {
+                "direction": direction,
+                "direction_confidence": direction_confidence,
+                "probability_long": prob_long,
+                "probability_short": prob_short,
+                "volatility_level": volatility_level,
+                "atr_ratio": atr_ratio,
+                "timing_good": timing_good,
+                "timing_waiting": timing_score < 40,
+                "timing_score": np.minimum(np.maximum(timing_score, 0), 100),
+                "stop_loss_percent": stop_loss,
+                "position_size_percent": position_size,
+                "combined_confidence": combined,
+            },
+            index=features.index,
+        )
+
     def _predict_direction(
         self,
         features: pd.Series,
-        rule_based_signal: Optional[str]
+        rule_based_signal: Optional[str],
+        models: Optional[Dict[str, Any]] = None
     ) -> DirectionPrediction:
         """Model 1: 방향 예측"""
+        models = models if models is not None else self.models
         # 실제 모델이 로드되어 있으면 사용
-        if self.models["direction"] is not None and LIGHTGBM_AVAILABLE:
+        if models["direction"] is not None and LIGHTGBM_AVAILABLE:
             try:
                 feature_array = features.values.reshape(1, -1)
-                probs = self.models["direction"].predict(feature_array)[0]
+                probs = models["direction"].predict(feature_array)[0]
                 # [neutral, long, short] 순서 가정
                 direction_idx = int(np.argmax(probs))
                 directions = [DirectionType.NEUTRAL, DirectionType.LONG, DirectionType.SHORT]
@@ -641,12 +729,14 @@ class EnsemblePredictor:
 
     def get_status(self) -> Dict[str, Any]:
         """모델 상태 조회"""
+        bundle = self._registry.get_bundle()
         return {
-            "models_loaded": self.models_loaded,
+            "models_loaded": bundle.models_loaded,
             "lightgbm_available": LIGHTGBM_AVAILABLE,
             "models": {
                 name: (model is not None)
-                for name, model in self.models.items()
+                for name, model in bundle.models.items()
             },
             "models_dir": str(self.models_dir),
+            "model_version": bundle.version,
         }
@@ -0,0 +1,276 @@
+"""
+Model Registry - 프로세스 공유 LightGBM 모델 저장소
+
+모델 디렉토리별로 5개 Booster와 학습 피처 목록을 프로세스당 한 번만 로드하고,
+EnsemblePredictor 인스턴스들이 같은 (읽기 전용) 번들을 참조하도록 합니다.
+
+핫스왑:
+- 재학습(ModelTrainer.save_all)은 모델 파일을 원자적으로 교체한 뒤
+  model_version.json 매니페스트를 마지막에 기록
+- get_bundle()은 check_interval 간격으로 매니페스트(없으면 파일 stat)를 확인하고,
+  변경 시 새 번들을 완전히 로드한 다음 참조를 한 번에 교체
+- 이벤트 루프 위에서는 재로드(Booster 파싱)를 스레드 풀로 넘기고 교체 전까지 현재 번들을 반환
+  (로드 동안 봇 루프가 멈추지 않음). 최초 로드만 동기.
+- 예측 중인 호출자는 이전 번들을 계속 사용 (부분 교체 상태 없음)
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:
+    LIGHTGBM_AVAILABLE = False
+
+DEFAULT_MODELS_DIR = Path(__file__).parent.parent / "saved_models"
+
+MODEL_FILES: Dict[str, str] = {
+    "direction": "lightgbm_direction.txt",
+    "volatility": "lightgbm_volatility.txt",
+    "timing": "lightgbm_timing.txt",
+    "stoploss": "lightgbm_stoploss.txt",
+    "position_size": "lightgbm_position_size.txt",
+}
+FEATURE_IMPORTANCE_FILE = "direction_feature_importance.csv"
+MANIFEST_FILE = "model_version.json"
+
+# 파일 변경 확인 간격 (초)
+DEFAULT_CHECK_INTERVAL = 30.0
+
+
+def _load_booster(path: Path) -> Any:
+    return lgb.Booster(model_file=str(path))
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """
+    한 버전의 모델 묶음 (불변)
+
+    models 딕셔너리와 Booster 객체는 여러 예측기가 공유하므로 수정하지 않습니다.
+    """
+    version: str
+    models: Dict[str, Any]
+    training_features: Optional[Tuple[str, ...]]
+    models_loaded: bool
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class ModelRegistry:
+    """
+    모델 디렉토리 단위 공유 레지스트리
+
+    사용법:
+    ```python
+    bundle = get_model_registry().get_bundle()
+    bundle.models["direction"].predict(...)
+    ```
+    """
+
+    def __init__(
+        self,
+        models_dir: Path,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        loader: Optional[Callable[[Path], Any]] = None,
+    ):
+        self.models_dir = Path(models_dir)
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        self.check_interval = check_interval
+        self._loader = loader or (_load_booster if LIGHTGBM_AVAILABLE else None)
+
+        self._lock = threading.Lock()
+        self._bundle: Optional[ModelBundle] = None
+        self._fingerprint: Optional[str] = None
+        self._next_check = 0.0
+        self._pending_reload: Optional[asyncio.Future] = None
+        self.reload_count = 0
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def get_bundle(self) -> ModelBundle:
+        """현재 번들 반환 (필요 시 변경 확인 후 핫스왑)"""
+        bundle = self._bundle
+        if bundle is not None and time.monotonic() < self._next_check:
+            return bundle
+        if bundle is not None and self._schedule_reload():
+            return bundle
+        return self.reload()
+
+    def _schedule_reload(self) -> bool:
+        """
+        이벤트 루프에서 호출된 경우 재로드를 스레드 풀에서 실행
+
+        Returns:
+            예약했으면(또는 이미 진행 중이면) True, 루프 밖이면 False (호출자가 동기 로드)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        pending = self._pending_reload
+        if pending is not None and not pending.done():
+            return True
+        # 로드가 끝날 때까지 매 호출마다 다시 예약하지 않도록
+        self._next_check = time.monotonic() + self.check_interval
+        self._pending_reload = loop.run_in_executor(None, self.reload)
+        self._pending_reload.add_done_callback(self._log_reload_failure)
+        return True
+
+    def _log_reload_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Background model reload failed ({self.models_dir}): {future.exception()}")
+
+    async def reload_async(self, force: bool = False) -> ModelBundle:
+        """reload()를 스레드에서 실행 (이벤트 루프 블로킹 없음)"""
+        return await asyncio.to_thread(self.reload, force)
+
+    def reload(self, force: bool = False) -> ModelBundle:
+        """
+        파일이 바뀌었으면 새 번들 로드
+
+        Args:
+            force: 변경 여부와 관계없이 다시 로드
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            fingerprint = self._compute_fingerprint()
+            if self._bundle is not None and not force and fingerprint == self._fingerprint:
+                return self._bundle
+
+            bundle = self._load_bundle(fingerprint)
+            previous = self._bundle
+            self._bundle = bundle
+            self._fingerprint = fingerprint
+            self.reload_count += 1
+
+        if previous is not None:
+            logger.info(
+                f"🔄 Model bundle hot-swapped: {previous.version} -> {bundle.version} "
+                f"({self.models_dir})"
+            )
+        return bundle
+
+    # ------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------
+
+    def _compute_fingerprint(self) -> str:
+        """매니페스트 버전, 없으면 모델/피처 파일 stat 기반 지문"""
+        manifest_path = self.models_dir / MANIFEST_FILE
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, "r") as f:
+                    return f"manifest:{json.load(f)['version']}"
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Invalid model manifest {manifest_path}: {e}")
+
+        parts: List[str] = []
+        for filename in [*MODEL_FILES.values(), FEATURE_IMPORTANCE_FILE]:
+            path = self.models_dir / filename
+            try:
+                stat = path.stat()
+                parts.append(f"{filename}:{stat.st_mtime_ns}:{stat.st_size}")
+            except FileNotFoundError:
+                parts.append(f"{filename}:-")
+        digest = hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+        return f"files:{digest}"
+
+    def _load_bundle(self, fingerprint: str) -> ModelBundle:
+        models: Dict[str, Any] = {name: None for name in MODEL_FILES}
+
+        if self._loader is None:
+            logger.warning("LightGBM not available, using fallback predictions")
+        else:
+            for name, filename in MODEL_FILES.items():
+                model_path = self.models_dir / filename
+                if not model_path.exists():
+                    continue
+                try:
+                    models[name] = self._loader(model_path)
+                    logger.debug(f"Loaded {name} model from {filename}")
+                except Exception as e:
+                    logger.error(f"Failed to load {name}: {e}")
+
+        loaded_count = sum(1 for model in models.values() if model is not None)
+        version = fingerprint.split(":", 1)[1]
+        logger.info(f"Loaded {loaded_count}/{len(MODEL_FILES)} models (version={version})")
+
+        return ModelBundle(
+            version=version,
+            models=models,
+            training_features=self._load_training_features(),
+            models_loaded=loaded_count == len(MODEL_FILES),
+        )
+
+    def _load_training_features(self) -> Optional[Tuple[str, ...]]:
+        """피처 중요도 파일에서 학습 시 사용된 피처 목록 로드"""
+        fi_path = self.models_dir / FEATURE_IMPORTANCE_FILE
+        if not fi_path.exists():
+            logger.debug("No feature importance file found")
+            return None
+        try:
+            with open(fi_path, "r") as f:
+                features = tuple(row["feature"] for row in csv.DictReader(f))
+            logger.info(f"Loaded {len(features)} training features from feature importance")
+            return features
+        except Exception as e:
+            logger.warning(f"Failed to load training features: {e}")
+            return None
+
+    def get_status(self) -> Dict[str, Any]:
+        bundle = self._bundle
+        return {
+            "models_dir": str(self.models_dir),
+            "version": bundle.version if bundle else None,
+            "loaded_at": bundle.loaded_at.isoformat() if bundle else None,
+            "reload_count": self.reload_count,
+        }
+
+
+# 모델 디렉토리별 싱글톤
+_registries: Dict[Path, ModelRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_model_registry(models_dir: Optional[Path] = None) -> ModelRegistry:
+    """모델 디렉토리에 대한 프로세스 공유 레지스트리 반환"""
+    key = Path(models_dir or DEFAULT_MODELS_DIR).resolve()
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                registry = ModelRegistry(key)
+                _registries[key] = registry
+    return registry
+
+
+def write_manifest(models_dir: Path, files: List[str]) -> str:
+    """
+    모델 버전 매니페스트 기록 (모델 파일 교체 후 마지막에 호출)
+
+    Returns:
+        새 버전 문자열
+    """
+    version = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    manifest_path = Path(models_dir) / MANIFEST_FILE
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": version, "saved_at": datetime.utcnow().isoformat(), "files": files}, f)
+    tmp_path.replace(manifest_path)
+    return version
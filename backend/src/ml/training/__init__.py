@@ -4,15 +4,18 @@ ML Training Module - 데이터 수집, 라벨링, 모델 학습
 Components:
 - DataCollector: 캔들 데이터 수집 및 저장
 - Labeler: 학습용 라벨 생성 (방향, 변동성 등)
-- ModelTrainer: LightGBM 모델 학습
+- ModelTrainer: LightGBM 모델 학습 (5개 모델 병렬)
+- FeatureMatrixCache: 버전별 피처/라벨 행렬 캐시 (증분 갱신)
 """
 
 from .data_collector import DataCollector
+from .feature_cache import FeatureMatrixCache
 from .labeler import Labeler
 from .train_all_models import ModelTrainer
 
 __all__ = [
     "DataCollector",
+    "FeatureMatrixCache",
     "Labeler",
     "ModelTrainer",
 ]
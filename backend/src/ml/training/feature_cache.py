@@ -0,0 +1,417 @@
+"""
+Feature Matrix Cache - 학습용 피처/라벨 행렬 영속 캐시
+
+재학습 때마다 전체 캔들을 다시 받아 FeaturePipeline을 처음부터 돌리는 대신,
+(심볼, 타임프레임, 피처 파이프라인 버전)별로 피처 행렬을 파일로 저장하고
+새 캔들만 이어 붙입니다.
+
+저장 구조 (cache_dir/<symbol>_<timeframe>_v<version>/):
+- manifest.json : 캐시 범위(start/end), 파트 목록, 누적 지표 상태
+- part-00000.parquet ... : 피처 행렬 (추가분마다 파트 하나, 많아지면 병합)
+- htf.parquet : 상위 타임프레임 원본 캔들 (MTF 피처 계산용)
+- labels-<hash>.parquet : 최근 요청 구간의 라벨 행렬
+
+증분 계산:
+- 새 캔들 앞에 캐시된 마지막 warmup_candles개 캔들을 붙여 피처를 계산하고 새 행만 저장
+  (EMA 200 기준 1000캔들이면 초기값 영향 < 1e-4)
+- 누적 지표(obv, vwap)는 manifest의 누적 상태에서 이어서 계산 -> 전체 재계산과 동일
+- 스윙 포인트는 오른쪽 3캔들을 봐야 확정되므로 마지막 provisional_candles개 행은 저장하지 않고
+  다음 갱신 때 다시 계산 (last_timestamp 이후 캔들에 포함됨)
+- MTF 피처는 계산 시점의 최신 상위 TF 봉 값으로 채워지므로 캐시된 행은 그 시점 값을 유지
+
+라벨은 변동성 백분위/포지션 사이즈 정규화가 구간 전체 기준이고 마지막 lookahead 행은
+미래 캔들에 따라 달라지므로, 요청 구간 단위로 계산해 저장합니다 (구간이 같으면 재사용).
+
+Parquet 엔진(pyarrow/fastparquet)이 없으면 pickle로 저장합니다.
+
+Usage:
+```python
+cache = FeatureMatrixCache()
+since = cache.last_timestamp("ETHUSDT", "5m")    # 이 시각 이후 캔들만 수집
+cache.update("ETHUSDT", "5m", df_5m, df_1h)
+df_labeled = cache.training_matrix("ETHUSDT", "5m", Labeler(), start=start)
+```
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from ..features.feature_pipeline import FEATURE_PIPELINE_VERSION, FeaturePipeline
+from .labeler import Labeler
+
+logger = logging.getLogger(__name__)
+
+# Parquet 엔진 optional import
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+LABEL_COLUMNS = [
+    "label_direction", "label_volatility", "label_timing",
+    "label_stop_loss", "label_position_size",
+]
+
+# 라벨 생성 부산물 (미래 정보 포함 -> 피처에서 제외)
+LABEL_AUX_COLUMNS = ["future_return", "atr_pct", "timing_efficiency"]
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "feature_cache"
+
+
+def training_feature_columns(df: pd.DataFrame) -> List[str]:
+    """학습 행렬에서 모델 입력 피처 컬럼 (라벨/라벨 부산물/OHLCV 제외)"""
+    excluded = set(LABEL_COLUMNS) | set(LABEL_AUX_COLUMNS) | set(OHLCV_COLUMNS)
+    return [col for col in df.columns if col not in excluded]
+
+
+def candles_to_frame(candles: List[dict]) -> pd.DataFrame:
+    """캔들 리스트 [{timestamp(ms), open, ...}] -> DatetimeIndex OHLCV DataFrame"""
+    if not candles:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = pd.DataFrame(candles)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    return df.set_index("timestamp")[OHLCV_COLUMNS]
+
+
+def _normalize_candles(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    df = df[OHLCV_COLUMNS].astype(float)
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    df.index.name = "timestamp"
+    return df
+
+
+def _to_records(df: pd.DataFrame) -> List[dict]:
+    """DatetimeIndex OHLCV -> FeaturePipeline 입력 캔들 리스트"""
+    records = df.reset_index()
+    records["timestamp"] = records["timestamp"].astype("datetime64[ms]").astype("int64")
+    return records.to_dict("records")
+
+
+class FeatureMatrixCache:
+    """
+    버전별 피처/라벨 행렬 파일 캐시
+
+    키: (symbol, timeframe, FEATURE_PIPELINE_VERSION). 날짜 범위는 manifest에 기록되며
+    load_features/training_matrix가 요청 구간만 잘라서 반환합니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        warmup_candles: int = 1000,
+        htf_warmup_candles: int = 300,
+        provisional_candles: int = 3,
+        max_parts: int = 32,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.warmup_candles = warmup_candles
+        self.htf_warmup_candles = htf_warmup_candles
+        self.provisional_candles = provisional_candles
+        self.max_parts = max_parts
+        self._ext = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def entry_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.cache_dir / f"{symbol}_{timeframe}_v{FEATURE_PIPELINE_VERSION}"
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        """캐시된 마지막 캔들 시각 (없으면 None) - 이후 캔들만 수집하면 됨"""
+        manifest = self._read_manifest(self.entry_dir(symbol, timeframe))
+        return pd.Timestamp(manifest["end"]) if manifest else None
+
+    def load_features(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """캐시된 피처 행렬 [start, end] 구간"""
+        entry = self.entry_dir(symbol, timeframe)
+        manifest = self._read_manifest(entry)
+        if not manifest:
+            return pd.DataFrame()
+
+        frames = [
+            _read_frame(entry / part["file"])
+            for part in manifest["parts"]
+            if (start is None or pd.Timestamp(part["end"]) >= pd.Timestamp(start))
+            and (end is None or pd.Timestamp(part["start"]) <= pd.Timestamp(end))
+        ]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        return df.loc[start:end]
+
+    def training_matrix(
+        self,
+        symbol: str,
+        timeframe: str,
+        labeler: Labeler,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        라벨이 포함된 학습 행렬 (같은 구간/라벨러 설정이면 저장된 행렬 재사용)
+
+        Returns:
+            라벨 NaN 행이 제거된 DataFrame (캐시가 없으면 빈 DataFrame)
+        """
+        entry = self.entry_dir(symbol, timeframe)
+        manifest = self._read_manifest(entry)
+        if not manifest:
+            return pd.DataFrame()
+
+        start_ts = max(pd.Timestamp(start), pd.Timestamp(manifest["start"])) if start else pd.Timestamp(manifest["start"])
+        end_ts = min(pd.Timestamp(end), pd.Timestamp(manifest["end"])) if end else pd.Timestamp(manifest["end"])
+        key = json.dumps({
+            "start": start_ts.isoformat(),
+            "end": end_ts.isoformat(),
+            "direction_threshold": labeler.direction_threshold,
+            "volatility_percentiles": list(labeler.volatility_percentiles),
+            "lookahead_candles": labeler.lookahead_candles,
+        }, sort_keys=True)
+        label_path = entry / f"labels-{hashlib.sha1(key.encode()).hexdigest()[:12]}{self._ext}"
+
+        if label_path.exists():
+            logger.info(f"Reusing cached training matrix {label_path.name}")
+            return _read_frame(label_path)
+
+        features = self.load_features(symbol, timeframe, start_ts, end_ts)
+        if features.empty:
+            return features
+        labeled = labeler.generate_all_labels(features)
+        labeled = labeled.dropna(subset=[c for c in LABEL_COLUMNS if c in labeled.columns])
+
+        for stale in entry.glob("labels-*"):
+            stale.unlink()
+        _write_frame(labeled, label_path)
+        return labeled
+
+    # ============================================================
+    # 갱신
+    # ============================================================
+
+    def update(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: pd.DataFrame,
+        candles_htf: Optional[pd.DataFrame] = None,
+        pipeline: Optional[FeaturePipeline] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        새 캔들을 피처 행렬에 추가
+
+        Args:
+            candles: DatetimeIndex OHLCV (캐시 이후 구간만 있어도 됨, 겹치는 행은 무시)
+            candles_htf: 상위 타임프레임(1h) OHLCV (optional)
+            pipeline: FeaturePipeline (기본: 새 인스턴스)
+            now: 기준 시각 (아직 닫히지 않은 봉 제외용, 기본: 현재 UTC)
+
+        Returns:
+            추가된 행 수
+        """
+        pipeline = pipeline or FeaturePipeline()
+        now = pd.Timestamp(now or datetime.utcnow())
+        entry = self.entry_dir(symbol, timeframe)
+        manifest = self._read_manifest(entry)
+
+        candles = _closed(_normalize_candles(candles), timeframe, now)
+        htf = self._merge_htf(entry, manifest, _closed(_normalize_candles(candles_htf), "1h", now))
+
+        if manifest:
+            last = pd.Timestamp(manifest["end"])
+            candles = candles[candles.index > last]
+        if candles.empty:
+            return 0
+
+        if not manifest:
+            features = self._extract(pipeline, symbol, candles, htf)
+            if features.empty:
+                return 0
+            manifest = {
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "version": FEATURE_PIPELINE_VERSION,
+                "start": features.index[0].isoformat(),
+                "parts": [],
+                "cumulative": {},
+            }
+            entry.mkdir(parents=True, exist_ok=True)
+        else:
+            history = self.load_features(symbol, timeframe).iloc[-self.warmup_candles:]
+            window = pd.concat([history[OHLCV_COLUMNS], candles])
+            features = self._extract(pipeline, symbol, window, htf)
+            if features.empty:
+                return 0
+            features = self._continue_cumulative(features, history, manifest["cumulative"])
+            features = features[features.index > last]
+
+        # 아직 확정되지 않은 마지막 행 보류
+        if self.provisional_candles:
+            features = features.iloc[:-self.provisional_candles]
+        if features.empty:
+            return 0
+
+        typical = (features["high"] + features["low"] + features["close"]) / 3
+        cumulative = manifest["cumulative"]
+        manifest["cumulative"] = {
+            "obv": float(features["obv"].iloc[-1]),
+            "price_volume": cumulative.get("price_volume", 0.0) + float((typical * features["volume"]).sum()),
+            "volume": cumulative.get("volume", 0.0) + float(features["volume"].sum()),
+        }
+
+        part = f"part-{len(manifest['parts']):05d}{self._ext}"
+        _write_frame(features, entry / part)
+        manifest["parts"].append({
+            "file": part,
+            "start": features.index[0].isoformat(),
+            "end": features.index[-1].isoformat(),
+            "rows": len(features),
+        })
+        manifest["end"] = features.index[-1].isoformat()
+        if htf is not None:
+            _write_frame(htf, entry / f"htf{self._ext}")
+            manifest["htf_file"] = f"htf{self._ext}"
+
+        if len(manifest["parts"]) > self.max_parts:
+            self._compact(entry, manifest)
+        self._write_manifest(entry, manifest)
+
+        logger.info(
+            f"Feature cache {entry.name}: +{len(features)} rows "
+            f"({manifest['start']} ~ {manifest['end']}, {len(manifest['parts'])} parts)"
+        )
+        return len(features)
+
+    def _extract(
+        self,
+        pipeline: FeaturePipeline,
+        symbol: str,
+        candles: pd.DataFrame,
+        htf: Optional[pd.DataFrame],
+    ) -> pd.DataFrame:
+        candles_htf = None
+        if htf is not None and not htf.empty:
+            # 5분봉 구간 앞쪽 warmup만큼의 상위 TF 봉 포함
+            first = htf.index.searchsorted(candles.index[0])
+            candles_htf = _to_records(htf.iloc[max(0, first - self.htf_warmup_candles):])
+
+        # 파이프라인의 심볼별 TTL 캐시를 거치지 않도록 비움
+        pipeline.clear_cache()
+        features = pipeline.extract_features(_to_records(candles), candles_htf, symbol=symbol)
+        return features.astype(float) if not features.empty else features
+
+    def _continue_cumulative(
+        self,
+        features: pd.DataFrame,
+        history: pd.DataFrame,
+        cumulative: Dict[str, float],
+    ) -> pd.DataFrame:
+        """warmup 구간부터 다시 시작한 누적 지표를 캐시 시작 시점 기준으로 이어 붙임"""
+        features = features.copy()
+        last = history.index[-1]
+        is_new = features.index > last
+
+        # OBV: 겹치는 마지막 행에서 오프셋 보정
+        offset = cumulative["obv"] - features.at[last, "obv"]
+        features.loc[is_new, "obv"] += offset
+
+        # VWAP: 누적 가격*거래량 / 누적 거래량
+        new = features.loc[is_new]
+        typical = (new["high"] + new["low"] + new["close"]) / 3
+        price_volume = cumulative["price_volume"] + (typical * new["volume"]).cumsum()
+        volume = cumulative["volume"] + new["volume"].cumsum()
+        features.loc[is_new, "vwap"] = (price_volume / volume).to_numpy()
+        return features
+
+    def _merge_htf(
+        self,
+        entry: Path,
+        manifest: Optional[Dict],
+        candles_htf: pd.DataFrame,
+    ) -> Optional[pd.DataFrame]:
+        cached = None
+        if manifest and manifest.get("htf_file") and (entry / manifest["htf_file"]).exists():
+            cached = _read_frame(entry / manifest["htf_file"])
+        if cached is None:
+            return candles_htf if not candles_htf.empty else None
+        if candles_htf.empty:
+            return cached
+        return _normalize_candles(pd.concat([cached, candles_htf]))
+
+    def _compact(self, entry: Path, manifest: Dict) -> None:
+        """파트 파일을 하나로 병합"""
+        frames = [_read_frame(entry / part["file"]) for part in manifest["parts"]]
+        merged = pd.concat(frames)
+        name = f"part-{len(manifest['parts']):05d}{self._ext}"
+        _write_frame(merged, entry / name)
+        for part in manifest["parts"]:
+            (entry / part["file"]).unlink(missing_ok=True)
+        manifest["parts"] = [{
+            "file": name,
+            "start": merged.index[0].isoformat(),
+            "end": merged.index[-1].isoformat(),
+            "rows": len(merged),
+        }]
+
+    # ============================================================
+    # manifest
+    # ============================================================
+
+    def _read_manifest(self, entry: Path) -> Optional[Dict]:
+        path = entry / "manifest.json"
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write_manifest(self, entry: Path, manifest: Dict) -> None:
+        path = entry / "manifest.json"
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def _closed(df: pd.DataFrame, timeframe: str, now: pd.Timestamp) -> pd.DataFrame:
+    """아직 닫히지 않은 봉 제외 (open 시각 + 봉 길이 <= now)"""
+    if df.empty:
+        return df
+    return df[df.index + pd.Timedelta(timeframe.lower()) <= now]
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        df.to_parquet(tmp_path)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
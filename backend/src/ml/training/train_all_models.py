@@ -6,9 +6,14 @@ Model Trainer - 5개 LightGBM 모델 학습
 3. Timing Model (Classifier): 진입 타이밍
 4. StopLoss Model (Regressor): 최적 SL
 5. PositionSize Model (Regressor): 최적 사이즈
+
+모델들은 서로 독립이므로 프로세스 풀에서 동시에 학습합니다 (코어를 모델 수로 분할).
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -25,6 +30,114 @@ except ImportError:
     LIGHTGBM_AVAILABLE = False
     logger.warning("LightGBM not installed. Training will be disabled.")
 
+# 기본 하이퍼파라미터
+DEFAULT_CLASSIFIER_PARAMS: Dict[str, Any] = {
+    "objective": "multiclass",
+    "metric": "multi_logloss",
+    "boosting_type": "gbdt",
+    "num_leaves": 31,
+    "learning_rate": 0.05,
+    "feature_fraction": 0.8,
+    "bagging_fraction": 0.8,
+    "bagging_freq": 5,
+    "verbose": -1,
+    "num_threads": 4,
+    "max_depth": 6,
+    "min_data_in_leaf": 20,
+}
+
+DEFAULT_REGRESSOR_PARAMS: Dict[str, Any] = {
+    "objective": "regression",
+    "metric": "rmse",
+    "boosting_type": "gbdt",
+    "num_leaves": 31,
+    "learning_rate": 0.05,
+    "feature_fraction": 0.8,
+    "bagging_fraction": 0.8,
+    "bagging_freq": 5,
+    "verbose": -1,
+    "num_threads": 4,
+    "max_depth": 6,
+    "min_data_in_leaf": 20,
+}
+
+# (모델 이름, 라벨 컬럼, 클래스 수 - None이면 회귀)
+MODEL_SPECS: List[Tuple[str, str, Optional[int]]] = [
+    ("direction", "label_direction", 3),
+    ("volatility", "label_volatility", 4),
+    ("timing", "label_timing", 3),
+    ("stop_loss", "label_stop_loss", None),
+    ("position_size", "label_position_size", None),
+]
+
+
+def thread_plan(num_models: int, max_workers: Optional[int] = None) -> Tuple[int, int]:
+    """
+    (동시 학습 프로세스 수, 모델당 num_threads)
+
+    코어를 프로세스끼리 나눠 써서 전체 스레드 수가 코어 수를 넘지 않도록 합니다.
+    """
+    cores = os.cpu_count() or 1
+    workers = max(1, min(num_models, cores, max_workers or cores))
+    return workers, max(1, cores // workers)
+
+
+def _fit_model(
+    name: str,
+    params: Dict,
+    num_classes: Optional[int],
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_val: pd.DataFrame,
+    y_val: pd.Series,
+    num_boost_round: int,
+    early_stopping_rounds: int,
+) -> Tuple[str, str, Dict, np.ndarray]:
+    """
+    모델 하나 학습 (프로세스 풀 워커에서 실행)
+
+    Booster는 프로세스 간에 문자열로 주고받습니다.
+
+    Returns:
+        (모델 이름, 모델 문자열, 평가 지표, gain 피처 중요도)
+    """
+    logger.info(f"Training {name} model...")
+    train_data = lgb.Dataset(X_train, label=y_train)
+    val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
+
+    callbacks = [
+        lgb.early_stopping(stopping_rounds=early_stopping_rounds),
+        lgb.log_evaluation(period=100),
+    ]
+
+    model = lgb.train(
+        params,
+        train_data,
+        num_boost_round=num_boost_round,
+        valid_sets=[train_data, val_data],
+        valid_names=['train', 'valid'],
+        callbacks=callbacks,
+    )
+
+    # 평가
+    y_pred = model.predict(X_val)
+    if num_classes:
+        y_pred_class = np.argmax(y_pred, axis=1)
+        metrics = {
+            'accuracy': (y_pred_class == y_val).mean(),
+            'best_iteration': model.best_iteration,
+            'num_classes': num_classes,
+        }
+    else:
+        metrics = {
+            'rmse': np.sqrt(np.mean((y_pred - y_val) ** 2)),
+            'mae': np.mean(np.abs(y_pred - y_val)),
+            'best_iteration': model.best_iteration,
+        }
+
+    importance = model.feature_importance(importance_type='gain')
+    return name, model.model_to_string(), metrics, importance
+
 
 class ModelTrainer:
     """
@@ -48,35 +161,8 @@ class ModelTrainer:
         self.models_dir.mkdir(parents=True, exist_ok=True)
 
         # 기본 하이퍼파라미터
-        self.classifier_params = classifier_params or {
-            "objective": "multiclass",
-            "metric": "multi_logloss",
-            "boosting_type": "gbdt",
-            "num_leaves": 31,
-            "learning_rate": 0.05,
-            "feature_fraction": 0.8,
-            "bagging_fraction": 0.8,
-            "bagging_freq": 5,
-            "verbose": -1,
-            "num_threads": 4,
-            "max_depth": 6,
-            "min_data_in_leaf": 20,
-        }
-
-        self.regressor_params = regressor_params or {
-            "objective": "regression",
-            "metric": "rmse",
-            "boosting_type": "gbdt",
-            "num_leaves": 31,
-            "learning_rate": 0.05,
-            "feature_fraction": 0.8,
-            "bagging_fraction": 0.8,
-            "bagging_freq": 5,
-            "verbose": -1,
-            "num_threads": 4,
-            "max_depth": 6,
-            "min_data_in_leaf": 20,
-        }
+        self.classifier_params = classifier_params or DEFAULT_CLASSIFIER_PARAMS.copy()
+        self.regressor_params = regressor_params or DEFAULT_REGRESSOR_PARAMS.copy()
 
         # 학습된 모델 저장
         self.models: Dict[str, Any] = {}
@@ -91,16 +177,23 @@ class ModelTrainer:
         test_size: float = 0.2,
         num_boost_round: int = 500,
         early_stopping_rounds: int = 50,
+        max_workers: Optional[int] = None,
+        model_params: Optional[Dict[str, Dict]] = None,
     ) -> Dict[str, Dict]:
         """
         모든 모델 학습
 
+        5개 모델은 서로 독립이므로 프로세스 풀에서 동시에 학습하고,
+        CPU 코어를 모델 수로 나눠 각 모델의 num_threads로 지정합니다.
+
         Args:
             df: 라벨이 포함된 DataFrame
             feature_columns: 피처 컬럼 목록
             test_size: 테스트 데이터 비율
             num_boost_round: 부스팅 라운드
             early_stopping_rounds: 조기 종료 라운드
+            max_workers: 동시 학습 프로세스 수 (기본: min(모델 수, CPU 코어), 1이면 순차 학습)
+            model_params: 모델별 하이퍼파라미터 덮어쓰기 (예: CrossValidationReport.best_params())
 
         Returns:
             각 모델의 학습 결과
@@ -109,164 +202,53 @@ class ModelTrainer:
             logger.error("LightGBM not available. Cannot train models.")
             return {}
 
-        results = {}
-
         # 데이터 분할
         train_df, val_df = self._split_data(df, test_size)
 
         X_train = train_df[feature_columns]
         X_val = val_df[feature_columns]
 
-        # 1. Direction Model
-        if 'label_direction' in df.columns:
-            logger.info("Training Direction model...")
-            results['direction'] = self._train_classifier(
-                X_train, train_df['label_direction'],
-                X_val, val_df['label_direction'],
-                model_name='direction',
-                num_classes=3,
-                num_boost_round=num_boost_round,
-                early_stopping_rounds=early_stopping_rounds,
-            )
-
-        # 2. Volatility Model
-        if 'label_volatility' in df.columns:
-            logger.info("Training Volatility model...")
-            results['volatility'] = self._train_classifier(
-                X_train, train_df['label_volatility'],
-                X_val, val_df['label_volatility'],
-                model_name='volatility',
-                num_classes=4,
-                num_boost_round=num_boost_round,
-                early_stopping_rounds=early_stopping_rounds,
-            )
-
-        # 3. Timing Model
-        if 'label_timing' in df.columns:
-            logger.info("Training Timing model...")
-            results['timing'] = self._train_classifier(
-                X_train, train_df['label_timing'],
-                X_val, val_df['label_timing'],
-                model_name='timing',
-                num_classes=3,
-                num_boost_round=num_boost_round,
-                early_stopping_rounds=early_stopping_rounds,
-            )
-
-        # 4. StopLoss Model
-        if 'label_stop_loss' in df.columns:
-            logger.info("Training StopLoss model...")
-            results['stop_loss'] = self._train_regressor(
-                X_train, train_df['label_stop_loss'],
-                X_val, val_df['label_stop_loss'],
-                model_name='stop_loss',
-                num_boost_round=num_boost_round,
-                early_stopping_rounds=early_stopping_rounds,
-            )
-
-        # 5. PositionSize Model
-        if 'label_position_size' in df.columns:
-            logger.info("Training PositionSize model...")
-            results['position_size'] = self._train_regressor(
-                X_train, train_df['label_position_size'],
-                X_val, val_df['label_position_size'],
-                model_name='position_size',
-                num_boost_round=num_boost_round,
-                early_stopping_rounds=early_stopping_rounds,
-            )
-
-        logger.info(f"Training complete. Models: {list(self.models.keys())}")
-        return results
-
-    def _train_classifier(
-        self,
-        X_train: pd.DataFrame,
-        y_train: pd.Series,
-        X_val: pd.DataFrame,
-        y_val: pd.Series,
-        model_name: str,
-        num_classes: int,
-        num_boost_round: int,
-        early_stopping_rounds: int,
-    ) -> Dict:
-        """분류 모델 학습"""
-        params = self.classifier_params.copy()
-        params['num_class'] = num_classes
-
-        train_data = lgb.Dataset(X_train, label=y_train)
-        val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
-
-        callbacks = [
-            lgb.early_stopping(stopping_rounds=early_stopping_rounds),
-            lgb.log_evaluation(period=100),
-        ]
-
-        model = lgb.train(
-            params,
-            train_data,
-            num_boost_round=num_boost_round,
-            valid_sets=[train_data, val_data],
-            valid_names=['train', 'valid'],
-            callbacks=callbacks,
+        specs = [spec for spec in MODEL_SPECS if spec[1] in df.columns]
+        workers, threads = thread_plan(len(specs), max_workers)
+
+        tasks = []
+        for name, label, num_classes in specs:
+            if num_classes:
+                params = {**self.classifier_params, "num_class": num_classes}
+            else:
+                params = self.regressor_params.copy()
+            params.update((model_params or {}).get(name, {}))
+            params["num_threads"] = threads
+            tasks.append((
+                name, params, num_classes,
+                X_train, train_df[label], X_val, val_df[label],
+                num_boost_round, early_stopping_rounds,
+            ))
+
+        logger.info(
+            f"Training {[t[0] for t in tasks]} with {workers} worker(s) x {threads} thread(s)"
         )
 
-        self.models[model_name] = model
-        self._save_feature_importance(model, model_name, X_train.columns)
-
-        # 평가
-        y_pred = model.predict(X_val)
-        y_pred_class = np.argmax(y_pred, axis=1)
-        accuracy = (y_pred_class == y_val).mean()
-
-        return {
-            'accuracy': accuracy,
-            'best_iteration': model.best_iteration,
-            'num_classes': num_classes,
-        }
-
-    def _train_regressor(
-        self,
-        X_train: pd.DataFrame,
-        y_train: pd.Series,
-        X_val: pd.DataFrame,
-        y_val: pd.Series,
-        model_name: str,
-        num_boost_round: int,
-        early_stopping_rounds: int,
-    ) -> Dict:
-        """회귀 모델 학습"""
-        params = self.regressor_params.copy()
-
-        train_data = lgb.Dataset(X_train, label=y_train)
-        val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
-
-        callbacks = [
-            lgb.early_stopping(stopping_rounds=early_stopping_rounds),
-            lgb.log_evaluation(period=100),
-        ]
-
-        model = lgb.train(
-            params,
-            train_data,
-            num_boost_round=num_boost_round,
-            valid_sets=[train_data, val_data],
-            valid_names=['train', 'valid'],
-            callbacks=callbacks,
-        )
-
-        self.models[model_name] = model
-        self._save_feature_importance(model, model_name, X_train.columns)
+        if workers > 1:
+            # fork 후 OpenMP 상태 공유로 인한 교착을 피하기 위해 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                outputs = list(pool.map(_fit_model, *zip(*tasks)))
+        else:
+            outputs = [_fit_model(*task) for task in tasks]
 
-        # 평가
-        y_pred = model.predict(X_val)
-        rmse = np.sqrt(np.mean((y_pred - y_val) ** 2))
-        mae = np.mean(np.abs(y_pred - y_val))
+        results = {}
+        for name, model_str, metrics, importance in outputs:
+            model = lgb.Booster(model_str=model_str)
+            self.models[name] = model
+            self.feature_importance[name] = pd.DataFrame({
+                'feature': feature_columns,
+                'importance': importance,
+            }).sort_values('importance', ascending=False)
+            results[name] = metrics
 
-        return {
-            'rmse': rmse,
-            'mae': mae,
-            'best_iteration': model.best_iteration,
-        }
+        logger.info(f"Training complete. Models: {list(self.models.keys())}")
+        return results
 
     def _split_data(
         self,
@@ -277,23 +259,18 @@ class ModelTrainer:
         split_idx = int(len(df) * (1 - test_size))
         return df.iloc[:split_idx], df.iloc[split_idx:]
 
-    def _save_feature_importance(
-        self,
-        model: Any,
-        model_name: str,
-        feature_names: List[str]
-    ):
-        """피처 중요도 저장"""
-        importance = model.feature_importance(importance_type='gain')
-        fi_df = pd.DataFrame({
-            'feature': feature_names,
-            'importance': importance
-        }).sort_values('importance', ascending=False)
+    def save_all(self) -> str:
+        """
+        모든 모델 저장 (EnsemblePredictor와 호환되는 파일명 사용)
 
-        self.feature_importance[model_name] = fi_df
+        각 파일은 임시 파일에 쓴 뒤 원자적으로 교체하고, 마지막에
+        버전 매니페스트를 기록해 실행 중인 ModelRegistry가 핫스왑하도록 합니다.
+
+        Returns:
+            새 모델 버전
+        """
+        from ..models.model_registry import write_manifest
 
-    def save_all(self):
-        """모든 모델 저장 (EnsemblePredictor와 호환되는 파일명 사용)"""
         # EnsemblePredictor가 기대하는 파일명 매핑
         filename_map = {
             "direction": "lightgbm_direction.txt",
@@ -303,17 +280,28 @@ class ModelTrainer:
             "position_size": "lightgbm_position_size.txt",
         }
 
+        saved_files = []
         for name, model in self.models.items():
             # EnsemblePredictor 호환 파일명 사용
             filename = filename_map.get(name, f"lightgbm_{name}.txt")
             model_path = self.models_dir / filename
-            model.save_model(str(model_path))
+            tmp_path = model_path.with_name(model_path.name + ".tmp")
+            model.save_model(str(tmp_path))
+            tmp_path.replace(model_path)
+            saved_files.append(filename)
             logger.info(f"Saved {name} model to {model_path}")
 
             # 피처 중요도 저장
             if name in self.feature_importance:
                 fi_path = self.models_dir / f"{name}_feature_importance.csv"
-                self.feature_importance[name].to_csv(fi_path, index=False)
+                tmp_path = fi_path.with_name(fi_path.name + ".tmp")
+                self.feature_importance[name].to_csv(tmp_path, index=False)
+                tmp_path.replace(fi_path)
+                saved_files.append(fi_path.name)
+
+        version = write_manifest(self.models_dir, saved_files)
+        logger.info(f"Model version {version} published")
+        return version
 
     def load_model(self, model_name: str) -> Optional[Any]:
         """모델 로드"""
@@ -2,17 +2,31 @@
 ML Validation Module - 모델 검증 및 백테스트
 
 Components:
-- Backtester: ML 예측 기반 백테스트
+- Backtester: ML 예측 기반 백테스트 (run / run_vectorized)
+- CrossValidator: 워크포워드 / Purged K-Fold 모델 검증
 - ABTester: A/B 테스트 프레임워크
 - PaperTrader: 페이퍼 트레이딩 시뮬레이터
 """
 
 from .ab_tester import ABTester, ABTestResult
-from .backtester import Backtester, BacktestResult
+from .backtester import Backtester, BacktestResult, signals_from_batch
+from .cross_validation import (
+    CrossValidationReport,
+    CrossValidator,
+    holdout_fold,
+    purged_kfold_folds,
+    walk_forward_folds,
+)
 
 __all__ = [
     "Backtester",
     "BacktestResult",
+    "signals_from_batch",
+    "CrossValidator",
+    "CrossValidationReport",
+    "walk_forward_folds",
+    "holdout_fold",
+    "purged_kfold_folds",
     "ABTester",
     "ABTestResult",
 ]
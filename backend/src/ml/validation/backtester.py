@@ -2,12 +2,17 @@
 Backtester - ML 예측 기반 백테스트
 
 ML 모델의 실제 거래 성능을 시뮬레이션하여 검증
+
+- run(): 캔들 단위 순회 (기준 구현)
+- run_vectorized(): 같은 결과를 NumPy 배열 연산으로 계산 (검증용 고속 경로)
+  진입 조건은 배열 마스크, 청산은 포지션마다 이후 구간에서 첫 SL/TP 도달 캔들 검색,
+  자산 곡선은 청산 시점 손익의 누적합으로 구성
 """
 
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -87,6 +92,32 @@ class BacktestResult:
         }
 
 
+def signals_from_batch(batch: pd.DataFrame) -> pd.DataFrame:
+    """
+    EnsemblePredictor.predict_batch() 결과 -> 백테스트 시그널 프레임
+
+    Returns:
+        recommended_action, confidence, timing, position_size_percent, stop_loss_percent 컬럼
+        (run_vectorized의 predictions로 그대로 사용)
+    """
+    direction = batch["direction"].to_numpy()
+    return pd.DataFrame(
+        {
+            "recommended_action": np.where(
+                direction == "long", "buy", np.where(direction == "short", "sell", "hold")
+            ),
+            "confidence": batch["combined_confidence"].to_numpy(dtype=float),
+            "timing": np.where(
+                batch["timing_waiting"].to_numpy(), "bad",
+                np.where(batch["timing_good"].to_numpy(), "good", "ok"),
+            ),
+            "position_size_percent": batch["position_size_percent"].to_numpy(dtype=float),
+            "stop_loss_percent": batch["stop_loss_percent"].to_numpy(dtype=float),
+        },
+        index=batch.index,
+    )
+
+
 class Backtester:
     """
     ML 예측 기반 백테스터
@@ -211,14 +242,156 @@ class Backtester:
 
         return result
 
+    def run_vectorized(
+        self,
+        candles: pd.DataFrame,
+        predictions: Union[List[Dict[str, Any]], pd.DataFrame],
+        symbol: str = "ETHUSDT",
+    ) -> BacktestResult:
+        """
+        배열 연산 백테스트 (run()과 같은 거래/지표)
+
+        Args:
+            candles: OHLCV DataFrame (index=timestamp)
+            predictions: run()과 같은 예측 리스트, 또는 candles와 같은 index의
+                시그널 DataFrame (signals_from_batch 출력)
+            symbol: 심볼
+
+        Returns:
+            BacktestResult
+        """
+        result = BacktestResult(
+            symbol=symbol,
+            initial_capital=self.initial_capital,
+        )
+
+        if len(candles) == 0 or len(predictions) == 0:
+            logger.warning("Empty data, returning default result")
+            return result
+
+        index = candles.index
+        close = candles['close'].to_numpy(dtype=float)
+        high = candles['high'].to_numpy(dtype=float)
+        low = candles['low'].to_numpy(dtype=float)
+        n = len(close)
+
+        preds = self._align_predictions(index, predictions)
+        enter_idx = np.flatnonzero(
+            [pred is not None and self._should_enter(pred) for pred in preds]
+        )
+
+        result.start_date = str(index[0])
+        result.end_date = str(index[-1])
+
+        capital = self.initial_capital
+        pnl_at = np.zeros(n)
+        trades: List[Trade] = []
+        position: Optional[Trade] = None
+        cursor = 0  # 진입 가능한 첫 캔들
+
+        while True:
+            k = np.searchsorted(enter_idx, cursor)
+            if k >= len(enter_idx):
+                break
+            entry = int(enter_idx[k])
+            position = self._open_position(index[entry], float(close[entry]), capital, preds[entry])
+
+            # 다음 캔들부터 첫 SL/TP 도달 (SL 우선)
+            if position.side == 'long':
+                sl_hit = low[entry + 1:] <= position.stop_loss
+                tp_hit = high[entry + 1:] >= position.take_profit
+            else:
+                sl_hit = high[entry + 1:] >= position.stop_loss
+                tp_hit = low[entry + 1:] <= position.take_profit
+            hit = sl_hit | tp_hit
+            if not hit.any():
+                break
+
+            offset = int(np.argmax(hit))
+            exit_ = entry + 1 + offset
+            position.exit_time = index[exit_]
+            position.exit_price = float(close[exit_])
+            position.exit_reason = "sl" if sl_hit[offset] else "tp"
+            position.pnl = self._calculate_pnl(position)
+            position.pnl_percent = position.pnl / (position.entry_price * position.size) * 100
+
+            capital += position.pnl
+            pnl_at[exit_] = position.pnl
+            trades.append(position)
+            position = None
+            # 청산한 캔들에서 바로 재진입 가능 (run()과 동일)
+            cursor = exit_
+
+        # 캔들별 실현 자산 (run()의 순차 누적과 같은 덧셈 순서)
+        equity_curve = np.cumsum(np.concatenate(([self.initial_capital], pnl_at))).tolist()
+
+        # 열린 포지션 강제 청산
+        if position:
+            position.exit_time = index[-1]
+            position.exit_price = float(close[-1])
+            position.exit_reason = "end"
+            position.pnl = self._calculate_pnl(position)
+            trades.append(position)
+            capital += position.pnl
+
+        result.final_capital = capital
+        result.trades = trades
+        result.equity_curve = equity_curve
+        result = self._calculate_metrics(result)
+
+        logger.info(
+            f"Vectorized backtest complete: {len(trades)} trades, "
+            f"Return: {result.total_return:.2f}%, "
+            f"Win rate: {result.win_rate:.2f}%"
+        )
+
+        return result
+
+    def _align_predictions(
+        self,
+        index: pd.Index,
+        predictions: Union[List[Dict[str, Any]], pd.DataFrame],
+    ) -> List[Optional[Dict]]:
+        """예측을 캔들 순서 리스트로 정렬 (예측 없는 캔들은 None)"""
+        if isinstance(predictions, pd.DataFrame):
+            frame = predictions.reindex(index)
+            actions = frame['recommended_action'].to_numpy()
+            confidences = frame['confidence'].to_numpy(dtype=float)
+            timings = frame['timing'].to_numpy()
+            sizes = frame['position_size_percent'].to_numpy(dtype=float)
+            sls = frame['stop_loss_percent'].to_numpy(dtype=float)
+            return [
+                None if not isinstance(actions[i], str) else {
+                    'recommended_action': actions[i],
+                    'confidence': {'overall': float(confidences[i])},
+                    'timing': timings[i],
+                    'position_size_percent': float(sizes[i]),
+                    'stop_loss_percent': float(sls[i]),
+                }
+                for i in range(len(index))
+            ]
+
+        pred_by_time = self._map_predictions(predictions)
+        return [pred_by_time.get(ts) for ts in index]
+
     def _map_predictions(self, predictions: List[Dict]) -> Dict[Any, Dict]:
-        """예측을 timestamp로 매핑"""
+        """예측을 timestamp로 매핑 (문자열 timestamp는 한 번에 파싱)"""
+        strings = list({
+            pred['timestamp'] for pred in predictions
+            if isinstance(pred.get('timestamp'), str) and pred['timestamp']
+        })
+        try:
+            parsed = dict(zip(strings, pd.to_datetime(strings)))
+        except (ValueError, TypeError):
+            # 형식이 섞여 있으면 개별 파싱
+            parsed = {ts: pd.to_datetime(ts) for ts in strings}
+
         result = {}
         for pred in predictions:
             ts = pred.get('timestamp')
             if ts:
                 if isinstance(ts, str):
-                    ts = pd.to_datetime(ts)
+                    ts = parsed[ts]
                 result[ts] = pred
         return result
 
@@ -337,14 +510,9 @@ class Backtester:
 
         # Max Drawdown
         equity = result.equity_curve
-        peak = equity[0]
-        max_dd = 0
-        for e in equity:
-            if e > peak:
-                peak = e
-            dd = (peak - e) / peak * 100
-            max_dd = max(max_dd, dd)
-        result.max_drawdown = max_dd
+        equity_arr = np.asarray(equity, dtype=float)
+        peak = np.maximum.accumulate(equity_arr)
+        result.max_drawdown = max(0, float(((peak - equity_arr) / peak * 100).max()))
 
         # Sharpe Ratio (연환산)
         if len(equity) > 1:
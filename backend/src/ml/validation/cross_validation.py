@@ -0,0 +1,482 @@
+"""
+Cross Validation - 워크포워드 / Purged K-Fold 모델 검증
+
+단일 train/val 분할 대신 시계열 폴드 여러 개로 5개 모델과 하이퍼파라미터 후보를 평가합니다.
+
+- walk_forward_folds(): 과거 구간으로 학습하고 바로 다음 구간으로 평가 (확장/슬라이딩 윈도우)
+- purged_kfold_folds(): 연속 블록 K-Fold. 라벨이 lookahead 캔들만큼 미래를 보므로
+  평가 블록 앞 purge개 학습 샘플 제거, 평가 블록 뒤 embargo개 학습 샘플 제거
+- holdout_fold(): 마지막 구간을 하이퍼파라미터 선택에서 떼어 두는 홀드아웃.
+  후보 선택은 그 앞 구간의 폴드로만 하고, 선택된 후보를 홀드아웃에서 한 번 더 평가해
+  배포 판단(report.metrics())은 선택에 쓰이지 않은 홀드아웃 지표로 합니다.
+
+피처 행렬은 한 번만 만들고(float32), 라벨별 LightGBM Dataset도 워커당 한 번만 구성(binning)합니다.
+폴드는 정수 인덱스로만 표현되고 Dataset.subset()으로 학습/조기종료 세트를 만들어 데이터를 복사하지 않습니다.
+(모델, 후보, 폴드) 작업은 프로세스 풀에서 병렬 실행되며, 데이터는 워커 초기화 때 한 번만 전달됩니다.
+
+Usage:
+```python
+validator = CrossValidator(method="walk_forward", n_folds=5)
+report = validator.run(df_labeled, feature_columns)
+report.metrics()       # check_performance 호환 {model: {accuracy|rmse: 홀드아웃 지표}}
+report.best_params()   # ModelTrainer.train_all(model_params=...)
+```
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..training.train_all_models import (
+    DEFAULT_CLASSIFIER_PARAMS,
+    DEFAULT_REGRESSOR_PARAMS,
+    LIGHTGBM_AVAILABLE,
+    MODEL_SPECS,
+    thread_plan,
+)
+
+if LIGHTGBM_AVAILABLE:
+    import lightgbm as lgb
+
+logger = logging.getLogger(__name__)
+
+# 기본 하이퍼파라미터 후보 (기본값 대비 덮어쓸 항목)
+DEFAULT_PARAM_GRID: List[Dict[str, Any]] = [
+    {},
+    {"num_leaves": 15, "min_data_in_leaf": 50},
+    {"num_leaves": 63, "learning_rate": 0.03, "max_depth": 8},
+]
+
+# 조기 종료용 검증 세트 비율 (학습 구간의 마지막 부분)
+EARLY_STOPPING_FRACTION = 0.1
+
+# 배포 판단용 홀드아웃 비율 (전체의 마지막 부분, 후보 선택에 사용하지 않음)
+DEFAULT_HOLDOUT_FRACTION = 0.15
+
+
+# ============================================================
+# 폴드 생성
+# ============================================================
+
+
+@dataclass(frozen=True)
+class Fold:
+    """폴드 - 학습 샘플 위치(정수 인덱스)와 평가 구간(연속 slice)"""
+
+    index: int
+    train: np.ndarray
+    test: slice
+
+    @property
+    def test_size(self) -> int:
+        return self.test.stop - self.test.start
+
+
+def walk_forward_folds(
+    n_samples: int,
+    n_folds: int = 5,
+    test_size: Optional[int] = None,
+    min_train_size: Optional[int] = None,
+    max_train_size: Optional[int] = None,
+    purge: int = 0,
+) -> List[Fold]:
+    """
+    워크포워드 폴드
+
+    마지막 n_folds * test_size 샘플을 평가 구간으로 나누고, 각 평가 구간 이전 데이터로 학습합니다.
+    max_train_size를 주면 슬라이딩 윈도우, 아니면 확장 윈도우입니다.
+    평가 구간 직전 purge개 샘플은 라벨이 평가 구간과 겹치므로 학습에서 제외합니다.
+    학습 샘플이 min_train_size(기본: test_size의 절반)보다 적은 폴드는 건너뜁니다.
+    """
+    test_size = test_size or n_samples // (n_folds + 1)
+    min_train_size = min_train_size or test_size // 2
+    folds = []
+    for k in range(n_folds):
+        test_start = n_samples - (n_folds - k) * test_size
+        train_end = test_start - purge
+        train_start = 0 if max_train_size is None else max(0, train_end - max_train_size)
+        if train_end - train_start < min_train_size:
+            continue
+        folds.append(Fold(
+            index=len(folds),
+            train=np.arange(train_start, train_end),
+            test=slice(test_start, test_start + test_size),
+        ))
+    return folds
+
+
+def purged_kfold_folds(
+    n_samples: int,
+    n_folds: int = 5,
+    purge: int = 0,
+    embargo: int = 0,
+) -> List[Fold]:
+    """
+    Purged K-Fold (연속 블록)
+
+    평가 블록 [s, e)에 대해 [s - purge, e + embargo) 구간을 학습에서 제외합니다.
+    """
+    bounds = np.linspace(0, n_samples, n_folds + 1).astype(int)
+    folds = []
+    for k in range(n_folds):
+        start, end = int(bounds[k]), int(bounds[k + 1])
+        mask = np.ones(n_samples, dtype=bool)
+        mask[max(0, start - purge):min(n_samples, end + embargo)] = False
+        folds.append(Fold(index=k, train=np.flatnonzero(mask), test=slice(start, end)))
+    return folds
+
+
+def holdout_fold(n_samples: int, holdout_fraction: float, purge: int = 0) -> Tuple[int, Optional[Fold]]:
+    """
+    마지막 구간 홀드아웃
+
+    Returns:
+        (선택용 폴드를 만들 샘플 수, 홀드아웃 폴드 - 비율이 0이면 None)
+
+    홀드아웃 [n - h, n) 직전 purge개 샘플은 라벨이 홀드아웃과 겹치므로
+    선택용 폴드와 홀드아웃 학습 양쪽에서 제외합니다.
+    """
+    n_holdout = int(n_samples * holdout_fraction)
+    if n_holdout <= 0:
+        return n_samples, None
+    n_selection = max(0, n_samples - n_holdout - purge)
+    return n_selection, Fold(
+        index=0,
+        train=np.arange(0, n_selection),
+        test=slice(n_samples - n_holdout, n_samples),
+    )
+
+
+# ============================================================
+# 결과 리포트
+# ============================================================
+
+
+def _primary_metric(model: str) -> Tuple[str, bool]:
+    """(대표 지표, 클수록 좋은지)"""
+    num_classes = {name: classes for name, _, classes in MODEL_SPECS}.get(model)
+    return ("accuracy", True) if num_classes else ("rmse", False)
+
+
+@dataclass
+class FoldResult:
+    """(모델, 후보, 폴드) 하나의 평가 결과"""
+
+    model: str
+    candidate: int
+    fold: int
+    train_size: int
+    test_size: int
+    metrics: Dict[str, float]
+    best_iteration: int = 0
+
+
+@dataclass
+class CrossValidationReport:
+    """폴드별 지표와 모델별 요약 (results: 후보 선택 폴드, holdout: 선택된 후보의 홀드아웃 평가)"""
+
+    method: str
+    n_folds: int
+    candidates: List[Dict[str, Any]]
+    results: List[FoldResult] = field(default_factory=list)
+    holdout: List[FoldResult] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모델별 최적 후보와 폴드 지표 요약
+
+        Returns:
+            {model: {metric, candidate, params, mean, std, min, max, folds: [...], candidates: {i: mean}}}
+        """
+        summary = {}
+        for model in dict.fromkeys(r.model for r in self.results):
+            metric, higher_is_better = _primary_metric(model)
+            by_candidate: Dict[int, List[FoldResult]] = {}
+            for result in self.results:
+                if result.model == model:
+                    by_candidate.setdefault(result.candidate, []).append(result)
+
+            means = {
+                candidate: float(np.mean([r.metrics[metric] for r in rows]))
+                for candidate, rows in by_candidate.items()
+            }
+            pick = max if higher_is_better else min
+            best = pick(means, key=means.get)
+            rows = sorted(by_candidate[best], key=lambda r: r.fold)
+            values = np.array([r.metrics[metric] for r in rows])
+
+            summary[model] = {
+                "metric": metric,
+                "candidate": best,
+                "params": self.candidates[best],
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "folds": [
+                    {"fold": r.fold, "train_size": r.train_size, "test_size": r.test_size,
+                     "best_iteration": r.best_iteration, **r.metrics}
+                    for r in rows
+                ],
+                "candidates": means,
+            }
+        return summary
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        배포 판단 지표 (auto_retrain.check_performance 입력 형식)
+
+        홀드아웃 결과가 있는 모델은 홀드아웃 지표(+ 선택 폴드 평균 cv_*), 없으면 최적 후보의 폴드 평균.
+        worst_*는 선택 폴드 중 최악 값입니다.
+        """
+        holdout = {r.model: r for r in self.holdout}
+        metrics = {}
+        for model, item in self.summary().items():
+            names = item["folds"][0].keys() - {"fold", "train_size", "test_size", "best_iteration"}
+            cv_means = {name: float(np.mean([fold[name] for fold in item["folds"]])) for name in names}
+            if model in holdout:
+                metrics[model] = {name: float(value) for name, value in holdout[model].metrics.items()}
+                metrics[model].update({f"cv_{name}": value for name, value in cv_means.items()})
+            else:
+                metrics[model] = cv_means
+            metrics[model][f"worst_{item['metric']}"] = item["min"] if item["metric"] == "accuracy" else item["max"]
+        return metrics
+
+    def best_params(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 최적 하이퍼파라미터 덮어쓰기 (ModelTrainer.train_all(model_params=...))"""
+        return {model: item["params"] for model, item in self.summary().items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "n_folds": self.n_folds,
+            "candidates": self.candidates,
+            "summary": self.summary(),
+            "metrics": self.metrics(),
+            "results": [asdict(r) for r in self.results],
+            "holdout": [asdict(r) for r in self.holdout],
+        }
+
+
+# ============================================================
+# 병렬 실행 (워커)
+# ============================================================
+
+# 워커 프로세스별 공유 데이터 (초기화 시 1회 전달)
+_worker_X: Optional[np.ndarray] = None
+_worker_labels: Dict[str, np.ndarray] = {}
+_worker_datasets: Dict[str, Any] = {}
+
+
+def _init_worker(X: np.ndarray, labels: Dict[str, np.ndarray]) -> None:
+    global _worker_X, _worker_labels, _worker_datasets
+    _worker_X = X
+    _worker_labels = labels
+    _worker_datasets = {}
+
+
+def _dataset(label: str) -> "lgb.Dataset":
+    """라벨별 전체 Dataset (binning 1회, 폴드는 subset으로 참조)"""
+    if label not in _worker_datasets:
+        dataset = lgb.Dataset(_worker_X, label=_worker_labels[label], free_raw_data=False)
+        _worker_datasets[label] = dataset.construct()
+    return _worker_datasets[label]
+
+
+def _run_fold(
+    model: str,
+    label: str,
+    num_classes: Optional[int],
+    candidate: int,
+    params: Dict[str, Any],
+    fold: Fold,
+    num_boost_round: int,
+    early_stopping_rounds: int,
+    purge: int,
+) -> FoldResult:
+    """(모델, 후보, 폴드) 하나 학습 + 평가"""
+    full = _dataset(label)
+
+    # 학습 구간 마지막 부분을 조기 종료용으로 분리 (라벨 겹침만큼 purge)
+    n_stop = max(1, int(len(fold.train) * EARLY_STOPPING_FRACTION))
+    fit_idx = fold.train[:max(1, len(fold.train) - n_stop - purge)]
+    stop_idx = fold.train[-n_stop:]
+
+    booster = lgb.train(
+        params,
+        full.subset(fit_idx),
+        num_boost_round=num_boost_round,
+        valid_sets=[full.subset(stop_idx)],
+        valid_names=["valid"],
+        callbacks=[lgb.early_stopping(stopping_rounds=early_stopping_rounds, verbose=False)],
+    )
+
+    X_test = _worker_X[fold.test]
+    y_test = _worker_labels[label][fold.test]
+    y_pred = booster.predict(X_test, num_iteration=booster.best_iteration)
+
+    if num_classes:
+        metrics = {"accuracy": float((np.argmax(y_pred, axis=1) == y_test).mean())}
+    else:
+        metrics = {
+            "rmse": float(np.sqrt(np.mean((y_pred - y_test) ** 2))),
+            "mae": float(np.mean(np.abs(y_pred - y_test))),
+        }
+
+    return FoldResult(
+        model=model,
+        candidate=candidate,
+        fold=fold.index,
+        train_size=len(fit_idx),
+        test_size=fold.test_size,
+        metrics=metrics,
+        best_iteration=int(booster.best_iteration),
+    )
+
+
+# ============================================================
+# CrossValidator
+# ============================================================
+
+
+class CrossValidator:
+    """
+    워크포워드 / Purged K-Fold 검증기
+
+    Usage:
+    ```python
+    validator = CrossValidator(method="purged_kfold", purge=6, embargo=6)
+    report = validator.run(df_labeled, feature_columns)
+    ```
+    """
+
+    def __init__(
+        self,
+        method: str = "walk_forward",
+        n_folds: int = 5,
+        purge: int = 6,
+        embargo: int = 6,
+        param_grid: Optional[List[Dict[str, Any]]] = None,
+        num_boost_round: int = 300,
+        early_stopping_rounds: int = 30,
+        max_workers: Optional[int] = None,
+        classifier_params: Optional[Dict] = None,
+        regressor_params: Optional[Dict] = None,
+        holdout_fraction: float = DEFAULT_HOLDOUT_FRACTION,
+    ):
+        if method not in ("walk_forward", "purged_kfold"):
+            raise ValueError(f"Unknown cross validation method: {method}")
+        self.method = method
+        self.n_folds = n_folds
+        self.purge = purge  # 라벨 lookahead 캔들 수 (Labeler.lookahead_candles)
+        self.embargo = embargo
+        self.param_grid = param_grid or DEFAULT_PARAM_GRID
+        self.num_boost_round = num_boost_round
+        self.early_stopping_rounds = early_stopping_rounds
+        self.max_workers = max_workers
+        self.classifier_params = classifier_params or DEFAULT_CLASSIFIER_PARAMS
+        self.regressor_params = regressor_params or DEFAULT_REGRESSOR_PARAMS
+        self.holdout_fraction = holdout_fraction  # 0이면 폴드 평균으로 배포 판단
+
+    def folds(self, n_samples: int) -> List[Fold]:
+        if self.method == "walk_forward":
+            return walk_forward_folds(n_samples, self.n_folds, purge=self.purge)
+        return purged_kfold_folds(n_samples, self.n_folds, purge=self.purge, embargo=self.embargo)
+
+    def run(self, df: pd.DataFrame, feature_columns: List[str]) -> CrossValidationReport:
+        """
+        모든 (모델, 후보, 폴드) 평가 후 모델별 최적 후보를 홀드아웃에서 평가
+
+        Returns:
+            CrossValidationReport (LightGBM이 없으면 결과 없는 리포트)
+        """
+        report = CrossValidationReport(
+            method=self.method, n_folds=self.n_folds, candidates=list(self.param_grid)
+        )
+        if not LIGHTGBM_AVAILABLE:
+            logger.error("LightGBM not available. Cannot cross-validate models.")
+            return report
+
+        # 피처 행렬 1회 생성 (폴드는 인덱스로만 참조)
+        X = np.ascontiguousarray(df[feature_columns].to_numpy(dtype=np.float32))
+        specs = [spec for spec in MODEL_SPECS if spec[1] in df.columns]
+        labels = {label: df[label].to_numpy(dtype=np.float64) for _, label, _ in specs}
+
+        # 홀드아웃은 후보 선택 폴드에 포함되지 않음
+        n_selection, holdout = holdout_fold(len(df), self.holdout_fraction, purge=self.purge)
+        folds = self.folds(n_selection)
+
+        tasks = []
+        for model, label, num_classes in specs:
+            for candidate in range(len(self.param_grid)):
+                params = self._params(num_classes, candidate)
+                for fold in folds:
+                    tasks.append([model, label, num_classes, candidate, params, fold])
+
+        workers, threads = thread_plan(len(tasks), self.max_workers)
+        extra = (self.num_boost_round, self.early_stopping_rounds, self.purge)
+
+        def with_threads(task_list: List[list]) -> List[tuple]:
+            return [tuple(task[:4]) + ({**task[4], "num_threads": threads},) + tuple(task[5:]) + extra
+                    for task in task_list]
+
+        logger.info(
+            f"Cross-validating {len(specs)} models x {len(self.param_grid)} candidates x "
+            f"{len(folds)} {self.method} folds with {workers} worker(s) x {threads} thread(s)"
+            + (f", holdout {holdout.test_size} samples" if holdout else "")
+        )
+
+        if workers > 1:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=context,
+                initializer=_init_worker, initargs=(X, labels),
+            ) as pool:
+                report.results = list(pool.map(_run_fold, *zip(*with_threads(tasks))))
+                holdout_tasks = self._holdout_tasks(report, specs, holdout)
+                if holdout_tasks:
+                    report.holdout = list(pool.map(_run_fold, *zip(*with_threads(holdout_tasks))))
+        else:
+            _init_worker(X, labels)
+            try:
+                report.results = [_run_fold(*arg) for arg in with_threads(tasks)]
+                holdout_tasks = self._holdout_tasks(report, specs, holdout)
+                report.holdout = [_run_fold(*arg) for arg in with_threads(holdout_tasks)]
+            finally:
+                _init_worker(None, {})
+
+        holdout_by_model = {r.model: r for r in report.holdout}
+        for model, item in report.summary().items():
+            held = holdout_by_model.get(model)
+            logger.info(
+                f"CV {model}: {item['metric']} {item['mean']:.4f} ± {item['std']:.4f} "
+                f"(candidate {item['candidate']}, folds {[round(f[item['metric']], 4) for f in item['folds']]})"
+                + (f", holdout {held.metrics[item['metric']]:.4f}" if held else "")
+            )
+        return report
+
+    def _params(self, num_classes: Optional[int], candidate: int) -> Dict[str, Any]:
+        base = self.classifier_params if num_classes else self.regressor_params
+        params = {**base, **self.param_grid[candidate]}
+        if num_classes:
+            params["num_class"] = num_classes
+        return params
+
+    def _holdout_tasks(
+        self, report: CrossValidationReport, specs: List[Tuple], holdout: Optional[Fold]
+    ) -> List[list]:
+        """선택 폴드에서 고른 모델별 최적 후보 1개씩 홀드아웃 평가 작업"""
+        if holdout is None or not report.results:
+            return []
+        summary = report.summary()
+        return [
+            [model, label, num_classes, summary[model]["candidate"],
+             self._params(num_classes, summary[model]["candidate"]), holdout]
+            for model, label, num_classes in specs
+            if model in summary
+        ]
@@ -130,6 +130,10 @@ async def shutdown_ai_service():
             logger.info("="*60)
 
         if _redis_client:
+            # 합쳐둔 비용 집계 쓰기 전송 후 종료
+            from src.agents.redis_client import get_batch_writer
+
+            await get_batch_writer(_redis_client).close()
             await _redis_client.close()
             logger.info("✅ Redis connection closed")
 
@@ -9,6 +9,8 @@ from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ...agents.redis_client import get_batch_writer
+
 logger = logging.getLogger(__name__)
 
 
@@ -159,7 +161,13 @@ class CostTracker:
         output_tokens: int,
         metadata: Dict[str, Any] = None,
     ):
-        """Redis에 비용 데이터 저장 (ATOMIC: pipeline 사용)"""
+        """
+        Redis에 비용 데이터 저장
+
+        AI 호출 경로에서는 쓰기 버퍼에 넣기만 하고 (왕복 0회),
+        공유 RedisBatchWriter가 수 ms 간격으로 MULTI/EXEC 한 번에 모아 전송한다.
+        HINCRBY/HINCRBYFLOAT는 원자적이라 동시 호출에도 집계가 어긋나지 않음.
+        """
         if not self.redis_client:
             return
 
@@ -168,33 +176,30 @@ class CostTracker:
             date_key = timestamp.strftime("%Y-%m-%d")
             hour_key = timestamp.strftime("%Y-%m-%d:%H")
 
-            # SECURITY/CONCURRENCY: Use pipeline for atomic operations
-            # This prevents race conditions under high concurrent load
-            async with self.redis_client.pipeline(transaction=True) as pipe:
-                # 일일 집계 (atomic)
-                daily_key = f"ai:cost:daily:{date_key}"
+            daily_key = f"ai:cost:daily:{date_key}"
+            hourly_key = f"ai:cost:hourly:{hour_key}"
+            agent_key = f"ai:cost:agent:{agent_type}"
+
+            def write(pipe):
+                # 일일 집계
                 pipe.hincrby(daily_key, "calls", 1)
                 pipe.hincrbyfloat(daily_key, "cost", cost)
                 pipe.hincrby(daily_key, "input_tokens", input_tokens)
                 pipe.hincrby(daily_key, "output_tokens", output_tokens)
                 pipe.expire(daily_key, 86400 * 90)  # 90일 보관
 
-                # 시간별 집계 (atomic)
-                hourly_key = f"ai:cost:hourly:{hour_key}"
+                # 시간별 집계
                 pipe.hincrby(hourly_key, "calls", 1)
                 pipe.hincrbyfloat(hourly_key, "cost", cost)
                 pipe.expire(hourly_key, 86400 * 7)  # 7일 보관
 
-                # 에이전트별 집계 (atomic)
-                agent_key = f"ai:cost:agent:{agent_type}"
+                # 에이전트별 집계
                 pipe.hincrby(agent_key, "calls", 1)
                 pipe.hincrbyfloat(agent_key, "cost", cost)
                 pipe.expire(agent_key, 86400 * 30)  # 30일 보관
 
-                # Execute all commands atomically
-                await pipe.execute()
-
-            logger.debug(f"Cost saved to Redis atomically: {agent_type}, ${cost:.4f}")
+            get_batch_writer(self.redis_client).enqueue(write)
+            logger.debug(f"Cost queued for Redis: {agent_type}, ${cost:.4f}")
 
         except Exception as e:
             logger.error(f"Failed to save cost to Redis: {e}", exc_info=True)
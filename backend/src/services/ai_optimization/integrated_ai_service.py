@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from src.agents.redis_client import get_batch_writer
 from src.config import settings
 
 from .cost_tracker import CostTracker
@@ -181,12 +182,16 @@ class IntegratedAIService:
                     "skip_reason": reason,
                 }
 
-        # 2. 응답 캐시 조회
+        # 2. 응답 캐시 조회 (L1 → Redis)
+        query_data = {"prompt": prompt, "context": context}
+        cache_key = None
 
         if enable_caching and self.response_cache.should_cache(response_type, context):
+            cache_key = self.response_cache.get_cache_key(response_type, query_data)
             cached_response = await self.response_cache.get_cached_response(
                 response_type=response_type,
-                query_data={"prompt": prompt, "context": context}
+                query_data=query_data,
+                cache_key=cache_key,
             )
 
             if cached_response:
@@ -199,7 +204,58 @@ class IntegratedAIService:
                     "sampled": True,
                 }
 
-        # 3. 프롬프트 캐시 조회 (시스템 프롬프트)
+        async def fetch() -> Dict[str, Any]:
+            return await self._call_upstream(
+                agent_type=agent_type,
+                prompt=prompt,
+                query_data=query_data,
+                system_prompt=system_prompt,
+                response_type=response_type,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                enable_caching=enable_caching,
+                cache_key=cache_key,
+            )
+
+        if cache_key is None:
+            return await fetch()
+
+        # 3. 동일 쿼리의 동시 호출은 하나의 업스트림 호출로 병합
+        result, coalesced = await self.response_cache.coalesce(cache_key, fetch)
+
+        if coalesced:
+            logger.info(f"🔗 Coalesced AI call for {agent_type}")
+            # 리더 호출 실패(기본 응답 + error)는 캐시 히트로 표시하지 않고 그대로 전달
+            if "error" in result:
+                return {**result, "coalesced": True}
+            return {
+                **result,
+                "cost_info": {"cost_usd": 0.0},
+                "cache_hit": True,
+                "coalesced": True,
+            }
+
+        return result
+
+    async def _call_upstream(
+        self,
+        agent_type: str,
+        prompt: str,
+        query_data: Dict[str, Any],
+        system_prompt: Optional[str],
+        response_type: str,
+        temperature: float,
+        max_tokens: int,
+        enable_caching: bool,
+        cache_key: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        실제 AI API 호출 (프롬프트 캐시 → API → 비용 추적 → 응답 캐싱)
+
+        call_ai()의 캐시 미스 경로이며, singleflight로 병합된 호출에서는
+        리더 한 번만 실행됩니다.
+        """
+        # 프롬프트 캐시 조회 (시스템 프롬프트)
         if system_prompt and enable_caching:
             cached_system = await self.prompt_cache.get_cached_prompt(
                 prompt_type="agent_prompt",
@@ -210,7 +266,7 @@ class IntegratedAIService:
                 system_prompt = cached_system
                 logger.debug(f"Prompt cache HIT for {agent_type}")
 
-        # 4. AI API 호출 (Gemini or DeepSeek)
+        # AI API 호출 (Gemini or DeepSeek)
         try:
             if self.ai_provider == "gemini":
                 response_text, usage = await self._call_gemini_api(
@@ -229,7 +285,7 @@ class IntegratedAIService:
                 )
                 model_name = "deepseek-v3"
 
-            # 5. 비용 추적
+            # 비용 추적
             cost_info = await self.cost_tracker.track_api_call(
                 model=model_name,
                 agent_type=agent_type,
@@ -240,15 +296,16 @@ class IntegratedAIService:
                 metadata={"response_type": response_type}
             )
 
-            # 6. 응답 캐싱
+            # 응답 캐싱
             if enable_caching:
                 await self.response_cache.set_cached_response(
                     response_type=response_type,
-                    query_data={"prompt": prompt, "context": context},
-                    response={"response": response_text, "cost_info": cost_info}
+                    query_data=query_data,
+                    response={"response": response_text, "cost_info": cost_info},
+                    cache_key=cache_key,
                 )
 
-            # 7. 프롬프트 캐싱 (시스템 프롬프트)
+            # 프롬프트 캐싱 (시스템 프롬프트)
             if system_prompt and enable_caching:
                 await self.prompt_cache.set_cached_prompt(
                     prompt_type="agent_prompt",
@@ -640,6 +697,9 @@ Provide a comprehensive analysis of these events and their combined implications
             "prompt_cache": self.prompt_cache.get_cache_stats(),
             "response_cache": self.response_cache.get_cache_stats(),
             "sampling": self.sampling_manager.get_sampling_stats(),
+            "redis_writes": (
+                get_batch_writer(self.redis_client).get_stats() if self.redis_client else None
+            ),
         }
 
     async def get_daily_cost(self) -> Dict[str, Any]:
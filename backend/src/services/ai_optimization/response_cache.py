@@ -4,11 +4,16 @@ Response Cache Manager (응답 캐싱 매니저)
 AI API 응답을 캐싱하여 동일한 쿼리에 대한 중복 호출 방지
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ...utils.codec import decode, encode
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,9 @@ VALID_RESPONSE_TYPES = {
     "general"  # General purpose
 }
 
+# L1 (프로세스 내) 캐시 최대 엔트리 수
+L1_MAX_ENTRIES = 512
+
 
 class ResponseCacheManager:
     """
@@ -38,11 +46,23 @@ class ResponseCacheManager:
     - 중복 API 호출 제거
     - 응답 속도 10~100배 향상
     - 월 $500~$1,000 절감 가능
+
+    2단 구조:
+    - L1: 프로세스 내 LRU (Redis 왕복/JSON 파싱 없이 조회)
+    - L2: Redis (프로세스 간 공유)
+    - 동일 캐시 키의 동시 미스는 singleflight로 하나의 업스트림 호출만 수행
     """
 
-    def __init__(self, redis_client=None):
+    def __init__(self, redis_client=None, l1_max_entries: int = L1_MAX_ENTRIES):
         self.redis_client = redis_client
 
+        # L1 캐시: cache_key -> (만료 시각(monotonic), 응답)
+        self._l1: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.l1_max_entries = l1_max_entries
+
+        # 진행 중인 업스트림 호출 (cache_key -> Future)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         # 캐싱 전략 (응답 타입별 TTL)
         self.cache_ttl = {
             "market_analysis": 300,  # 5분 (시장 분석)
@@ -59,10 +79,40 @@ class ResponseCacheManager:
             "cache_misses": 0,
             "api_calls_saved": 0,
             "cost_saved_usd": 0.0,
+            "l1_hits": 0,
+            "coalesced_calls": 0,
         }
 
         logger.info("ResponseCacheManager initialized")
 
+    def _l1_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """L1 캐시 조회 (만료 엔트리는 제거)"""
+        entry = self._l1.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._l1[cache_key]
+            return None
+
+        self._l1.move_to_end(cache_key)
+        return response
+
+    def _l1_set(self, cache_key: str, response: Dict[str, Any], ttl: int):
+        """L1 캐시 저장 (LRU 초과 시 가장 오래된 엔트리 제거)"""
+        self._l1[cache_key] = (time.monotonic() + ttl, response)
+        self._l1.move_to_end(cache_key)
+
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    def _record_hit(self, response_type: str):
+        """캐시 히트 통계 기록"""
+        self.stats["cache_hits"] += 1
+        self.stats["api_calls_saved"] += 1
+        self.stats["cost_saved_usd"] += self._estimate_cost_per_call(response_type)
+
     def get_cache_key(
         self, response_type: str, query_data: Dict[str, Any]
     ) -> str:
@@ -109,33 +159,41 @@ class ResponseCacheManager:
         return cache_key
 
     async def get_cached_response(
-        self, response_type: str, query_data: Dict[str, Any]
+        self,
+        response_type: str,
+        query_data: Dict[str, Any],
+        cache_key: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
-        캐시된 응답 조회
+        캐시된 응답 조회 (L1 → Redis 순서)
 
         Args:
             response_type: 응답 타입
             query_data: 쿼리 데이터
+            cache_key: 미리 계산된 캐시 키 (없으면 query_data로 계산)
 
         Returns:
             캐시된 응답 (없으면 None)
         """
+        if cache_key is None:
+            cache_key = self.get_cache_key(response_type, query_data)
+
+        l1_response = self._l1_get(cache_key)
+        if l1_response is not None:
+            self.stats["l1_hits"] += 1
+            self._record_hit(response_type)
+            logger.debug(f"Response cache L1 HIT: {response_type}")
+            return l1_response
+
         if not self.redis_client:
+            self.stats["cache_misses"] += 1
             return None
 
-        cache_key = self.get_cache_key(response_type, query_data)
-
         try:
             cached = await self.redis_client.get(cache_key)
 
             if cached:
-                self.stats["cache_hits"] += 1
-                self.stats["api_calls_saved"] += 1
-
-                # 비용 절감 계산 (응답 타입별 추정 비용)
-                cost_per_call = self._estimate_cost_per_call(response_type)
-                self.stats["cost_saved_usd"] += cost_per_call
+                self._record_hit(response_type)
 
                 logger.debug(f"Response cache HIT: {response_type}")
 
@@ -150,12 +208,9 @@ class ResponseCacheManager:
                     )
                     return None
 
-                # JSON 파싱 with validation
-                if isinstance(cached, bytes):
-                    cached = cached.decode("utf-8")
-
+                # 코덱 역직렬화 with validation (헤더 없는 레거시 JSON도 허용)
                 try:
-                    parsed = json.loads(cached)
+                    parsed = decode(cached, strict=True)
 
                     # SECURITY: Validate expected structure
                     if not isinstance(parsed, dict):
@@ -167,10 +222,18 @@ class ResponseCacheManager:
                         logger.warning("Cached response missing expected fields")
                         # Still return it, might be valid but different format
 
+                    # Redis 잔여 TTL만큼 L1에 승격 (다음 조회부터 Redis 왕복 생략)
+                    try:
+                        ttl = await self.redis_client.ttl(cache_key)
+                    except Exception:
+                        ttl = None
+                    if isinstance(ttl, int) and ttl > 0:
+                        self._l1_set(cache_key, parsed, ttl)
+
                     return parsed
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse cached response JSON: {e}")
+                except ValueError as e:
+                    logger.error(f"Failed to parse cached response: {e}")
                     # Clear corrupt cache entry
                     await self.redis_client.delete(cache_key)
                     return None
@@ -197,27 +260,32 @@ class ResponseCacheManager:
         query_data: Dict[str, Any],
         response: Dict[str, Any],
         custom_ttl: Optional[int] = None,
+        cache_key: Optional[str] = None,
     ):
         """
-        응답 캐싱
+        응답 캐싱 (L1 + Redis)
 
         Args:
             response_type: 응답 타입
             query_data: 쿼리 데이터
             response: 캐싱할 응답
             custom_ttl: 커스텀 TTL (초)
+            cache_key: 미리 계산된 캐시 키 (없으면 query_data로 계산)
         """
+        if cache_key is None:
+            cache_key = self.get_cache_key(response_type, query_data)
+        ttl = custom_ttl or self.cache_ttl.get(response_type, 300)
+
+        self._l1_set(cache_key, response, ttl)
+
         if not self.redis_client:
             return
 
-        cache_key = self.get_cache_key(response_type, query_data)
-        ttl = custom_ttl or self.cache_ttl.get(response_type, 300)
-
         try:
-            # JSON 직렬화
-            response_json = json.dumps(response)
+            # 코덱 직렬화 (버전 헤더 + JSON 본문)
+            payload = encode(response)
 
-            await self.redis_client.setex(cache_key, ttl, response_json)
+            await self.redis_client.setex(cache_key, ttl, payload)
 
             logger.debug(f"Response cached: {response_type}, TTL={ttl}s")
 
@@ -234,6 +302,13 @@ class ResponseCacheManager:
             response_type: 응답 타입
             query_data: 특정 쿼리 (None이면 타입 전체)
         """
+        if query_data:
+            self._l1.pop(self.get_cache_key(response_type, query_data), None)
+        else:
+            prefix = f"ai:response:{response_type}:"
+            for key in [k for k in self._l1 if k.startswith(prefix)]:
+                del self._l1[key]
+
         if not self.redis_client:
             return
 
@@ -267,6 +342,48 @@ class ResponseCacheManager:
         except Exception as e:
             logger.error(f"Failed to invalidate cache: {e}")
 
+    async def coalesce(
+        self, cache_key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        동일 캐시 키에 대한 동시 업스트림 호출 병합 (singleflight)
+
+        첫 호출자만 fetch()를 실행하고, 그 사이 들어온 호출자들은
+        같은 결과를 기다립니다.
+
+        Args:
+            cache_key: 캐시 키
+            fetch: 실제 업스트림 호출 코루틴 팩토리
+
+        Returns:
+            (결과, 병합 여부) - 병합 여부가 True면 다른 호출의 결과를 공유
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.stats["coalesced_calls"] += 1
+            logger.debug(f"Coalesced in-flight AI call: {cache_key}")
+            # shield: 대기자 취소가 리더 호출을 취소하지 않도록
+            return await asyncio.shield(inflight), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._inflight.pop(cache_key, None)
+
     def _estimate_cost_per_call(self, response_type: str) -> float:
         """
         응답 타입별 API 호출 비용 추정
@@ -319,9 +436,10 @@ class ResponseCacheManager:
 
                 cache_key = self.get_cache_key(response_type, query_data)
                 ttl = self.cache_ttl.get(response_type, 300)
-                response_json = json.dumps(response)
+                payload = encode(response)
 
-                pipe.setex(cache_key, ttl, response_json)
+                self._l1_set(cache_key, response, ttl)
+                pipe.setex(cache_key, ttl, payload)
 
             await pipe.execute()
 
@@ -371,6 +489,10 @@ class ResponseCacheManager:
             "hit_rate_percent": round(hit_rate, 2),
             "api_calls_saved": self.stats["api_calls_saved"],
             "cost_saved_usd": round(self.stats["cost_saved_usd"], 2),
+            "l1_hits": self.stats["l1_hits"],
+            "l1_entries": len(self._l1),
+            "coalesced_calls": self.stats["coalesced_calls"],
+            "inflight_calls": len(self._inflight),
         }
 
     async def warm_up_cache(
@@ -6,6 +6,7 @@ Smart Sampling Manager (스마트 샘플링 매니저)
 
 import json
 import logging
+import math
 import threading
 from datetime import datetime
 from enum import Enum
@@ -94,6 +95,9 @@ class SmartSamplingManager:
         # 인메모리 캐시 (Redis 없을 때 사용)
         self._memory_cache: Dict[str, datetime] = {}
 
+        # Redis 주기 키별로 마지막 확인한 호출 시각 (주기 전이면 왕복 생략)
+        self._redis_last_seen: Dict[str, datetime] = {}
+
         # 에이전트별 샘플링 전략
         self.strategies = {
             # 항상 호출 (중요)
@@ -143,6 +147,7 @@ class SmartSamplingManager:
             "skipped_requests": 0,
             "api_calls_saved": 0,
             "rate_limit_hits": 0,
+            "redis_round_trips": 0,
         }
 
         logger.info("SmartSamplingManager initialized with dynamic interval control")
@@ -245,15 +250,29 @@ class SmartSamplingManager:
     async def _check_periodic_redis(
         self, key: str, effective_interval: int
     ) -> tuple[bool, Optional[str]]:
-        """Redis 기반 주기적 샘플링 체크"""
-        # 마지막 호출 시간 조회
-        last_call = await self.redis_client.get(key)
+        """
+        Redis 기반 주기적 샘플링 체크
 
-        if not last_call:
-            # 첫 호출
-            await self.redis_client.setex(
-                key, effective_interval, datetime.utcnow().isoformat()
-            )
+        - 마지막으로 확인한 호출 시각 기준 아직 주기 전이면 Redis 없이 대기 (왕복 0회)
+        - 그 외에는 SET NX EX + GET을 한 파이프라인으로 (왕복 1회)
+          키 TTL = 간격이므로 NX 성공 = 주기 도래 (다른 프로세스와도 한 번만 샘플링)
+        """
+        now = datetime.utcnow()
+        seen = self._redis_last_seen.get(key)
+        if seen is not None and (now - seen).total_seconds() < effective_interval:
+            self.stats["skipped_requests"] += 1
+            self.stats["api_calls_saved"] += 1
+            return False, f"periodic_wait_{int(effective_interval - (now - seen).total_seconds())}s"
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.set(key, now.isoformat(), nx=True, ex=max(1, math.ceil(effective_interval)))
+            pipe.get(key)
+            acquired, last_call = await pipe.execute()
+        self.stats["redis_round_trips"] += 1
+
+        if acquired:
+            # 키가 없었음 (첫 호출 또는 TTL=간격 경과)
+            self._redis_last_seen[key] = now
             self.stats["sampled_requests"] += 1
             return True, "first_call"
 
@@ -261,18 +280,21 @@ class SmartSamplingManager:
         last_call_time = datetime.fromisoformat(
             last_call.decode("utf-8") if isinstance(last_call, bytes) else last_call
         )
-        elapsed = (datetime.utcnow() - last_call_time).total_seconds()
+        elapsed = (now - last_call_time).total_seconds()
 
         if elapsed >= effective_interval:
-            # 주기 도래
+            # 간격이 줄어든 경우 (backoff 해제 등): 키 TTL보다 먼저 주기 도래
             await self.redis_client.setex(
-                key, effective_interval, datetime.utcnow().isoformat()
+                key, max(1, math.ceil(effective_interval)), now.isoformat()
             )
+            self.stats["redis_round_trips"] += 1
+            self._redis_last_seen[key] = now
             self.stats["sampled_requests"] += 1
             return True, f"periodic_elapsed_{int(elapsed)}s_interval_{int(effective_interval)}s"
 
         else:
             # 아직 주기 안 됨
+            self._redis_last_seen[key] = last_call_time
             self.stats["skipped_requests"] += 1
             self.stats["api_calls_saved"] += 1
             return False, f"periodic_wait_{int(effective_interval - elapsed)}s"
@@ -274,6 +274,7 @@ class BinanceRestClient:
         logger.info(f"   기간: {start_time} ~ {end_time}")
 
         all_candles = []
+        seen_ts = set()
         current_start_ts = start_ts
         batch_count = 0
         rate_limit_delay = 0.1  # 100ms 딜레이 (안전)
@@ -294,9 +295,9 @@ class BinanceRestClient:
                     logger.info(f"   더 이상 데이터 없음 (배치 {batch_count})")
                     break
 
-                # 중복 제거 후 추가
-                existing_ts = {c["timestamp"] for c in all_candles}
-                new_candles = [c for c in candles if c["timestamp"] not in existing_ts]
+                # 중복 제거 후 추가 (본 타임스탬프 집합은 누적 갱신)
+                new_candles = [c for c in candles if c["timestamp"] not in seen_ts]
+                seen_ts.update(c["timestamp"] for c in new_candles)
                 all_candles.extend(new_candles)
 
                 # 진행률 로깅 (10배치마다)
@@ -23,9 +23,33 @@ from ..utils.bitget_exceptions import (
     BitgetTimeoutError,
     classify_bitget_error,
 )
+from ..utils.metrics import exchange_request_seconds
 
 logger = logging.getLogger(__name__)
 
+# 통일된 타임프레임 → Bitget granularity
+# Bitget 지원: 1m,3m,5m,15m,30m,1H,4H,6H,12H,1D,1W,1M
+BITGET_GRANULARITY = {
+    "1m": "1m",
+    "3m": "3m",
+    "5m": "5m",
+    "15m": "15m",
+    "30m": "30m",
+    "1h": "1H",
+    "4h": "4H",
+    "6h": "6H",
+    "12h": "12H",
+    "1d": "1D",
+    "1D": "1D",
+    "1w": "1W",
+    "1W": "1W",
+}
+
+
+def bitget_granularity(interval: str) -> str:
+    """'1h' → '1H' (매핑에 없으면 h/d만 대문자로)"""
+    return BITGET_GRANULARITY.get(interval, interval.replace("h", "H").replace("d", "D"))
+
 
 class OrderSide(str, Enum):
     """주문 방향"""
@@ -178,6 +202,7 @@ class BitgetRestClient:
         last_exception = None
 
         for attempt in range(max_retries):
+            started = time.perf_counter()
             try:
                 async with self.session.request(
                     method=method,
@@ -188,6 +213,9 @@ class BitgetRestClient:
                 ) as response:
                     # Read response text first to avoid ChunkedIteratorResult issues
                     text = await response.text()
+                    exchange_request_seconds.labels("bitget", endpoint, response.status).observe(
+                        time.perf_counter() - started
+                    )
                     result = json.loads(text) if text else {}
 
                     # Bitget API 응답 형식: {"code": "00000", "msg": "success", "data": {...}}
@@ -239,6 +267,9 @@ class BitgetRestClient:
                             raise exception
 
             except asyncio.TimeoutError:
+                exchange_request_seconds.labels("bitget", endpoint, "timeout").observe(
+                    time.perf_counter() - started
+                )
                 logger.error(f"Request timeout: {url}")
                 last_exception = BitgetTimeoutError(
                     f"요청 시간이 초과되었습니다: {endpoint}"
@@ -251,6 +282,9 @@ class BitgetRestClient:
                     continue
 
             except aiohttp.ClientError as e:
+                exchange_request_seconds.labels("bitget", endpoint, "error").observe(
+                    time.perf_counter() - started
+                )
                 logger.error(f"HTTP request failed: {e}")
                 last_exception = BitgetNetworkError(f"네트워크 에러: {str(e)}")
                 if attempt < max_retries - 1:
@@ -809,25 +843,7 @@ class BitgetRestClient:
             end_ts = str(int(now_utc.timestamp() * 1000))
 
         # Bitget API granularity 형식 변환 (명시적 매핑)
-        # Bitget 지원: 1m,3m,5m,15m,30m,1H,4H,6H,12H,1D,1W,1M
-        INTERVAL_MAP = {
-            "1m": "1m",
-            "3m": "3m",
-            "5m": "5m",
-            "15m": "15m",
-            "30m": "30m",
-            "1h": "1H",
-            "4h": "4H",
-            "6h": "6H",
-            "12h": "12H",
-            "1d": "1D",
-            "1D": "1D",
-            "1w": "1W",
-            "1W": "1W",
-        }
-        granularity = INTERVAL_MAP.get(
-            interval, interval.replace("h", "H").replace("d", "D")
-        )
+        granularity = bitget_granularity(interval)
 
         # Bitget API v2는 endTime 기준으로 이전 데이터를 가져옴
         params = {
@@ -916,6 +932,9 @@ class BitgetRestClient:
         """
         전체 과거 캔들 데이터 조회 (페이지네이션, Bitget 오픈 ~ 현재)
 
+        메모리로 한 번에 받는 용도. 수년치 대량 수집은
+        services.historical_downloader (병렬 + 체크포인트 + 컬럼 저장소) 사용.
+
         Args:
             symbol: 거래쌍 (예: BTCUSDT)
             interval: 캔들 간격 (1m, 5m, 15m, 30m, 1h, 4h, 1D 등)
@@ -954,26 +973,10 @@ class BitgetRestClient:
         logger.info(f"   Period: {start_time} ~ {end_time}")
 
         # Bitget API granularity 형식 변환
-        INTERVAL_MAP = {
-            "1m": "1m",
-            "3m": "3m",
-            "5m": "5m",
-            "15m": "15m",
-            "30m": "30m",
-            "1h": "1H",
-            "4h": "4H",
-            "6h": "6H",
-            "12h": "12H",
-            "1d": "1D",
-            "1D": "1D",
-            "1w": "1W",
-            "1W": "1W",
-        }
-        granularity = INTERVAL_MAP.get(
-            interval, interval.replace("h", "H").replace("d", "D")
-        )
+        granularity = bitget_granularity(interval)
 
         all_candles = []
+        seen_timestamps = set()
         current_end_ts = int(end_dt.timestamp() * 1000)
         start_ts = int(start_dt.timestamp() * 1000)
         batch_count = 0
@@ -1016,11 +1019,11 @@ class BitgetRestClient:
                             }
                         )
 
-                # 결과 추가 (중복 제거)
-                existing_timestamps = {c["timestamp"] for c in all_candles}
+                # 결과 추가 (중복 제거, 본 타임스탬프 집합은 누적 갱신)
                 new_candles = [
-                    c for c in candles if c["timestamp"] not in existing_timestamps
+                    c for c in candles if c["timestamp"] not in seen_timestamps
                 ]
+                seen_timestamps.update(c["timestamp"] for c in new_candles)
                 all_candles.extend(new_candles)
 
                 # 진행률 로깅 (10배치마다)
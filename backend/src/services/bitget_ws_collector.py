@@ -1,7 +1,7 @@
 """
 Bitget WebSocket 데이터 수집기
 
-실시간 시세 데이터를 수집하여 candle_generator와 market_queue에 전달
+실시간 시세 데이터를 수집하여 candle_aggregator와 market_queue에 전달
 """
 
 import asyncio
@@ -11,6 +11,8 @@ from typing import Optional
 
 import websockets
 
+from .candle_aggregator import candle_aggregator
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +93,11 @@ class BitgetWebSocketCollector:
                         "open": float(ticker_data.get("open24h", 0)),
                     }
 
+                    # 공유 캔들 갱신 (소비자가 틱을 받기 전에)
+                    candle_aggregator.on_tick(
+                        symbol, market_data["price"], market_data["volume"], market_data["timestamp"]
+                    )
+
                     # Market queue에 전달
                     try:
                         self.market_queue.put_nowait(market_data)
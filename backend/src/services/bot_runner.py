@@ -12,16 +12,17 @@
 import asyncio
 import json
 import logging
+import time
 from collections import deque
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional, Set
+from typing import Awaitable, Callable, Dict, Optional, Set
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..agents.base import AgentState, AgentTask, TaskPriority
-from ..agents.market_regime import MarketRegimeAgent
+from ..agents.market_regime import get_regime_service
 from ..agents.risk_monitor import RiskMonitorAgent
 from ..agents.signal_validator import SignalValidatorAgent
 from ..database.models import (
@@ -38,10 +39,12 @@ from ..database.models import (
 )
 from ..services.allocation_manager import allocation_manager  # 다중 봇 시스템 (NEW)
 from ..services.bitget_rest import OrderSide, get_bitget_rest
+from ..services.candle_aggregator import candle_aggregator
 from ..services.bot_isolation_manager import bot_isolation_manager  # 다중 봇 시스템 (NEW)
 from ..services.bot_recovery_manager import bot_recovery_manager  # 다중 봇 시스템 (NEW)
 from ..services.equity_service import record_equity
 from ..services.exchanges import ExchangeFactory
+from ..services.signal_tracker import SignalTracker
 from ..services.strategy_loader import generate_signal_with_strategy
 from ..services.telegram import (
     OrderFilledInfo,
@@ -54,7 +57,9 @@ from ..services.telegram import (
 from ..services.trade_executor import (
     InvalidApiKeyError,
 )
+from ..services.write_behind import record_bot_log, record_bot_stats
 from ..utils.crypto_secrets import decrypt_secret
+from ..utils.metrics import bot_decision_to_order_seconds, bot_tick_to_decision_seconds
 from ..websockets.ws_server import broadcast_to_user
 
 logger = logging.getLogger(__name__)
@@ -83,19 +88,16 @@ class BotRunner:
         self.instance_tasks: Dict[int, asyncio.Task] = {}  # bot_instance_id → Task
         self.user_bots: Dict[int, Set[int]] = {}  # user_id → Set[bot_instance_id]
 
-        # Market Regime Agent (Day 2) - 시장 환경 분석
-        self.market_regime = MarketRegimeAgent(
-            agent_id="market_regime_main",
-            name="Main Market Regime Analyzer",
-            config={
-                "symbol": "BTCUSDT",
-                "timeframe": "5m",
-                "candle_limit": 200
-            },
-            bitget_client=None,  # 실행 시점에 설정
-            candle_cache=None,   # 실행 시점에 설정
-            redis_client=None    # Redis 연동 시 설정 필요
-        )
+        # 분산 스케줄러 (src/workers/scheduler.py)
+        # lease_guard: 틱마다 리스 보유 여부 확인, False면 DB 상태를 건드리지 않고 루프 종료
+        # fence_guard: 주문 / 거래·포지션 DB 쓰기 직전 펜싱 토큰 확인, False면 쓰기를 버리고 루프 종료
+        # _handoff: 다른 워커로 넘기기 위해 정지하는 봇 (is_running=False 기록 생략)
+        self.lease_guard: Optional[Callable[[int], bool]] = None
+        self.fence_guard: Optional[Callable[[int], Awaitable[bool]]] = None
+        self._handoff: Set[int] = set()
+
+        # Market Regime (Day 2) - 심볼별 시장 환경 (프로세스 공유, 캔들 마감 시 갱신)
+        self.regime_service = get_regime_service()
 
         # Signal Validator Agent (Day 3)
         self.signal_validator = SignalValidatorAgent(
@@ -452,20 +454,24 @@ class BotRunner:
             f"User now has {len(self.user_bots[user_id])} running bot(s)"
         )
 
-    def stop_instance(self, bot_instance_id: int, user_id: int):
+    def stop_instance(self, bot_instance_id: int, user_id: int, handoff: bool = False):
         """
         봇 인스턴스 정지 (다중 봇 시스템)
 
         Args:
             bot_instance_id: 봇 인스턴스 ID
             user_id: 사용자 ID (user_bots 추적용)
+            handoff: 다른 워커로 넘기는 정지 (DB is_running 유지)
         """
         stopped = False
 
         # 1. AI 봇 체크 (BotRunner.instance_tasks)
-        if self.is_instance_running(bot_instance_id):
+        task = self.instance_tasks.get(bot_instance_id)
+        if task is not None and not task.done():
             logger.info(f"Stopping AI bot instance {bot_instance_id}")
-            self.instance_tasks[bot_instance_id].cancel()
+            if handoff:
+                self._handoff.add(bot_instance_id)
+            task.cancel()
             stopped = True
 
         # 2. 그리드 봇 체크 (GridBotRunner.tasks)
@@ -473,7 +479,7 @@ class BotRunner:
         grid_runner = get_grid_bot_runner(self.market_queue)
         if grid_runner.is_running(bot_instance_id):
             logger.info(f"Stopping Grid bot instance {bot_instance_id}")
-            grid_runner.stop(bot_instance_id)
+            grid_runner.stop(bot_instance_id, handoff=handoff)
             stopped = True
 
         if stopped:
@@ -509,14 +515,6 @@ class BotRunner:
         """
         logger.info(f"Starting bot instance loop: bot_id={bot_instance_id}, user_id={user_id}")
 
-        # Market Regime Agent 시작 (한 번만) - Bitget client는 나중에 설정
-        if self.market_regime.state != AgentState.RUNNING:
-            try:
-                await self.market_regime.start()
-                logger.info("✅ MarketRegime Agent started")
-            except Exception as e:
-                logger.error(f"Failed to start MarketRegime Agent: {e}")
-
         # Signal Validator Agent 시작 (한 번만)
         if self.signal_validator.state != AgentState.RUNNING:
             try:
@@ -589,36 +587,16 @@ class BotRunner:
                     user_id, bot_instance_id, bitget_client, session
                 )
 
-                # 4.5. MarketRegimeAgent에 Bitget 클라이언트 설정 (캔들 데이터 조회용)
-                if self.market_regime.bitget_client is None:
-                    self.market_regime.bitget_client = bitget_client
-                    self.market_regime.symbol = bot_instance.symbol
-                    logger.info(f"✅ MarketRegimeAgent: Bitget client connected for {bot_instance.symbol}")
-
-                # 5. 캔들 버퍼 초기화
-                candle_buffer = deque(maxlen=200)
+                # 5. 공유 캔들 시리즈 구독 (심볼/타임프레임당 첫 구독에서만 백필)
                 symbol = bot_instance.symbol  # 예: "BTCUSDT"
+                strategy_params = json.loads(strategy.params) if strategy and strategy.params else {}
+                timeframe = strategy_params.get("timeframe", "5m")
 
-                try:
-                    # 전략 파라미터에서 타임프레임 가져오기
-                    strategy_params = json.loads(strategy.params) if strategy and strategy.params else {}
-                    timeframe = strategy_params.get("timeframe", "5m")
+                candle_series = await candle_aggregator.subscribe(symbol, timeframe, client=bitget_client)
+                logger.info(f"✅ Using {len(candle_series)} shared {timeframe} candles for bot {bot_instance_id}")
 
-                    historical = await bitget_client.get_historical_candles(
-                        symbol=symbol, interval=timeframe, limit=200
-                    )
-                    for candle in historical:
-                        candle_buffer.append({
-                            "open": float(candle.get("open", 0)),
-                            "high": float(candle.get("high", 0)),
-                            "low": float(candle.get("low", 0)),
-                            "close": float(candle.get("close", 0)),
-                            "volume": float(candle.get("volume", 0)),
-                            "time": candle.get("timestamp", 0),
-                        })
-                    logger.info(f"✅ Loaded {len(candle_buffer)} historical candles for bot {bot_instance_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to load historical candles for bot {bot_instance_id}: {e}")
+                # 5.5. 심볼 시장 환경 추적
+                await self.regime_service.track(symbol, client=bitget_client)
 
                 # 6. 기존 포지션 동기화 (봇 시작 시 Bitget에서 조회)
                 current_position = None
@@ -640,9 +618,9 @@ class BotRunner:
                                 # PnL % 계산
                                 if entry_price > 0:
                                     if side == "long":
-                                        pnl_percent = ((candle_buffer[-1]["close"] if candle_buffer else entry_price) - entry_price) / entry_price * 100 * leverage
+                                        pnl_percent = ((float(candle_series.view(1).close[-1]) if len(candle_series) else entry_price) - entry_price) / entry_price * 100 * leverage
                                     else:
-                                        pnl_percent = (entry_price - (candle_buffer[-1]["close"] if candle_buffer else entry_price)) / entry_price * 100 * leverage
+                                        pnl_percent = (entry_price - (float(candle_series.view(1).close[-1]) if len(candle_series) else entry_price)) / entry_price * 100 * leverage
                                 else:
                                     pnl_percent = 0
 
@@ -670,6 +648,10 @@ class BotRunner:
                 consecutive_errors = 0
                 max_consecutive_errors = 10
 
+                # 지연 계측 (/metrics) - 라벨 자식은 루프 시작 시 한 번만 바인딩
+                tick_to_decision = bot_tick_to_decision_seconds.labels(bot_instance_id)
+                decision_to_order = bot_decision_to_order_seconds.labels(bot_instance_id)
+
                 while True:
                     try:
                         # 마켓 데이터 수신
@@ -678,6 +660,7 @@ class BotRunner:
                         except asyncio.TimeoutError:
                             logger.warning(f"No market data for 60s (bot {bot_instance_id})")
                             continue
+                        tick_at = time.perf_counter()
 
                         price = float(market.get("price", 0))
                         market_symbol = market.get("symbol", "BTCUSDT")
@@ -692,19 +675,16 @@ class BotRunner:
                         if price <= 0:
                             continue
 
-                        # 캔들 버퍼 업데이트
-                        new_candle = {
-                            "open": market.get("open", price),
-                            "high": market.get("high", price),
-                            "low": market.get("low", price),
-                            "close": market.get("close", price),
-                            "volume": market.get("volume", 0),
-                            "time": market.get("time", 0),
-                        }
-                        candle_buffer.append(new_candle)
-                        candles = list(candle_buffer)
+                        # 리스를 잃었으면 새 소유 워커가 이어받으므로 여기서 종료
+                        if self.lease_guard is not None and not self.lease_guard(bot_instance_id):
+                            logger.warning(f"Bot instance {bot_instance_id} lost its lease, exiting loop")
+                            break
+
+                        # 공유 캔들 뷰 (수집기가 이미 이 틱을 반영, 복사 없음)
+                        candles = candle_series.view()
 
                         # === Risk Monitor (Day 4) - 포지션 보유 시 실시간 리스크 체크 ===
+                        fenced_out = False
                         if current_position:
                             try:
                                 # 현재 포지션 데이터 구성
@@ -769,10 +749,12 @@ class BotRunner:
                                             # 치명적 리스크 시 포지션 강제 청산
                                             if alert.recommended_action.value in {"close_position", "emergency_shutdown"}:
                                                 logger.warning("🛑 Force closing position due to critical risk")
-                                                await self._close_instance_position(
+                                                if not await self._close_instance_position(
                                                     session, bitget_client, bot_instance, user_id,
                                                     current_position, price, f"Risk alert: {alert.message}"
-                                                )
+                                                ):
+                                                    fenced_out = True
+                                                    break
                                                 current_position = None
                                                 continue
                                         else:
@@ -784,6 +766,9 @@ class BotRunner:
                             except Exception as e:
                                 logger.error(f"Risk monitoring error: {e}")
 
+                            if fenced_out:
+                                break
+
                         # 전략 실행
                         if strategy:
                             try:
@@ -810,6 +795,8 @@ class BotRunner:
                             signal_action = "hold"
                             signal_confidence = 0
                             signal_reason = "No strategy"
+                        decided_at = time.perf_counter()
+                        tick_to_decision.observe(decided_at - tick_at)
 
                         # === Signal Validator (Day 3) ===
                         if signal_action in {"buy", "sell", "close"} and signal_action != "hold":
@@ -832,22 +819,11 @@ class BotRunner:
                             position_value = available * 0.95
                             order_size_usd = position_value
 
-                            # 5. Market Regime 조회 (Day 2)
+                            # 5. Market Regime 조회 (Day 2) - 봇 심볼 기준, 메모리 조회
                             market_regime_type = None
                             market_volatility = None
                             try:
-                                # MarketRegimeAgent에서 현재 시장 환경 조회
-                                regime_task = AgentTask(
-                                    task_id=f"regime_{bot_instance_id}_{datetime.utcnow().timestamp()}",
-                                    task_type="get_current_regime",
-                                    priority=TaskPriority.HIGH,
-                                    params={},
-                                    timeout=0.5
-                                )
-                                await self.market_regime.submit_task(regime_task)
-                                await asyncio.sleep(0.05)  # 조회 대기
-
-                                regime = regime_task.result
+                                regime = self.regime_service.get_regime(symbol)
                                 if regime:
                                     market_regime_type = regime.regime_type.value  # "trending_up", "ranging", etc.
                                     # volatility는 float (ATR 기반 %), 레벨로 변환
@@ -930,6 +906,16 @@ class BotRunner:
 
                                     # 최근 신호 기록
                                     self._record_signal(bot_instance_id, signal_action)
+                                    if signal_action in {"buy", "sell"}:
+                                        SignalTracker.enqueue_signal(
+                                            user_id=user_id,
+                                            symbol=symbol,
+                                            signal_type=signal_action,
+                                            timeframe=timeframe,
+                                            strategy_id=bot_instance.strategy_id,
+                                            price=price,
+                                            confidence=signal_confidence,
+                                        )
 
                                 else:
                                     logger.error("Validation result is None - rejecting signal for safety")
@@ -941,10 +927,12 @@ class BotRunner:
 
                         # 포지션 청산
                         if signal_action == "close" and current_position:
-                            await self._close_instance_position(
+                            if not await self._close_instance_position(
                                 session, bitget_client, bot_instance, user_id,
                                 current_position, price, signal_reason
-                            )
+                            ):
+                                break
+                            decision_to_order.observe(time.perf_counter() - decided_at)
                             current_position = None
 
                         elif signal_action in {"buy", "sell"} and current_position:
@@ -986,6 +974,10 @@ class BotRunner:
                             if not can_order:
                                 continue
 
+                            if not await self._fenced(bot_instance_id, "add-position order"):
+                                allocation_manager.release_order_amount(bot_instance_id, add_position_value)
+                                break
+
                             try:
                                 await bitget_client.set_leverage(
                                     symbol=symbol, leverage=leverage, margin_coin="USDT"
@@ -998,6 +990,7 @@ class BotRunner:
                                     margin_coin="USDT",
                                     reduce_only=False,
                                 )
+                                decision_to_order.observe(time.perf_counter() - decided_at)
 
                                 old_size = float(current_position.get("size", 0))
                                 new_size = old_size + add_size
@@ -1012,6 +1005,9 @@ class BotRunner:
                                     "position_value", 0
                                 ) + add_position_value
 
+                                if not await self._fenced(bot_instance_id, "position update"):
+                                    break
+
                                 await bot_isolation_manager.update_position(
                                     user_id,
                                     bot_instance_id,
@@ -1080,6 +1076,10 @@ class BotRunner:
                                 logger.warning(f"Bot {bot_instance_id}: Order rejected - {msg}")
                                 continue
 
+                            if not await self._fenced(bot_instance_id, "entry order"):
+                                allocation_manager.release_order_amount(bot_instance_id, position_value)
+                                break
+
                             try:
                                 # 레버리지 설정
                                 await bitget_client.set_leverage(
@@ -1095,6 +1095,10 @@ class BotRunner:
                                     margin_coin="USDT",
                                     reduce_only=False,
                                 )
+                                decision_to_order.observe(time.perf_counter() - decided_at)
+
+                                if not await self._fenced(bot_instance_id, "entry trade record"):
+                                    break
 
                                 # 4. 포지션 격리 매니저에 등록
                                 exchange_order_id = order_result.get("data", {}).get("orderId")
@@ -1165,6 +1169,9 @@ class BotRunner:
                         await asyncio.sleep(min(retry_delay, 10))  # 루프 내에서는 최대 10초
 
         except asyncio.CancelledError:
+            if bot_instance_id in self._handoff:
+                logger.info(f"Bot instance {bot_instance_id} handed off to another worker")
+                raise
             logger.info(f"Bot instance {bot_instance_id} cancelled by user")
             # 복구 매니저 상태 정리
             bot_recovery_manager.cancel_recovery(bot_instance_id)
@@ -1188,6 +1195,7 @@ class BotRunner:
 
         finally:
             # 리소스 정리
+            self._handoff.discard(bot_instance_id)
             if bot_instance_id in self.instance_tasks:
                 del self.instance_tasks[bot_instance_id]
             if user_id in self.user_bots:
@@ -1204,8 +1212,19 @@ class BotRunner:
             # BotRecoveryManager 에러 카운터 리셋 (정상 종료 시)
             bot_recovery_manager.reset_error_count(bot_instance_id)
 
+            # 지연 메트릭 라벨 제거 (종료된 봇 시리즈가 남지 않도록)
+            bot_tick_to_decision_seconds.remove(bot_instance_id)
+            bot_decision_to_order_seconds.remove(bot_instance_id)
+
             logger.info(f"Bot instance {bot_instance_id} loop ended. Resources cleaned up.")
 
+    async def _fenced(self, bot_instance_id: int, action: str) -> bool:
+        """주문 / DB 쓰기 직전 펜싱 확인 (스케줄러 밖에서 실행 중이면 항상 통과)"""
+        if self.fence_guard is None or await self.fence_guard(bot_instance_id):
+            return True
+        logger.warning(f"Bot instance {bot_instance_id}: stale fencing token, dropping {action}")
+        return False
+
     async def _get_bot_instance(
         self,
         session: AsyncSession,
@@ -1310,6 +1329,7 @@ class BotRunner:
                 bot.last_error = error_msg[:500]  # 최대 500자
                 bot.is_running = False
                 await session.commit()
+                record_bot_log(bot.user_id, "bot_error", f"Bot {bot_instance_id}: {error_msg}")
         except Exception as e:
             logger.error(f"Failed to update bot instance error: {e}")
 
@@ -1365,8 +1385,7 @@ class BotRunner:
             exit_reason=None,
         )
         session.add(trade)
-        await session.commit()
-        await session.refresh(trade)
+        await session.commit()  # expire_on_commit=False: trade.id는 flush 시 채워짐
 
         logger.info(
             f"📝 Bot {bot_instance_id} trade entry: ID={trade.id}, {symbol} {side.upper()} "
@@ -1384,8 +1403,16 @@ class BotRunner:
         exit_price: float,
         reason: str
     ):
-        """봇 인스턴스 포지션 청산"""
+        """
+        봇 인스턴스 포지션 청산
+
+        Returns:
+            펜싱 토큰이 유효하지 않아 주문 / 기록을 버렸으면 False
+        """
         try:
+            if not await self._fenced(bot_instance.id, "close order"):
+                return False
+
             close_side = OrderSide.SELL if position["side"] == "long" else OrderSide.BUY
 
             await bitget_client.place_market_order(
@@ -1408,6 +1435,9 @@ class BotRunner:
                 pnl_usdt = (entry_price - exit_price) * position_size * leverage
                 pnl_percent = ((entry_price - exit_price) / entry_price) * 100 * leverage if entry_price > 0 else 0.0
 
+            if not await self._fenced(bot_instance.id, "exit trade record"):
+                return False
+
             # Trade 레코드 업데이트
             if position.get("trade_id"):
                 exit_tag = self._generate_exit_tag(reason, pnl_percent)
@@ -1417,9 +1447,7 @@ class BotRunner:
                 )
 
             # BotInstance 통계 업데이트
-            await self._update_bot_instance_stats(
-                session, bot_instance.id, pnl_usdt, pnl_usdt > 0
-            )
+            record_bot_stats(bot_instance.id, pnl_usdt, pnl_usdt > 0)
 
             # AllocationManager 금액 해제
             if "position_value" in position:
@@ -1442,29 +1470,7 @@ class BotRunner:
 
         except Exception as e:
             logger.error(f"Failed to close position for bot {bot_instance.id}: {e}", exc_info=True)
-
-    async def _update_bot_instance_stats(
-        self,
-        session: AsyncSession,
-        bot_instance_id: int,
-        pnl: float,
-        is_win: bool
-    ):
-        """봇 인스턴스 통계 업데이트"""
-        try:
-            result = await session.execute(
-                select(BotInstance).where(BotInstance.id == bot_instance_id)
-            )
-            bot = result.scalar_one_or_none()
-            if bot:
-                bot.total_trades += 1
-                if is_win:
-                    bot.winning_trades += 1
-                bot.total_pnl = float(bot.total_pnl or 0) + pnl
-                bot.last_trade_at = datetime.utcnow()
-                await session.commit()
-        except Exception as e:
-            logger.error(f"Failed to update bot instance stats: {e}")
+        return True
 
     async def _send_instance_trade_notification(
         self,
@@ -1544,14 +1550,6 @@ class BotRunner:
 
         # ===== Agent System 시작 (한 번만) =====
         try:
-            # Market Regime Agent 시작
-            if self.market_regime.state != AgentState.RUNNING:
-                try:
-                    await self.market_regime.start()
-                    logger.info("✅ MarketRegime Agent started (legacy bot)")
-                except Exception as e:
-                    logger.error(f"❌ Failed to start MarketRegime Agent: {e}", exc_info=True)
-
             # Signal Validator Agent 시작
             if self.signal_validator.state != AgentState.RUNNING:
                 try:
@@ -1659,54 +1657,28 @@ class BotRunner:
                     )
                     return
 
-                # 2.5. MarketRegimeAgent에 Bitget 클라이언트 설정 (캔들 데이터 조회용)
-                # 전략 파라미터에서 심볼과 타임프레임 미리 가져오기
+                # 2.5. 전략 파라미터에서 심볼과 타임프레임 미리 가져오기
                 strategy_params = json.loads(strategy.params) if strategy.params else {}
                 symbol = strategy_params.get("symbol", "ETH/USDT").replace(
                     "/", ""
                 )  # "ETHUSDT"
                 timeframe = strategy_params.get("timeframe", "5m")
 
-                if self.market_regime.bitget_client is None:
-                    self.market_regime.bitget_client = bitget_client
-                    self.market_regime.symbol = symbol
-                    self.market_regime.timeframe = timeframe
-                    logger.info(f"✅ MarketRegimeAgent: Bitget client connected for {symbol} (legacy)")
-
-                # 3. 과거 캔들 데이터 로드 (CRITICAL: 전략 정확도 향상)
-                candle_buffer = deque(maxlen=200)
-
-                try:
-                    # Bitget API에서 과거 200개 캔들 가져오기
-                    historical = await bitget_client.get_historical_candles(
-                        symbol=symbol, interval=timeframe, limit=200
-                    )
-
-                    # 캔들 버퍼에 추가
-                    for candle in historical:
-                        candle_buffer.append(
-                            {
-                                "open": float(candle.get("open", 0)),
-                                "high": float(candle.get("high", 0)),
-                                "low": float(candle.get("low", 0)),
-                                "close": float(candle.get("close", 0)),
-                                "volume": float(candle.get("volume", 0)),
-                                "time": candle.get("timestamp", 0),
-                            }
-                        )
-
+                # 3. 공유 캔들 시리즈 구독 (CRITICAL: 전략 정확도 향상)
+                # 같은 심볼/타임프레임의 봇들은 한 시리즈를 공유하며 첫 구독에서만 백필
+                candle_series = await candle_aggregator.subscribe(symbol, timeframe, client=bitget_client)
+                if len(candle_series):
                     logger.info(
-                        f"✅ Loaded {len(candle_buffer)} historical candles for {symbol} {timeframe} (user {user_id})"
-                    )
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load historical candles for user {user_id}: {e}"
+                        f"✅ Using {len(candle_series)} shared candles for {symbol} {timeframe} (user {user_id})"
                     )
+                else:
                     logger.info(
-                        "Continuing with empty candle buffer (strategies may have reduced accuracy)"
+                        "Continuing with empty candle series (strategies may have reduced accuracy)"
                     )
 
+                # 3.5. 심볼 시장 환경 추적
+                await self.regime_service.track(symbol, client=bitget_client)
+
                 # 4. 기존 포지션 동기화 (봇 시작 시 Bitget에서 조회)
                 current_position = None
                 try:
@@ -1727,9 +1699,9 @@ class BotRunner:
                                 # PnL % 계산
                                 if entry_price > 0:
                                     if side == "long":
-                                        pnl_percent = ((candle_buffer[-1]["close"] if candle_buffer else entry_price) - entry_price) / entry_price * 100 * leverage
+                                        pnl_percent = ((float(candle_series.view(1).close[-1]) if len(candle_series) else entry_price) - entry_price) / entry_price * 100 * leverage
                                     else:
-                                        pnl_percent = (entry_price - (candle_buffer[-1]["close"] if candle_buffer else entry_price)) / entry_price * 100 * leverage
+                                        pnl_percent = (entry_price - (float(candle_series.view(1).close[-1]) if len(candle_series) else entry_price)) / entry_price * 100 * leverage
                                 else:
                                     pnl_percent = 0
 
@@ -1812,21 +1784,8 @@ class BotRunner:
                             logger.warning(f"Invalid price received: {price}")
                             continue
 
-                        # 캔들 데이터 준비 - market 데이터를 캔들 형식으로 변환
-                        new_candle = {
-                            "open": market.get("open", price),
-                            "high": market.get("high", price),
-                            "low": market.get("low", price),
-                            "close": market.get("close", price),
-                            "volume": market.get("volume", 0),
-                            "time": market.get("time", 0),
-                        }
-
-                        # 새 캔들을 버퍼에 추가 (롤링 윈도우)
-                        candle_buffer.append(new_candle)
-
-                        # 전체 캔들 버퍼를 전략에 전달 (1개가 아닌 전체!)
-                        candles = list(candle_buffer)
+                        # 전체 캔들 시리즈를 전략에 전달 (수집기가 이미 이 틱을 반영, 복사 없음)
+                        candles = candle_series.view()
 
                         # 새로운 전략 로더 사용 (포지션 정보 포함)
                         try:
@@ -2408,7 +2367,7 @@ class BotRunner:
 
                         # 자산 기록 (에러 격리)
                         try:
-                            await record_equity(session, user_id, value=price)
+                            record_equity(user_id, value=price)
                         except Exception as e:
                             logger.error(
                                 f"Failed to record equity for user {user_id}: {e}"
@@ -2568,8 +2527,7 @@ class BotRunner:
             order_tag=order_tag,  # 주문 태그
         )
         session.add(trade)
-        await session.commit()
-        await session.refresh(trade)
+        await session.commit()  # expire_on_commit=False: trade.id는 flush 시 채워짐
 
         logger.info(
             f"📝 Trade entry recorded: ID={trade.id}, {symbol} {side.upper()} "
@@ -2773,23 +2731,16 @@ class BotRunner:
         """
         주기적 에이전트 태스크 시작 (선물거래 최적화)
 
-        - MarketRegimeAgent: 10분마다 시장 환경 분석 (트렌드는 단기적으로 안정적)
+        - 시장 환경은 RegimeService가 캔들 마감 시 심볼별로 갱신 (주기 태스크 없음)
         - RiskMonitorAgent: 2분마다 리스크 체크 (레버리지 청산 위험 모니터링)
 
         각 태스크는 봇이 실행 중일 때만 동작하고, 봇 종료 시 자동으로 정지됩니다.
         """
         # 이미 실행 중이면 중복 시작 방지
-        if "market_regime_periodic" in self._periodic_tasks:
+        if "risk_monitor_periodic" in self._periodic_tasks:
             logger.debug("Periodic agents already running")
             return
 
-        # MarketRegime 주기적 실행 (10분마다)
-        market_task = asyncio.create_task(
-            self._periodic_market_regime_analysis(bot_instance_id)
-        )
-        self._periodic_tasks["market_regime_periodic"] = market_task
-        logger.info("✅ Started MarketRegime periodic task (10분 주기)")
-
         # RiskMonitor 주기적 실행 (2분마다)
         risk_task = asyncio.create_task(
             self._periodic_risk_monitoring(bot_instance_id, user_id)
@@ -2797,60 +2748,6 @@ class BotRunner:
         self._periodic_tasks["risk_monitor_periodic"] = risk_task
         logger.info("✅ Started RiskMonitor periodic task (2분 주기)")
 
-    async def _periodic_market_regime_analysis(self, bot_instance_id: int):
-        """
-        MarketRegimeAgent 주기적 실행 (10분마다)
-
-        시장 환경을 분석하여 Redis에 저장합니다.
-        다른 컴포넌트(SignalValidator 등)에서 참조 가능합니다.
-
-        Note: bitget_client가 설정되어 있으면 자동으로 캔들 데이터를 가져옵니다.
-        """
-        while bot_instance_id in self.instance_tasks:
-            try:
-                # MarketRegimeAgent에 설정된 심볼과 타임프레임 사용
-                symbol = self.market_regime.symbol or "BTCUSDT"
-                timeframe = self.market_regime.timeframe or "5m"
-
-                # 시장 환경 분석 태스크 생성
-                # Note: bitget_client가 MarketRegimeAgent에 설정되어 있으면
-                #       _fetch_candles()에서 자동으로 캔들 데이터를 가져옴
-                regime_task = AgentTask(
-                    task_id=f"periodic_regime_{datetime.utcnow().timestamp()}",
-                    task_type="analyze_market",
-                    priority=TaskPriority.NORMAL,
-                    params={
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        "force_refresh": True  # 주기적 분석은 항상 최신 데이터 사용
-                    },
-                    timeout=10.0  # 타임아웃 증가 (API 호출 포함)
-                )
-
-                # 에이전트에 태스크 제출
-                await self.market_regime.submit_task(regime_task)
-                await asyncio.sleep(0.5)  # 처리 대기 (API 호출 포함)
-
-                # 결과 로깅
-                if regime_task.result:
-                    regime = regime_task.result
-                    logger.info(
-                        f"📊 Periodic Market Analysis: {symbol} -> "
-                        f"regime={regime.regime_type.value}, "
-                        f"volatility={regime.volatility:.2f}%, "
-                        f"confidence={regime.confidence:.2f}"
-                    )
-                else:
-                    logger.warning(f"Periodic Market Analysis: No result for {symbol}")
-
-            except Exception as e:
-                logger.error(f"Periodic market regime analysis error: {e}", exc_info=True)
-
-            # 10분 대기
-            await asyncio.sleep(600)
-
-        logger.info("Periodic MarketRegime analysis stopped (bot stopped)")
-
     async def _periodic_risk_monitoring(self, bot_instance_id: int, user_id: int):
         """
         RiskMonitorAgent 주기적 실행 (2분마다)
@@ -6,6 +6,7 @@
 
 특징:
 1. 저장된 CSV 캐시 데이터만 사용 (API 호출 없음)
+   - 상위 타임프레임 파일이 없으면 1m 기준 파일에서 로컬 집계
 2. Rate Limit 없음 - 무제한 실행 가능
 3. 빠른 속도 - 로컬 파일 읽기
 4. 동시성 안전 - 여러 사용자 동시 사용 가능
@@ -14,17 +15,31 @@
 """
 
 import csv
+import itertools
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from ..database.models import GridMode, PositionDirection
+from ..utils.candle_rollup import (
+    BASE_TIMEFRAME,
+    ROLLUP_TIMEFRAMES,
+    can_rollup,
+    rollup_arrays,
+    timeframe_seconds,
+)
+from .grid_simulator import CandleArrays, run_parameter_sweep, simulate_grid
 
 logger = logging.getLogger(__name__)
 
+# 스윕 1회당 최대 파라미터 조합 수
+MAX_SWEEP_COMBINATIONS = 5000
+
 
 @dataclass
 class CachedCandle:
@@ -82,6 +97,8 @@ class CacheBacktestService:
             self.cache_dir = Path(__file__).parent.parent.parent / "candle_cache"
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._array_cache: Dict[Path, Tuple[float, CandleArrays]] = {}
+        self._rollup_cache: Dict[Tuple[str, str], Tuple[float, Tuple[np.ndarray, ...]]] = {}
         logger.info(f"📦 CacheBacktestService initialized: {self.cache_dir}")
 
     def get_available_data(self) -> Dict[str, Any]:
@@ -122,12 +139,29 @@ class CacheBacktestService:
                     }
                 )
 
+        # 1m 기준 파일에서 집계 가능한 상위 타임프레임
+        stored = {(d["symbol"], d["timeframe"]) for d in available["data"]}
+        for base in [d for d in available["data"] if d["timeframe"] == BASE_TIMEFRAME]:
+            for timeframe in ROLLUP_TIMEFRAMES:
+                if (base["symbol"], timeframe) in stored:
+                    continue
+                available["timeframes"].add(timeframe)
+                available["data"].append(
+                    {
+                        "symbol": base["symbol"],
+                        "timeframe": timeframe,
+                        "candle_count": base["candle_count"] * 60 // timeframe_seconds(timeframe),
+                        "file": base["file"],
+                        "derived_from": BASE_TIMEFRAME,
+                    }
+                )
+
         available["symbols"] = sorted(available["symbols"])
         available["timeframes"] = sorted(
             available["timeframes"],
             key=lambda x: (
                 0 if x.endswith("m") else 1 if x.endswith("h") else 2,
-                int(x.replace("m", "").replace("h", "").replace("d", ""))
+                int(x.replace("m", "").replace("h", "").replace("d", "").replace("D", ""))
                 if x[:-1].isdigit()
                 else 0,
             ),
@@ -163,48 +197,50 @@ class CacheBacktestService:
         symbol = symbol.upper().replace("/", "")
         cache_file = self.cache_dir / f"{symbol}_{timeframe}.csv"
 
-        if not cache_file.exists():
-            raise FileNotFoundError(
-                f"캐시 데이터 없음: {symbol} {timeframe}\n"
-                f"사용 가능한 데이터: {self.get_available_data()['data']}"
-            )
-
         candles = []
-        with open(cache_file, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                candles.append(
-                    CachedCandle(
-                        timestamp=int(row["timestamp"]),
-                        open=Decimal(row["open"]),
-                        high=Decimal(row["high"]),
-                        low=Decimal(row["low"]),
-                        close=Decimal(row["close"]),
-                        volume=Decimal(row["volume"]),
+        if cache_file.exists():
+            with open(cache_file, "r", newline="") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    candles.append(
+                        CachedCandle(
+                            timestamp=int(row["timestamp"]),
+                            open=Decimal(row["open"]),
+                            high=Decimal(row["high"]),
+                            low=Decimal(row["low"]),
+                            close=Decimal(row["close"]),
+                            volume=Decimal(row["volume"]),
+                        )
                     )
+        else:
+            columns = self._rollup_from_base(symbol, timeframe)
+            if columns is None:
+                raise FileNotFoundError(
+                    f"캐시 데이터 없음: {symbol} {timeframe}\n"
+                    f"사용 가능한 데이터: {self.get_available_data()['data']}"
+                )
+            times, opens, highs, lows, closes, volumes = (col.tolist() for col in columns)
+            candles = [
+                CachedCandle(
+                    timestamp=int(times[i]),
+                    open=Decimal(str(opens[i])),
+                    high=Decimal(str(highs[i])),
+                    low=Decimal(str(lows[i])),
+                    close=Decimal(str(closes[i])),
+                    volume=Decimal(str(volumes[i])),
                 )
+                for i in range(len(times))
+            ]
 
         if not candles:
             raise ValueError(f"캐시 파일이 비어있음: {cache_file}")
 
         # 기간 필터링
-        if days:
-            # 최근 N일
-            now_ts = datetime.now().timestamp() * 1000
-            start_ts = now_ts - (days * 24 * 60 * 60 * 1000)
+        start_ts, end_ts = self._period_bounds(days, start_date, end_date)
+        if start_ts is not None:
             candles = [c for c in candles if c.timestamp >= start_ts]
-        elif start_date or end_date:
-            if start_date:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                start_ts = int(start_dt.timestamp() * 1000)
-                candles = [c for c in candles if c.timestamp >= start_ts]
-
-            if end_date:
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
-                    hour=23, minute=59, second=59
-                )
-                end_ts = int(end_dt.timestamp() * 1000)
-                candles = [c for c in candles if c.timestamp <= end_ts]
+        if end_ts is not None:
+            candles = [c for c in candles if c.timestamp <= end_ts]
 
         if not candles:
             raise ValueError(
@@ -217,6 +253,123 @@ class CacheBacktestService:
         )
         return candles
 
+    @staticmethod
+    def _period_bounds(
+        days: Optional[int],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """기간 필터 -> (시작 ms, 종료 ms). days가 start_date보다 우선"""
+        if days:
+            now_ts = datetime.now().timestamp() * 1000
+            return now_ts - (days * 24 * 60 * 60 * 1000), None
+
+        start_ts = end_ts = None
+        if start_date:
+            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+            start_ts = int(start_dt.timestamp() * 1000)
+        if end_date:
+            end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
+                hour=23, minute=59, second=59
+            )
+            end_ts = int(end_dt.timestamp() * 1000)
+        return start_ts, end_ts
+
+    def _read_arrays(self, cache_file: Path) -> CandleArrays:
+        """CSV -> 컬럼형 배열 (파일 수정 시각 기준 메모리 캐시)"""
+        mtime = cache_file.stat().st_mtime
+        cached = self._array_cache.get(cache_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(cache_file, "r") as f:
+            header = f.readline().strip().split(",")
+        columns = [header.index(name) for name in ("timestamp", "high", "low", "close")]
+        data = np.loadtxt(
+            cache_file, delimiter=",", skiprows=1, usecols=columns, ndmin=2
+        )
+        arrays = CandleArrays(
+            timestamps=data[:, 0].astype(np.int64),
+            highs=data[:, 1],
+            lows=data[:, 2],
+            closes=data[:, 3],
+        )
+        self._array_cache[cache_file] = (mtime, arrays)
+        return arrays
+
+    def _rollup_from_base(
+        self, symbol: str, timeframe: str
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """1m 기준 CSV에서 상위 타임프레임 OHLCV 컬럼 집계 (기준 파일 수정 시각 기준 메모리 캐시)"""
+        base_file = self.cache_dir / f"{symbol}_{BASE_TIMEFRAME}.csv"
+        if not can_rollup(BASE_TIMEFRAME, timeframe) or not base_file.exists():
+            return None
+
+        mtime = base_file.stat().st_mtime
+        cached = self._rollup_cache.get((symbol, timeframe))
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(base_file, "r") as f:
+            header = f.readline().strip().split(",")
+        names = ("timestamp", "open", "high", "low", "close", "volume")
+        data = np.loadtxt(
+            base_file, delimiter=",", skiprows=1,
+            usecols=[header.index(name) for name in names], ndmin=2,
+        )
+        columns = rollup_arrays(
+            data[:, 0].astype(np.int64), data[:, 1], data[:, 2], data[:, 3], data[:, 4], data[:, 5],
+            timeframe_seconds(timeframe) * 1000,
+        )
+        self._rollup_cache[(symbol, timeframe)] = (mtime, columns)
+        logger.info(
+            f"📊 Rolled up {len(columns[0])} {timeframe} candles from {base_file.name}"
+        )
+        return columns
+
+    def load_candle_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        days: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> CandleArrays:
+        """
+        캐시에서 캔들 데이터를 컬럼형 float64 배열로 로드 (벡터화 시뮬레이션용)
+
+        Args/Raises: load_candles와 동일
+        """
+        symbol = symbol.upper().replace("/", "")
+        cache_file = self.cache_dir / f"{symbol}_{timeframe}.csv"
+
+        if cache_file.exists():
+            arrays = self._read_arrays(cache_file)
+        else:
+            columns = self._rollup_from_base(symbol, timeframe)
+            if columns is None:
+                raise FileNotFoundError(f"캐시 데이터 없음: {symbol} {timeframe}")
+            times, _, highs, lows, closes, _ = columns
+            arrays = CandleArrays(timestamps=times, highs=highs, lows=lows, closes=closes)
+        if not len(arrays):
+            raise ValueError(f"캐시 파일이 비어있음: {cache_file}")
+
+        start_ts, end_ts = self._period_bounds(days, start_date, end_date)
+        if start_ts is not None or end_ts is not None:
+            mask = np.ones(len(arrays), dtype=bool)
+            if start_ts is not None:
+                mask &= arrays.timestamps >= start_ts
+            if end_ts is not None:
+                mask &= arrays.timestamps <= end_ts
+            arrays = arrays.slice(mask)
+
+        if not len(arrays):
+            raise ValueError(
+                f"지정된 기간에 데이터 없음: {symbol} {timeframe}\n"
+                f"요청 기간: days={days}, start={start_date}, end={end_date}"
+            )
+        return arrays
+
     async def run_grid_backtest(
         self,
         symbol: str,
@@ -265,8 +418,8 @@ class CacheBacktestService:
                 days=30,
             )
         """
-        # 1. 캐시에서 캔들 로드
-        candles = self.load_candles(
+        # 1. 캐시에서 캔들 로드 (컬럼형 배열)
+        candles = self.load_candle_arrays(
             symbol=symbol,
             timeframe=timeframe,
             days=days if not start_date else None,
@@ -322,6 +475,74 @@ class CacheBacktestService:
         return result
 
     def _run_simulation(
+        self,
+        candles: Union[CandleArrays, List[CachedCandle]],
+        grid_prices: List[Decimal],
+        direction: PositionDirection,
+        per_grid_amount: Decimal,
+        investment: Decimal,
+    ) -> Dict[str, Any]:
+        """그리드 트레이딩 시뮬레이션 (벡터화 float64 경로)"""
+        if not isinstance(candles, CandleArrays):
+            candles = CandleArrays.from_candles(candles)
+
+        investment_f = float(investment)
+        sim = simulate_grid(
+            candles,
+            [float(p) for p in grid_prices],
+            long=direction == PositionDirection.LONG,
+            per_grid_amount=float(per_grid_amount),
+            investment=investment_f,
+            keep_last_trades=50,
+        )
+
+        trades = []
+        for candle_index, grid_index, profit in sim.last_trades:
+            entry = float(grid_prices[grid_index])
+            if direction == PositionDirection.LONG:
+                trade = {"buy": entry, "sell": float(grid_prices[grid_index + 1])}
+            else:
+                trade = {"sell": entry, "buy": float(grid_prices[grid_index - 1])}
+            trade["profit"] = profit
+            trade["time"] = candles.datetime_at(candle_index).isoformat()
+            trades.append(trade)
+
+        total_roi = sim.total_profit / investment_f * 100 if investment_f > 0 else 0.0
+        win_rate = sim.winning_trades / sim.total_trades * 100 if sim.total_trades else 0
+
+        # 일별 ROI
+        daily_roi = []
+        prev_eq = investment_f
+        for eq in sim.day_start_equity:
+            day_roi = ((eq - prev_eq) / prev_eq * 100) if prev_eq > 0 else 0
+            daily_roi.append(round(day_roi, 2))
+            prev_eq = eq
+
+        # 누적 ROI
+        cumulative_roi = []
+        cum = 0
+        for roi in daily_roi:
+            cum += roi
+            cumulative_roi.append(round(cum, 2))
+
+        return {
+            "total_roi": round(total_roi, 2),
+            "roi_30d": round(total_roi, 2),
+            "max_drawdown": round(sim.max_drawdown, 2),
+            "total_trades": sim.total_trades,
+            "winning_trades": sim.winning_trades,
+            "losing_trades": sim.losing_trades,
+            "win_rate": round(win_rate, 2),
+            "total_profit": round(sim.total_profit, 2),
+            "avg_profit_per_trade": round(sim.total_profit / sim.total_trades, 2)
+            if sim.total_trades
+            else 0,
+            "daily_roi": cumulative_roi,
+            "equity_curve": sim.day_start_equity,
+            "trades": trades,  # 최근 50개만
+        }
+
+    def _run_simulation_reference(
         self,
         candles: List[CachedCandle],
         grid_prices: List[Decimal],
@@ -329,7 +550,7 @@ class CacheBacktestService:
         per_grid_amount: Decimal,
         investment: Decimal,
     ) -> Dict[str, Any]:
-        """그리드 트레이딩 시뮬레이션"""
+        """그리드 트레이딩 시뮬레이션 (Decimal 기준 구현, 벡터화 경로 검증용)"""
 
         # 수수료율
         TAKER_FEE = Decimal("0.0006")  # 0.06%
@@ -495,6 +716,71 @@ class CacheBacktestService:
             "trades": trades[-50:],  # 최근 50개만
         }
 
+    async def run_grid_sweep(
+        self,
+        symbol: str,
+        timeframe: str,
+        direction: PositionDirection,
+        lower_prices: Sequence[float],
+        upper_prices: Sequence[float],
+        grid_counts: Sequence[int],
+        grid_modes: Sequence[GridMode],
+        investment: float,
+        leverage: int = 5,
+        days: int = 30,
+        top_n: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        그리드 파라미터 스윕 (캐시 데이터 사용)
+
+        lower × upper × grid_count × mode 전체 조합을 한 번에 평가해
+        ROI 기준 상위 top_n 결과를 반환합니다.
+
+        Raises:
+            ValueError: 유효한 조합이 없거나 조합 수 초과
+        """
+        combos = [
+            (float(lower), float(upper), int(count), mode == GridMode.ARITHMETIC)
+            for lower, upper, count, mode in itertools.product(
+                lower_prices, upper_prices, grid_counts, grid_modes
+            )
+            if lower < upper and count >= 2
+        ]
+        if not combos:
+            raise ValueError("유효한 파라미터 조합이 없습니다 (lower < upper, grid_count >= 2)")
+        if len(combos) > MAX_SWEEP_COMBINATIONS:
+            raise ValueError(
+                f"파라미터 조합이 너무 많습니다: {len(combos)} > {MAX_SWEEP_COMBINATIONS}"
+            )
+
+        candles = self.load_candle_arrays(symbol, timeframe, days=days)
+        results = await run_parameter_sweep(
+            candles,
+            combos,
+            long=direction == PositionDirection.LONG,
+            investment=float(investment),
+            leverage=leverage,
+        )
+        results.sort(key=lambda r: (r["roi_30d"], -r["max_drawdown"]), reverse=True)
+
+        logger.info(
+            f"✅ Grid sweep complete: {symbol} {timeframe} | "
+            f"{len(combos)} combos | best ROI: {results[0]['roi_30d']}%"
+        )
+
+        return {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "direction": direction.value,
+            "leverage": leverage,
+            "investment": float(investment),
+            "backtest_days": days,
+            "total_candles": len(candles),
+            "evaluated": len(combos),
+            "results": results[:top_n],
+            "data_source": "cache",
+        }
+
     def _calculate_grid_prices(
         self,
         lower_price: Decimal,
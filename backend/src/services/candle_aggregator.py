@@ -0,0 +1,416 @@
+"""
+Shared live candle aggregator
+
+심볼/타임프레임별로 OHLCV 캔들을 한 번만 만들어 모든 봇, 차트, 에이전트가 공유합니다.
+
+- 시세 틱(ccxt_price_collector)으로 현재 캔들을 갱신하고, 버킷이 바뀌면 새 캔들 시작
+- 첫 구독 시에만 백필: 같은 심볼의 하위 타임프레임 시리즈로 충분하면 로컬 집계,
+  아니면 REST (시작 시 REST 호출 ≤ 심볼 × 타임프레임)
+- 컬럼형 링버퍼: 각 값을 두 번 기록해서 최근 N개가 항상 연속 구간
+  -> 소비자는 복사 없이 읽기 전용 numpy 뷰(CandleView)를 받음
+- 캔들 마감 리스너: 마감 시점에만 재계산하는 소비자용 (예: RegimeService)
+
+CandleView는 기존 list[dict] 캔들과 같은 방식으로 읽을 수 있습니다
+(len, 인덱싱, 슬라이싱, 반복, row.get("close")). 뷰는 다음 틱에서 갱신된
+버퍼를 가리키므로 보관하지 말고 틱마다 새로 받아서 사용합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.candle_rollup import TIMEFRAME_SECONDS, can_rollup, rollup_arrays
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 500
+# 하위 타임프레임 시리즈에서 이만큼 이상 만들 수 있으면 REST 백필 대신 로컬 집계
+MIN_DERIVED_CANDLES = 100
+
+COLUMNS = ("time", "open", "high", "low", "close", "volume", "tick_count")
+_TIME, _OPEN, _HIGH, _LOW, _CLOSE, _VOLUME, _TICKS = range(len(COLUMNS))
+
+CloseListener = Callable[[str, str, dict], Any]
+
+
+def normalize_symbol(symbol: str) -> str:
+    """'ETH/USDT:USDT', 'ETH-USDT', 'ethusdt' -> 'ETHUSDT'"""
+    return symbol.split(":")[0].replace("/", "").replace("-", "").upper()
+
+
+def to_seconds(timestamp: Any) -> int:
+    """초/밀리초 타임스탬프 -> 초"""
+    ts = int(float(timestamp or 0))
+    return ts // 1000 if ts > 10**12 else ts
+
+
+class CandleView(Sequence):
+    """
+    캔들 링버퍼의 읽기 전용 뷰 (복사 없음)
+
+    컬럼 배열(view.close, view.volume ...)로 바로 계산하거나,
+    list[dict]처럼 행 단위로 읽을 수 있습니다 (행 dict는 접근 시 생성).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: np.ndarray):
+        self._data = data
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CandleView(self._data[:, index])
+        row = self._data[:, index]
+        return {
+            "time": int(row[_TIME]),
+            "open": float(row[_OPEN]),
+            "high": float(row[_HIGH]),
+            "low": float(row[_LOW]),
+            "close": float(row[_CLOSE]),
+            "volume": float(row[_VOLUME]),
+            "tick_count": int(row[_TICKS]),
+        }
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"CandleView(len={len(self)})"
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._data[_TIME]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._data[_OPEN]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._data[_HIGH]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._data[_LOW]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._data[_CLOSE]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._data[_VOLUME]
+
+    def as_columns(self) -> Dict[str, np.ndarray]:
+        """컬럼 이름 -> 배열 (DataFrame 생성용)"""
+        return {name: self._data[i] for i, name in enumerate(COLUMNS)}
+
+    def to_list(self) -> List[dict]:
+        """list[dict]로 복사 (직렬화/보관용)"""
+        return list(self)
+
+
+class CandleSeries:
+    """
+    한 (심볼, 타임프레임)의 캔들 링버퍼
+
+    마지막 행은 진행 중인 캔들이며 틱마다 제자리에서 갱신됩니다.
+    """
+
+    def __init__(self, symbol: str, timeframe: str, capacity: int = DEFAULT_CAPACITY):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.interval = TIMEFRAME_SECONDS[timeframe]
+        self.capacity = capacity
+
+        # 각 행을 i, i + capacity 두 곳에 기록 -> 최근 N개가 항상 연속
+        self._buf = np.zeros((len(COLUMNS), capacity * 2), dtype=np.float64)
+        self._readonly = self._buf.view()
+        self._readonly.flags.writeable = False
+        self._pos = 0
+        self._count = 0
+
+        self.backfilled = False
+        # 첫 틱으로 새로 연 캔들은 버킷 중간부터 본 것이므로 마감 알림 제외
+        self._live = False
+        self._current_partial = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_time(self) -> Optional[int]:
+        if not self._count:
+            return None
+        return int(self._buf[_TIME, (self._pos - 1) % self.capacity])
+
+    def bucket_start(self, ts: float) -> int:
+        ts = int(ts)
+        return ts - ts % self.interval
+
+    def view(self, limit: Optional[int] = None) -> CandleView:
+        """최근 limit개 (기본 전체) 읽기 전용 뷰"""
+        n = self._count if limit is None else max(0, min(limit, self._count))
+        end = self._pos + self.capacity
+        return CandleView(self._readonly[:, end - n:end])
+
+    def _write(self, index: int, row) -> None:
+        self._buf[:, index] = row
+        self._buf[:, index + self.capacity] = row
+
+    def append(self, row) -> None:
+        self._write(self._pos, row)
+        self._pos = (self._pos + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def backfill(self, candles: List[dict]) -> None:
+        """REST 캔들로 채우기 (시간순 정렬, 기존 캔들보다 과거는 무시)"""
+        rows = sorted(
+            (
+                (
+                    to_seconds(c.get("timestamp", c.get("time"))),
+                    float(c["open"]), float(c["high"]), float(c["low"]),
+                    float(c["close"]), float(c.get("volume", 0) or 0), 0.0,
+                )
+                for c in candles
+            ),
+            key=lambda r: r[0],
+        )
+        for row in rows[-self.capacity:]:
+            last = self.last_time
+            if last is not None and row[0] < last:
+                continue
+            if last is not None and row[0] == last:
+                self._write((self._pos - 1) % self.capacity, row)
+            else:
+                self.append(row)
+        self.backfilled = True
+        # 백필 마지막 캔들은 이미 마감됐을 수 있으므로 틱으로 이어받기 전에는 알림 제외
+        self._current_partial = True
+
+    def on_tick(self, price: float, volume: float, ts: float) -> Optional[dict]:
+        """
+        틱 반영
+
+        Returns:
+            새 버킷이 시작되어 직전 캔들이 마감된 경우 마감 캔들 (부분 캔들 제외)
+        """
+        start = self.bucket_start(ts)
+        last = self.last_time
+
+        if last is not None and start < last:
+            return None  # 지연 도착 틱
+
+        if last is not None and start == last:
+            if not self._live:
+                # 백필된 진행 중 캔들을 이어서 갱신 -> 마감 시 알림 대상
+                self._current_partial = False
+                self._live = True
+            i = (self._pos - 1) % self.capacity
+            row = self._buf[:, i].copy()
+            row[_HIGH] = max(row[_HIGH], price)
+            row[_LOW] = min(row[_LOW], price)
+            row[_CLOSE] = price
+            row[_VOLUME] += volume
+            row[_TICKS] += 1
+            self._write(i, row)
+            return None
+
+        closed = None
+        if last is not None and not self._current_partial:
+            closed = self.view(1)[0]
+
+        self._current_partial = not self._live
+        self._live = True
+        self.append((start, price, price, price, price, volume, 1.0))
+        return closed
+
+
+class CandleAggregator:
+    """
+    프로세스 공유 캔들 집계기
+
+    사용법:
+    ```python
+    series = await candle_aggregator.subscribe("ETHUSDT", "5m", client=bitget_client)
+    candles = series.view()  # 틱마다 (복사 없음)
+    ```
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._series: Dict[Tuple[str, str], CandleSeries] = {}
+        self._by_symbol: Dict[str, List[CandleSeries]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._last_base_volume: Dict[str, float] = {}
+        self._close_listeners: List[CloseListener] = []
+
+        self.stats = {"ticks": 0, "candles_closed": 0, "backfills": 0, "derived_backfills": 0}
+
+    # ------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------
+
+    def get_series(self, symbol: str, timeframe: str) -> Optional[CandleSeries]:
+        return self._series.get((normalize_symbol(symbol), timeframe))
+
+    def ensure_series(self, symbol: str, timeframe: str) -> CandleSeries:
+        """백필 없이 시리즈 생성 (틱으로만 채움)"""
+        key = (normalize_symbol(symbol), timeframe)
+        series = self._series.get(key)
+        if series is None:
+            series = CandleSeries(key[0], timeframe, self.capacity)
+            self._series[key] = series
+            self._by_symbol.setdefault(key[0], []).append(series)
+        return series
+
+    async def subscribe(
+        self,
+        symbol: str,
+        timeframe: str,
+        client: Any = None,
+        seed_candles: Optional[List[dict]] = None,
+    ) -> CandleSeries:
+        """
+        시리즈 구독 (첫 구독에서만 백필)
+
+        Args:
+            client: get_historical_candles(symbol, interval, limit) 제공 클라이언트
+            seed_candles: 이미 받은 과거 캔들 (있으면 REST 호출 없음)
+        """
+        key = (normalize_symbol(symbol), timeframe)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            series = self.ensure_series(*key)
+            if series.backfilled:
+                return series
+
+            if not seed_candles:
+                seed_candles = self._derive_seed(key[0], timeframe)
+                if seed_candles:
+                    self.stats["derived_backfills"] += 1
+
+            if not seed_candles and client is not None:
+                try:
+                    seed_candles = await client.get_historical_candles(
+                        symbol=key[0], interval=timeframe, limit=self.capacity
+                    )
+                    self.stats["backfills"] += 1
+                except Exception as e:
+                    logger.warning(f"Candle backfill failed for {key[0]} {timeframe}: {e}")
+                    return series
+
+            if seed_candles:
+                series.backfill(seed_candles)
+                logger.info(f"✅ Candle series ready: {key[0]} {timeframe} ({len(series)} candles)")
+            return series
+
+    def _derive_seed(self, symbol: str, timeframe: str) -> Optional[List[dict]]:
+        """같은 심볼의 백필된 하위 타임프레임 시리즈를 집계한 캔들 (부족하면 None)"""
+        sources = [
+            series for series in self._by_symbol.get(symbol, [])
+            if series.backfilled and can_rollup(series.timeframe, timeframe)
+        ]
+        if not sources:
+            return None
+
+        view = min(sources, key=lambda series: series.interval).view()
+        times, opens, highs, lows, closes, volumes = rollup_arrays(
+            view.time, view.open, view.high, view.low, view.close, view.volume,
+            TIMEFRAME_SECONDS[timeframe],
+        )
+        if len(times) < min(MIN_DERIVED_CANDLES, self.capacity):
+            return None
+
+        return [
+            {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for t, o, h, l, c, v in zip(
+                times.tolist(), opens.tolist(), highs.tolist(),
+                lows.tolist(), closes.tolist(), volumes.tolist(),
+            )
+        ]
+
+    def add_close_listener(self, listener: CloseListener) -> None:
+        """캔들 마감 콜백 등록: listener(symbol, timeframe, candle)"""
+        if listener not in self._close_listeners:
+            self._close_listeners.append(listener)
+
+    # ------------------------------------------------------------
+    # 틱 입력
+    # ------------------------------------------------------------
+
+    def on_tick(
+        self,
+        symbol: str,
+        price: float,
+        base_volume_24h: Optional[float] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        시세 틱을 해당 심볼의 모든 시리즈에 반영
+
+        캔들 거래량은 24h 누적 거래량의 증가분으로 근사합니다.
+        """
+        key = normalize_symbol(symbol)
+        series_list = self._by_symbol.get(key)
+        if not series_list or price <= 0:
+            return
+
+        ts = timestamp if timestamp is not None else time.time()
+
+        volume = 0.0
+        if base_volume_24h is not None:
+            previous = self._last_base_volume.get(key)
+            if previous is not None:
+                volume = max(0.0, base_volume_24h - previous)
+            self._last_base_volume[key] = base_volume_24h
+
+        self.stats["ticks"] += 1
+        for series in series_list:
+            closed = series.on_tick(price, volume, ts)
+            if closed is not None:
+                self.stats["candles_closed"] += 1
+                for listener in self._close_listeners:
+                    try:
+                        listener(key, series.timeframe, closed)
+                    except Exception as e:
+                        logger.error(f"Candle close listener failed: {e}", exc_info=True)
+
+    def get_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 100,
+        include_current: bool = True,
+    ) -> List[dict]:
+        """캔들 list[dict] 복사본 (API 응답용)"""
+        series = self.get_series(symbol, timeframe)
+        if series is None:
+            return []
+        view = series.view(limit + (0 if include_current else 1))
+        if not include_current:
+            view = view[:-1]
+        return view.to_list()
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "series": {
+                f"{symbol}:{timeframe}": len(series)
+                for (symbol, timeframe), series in self._series.items()
+            },
+            **self.stats,
+        }
+
+
+# 싱글톤 인스턴스
+candle_aggregator = CandleAggregator()
@@ -14,6 +14,8 @@ API Rate Limit 문제를 해결하고 성능을 최적화합니다.
 3. Rate Limit 큐: 동시 요청 순차 처리
 4. 파일 기반 영구 저장: 서버 재시작 후에도 유지
 5. 멀티 소스: Binance/Bitget 선택 가능
+6. 1m 기준 캐시: 상위 타임프레임은 1m 캐시가 기간을 덮으면 로컬 집계 (다운로드/저장 없음)
+7. 컬럼형 저장소: historical_downloader가 받아 둔 월 파티션이 기간을 덮으면 그대로 사용
 
 수정 이력:
 - 2025-12-13: Binance API 지원 추가
@@ -28,6 +30,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.candle_rollup import BASE_TIMEFRAME, can_rollup, rollup_arrays, rollup_candles, timeframe_seconds
+from .candle_store import COLUMNS, ColumnarCandleStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,6 +73,9 @@ class CandleCacheManager:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # 대량 다운로드 결과 (scripts/download_history.py)
+        self.columnar_store = ColumnarCandleStore(str(self.cache_dir / "columnar"))
+
         # 메모리 캐시 (자주 사용되는 데이터)
         self._memory_cache: Dict[str, List[Dict]] = {}
         self._memory_cache_timestamps: Dict[str, float] = {}
@@ -151,12 +159,26 @@ class CandleCacheManager:
             logger.info(f"   ✅ Memory cache hit: {len(memory_candles)} candles")
             return memory_candles
 
-        # 2. 파일 캐시 확인
+        # 1.5 컬럼형 저장소 (다운로더가 기간 전체를 받아 둔 경우)
+        stored = self._get_from_columnar_store(source, symbol, timeframe, start_date, end_date)
+        if stored:
+            logger.info(f"   ✅ Columnar store hit: {len(stored)} candles")
+            self._update_memory_cache(cache_key, stored)
+            return stored
+
+        # 2. 상위 타임프레임은 1m 기준 캐시에서 집계
+        rolled_up = self._rollup_from_base(symbol, timeframe, start_date, end_date)
+        if rolled_up:
+            logger.info(f"   ✅ Rolled up from {BASE_TIMEFRAME} cache: {len(rolled_up)} candles")
+            self._update_memory_cache(cache_key, rolled_up)
+            return rolled_up
+
+        # 3. 파일 캐시 확인
         file_candles = self._get_from_file_cache(
             symbol, timeframe, start_date, end_date
         )
 
-        # 3. 필요한 기간 계산
+        # 4. 필요한 기간 계산
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(
             hour=23, minute=59, second=59
@@ -218,7 +240,7 @@ class CandleCacheManager:
                 self._update_memory_cache(cache_key, result)
                 return result
 
-        # 4. 캐시 없음
+        # 5. 캐시 없음
         if cache_only:
             logger.warning(
                 f"   ⚠️ Cache only mode: no cache available for {symbol} {timeframe}"
@@ -238,6 +260,66 @@ class CandleCacheManager:
 
         return candles
 
+    def _rollup_from_base(
+        self, symbol: str, timeframe: str, start_date: str, end_date: str
+    ) -> Optional[List[Dict]]:
+        """1m 기준 파일 캐시가 요청 기간을 모두 덮으면 상위 타임프레임으로 집계"""
+        if not can_rollup(BASE_TIMEFRAME, timeframe):
+            return None
+
+        base_candles = self._get_from_file_cache(symbol, BASE_TIMEFRAME, start_date, end_date)
+        if not base_candles:
+            return None
+
+        start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp() * 1000)
+        end_ts = int(
+            datetime.strptime(end_date, "%Y-%m-%d")
+            .replace(hour=23, minute=59, second=59)
+            .timestamp() * 1000
+        )
+        cached_start = min(c["timestamp"] for c in base_candles)
+        cached_end = max(c["timestamp"] for c in base_candles)
+        if cached_start > start_ts or cached_end + self.TIMEFRAME_MS[BASE_TIMEFRAME] <= end_ts:
+            return None
+
+        return rollup_candles(
+            [c for c in base_candles if start_ts <= c["timestamp"] <= end_ts], timeframe
+        )
+
+    def _get_from_columnar_store(
+        self, source: str, symbol: str, timeframe: str, start_date: str, end_date: str
+    ) -> Optional[List[Dict]]:
+        """컬럼형 저장소가 요청 기간을 모두 덮으면 조회 (없으면 1m 파티션에서 집계)"""
+        start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp() * 1000)
+        end_ts = int(
+            datetime.strptime(end_date, "%Y-%m-%d")
+            .replace(hour=23, minute=59, second=59)
+            .timestamp() * 1000
+        ) + 1
+
+        try:
+            if self.columnar_store.covers(source, symbol, timeframe, start_ts, end_ts):
+                return self.columnar_store.read_candles(source, symbol, timeframe, start_ts, end_ts)
+
+            if can_rollup(BASE_TIMEFRAME, timeframe) and self.columnar_store.covers(
+                source, symbol, BASE_TIMEFRAME, start_ts, end_ts
+            ):
+                columns = self.columnar_store.read_columns(source, symbol, BASE_TIMEFRAME, start_ts, end_ts)
+                t, o, h, l, c, v = (
+                    column.tolist()
+                    for column in rollup_arrays(
+                        *(columns[name] for name in COLUMNS),
+                        timeframe_seconds(timeframe) * 1000,
+                    )
+                )
+                return [
+                    {"timestamp": t[i], "open": o[i], "high": h[i], "low": l[i], "close": c[i], "volume": v[i]}
+                    for i in range(len(t))
+                ]
+        except Exception as e:
+            logger.warning(f"Columnar store read failed for {symbol} {timeframe}: {e}")
+        return None
+
     def _get_from_memory_cache(
         self, cache_key: str, start_date: str, end_date: str
     ) -> Optional[List[Dict]]:
@@ -0,0 +1,240 @@
+"""
+컬럼형 캔들 저장소 (Columnar Candle Store)
+
+과거 캔들을 (거래소, 심볼, 타임프레임)별 월 파티션으로 나눠 컬럼마다 .npy 파일로 저장합니다.
+
+    {root}/{exchange}/{symbol}/{timeframe}/2024-01/timestamp.npy, open.npy, ..., volume.npy
+    {root}/{exchange}/{symbol}/{timeframe}/checkpoint.json
+
+- 파티션은 임시 디렉토리에 다 쓴 뒤 rename으로 교체 (중간에 죽어도 반쯤 쓴 파티션 없음)
+- checkpoint.json: 파티션별로 받은 구간(from/to, ms, 반열림)과 완료 여부
+  → 다운로더 재시작 시 완료된 월은 건너뜀
+- 읽기는 np.load(mmap_mode="r")로 필요한 파티션만 열고 searchsorted로 구간만 잘라냄
+
+모든 구간은 [start_ts, end_ts) 반열림, 시각은 UTC epoch ms.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+CHECKPOINT_FILE = "checkpoint.json"
+
+# (파티션 이름, 월 시작 ms, 다음 달 시작 ms)
+Partition = Tuple[str, int, int]
+
+
+def normalize_timeframe(timeframe: str) -> str:
+    """'1H' / '1D' → '1h' / '1d' (저장 경로 통일, 1m(분)과 1M(월)은 구분)"""
+    if timeframe[-1:] in ("H", "D", "W"):
+        return timeframe[:-1] + timeframe[-1].lower()
+    return timeframe
+
+
+def month_partitions(start_ts: int, end_ts: int) -> List[Partition]:
+    """[start_ts, end_ts)와 겹치는 월 파티션 목록"""
+    month = datetime.fromtimestamp(start_ts / 1000, tz=timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    partitions = []
+    while True:
+        month_start = int(month.timestamp() * 1000)
+        if month_start >= end_ts:
+            break
+        if month.month == 12:
+            next_month = month.replace(year=month.year + 1, month=1)
+        else:
+            next_month = month.replace(month=month.month + 1)
+        partitions.append((month.strftime("%Y-%m"), month_start, int(next_month.timestamp() * 1000)))
+        month = next_month
+    return partitions
+
+
+class ColumnarCandleStore:
+    """
+    월 파티션 + 컬럼별 .npy 캔들 저장소
+
+    사용 예시:
+        store = ColumnarCandleStore()
+        store.write_partition("binance", "BTCUSDT", "1m", "2024-01", columns, start, end, complete=True)
+        columns = store.read_columns("binance", "BTCUSDT", "1m", start_ts, end_ts)
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        if root:
+            self.root = Path(root)
+        else:
+            # 기본: backend/candle_cache/columnar/
+            self.root = Path(__file__).parent.parent.parent / "candle_cache" / "columnar"
+        self.root.mkdir(parents=True, exist_ok=True)
+        # 파티션 쓰기는 스레드로 넘기므로 체크포인트 read-modify-write 보호
+        self._lock = threading.Lock()
+
+    def series_dir(self, exchange: str, symbol: str, timeframe: str) -> Path:
+        return self.root / exchange.lower() / symbol.upper() / normalize_timeframe(timeframe)
+
+    # ============================================================
+    # 체크포인트
+    # ============================================================
+
+    def load_checkpoint(self, exchange: str, symbol: str, timeframe: str) -> Dict[str, Dict[str, Any]]:
+        """파티션 이름 → {"from", "to", "rows", "complete", "updated_at"}"""
+        path = self.series_dir(exchange, symbol, timeframe) / CHECKPOINT_FILE
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r") as f:
+                return json.load(f).get("partitions", {})
+        except Exception as e:
+            logger.warning(f"Failed to load candle checkpoint {path}: {e}")
+            return {}
+
+    def _save_checkpoint(self, series: Path, partitions: Dict[str, Dict[str, Any]]):
+        tmp = series / f".{CHECKPOINT_FILE}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"partitions": partitions}, f, indent=2, sort_keys=True)
+        os.replace(tmp, series / CHECKPOINT_FILE)
+
+    # ============================================================
+    # 쓰기
+    # ============================================================
+
+    def write_partition(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        name: str,
+        columns: Dict[str, np.ndarray],
+        covered_from: int,
+        covered_to: int,
+        complete: bool,
+    ):
+        """
+        파티션 전체를 원자적으로 교체하고 체크포인트 갱신
+
+        Args:
+            name: 파티션 이름 (YYYY-MM)
+            columns: COLUMNS 이름 → 시간순 배열 (timestamp는 int64 ms)
+            covered_from / covered_to: 실제로 받은 구간 [from, to)
+            complete: 월 전체를 받았는지 (True면 다운로더가 다시 받지 않음)
+        """
+        series = self.series_dir(exchange, symbol, timeframe)
+        series.mkdir(parents=True, exist_ok=True)
+        final = series / name
+        tmp = series / f".{name}.tmp"
+        old = series / f".{name}.old"
+        for stale in (tmp, old):
+            if stale.exists():
+                shutil.rmtree(stale)
+
+        tmp.mkdir()
+        for column in COLUMNS:
+            dtype = np.int64 if column == "timestamp" else np.float64
+            np.save(tmp / f"{column}.npy", np.ascontiguousarray(columns[column], dtype=dtype))
+
+        with self._lock:
+            if final.exists():
+                os.replace(final, old)
+            os.replace(tmp, final)
+            if old.exists():
+                shutil.rmtree(old)
+
+            partitions = self.load_checkpoint(exchange, symbol, timeframe)
+            partitions[name] = {
+                "from": int(covered_from),
+                "to": int(covered_to),
+                "rows": int(len(columns["timestamp"])),
+                "complete": bool(complete),
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+            self._save_checkpoint(series, partitions)
+
+    # ============================================================
+    # 읽기
+    # ============================================================
+
+    def covers(self, exchange: str, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> bool:
+        """[start_ts, end_ts) 전체를 받은 적이 있는지 (체크포인트 기준)"""
+        if end_ts <= start_ts:
+            return False
+        partitions = self.load_checkpoint(exchange, symbol, timeframe)
+        for name, month_start, month_end in month_partitions(start_ts, end_ts):
+            record = partitions.get(name)
+            if record is None:
+                return False
+            if record["from"] > max(start_ts, month_start) or record["to"] < min(end_ts, month_end):
+                return False
+        return True
+
+    def read_columns(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_ts: int,
+        end_ts: int,
+    ) -> Dict[str, np.ndarray]:
+        """[start_ts, end_ts) 캔들 컬럼 (없는 파티션은 건너뜀)"""
+        series = self.series_dir(exchange, symbol, timeframe)
+        chunks: Dict[str, List[np.ndarray]] = {column: [] for column in COLUMNS}
+
+        for name, _, _ in month_partitions(start_ts, end_ts):
+            part = series / name
+            if not (part / "timestamp.npy").exists():
+                continue
+            times = np.load(part / "timestamp.npy", mmap_mode="r")
+            lo = int(np.searchsorted(times, start_ts, side="left"))
+            hi = int(np.searchsorted(times, end_ts, side="left"))
+            if hi <= lo:
+                continue
+            for column in COLUMNS:
+                values = times if column == "timestamp" else np.load(part / f"{column}.npy", mmap_mode="r")
+                chunks[column].append(np.array(values[lo:hi]))
+
+        return {
+            column: (
+                np.concatenate(parts) if parts
+                else np.empty(0, dtype=np.int64 if column == "timestamp" else np.float64)
+            )
+            for column, parts in chunks.items()
+        }
+
+    def read_candles(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_ts: int,
+        end_ts: int,
+    ) -> List[Dict[str, Any]]:
+        """read_columns 결과를 기존 캔들 dict 리스트 형식으로"""
+        columns = self.read_columns(exchange, symbol, timeframe, start_ts, end_ts)
+        t, o, h, l, c, v = (columns[column].tolist() for column in COLUMNS)
+        return [
+            {"timestamp": t[i], "open": o[i], "high": h[i], "low": l[i], "close": c[i], "volume": v[i]}
+            for i in range(len(t))
+        ]
+
+    def get_info(self) -> Dict[str, Any]:
+        """저장된 시리즈별 파티션 / 행 수"""
+        info: Dict[str, Any] = {}
+        for checkpoint in self.root.glob(f"*/*/*/{CHECKPOINT_FILE}"):
+            exchange, symbol, timeframe = checkpoint.parent.relative_to(self.root).parts
+            partitions = self.load_checkpoint(exchange, symbol, timeframe)
+            info[f"{exchange}:{symbol}:{timeframe}"] = {
+                "partitions": len(partitions),
+                "complete": sum(1 for p in partitions.values() if p["complete"]),
+                "rows": sum(p["rows"] for p in partitions.values()),
+            }
+        return info
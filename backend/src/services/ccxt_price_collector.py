@@ -47,6 +47,9 @@ async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio
             'ADA/USDT:USDT',
         ]
 
+        # 공유 캔들 집계기 (구독된 심볼/타임프레임만 캔들 구성)
+        from .candle_aggregator import candle_aggregator
+
         logger.info("🚀 CCXT price collector started")
         logger.info(f"📡 Watching symbols: {symbols}")
 
@@ -77,6 +80,17 @@ async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio
                             "time": int(now),
                         }
 
+                        # Update shared candles before consumers see the tick
+                        try:
+                            candle_aggregator.on_tick(
+                                simple_symbol,
+                                market_data["price"],
+                                ticker.get("baseVolume"),
+                                now,
+                            )
+                        except Exception as e:
+                            logger.debug(f"Candle update failed for {simple_symbol}: {e}")
+
                         # Put to market queue (for bot)
                         try:
                             market_queue.put_nowait(market_data)
@@ -1,16 +1,17 @@
 """
-Chart data service - Integrates WebSocket ticks with candle generation
+Chart data service - Broadcasts live candles from the shared candle aggregator
 
-This service bridges the LBank WebSocket client and the candle generator,
-converting real-time tick data into OHLCV candles for chart visualization.
+Candles are built once by the shared CandleAggregator (fed by the price
+collector); this service only subscribes the chart timeframe and pushes
+updates to connected frontend clients.
 """
 
 import asyncio
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..websockets.ws_server import broadcast_to_all
-from .candle_generator import get_candle_generator
+from .candle_aggregator import CandleSeries, candle_aggregator
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +21,27 @@ class ChartDataService:
     Manages real-time chart data flow
 
     Responsibilities:
-    - Consume tick data from market queue
-    - Generate OHLCV candles
+    - Consume tick notifications from market queue
+    - Subscribe the chart timeframe on the shared candle aggregator
     - Broadcast candle updates to connected frontend clients
     """
 
-    def __init__(self, market_queue: asyncio.Queue, candle_interval: int = 60):
+    def __init__(self, market_queue: asyncio.Queue, timeframe: str = "1m"):
         """
         Args:
-            market_queue: Queue receiving tick data from WebSocket
-            candle_interval: Candle interval in seconds (default: 60 = 1 minute)
+            market_queue: Queue receiving tick data from the price collector
+            timeframe: Chart candle timeframe (default: 1m)
         """
         self.market_queue = market_queue
-        self.candle_generator = get_candle_generator(candle_interval)
+        self.timeframe = timeframe
+        self.aggregator = candle_aggregator
         self.is_running = False
         self._task: Optional[asyncio.Task] = None
 
-        logger.info(f"ChartDataService initialized with {candle_interval}s candles")
+        # Symbol -> start time of the last broadcast current candle
+        self._last_candle_time: Dict[str, int] = {}
+
+        logger.info(f"ChartDataService initialized with {timeframe} candles")
 
     async def start(self):
         """Start processing tick data"""
@@ -76,31 +81,17 @@ class ChartDataService:
                 except asyncio.TimeoutError:
                     continue
 
-                # Extract tick information
                 symbol = tick_data.get("symbol", "BTCUSDT")
-                price = tick_data.get("price")
-                timestamp = tick_data.get("timestamp")
-                volume = tick_data.get("volume", 0.0)
-
-                if price is None:
+                if tick_data.get("price") is None:
                     logger.warning(f"⚠️ Tick data missing price: {tick_data}")
                     continue
 
-                logger.debug(f"📊 Processing tick: {symbol} @ ${price}")
-
-                # Process tick and check if candle completed
-                completed_candle = self.candle_generator.process_tick(
-                    symbol=symbol,
-                    price=float(price),
-                    volume=float(volume),
-                    timestamp=timestamp
-                )
-
-                if completed_candle:
-                    logger.info(f"✅ Candle completed for {symbol}: {completed_candle.to_dict()}")
+                # Candles are already updated by the collector; first tick only subscribes
+                series = self.aggregator.ensure_series(symbol, self.timeframe)
+                if not len(series):
+                    continue
 
-                # Broadcast updates to frontend
-                await self._broadcast_updates(symbol, completed_candle)
+                await self._broadcast_updates(symbol, series)
 
             except asyncio.CancelledError:
                 logger.info("Tick processing cancelled")
@@ -111,17 +102,17 @@ class ChartDataService:
                 # Continue processing despite errors
                 await asyncio.sleep(0.1)
 
-    async def _broadcast_updates(self, symbol: str, completed_candle: Optional[dict]):
+    async def _broadcast_updates(self, symbol: str, series: CandleSeries):
         """
         Broadcast candle updates to connected frontend clients
 
         Args:
             symbol: Trading pair symbol
-            completed_candle: Completed candle if any (from Candle object)
+            series: Shared candle series for the chart timeframe
         """
         try:
-            # Get current candle
-            current_candle = self.candle_generator.get_current_candle(symbol)
+            recent = series.view(2)
+            current_candle = recent[-1]
 
             # Prepare update message
             update = {
@@ -130,9 +121,12 @@ class ChartDataService:
                 "current_candle": current_candle
             }
 
-            # Include completed candle if available
-            if completed_candle:
-                update["completed_candle"] = completed_candle.to_dict()
+            # Include completed candle when a new candle started since the last update
+            previous_time = self._last_candle_time.get(symbol)
+            if previous_time is not None and current_candle["time"] != previous_time and len(recent) > 1:
+                update["completed_candle"] = recent[0]
+                logger.info(f"✅ Candle completed for {symbol}: {recent[0]}")
+            self._last_candle_time[symbol] = current_candle["time"]
 
             # Broadcast to all connected users
             # TODO: Make this user-specific based on their active trading pairs
@@ -168,14 +162,14 @@ class ChartDataService:
         Returns:
             List of candle dictionaries
         """
-        return self.candle_generator.get_all_candles(symbol, limit, include_current)
+        return self.aggregator.get_candles(symbol, self.timeframe, limit, include_current)
 
     def get_status(self) -> dict:
         """Get service status"""
         return {
             "is_running": self.is_running,
             "queue_size": self.market_queue.qsize(),
-            "candle_generator": self.candle_generator.get_status()
+            "candle_aggregator": self.aggregator.get_status()
         }
 
 
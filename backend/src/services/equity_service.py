@@ -1,13 +1,13 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from ..database.models import Equity
+from .write_behind import write_behind
 
 
-async def record_equity(session: AsyncSession, user_id: int, value: float):
-    equity = Equity(user_id=user_id, value=Decimal(str(value)), timestamp=datetime.utcnow())
-    session.add(equity)
-    await session.commit()
-    return equity
+def record_equity(user_id: int, value: float) -> bool:
+    """자산 기록 (write-behind 배치 저장, 버퍼가 가득 차면 False)"""
+    return write_behind.enqueue(
+        Equity,
+        {"user_id": user_id, "value": Decimal(str(value)), "timestamp": datetime.utcnow()},
+    )
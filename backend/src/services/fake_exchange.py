@@ -0,0 +1,147 @@
+"""
+로컬 가짜 거래소 (Fake Exchange Server)
+
+과거 캔들 다운로더를 네트워크/실거래소 없이 돌리기 위한 aiohttp 서버.
+Binance /fapi/v1/klines 와 Bitget /api/v2/mix/market/history-candles 응답 형식을 흉내 낸다.
+
+- 가격은 timestamp로 결정: 어느 페이지를 어떤 순서로 받아도 같은 값 (검증용 expected_candle)
+- rate_limit_every: N번째 요청마다 429 + Retry-After
+- fail_every: N번째 요청마다 500
+- listing_ts: 이 시각 이전 캔들은 없음 (상장 전 구간)
+- latency: 요청마다 지연 (초)
+
+사용 예시:
+    server = FakeExchangeServer(rate_limit_every=10)
+    base_url = await server.start()
+    source = BinanceCandleSource(base_url=base_url)
+    ...
+    await server.stop()
+"""
+
+import asyncio
+import logging
+import math
+from typing import List, Optional
+
+from aiohttp import web
+
+from ..utils.candle_rollup import timeframe_seconds
+from .candle_store import normalize_timeframe
+
+logger = logging.getLogger(__name__)
+
+BINANCE_PAGE_LIMIT = 1500
+BITGET_PAGE_LIMIT = 200
+
+
+def expected_candle(timestamp: int, interval_ms: int) -> List[float]:
+    """가짜 거래소가 돌려주는 캔들 [ts, open, high, low, close, volume]"""
+    base = 100.0 + 10.0 * math.sin(timestamp / 3_600_000)
+    close = base + 0.5 * math.cos(timestamp / 60_000)
+    return [
+        timestamp,
+        round(base, 4),
+        round(max(base, close) + 0.25, 4),
+        round(min(base, close) - 0.25, 4),
+        round(close, 4),
+        round(1.0 + (timestamp // interval_ms) % 97, 4),
+    ]
+
+
+class FakeExchangeServer:
+    """Binance/Bitget 캔들 엔드포인트만 있는 로컬 HTTP 서버"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        fail_every: int = 0,
+        listing_ts: int = 0,
+        retry_after: float = 0.05,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.fail_every = fail_every
+        self.listing_ts = listing_ts
+        self.retry_after = retry_after
+        self.requests = 0
+        self.served_candles = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/fapi/v1/klines", self._binance_klines)
+        app.router.add_get("/api/v2/mix/market/history-candles", self._bitget_candles)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.info(f"🧪 Fake exchange listening on {self.base_url}")
+        return self.base_url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _candles(self, timeframe: str, start_ts: int, end_ts: int, limit: int) -> List[List[float]]:
+        """[start_ts, end_ts] (양끝 포함, 거래소와 동일) 구간 캔들 limit개"""
+        interval = timeframe_seconds(normalize_timeframe(timeframe)) * 1000
+        first = max(start_ts, self.listing_ts)
+        first += (-first) % interval
+        candles = []
+        ts = first
+        while ts <= end_ts and len(candles) < limit:
+            candles.append(expected_candle(ts, interval))
+            ts += interval
+        self.served_candles += len(candles)
+        return candles
+
+    async def _gate(self) -> Optional[web.Response]:
+        """요청 수 집계 + 지연 + 주입된 429/500"""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+            return web.json_response(
+                {"code": -1003, "msg": "Too many requests"}, status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if self.fail_every and self.requests % self.fail_every == 0:
+            return web.json_response({"code": "50000", "msg": "injected failure"}, status=500)
+        return None
+
+    async def _binance_klines(self, request: web.Request) -> web.Response:
+        error = await self._gate()
+        if error:
+            return error
+        q = request.query
+        limit = min(int(q.get("limit", 500)), BINANCE_PAGE_LIMIT)
+        candles = self._candles(q["interval"], int(q["startTime"]), int(q["endTime"]), limit)
+        # [open time, o, h, l, c, v, close time, ...] 숫자는 문자열
+        return web.json_response([
+            [c[0], *(str(x) for x in c[1:6]), c[0] + 59_999, "0", 0, "0", "0", "0"]
+            for c in candles
+        ])
+
+    async def _bitget_candles(self, request: web.Request) -> web.Response:
+        error = await self._gate()
+        if error:
+            return error
+        q = request.query
+        limit = min(int(q.get("limit", 100)), BITGET_PAGE_LIMIT)
+        candles = self._candles(q["granularity"], int(q["startTime"]), int(q["endTime"]), limit)
+        return web.json_response({
+            "code": "00000",
+            "msg": "success",
+            "data": [[str(c[0]), *(str(x) for x in c[1:6]), "0"] for c in candles],
+        })
@@ -19,7 +19,7 @@ import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -59,10 +59,22 @@ class GridBotRunner:
         self.tasks: Dict[int, asyncio.Task] = {}  # bot_instance_id -> Task
         self._stop_flags: Dict[int, bool] = {}  # Graceful shutdown flags
 
+        # 분산 스케줄러 리스 / 펜싱 확인, 워커 간 이관 중인 봇 (BotRunner와 동일)
+        self.lease_guard: Optional[Callable[[int], bool]] = None
+        self.fence_guard: Optional[Callable[[int], Awaitable[bool]]] = None
+        self._handoff: Set[int] = set()
+
     def is_running(self, bot_instance_id: int) -> bool:
         """봇이 실행 중인지 확인"""
         return bot_instance_id in self.tasks and not self.tasks[bot_instance_id].done()
 
+    async def _fenced(self, bot_instance_id: int, action: str) -> bool:
+        """주문 / DB 쓰기 직전 펜싱 확인 (스케줄러 밖에서 실행 중이면 항상 통과)"""
+        if self.fence_guard is None or await self.fence_guard(bot_instance_id):
+            return True
+        logger.warning(f"Grid bot {bot_instance_id}: stale fencing token, dropping {action}")
+        return False
+
     async def start(self, session_factory, bot_instance_id: int, user_id: int):
         """그리드 봇 시작"""
         if self.is_running(bot_instance_id):
@@ -76,11 +88,13 @@ class GridBotRunner:
         self.tasks[bot_instance_id] = task
         logger.info(f"Started grid bot {bot_instance_id} for user {user_id}")
 
-    def stop(self, bot_instance_id: int):
-        """그리드 봇 정지"""
+    def stop(self, bot_instance_id: int, handoff: bool = False):
+        """그리드 봇 정지 (handoff=True면 다른 워커가 이어받으므로 DB 정리 생략)"""
         if self.is_running(bot_instance_id):
             logger.info(f"Stopping grid bot {bot_instance_id}")
             self._stop_flags[bot_instance_id] = True
+            if handoff:
+                self._handoff.add(bot_instance_id)
             self.tasks[bot_instance_id].cancel()
         else:
             logger.warning(f"Grid bot {bot_instance_id} is not running")
@@ -229,6 +243,9 @@ class GridBotRunner:
                 )
 
                 while not self._stop_flags.get(bot_instance_id, False):
+                    if self.lease_guard is not None and not self.lease_guard(bot_instance_id):
+                        logger.warning(f"Grid bot {bot_instance_id} lost its lease, exiting loop")
+                        break
                     try:
                         # market_queue에서 가격 데이터 수신 시도
                         try:
@@ -294,6 +311,9 @@ class GridBotRunner:
                         await asyncio.sleep(queue_timeout)
 
         except asyncio.CancelledError:
+            if bot_instance_id in self._handoff:
+                logger.info(f"Grid bot {bot_instance_id} handed off to another worker")
+                raise
             logger.info(f"Grid bot {bot_instance_id} cancelled")
             # 열린 주문 취소 (옵션)
             try:
@@ -309,6 +329,7 @@ class GridBotRunner:
             )
 
         finally:
+            self._handoff.discard(bot_instance_id)
             if bot_instance_id in self.tasks:
                 del self.tasks[bot_instance_id]
             if bot_instance_id in self._stop_flags:
@@ -345,6 +366,9 @@ class GridBotRunner:
             if grid_price < current_price and order.status == GridOrderStatus.PENDING:
                 qty = self.calculate_order_qty(per_grid, grid_price)
 
+                if not await self._fenced(bot_instance.id, "grid buy order"):
+                    break
+
                 try:
                     # 매수 지정가 주문
                     result = await bitget_client.place_limit_order(
@@ -371,6 +395,9 @@ class GridBotRunner:
                         f"Failed to place buy order at grid {order.grid_index}: {e}"
                     )
 
+        if not await self._fenced(bot_instance.id, "grid order update"):
+            await session.rollback()
+            return
         await session.commit()
         logger.info(
             f"Initial orders: {placed_count} buy orders placed out of {len(grid_orders)} grids"
@@ -489,6 +516,9 @@ class GridBotRunner:
             except Exception as e:
                 logger.error(f"Error processing grid {order.grid_index}: {e}")
 
+        if not await self._fenced(bot_instance.id, "grid order update"):
+            await session.rollback()
+            return
         await session.commit()
 
     async def _place_sell_order(
@@ -501,6 +531,8 @@ class GridBotRunner:
         qty: float,
     ):
         """매도 주문 설정"""
+        if not await self._fenced(bot_instance.id, "grid sell order"):
+            return
         try:
             result = await bitget_client.place_limit_order(
                 symbol=bot_instance.symbol,
@@ -535,6 +567,8 @@ class GridBotRunner:
         grid_price = float(order.grid_price)
         qty = self.calculate_order_qty(per_grid, grid_price)
 
+        if not await self._fenced(bot_instance.id, "grid buy order"):
+            return
         try:
             result = await bitget_client.place_limit_order(
                 symbol=bot_instance.symbol,
@@ -714,6 +748,8 @@ class GridBotRunner:
         profit: float,
     ):
         """그리드 거래 기록"""
+        if not await self._fenced(bot_instance.id, "grid trade record"):
+            return
         trade = Trade(
             user_id=bot_instance.user_id,
             bot_instance_id=bot_instance.id,
@@ -0,0 +1,389 @@
+"""
+벡터화 그리드 시뮬레이터 (float64 / NumPy)
+
+GridBacktester / CacheBacktestService의 Decimal 시뮬레이션과 동일한 규칙을
+캔들 × 그리드 행렬 연산으로 계산합니다.
+
+핵심 관찰:
+- 각 그리드 레벨은 서로 독립적인 상태 머신 (체결가 = 그리드 가격)
+- 캔들마다 "진입 터치(A)"와 "청산 터치(B)" 여부는 정렬된 그리드 가격에
+  대한 searchsorted 두 번으로 결정됨
+- 체결 상태 = 마지막 A 시점 > 마지막 B 시점 (누적 최대값으로 계산)
+- 거래 발생 = B and (A or 직전 체결 상태)
+
+행렬은 캔들 방향으로 청크 분할해 메모리 사용량을 일정하게 유지합니다.
+
+파라미터 스윕은 동일한 캔들 배열로 여러 (lower, upper, grid_count, mode)
+조합을 프로세스 풀에서 병렬 평가합니다.
+"""
+
+import asyncio
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 수수료율 (Bitget taker 기준, Decimal 구현과 동일)
+TAKER_FEE = 0.0006
+
+# 청크당 (캔들 × 그리드) 셀 수 상한
+CHUNK_CELLS = 1 << 20
+
+# 이 개수 미만의 조합은 프로세스 풀 없이 스레드에서 평가
+PARALLEL_MIN_COMBOS = 8
+
+_NO_EVENT = -3
+
+
+def _local_day_numbers(timestamps_ms: np.ndarray) -> np.ndarray:
+    """
+    타임스탬프(ms) -> 로컬 날짜 일련번호 (1970-01-01 = 0)
+
+    datetime.fromtimestamp()와 같은 로컬 시간대 기준.
+    UTC 오프셋은 시간(hour) 단위로 한 번씩만 계산합니다 (DST 대응).
+    """
+    hours = timestamps_ms // 3_600_000
+    unique_hours, inverse = np.unique(hours, return_inverse=True)
+    offsets = np.fromiter(
+        (
+            (
+                datetime.fromtimestamp(int(h) * 3600)
+                - datetime.fromtimestamp(int(h) * 3600, timezone.utc).replace(tzinfo=None)
+            ).total_seconds()
+            for h in unique_hours
+        ),
+        dtype=np.float64,
+        count=len(unique_hours),
+    )
+    local_seconds = timestamps_ms / 1000.0 + offsets[inverse]
+    return np.floor(local_seconds / 86400.0).astype(np.int64)
+
+
+@dataclass
+class CandleArrays:
+    """시뮬레이션용 컬럼형 캔들 데이터 (float64)"""
+
+    timestamps: np.ndarray  # int64, ms
+    highs: np.ndarray
+    lows: np.ndarray
+    closes: np.ndarray
+    _day_starts: Optional[np.ndarray] = field(default=None, repr=False)
+    _day_keys: Optional[List[str]] = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Any]) -> "CandleArrays":
+        """Candle / CachedCandle 리스트에서 변환"""
+        count = len(candles)
+        return cls(
+            timestamps=np.fromiter((c.timestamp for c in candles), dtype=np.int64, count=count),
+            highs=np.fromiter((float(c.high) for c in candles), dtype=np.float64, count=count),
+            lows=np.fromiter((float(c.low) for c in candles), dtype=np.float64, count=count),
+            closes=np.fromiter((float(c.close) for c in candles), dtype=np.float64, count=count),
+        )
+
+    def slice(self, mask: np.ndarray) -> "CandleArrays":
+        return CandleArrays(
+            timestamps=self.timestamps[mask],
+            highs=self.highs[mask],
+            lows=self.lows[mask],
+            closes=self.closes[mask],
+        )
+
+    def datetime_at(self, index: int) -> datetime:
+        return datetime.fromtimestamp(int(self.timestamps[index]) / 1000)
+
+    def day_boundaries(self) -> Tuple[np.ndarray, List[str]]:
+        """(각 날짜 첫 캔들 인덱스, 'YYYY-MM-DD' 키) - 한 번만 계산"""
+        if self._day_starts is None:
+            days = _local_day_numbers(self.timestamps)
+            changed = np.empty(len(days), dtype=bool)
+            if len(days):
+                changed[0] = True
+                np.not_equal(days[1:], days[:-1], out=changed[1:])
+            self._day_starts = np.flatnonzero(changed)
+            self._day_keys = [
+                str(np.datetime64(int(d), "D")) for d in days[self._day_starts]
+            ]
+        return self._day_starts, self._day_keys
+
+
+@dataclass
+class GridSimulation:
+    """벡터화 시뮬레이션 원시 결과 (표현 형식은 호출자가 결정)"""
+
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    total_profit: float
+    max_profit_trade: float
+    max_loss_trade: float
+    max_drawdown: float                 # %
+    day_keys: List[str]
+    day_start_equity: List[float]       # 각 날짜 첫 캔들 처리 전 자산
+    trade_counts: np.ndarray            # 그리드별 완료 사이클 수
+    # (캔들 인덱스, 그리드 인덱스, 수익) - 시간순, 최근 keep_last_trades건
+    last_trades: List[Tuple[int, int, float]] = field(default_factory=list)
+
+
+def grid_price_array(
+    lower_price: float,
+    upper_price: float,
+    grid_count: int,
+    arithmetic: bool,
+) -> np.ndarray:
+    """그리드 가격 배열 (Decimal 구현과 동일하게 소수 8자리 내림)"""
+    index = np.arange(grid_count, dtype=np.float64)
+    if arithmetic:
+        step = (upper_price - lower_price) / (grid_count - 1)
+        prices = lower_price + step * index
+    else:
+        ratio = math.pow(upper_price / lower_price, 1 / (grid_count - 1))
+        prices = lower_price * np.power(ratio, index)
+    return np.floor(prices * 1e8) / 1e8
+
+
+def _grid_cycle_profits(
+    prices: np.ndarray, long: bool, per_grid_amount: float, fee: float
+) -> np.ndarray:
+    """그리드별 1사이클 순수익 (수수료 차감)"""
+    profits = np.zeros(len(prices), dtype=np.float64)
+    quantity = per_grid_amount / prices
+    if long:
+        entry, exit_ = prices[:-1], prices[1:]
+        qty = quantity[:-1]
+        profits[:-1] = (exit_ - entry) * qty - (entry + exit_) * qty * fee
+    else:
+        entry, exit_ = prices[1:], prices[:-1]
+        qty = quantity[1:]
+        profits[1:] = (entry - exit_) * qty - (entry + exit_) * qty * fee
+    return profits
+
+
+def simulate_grid(
+    candles: CandleArrays,
+    grid_prices: Sequence[float],
+    long: bool,
+    per_grid_amount: float,
+    investment: float,
+    fee: float = TAKER_FEE,
+    keep_last_trades: int = 0,
+) -> GridSimulation:
+    """
+    그리드 시뮬레이션 (벡터화)
+
+    Args:
+        candles: 컬럼형 캔들 데이터
+        grid_prices: 오름차순 그리드 가격
+        long: True=LONG, False=SHORT
+        per_grid_amount: 그리드당 투자금액 (레버리지 반영)
+        investment: 초기 자산
+        fee: 편도 수수료율
+        keep_last_trades: 반환할 최근 거래 수
+    """
+    prices = np.asarray(grid_prices, dtype=np.float64)
+    n_grids = len(prices)
+    n_candles = len(candles)
+    cols = np.arange(n_grids)
+    cycle_profit = _grid_cycle_profits(prices, long, per_grid_amount, fee)
+
+    # 초기 체결: LONG은 현재가 아래, SHORT는 현재가 위
+    initial_price = candles.closes[0]
+    initially_filled = prices < initial_price if long else prices > initial_price
+    last_entry = np.where(initially_filled, -1, -2).astype(np.int64)
+    last_exit = np.full(n_grids, -2, dtype=np.int64)
+
+    trade_counts = np.zeros(n_grids, dtype=np.int64)
+    candle_profit = np.zeros(n_candles, dtype=np.float64)
+    recent: List[Tuple[int, int, float]] = []
+
+    chunk_rows = max(1, CHUNK_CELLS // max(n_grids, 1))
+    for start in range(0, n_candles, chunk_rows):
+        end = min(start + chunk_rows, n_candles)
+        highs = candles.highs[start:end]
+        lows = candles.lows[start:end]
+
+        low_idx = np.searchsorted(prices, lows, side="left")[:, None]    # p >= low
+        high_idx = np.searchsorted(prices, highs, side="right")[:, None]  # p <= high
+        if long:
+            # 매수: low <= p[i] / 매도: high >= p[i+1]
+            entry = cols >= low_idx
+            exit_ = cols <= high_idx - 2
+        else:
+            # 매도 진입: high >= p[i] / 매수 청산: low <= p[i-1]
+            entry = cols < high_idx
+            exit_ = cols >= low_idx + 1
+
+        rows = np.arange(start, end, dtype=np.int64)[:, None]
+        entry_at = np.maximum.accumulate(
+            np.vstack([last_entry, np.where(entry, rows, _NO_EVENT)]), axis=0
+        )
+        exit_at = np.maximum.accumulate(
+            np.vstack([last_exit, np.where(exit_, rows, _NO_EVENT)]), axis=0
+        )
+        filled_before = entry_at[:-1] > exit_at[:-1]
+        trades = exit_ & (entry | filled_before)
+
+        last_entry = entry_at[-1]
+        last_exit = exit_at[-1]
+        trade_counts += trades.sum(axis=0)
+        candle_profit[start:end] = trades @ cycle_profit
+
+        if keep_last_trades:
+            trade_rows, trade_cols = np.nonzero(trades)
+            recent.extend(
+                (int(r) + start, int(c), float(cycle_profit[c]))
+                for r, c in zip(trade_rows[-keep_last_trades:], trade_cols[-keep_last_trades:])
+            )
+            recent = recent[-keep_last_trades:]
+
+    # 자산 곡선 / 최대 낙폭 (캔들 처리 후 기준)
+    equity = investment + np.cumsum(candle_profit)
+    peak = np.maximum.accumulate(np.maximum(equity, investment))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(peak > 0, (peak - equity) / peak * 100, 0.0)
+    max_drawdown = max(0.0, float(drawdown.max())) if n_candles else 0.0
+
+    # 일별 자산 (각 날짜 첫 캔들 처리 전)
+    day_starts, day_keys = candles.day_boundaries()
+    equity_before = equity - candle_profit
+    day_start_equity = equity_before[day_starts].tolist()
+
+    traded = trade_counts > 0
+    winning = int(trade_counts[cycle_profit > 0].sum())
+    total_trades = int(trade_counts.sum())
+
+    return GridSimulation(
+        total_trades=total_trades,
+        winning_trades=winning,
+        losing_trades=total_trades - winning,
+        total_profit=float(trade_counts @ cycle_profit),
+        max_profit_trade=float(cycle_profit[traded].max()) if traded.any() else 0.0,
+        max_loss_trade=float(cycle_profit[traded].min()) if traded.any() else 0.0,
+        max_drawdown=max_drawdown,
+        day_keys=day_keys,
+        day_start_equity=day_start_equity,
+        trade_counts=trade_counts,
+        last_trades=recent,
+    )
+
+
+# ============================================================
+# 파라미터 스윕
+# ============================================================
+
+
+def evaluate_grid_params(
+    candles: CandleArrays,
+    long: bool,
+    lower_price: float,
+    upper_price: float,
+    grid_count: int,
+    arithmetic: bool,
+    investment: float,
+    leverage: int,
+) -> Dict[str, Any]:
+    """단일 파라미터 조합 평가 -> 요약 지표"""
+    prices = grid_price_array(lower_price, upper_price, grid_count, arithmetic)
+    per_grid_amount = investment * leverage / grid_count
+    sim = simulate_grid(candles, prices, long, per_grid_amount, investment)
+
+    roi = sim.total_profit / investment * 100 if investment > 0 else 0.0
+    return {
+        "lower_price": lower_price,
+        "upper_price": upper_price,
+        "grid_count": grid_count,
+        "grid_mode": "arithmetic" if arithmetic else "geometric",
+        "roi_30d": round(roi, 2),
+        "max_drawdown": round(sim.max_drawdown, 2),
+        "total_trades": sim.total_trades,
+        "win_rate": round(sim.winning_trades / sim.total_trades * 100, 2) if sim.total_trades else 0,
+        "total_profit": round(sim.total_profit, 2),
+    }
+
+
+def sweep_grid_params(
+    candles: CandleArrays,
+    combos: Sequence[Tuple[float, float, int, bool]],
+    long: bool,
+    investment: float,
+    leverage: int,
+) -> List[Dict[str, Any]]:
+    """조합 목록 평가 (프로세스 풀 작업 단위)"""
+    return [
+        evaluate_grid_params(candles, long, lower, upper, count, arithmetic, investment, leverage)
+        for lower, upper, count, arithmetic in combos
+    ]
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _pool_size() -> int:
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """스윕 전용 프로세스 풀 (지연 생성)"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=_pool_size())
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def run_parameter_sweep(
+    candles: CandleArrays,
+    combos: Sequence[Tuple[float, float, int, bool]],
+    long: bool,
+    investment: float,
+    leverage: int,
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 스윕 실행
+
+    조합을 워커 수만큼 청크로 나눠 프로세스 풀에서 평가합니다
+    (캔들 배열 직렬화는 청크당 1회). 조합 수가 적으면 스레드에서 실행.
+    """
+    loop = asyncio.get_running_loop()
+    candles.day_boundaries()  # 워커마다 재계산하지 않도록 미리 계산
+
+    if len(combos) < PARALLEL_MIN_COMBOS:
+        return await loop.run_in_executor(
+            None, sweep_grid_params, candles, combos, long, investment, leverage
+        )
+
+    workers = _pool_size()
+    chunk_size = math.ceil(len(combos) / workers)
+    chunks = [combos[i:i + chunk_size] for i in range(0, len(combos), chunk_size)]
+
+    try:
+        pool = get_process_pool()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, sweep_grid_params, candles, chunk, long, investment, leverage)
+            for chunk in chunks
+        ])
+    except BrokenProcessPool:
+        logger.warning("Sweep process pool broken, falling back to in-thread evaluation")
+        shutdown_process_pool()
+        return await loop.run_in_executor(
+            None, sweep_grid_params, candles, combos, long, investment, leverage
+        )
+
+    return [row for chunk_result in results for row in chunk_result]
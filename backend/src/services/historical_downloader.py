@@ -0,0 +1,377 @@
+"""
+과거 캔들 다운로더 (Historical Candle Downloader)
+
+수년치 캔들을 거래소에서 받아 컬럼형 저장소(services.candle_store)에 바로 씁니다.
+
+- 월 파티션 단위 체크포인트: 완료된 (거래소, 심볼, 타임프레임, 월)은 재시작 시 건너뜀
+- 페이지 병렬 조회: 동시 요청 수(semaphore) + 토큰 버킷(초당 요청 수)으로 제한
+- 429 응답은 토큰 버킷 전체를 Retry-After만큼 멈추고, 그 외 오류는 지수 백오프 재시도
+- 선형 시간: 페이지마다 (ts - 시작) // 간격 슬롯에 바로 배치 (중복/순서 무관, 집합 재구성 없음)
+- 월이 다 받아지면 파티션을 원자적으로 쓰고 메모리에서 버림 (스트리밍)
+
+사용 예시:
+    source = BinanceCandleSource()
+    downloader = HistoricalCandleDownloader(source, ColumnarCandleStore())
+    result = await downloader.download("BTCUSDT", "1m", start_ts, end_ts)
+    await source.close()
+
+테스트/로컬 실행은 services.fake_exchange.FakeExchangeServer의 base_url을 소스에 넘기면 됩니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+import numpy as np
+
+from ..utils.candle_rollup import timeframe_seconds
+from ..utils.metrics import exchange_request_seconds
+from .binance_rest import BinanceRestClient
+from .bitget_rest import bitget_granularity
+from .candle_store import COLUMNS, ColumnarCandleStore, month_partitions, normalize_timeframe
+
+logger = logging.getLogger(__name__)
+
+
+class CandleSourceError(Exception):
+    """거래소 캔들 조회 실패 (재시도 대상)"""
+
+
+class RateLimitedError(CandleSourceError):
+    """429 응답 (retry_after초 동안 전체 요청 정지)"""
+
+    def __init__(self, retry_after: float = 1.0):
+        super().__init__(f"Rate limited, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    초당 rate개 토큰, 최대 capacity개까지 버스트
+
+    pause(seconds)는 429 응답 시 버킷 전체를 멈춰 다른 요청도 같이 기다리게 한다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰이 생길 때까지 대기 (먼저 온 순서대로)"""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """seconds 동안 토큰 발급 중단 (남은 토큰도 비움)"""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self._tokens = 0.0
+        self._updated = self._clock()
+
+
+# ============================================================
+# 거래소 캔들 소스
+# ============================================================
+
+
+class CandleSource:
+    """
+    거래소 캔들 페이지 조회
+
+    fetch_page는 [start_ts, end_ts) 구간의 캔들을 page_limit개 이하로 돌려준다.
+    각 행은 [timestamp, open, high, low, close, volume, ...] (문자열이어도 됨).
+    """
+
+    exchange = ""
+    page_limit = 1000
+    BASE_URL = ""
+
+    def __init__(self, base_url: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None):
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.session = session
+        self._owns_session = session is None
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Any:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+            self._owns_session = True
+        started = time.perf_counter()
+        try:
+            async with self.session.get(self.base_url + path, params=params) as response:
+                exchange_request_seconds.labels(self.exchange, path, response.status).observe(
+                    time.perf_counter() - started
+                )
+                if response.status == 429:
+                    raise RateLimitedError(float(response.headers.get("Retry-After", "1")))
+                if response.status != 200:
+                    text = await response.text()
+                    raise CandleSourceError(f"{self.exchange} HTTP {response.status}: {text[:200]}")
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+            exchange_request_seconds.labels(self.exchange, path, status).observe(time.perf_counter() - started)
+            raise CandleSourceError(f"{self.exchange} request failed: {e}") from e
+
+    async def fetch_page(self, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> List[List[Any]]:
+        raise NotImplementedError
+
+    async def close(self):
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+
+
+class BinanceCandleSource(CandleSource):
+    """Binance Futures /fapi/v1/klines (startTime 기준 오름차순, 요청당 1500개)"""
+
+    exchange = "binance"
+    page_limit = 1500
+    BASE_URL = BinanceRestClient.BASE_URL
+
+    async def fetch_page(self, symbol, timeframe, start_ts, end_ts):
+        return await self._get(BinanceRestClient.KLINES_ENDPOINT, {
+            "symbol": symbol.upper(),
+            "interval": BinanceRestClient.INTERVAL_MAP.get(timeframe, timeframe.lower()),
+            "startTime": start_ts,
+            "endTime": end_ts - 1,  # Binance endTime은 포함
+            "limit": self.page_limit,
+        })
+
+
+class BitgetCandleSource(CandleSource):
+    """Bitget /api/v2/mix/market/history-candles (과거 구간 조회용, 요청당 200개)"""
+
+    exchange = "bitget"
+    page_limit = 200
+    BASE_URL = "https://api.bitget.com"
+    ENDPOINT = "/api/v2/mix/market/history-candles"
+
+    async def fetch_page(self, symbol, timeframe, start_ts, end_ts):
+        result = await self._get(self.ENDPOINT, {
+            "symbol": symbol.upper(),
+            "productType": "USDT-FUTURES",
+            "granularity": bitget_granularity(timeframe),
+            "startTime": start_ts,
+            "endTime": end_ts - 1,
+            "limit": self.page_limit,
+        })
+        if not isinstance(result, dict) or result.get("code") != "00000":
+            raise CandleSourceError(f"bitget error: {str(result)[:200]}")
+        return result.get("data") or []
+
+
+def create_candle_source(exchange: str, base_url: Optional[str] = None) -> CandleSource:
+    """거래소 이름으로 소스 생성 (binance / bitget)"""
+    sources = {"binance": BinanceCandleSource, "bitget": BitgetCandleSource}
+    try:
+        return sources[exchange.lower()](base_url=base_url)
+    except KeyError:
+        raise ValueError(f"Unsupported exchange: {exchange}") from None
+
+
+# ============================================================
+# 다운로더
+# ============================================================
+
+
+@dataclass
+class DownloadResult:
+    """다운로드 결과 요약"""
+
+    exchange: str
+    symbol: str
+    timeframe: str
+    partitions_written: int = 0
+    partitions_skipped: int = 0
+    failed_partitions: List[str] = field(default_factory=list)
+    candles: int = 0
+    pages: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_partitions
+
+
+class HistoricalCandleDownloader:
+    """
+    (거래소, 심볼, 타임프레임) 과거 캔들 → 컬럼형 저장소
+
+    Args:
+        source: 캔들 소스 (BinanceCandleSource / BitgetCandleSource)
+        store: 저장소 (기본: ColumnarCandleStore())
+        concurrency: 동시 페이지 요청 수
+        requests_per_second: 토큰 버킷 속도 (거래소 rate limit보다 낮게)
+        burst: 토큰 버킷 용량 (기본: requests_per_second)
+        max_retries: 페이지당 재시도 횟수 (429 제외)
+        retry_backoff: 첫 재시도 대기 (초, 이후 2배씩)
+        months_in_flight: 동시에 메모리에 올리는 월 파티션 수
+    """
+
+    def __init__(
+        self,
+        source: CandleSource,
+        store: Optional[ColumnarCandleStore] = None,
+        concurrency: int = 8,
+        requests_per_second: float = 10.0,
+        burst: Optional[float] = None,
+        max_retries: int = 5,
+        retry_backoff: float = 0.5,
+        months_in_flight: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.source = source
+        self.store = store or ColumnarCandleStore()
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._page_slots = asyncio.Semaphore(concurrency)
+        self._month_slots = asyncio.Semaphore(months_in_flight)
+        self._clock = clock
+
+    async def download(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: int,
+        end_ts: Optional[int] = None,
+        progress: Optional[Callable[[str, DownloadResult], None]] = None,
+    ) -> DownloadResult:
+        """
+        [start_ts, end_ts) 다운로드 (end_ts 없으면 마지막으로 닫힌 캔들까지)
+
+        실패한 월은 result.failed_partitions에 남고 다음 실행에서 다시 받는다.
+        """
+        symbol = symbol.upper()
+        timeframe = normalize_timeframe(timeframe)
+        interval = timeframe_seconds(timeframe) * 1000
+        now = int(self._clock() * 1000)
+        end_ts = min(end_ts or now, now - now % interval)
+        start_ts -= start_ts % interval
+
+        result = DownloadResult(self.source.exchange, symbol, timeframe)
+        started = time.perf_counter()
+        checkpoint = self.store.load_checkpoint(self.source.exchange, symbol, timeframe)
+
+        async def run(partition):
+            name = partition[0]
+            try:
+                async with self._month_slots:
+                    await self._download_partition(
+                        symbol, timeframe, interval, partition, start_ts, end_ts,
+                        checkpoint.get(name), result,
+                    )
+            except Exception as e:
+                logger.error(f"   ❌ {self.source.exchange} {symbol} {timeframe} {name} failed: {e}")
+                result.failed_partitions.append(name)
+            if progress:
+                progress(name, result)
+
+        logger.info(f"📥 Downloading {self.source.exchange} {symbol} {timeframe} into columnar store")
+        await asyncio.gather(*(run(p) for p in month_partitions(start_ts, end_ts)))
+
+        result.failed_partitions.sort()
+        result.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"✅ {symbol} {timeframe}: {result.candles:,} candles, {result.pages} pages, "
+            f"{result.partitions_written} written / {result.partitions_skipped} skipped / "
+            f"{len(result.failed_partitions)} failed ({result.elapsed_seconds:.1f}s)"
+        )
+        return result
+
+    async def _download_partition(
+        self,
+        symbol: str,
+        timeframe: str,
+        interval: int,
+        partition,
+        start_ts: int,
+        end_ts: int,
+        record: Optional[Dict[str, Any]],
+        result: DownloadResult,
+    ):
+        name, month_start, month_end = partition
+        lo, hi = max(start_ts, month_start), min(end_ts, month_end)
+
+        if record:
+            if record["complete"] or (record["from"] <= lo and record["to"] >= hi):
+                result.partitions_skipped += 1
+                return
+            # 파티션은 통째로 교체되고 체크포인트는 구간 하나만 기록하므로,
+            # 이전에 받은 부분 구간과 떨어져 있어도 둘을 포함하는 구간(사이 공백 포함)을 다시 받음
+            lo, hi = min(lo, record["from"]), max(hi, record["to"])
+
+        slots = (hi - lo + interval - 1) // interval
+        values = np.full((len(COLUMNS) - 1, slots), np.nan)
+        present = np.zeros(slots, dtype=bool)
+        page_span = self.source.page_limit * interval
+
+        async def fetch(page_start: int):
+            rows = await self._fetch_page(symbol, timeframe, page_start, min(page_start + page_span, hi), result)
+            if not rows:
+                return
+            data = np.asarray([row[:6] for row in rows], dtype=np.float64)
+            times = data[:, 0].astype(np.int64)
+            ok = (times >= lo) & (times < hi) & ((times - lo) % interval == 0)
+            idx = (times[ok] - lo) // interval
+            values[:, idx] = data[ok, 1:6].T
+            present[idx] = True
+
+        await asyncio.gather(*(fetch(page_start) for page_start in range(lo, hi, page_span)))
+
+        columns = {"timestamp": (lo + np.flatnonzero(present) * interval).astype(np.int64)}
+        for i, column in enumerate(COLUMNS[1:]):
+            columns[column] = values[i][present]
+
+        complete = lo <= month_start and hi >= month_end
+        await asyncio.to_thread(
+            self.store.write_partition,
+            self.source.exchange, symbol, timeframe, name, columns, lo, hi, complete,
+        )
+        result.partitions_written += 1
+        result.candles += int(present.sum())
+        logger.info(f"   💾 {symbol} {timeframe} {name}: {int(present.sum()):,} candles{'' if complete else ' (partial)'}")
+
+    async def _fetch_page(self, symbol: str, timeframe: str, start_ts: int, end_ts: int, result: DownloadResult):
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            try:
+                async with self._page_slots:
+                    rows = await self.source.fetch_page(symbol, timeframe, start_ts, end_ts)
+                result.pages += 1
+                return rows
+            except RateLimitedError as e:
+                result.retries += 1
+                self.bucket.pause(e.retry_after)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                result.retries += 1
+                delay = self.retry_backoff * (2 ** attempt)
+                attempt += 1
+                logger.warning(f"   Page {symbol} {timeframe} @{start_ts} failed ({e}), retry in {delay:.1f}s")
+                await asyncio.sleep(delay)
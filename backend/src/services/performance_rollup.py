@@ -0,0 +1,626 @@
+"""
+Daily Performance Rollup Service
+
+사용자별 일간 성과 롤업(DailyPerformanceRollup) 유지 및 조회.
+
+Maintenance:
+- Session 이벤트 훅이 커밋된 Trade(청산)/Equity 변경의 (user_id, 일자)를 기록
+- 백그라운드 워커(및 분석 API 호출 시 해당 사용자)가 변경된 일자만 원본에서 재집계
+- backfill_rollups()로 전체 히스토리 재구성 (마이그레이션 006 이후 1회 실행)
+- 분산 모드: 봇 워커 프로세스는 변경 일자를 Redis 집합(rollup:dirty)에 올리고
+  (rollup_publisher_loop), API 프로세스의 롤업 워커가 가져가 재집계
+
+Reads:
+- 분석 API는 롤업 + 기간 경계일의 원본 거래만 조회하므로
+  응답 시간이 계정 히스토리 길이와 무관
+"""
+
+import asyncio
+import logging
+import math
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.orm import Session
+
+from ..config import SchedulerConfig
+from ..database.db import AsyncSessionLocal
+from ..database.models import DailyPerformanceRollup, Equity, Trade
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FLUSH_INTERVAL_SECONDS = 10
+
+# 프로세스 간 변경 일자 전달 (멤버: "{user_id}:{YYYY-MM-DD}")
+SHARED_DIRTY_KEY = "rollup:dirty"
+SHARED_DRAIN_BATCH = 1000
+
+# 커밋 완료되어 재집계가 필요한 일자 (user_id -> {day})
+_dirty_days: Dict[int, Set[date]] = defaultdict(set)
+_refresh_lock = asyncio.Lock()
+
+
+# ============================================================
+# 변경 추적 (Session 이벤트 훅)
+# ============================================================
+
+
+def mark_dirty(user_id: int, day: date):
+    """재집계가 필요한 (사용자, 일자) 등록"""
+    _dirty_days[user_id].add(day)
+
+
+def _day_of(value: Optional[datetime]) -> date:
+    return (value or datetime.utcnow()).date()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_days(session, flush_context):
+    pending = session.info.setdefault("rollup_pending", set())
+
+    for obj in session.new:
+        if isinstance(obj, Trade) and obj.exit_price is not None and obj.user_id:
+            pending.add((obj.user_id, _day_of(obj.created_at)))
+        elif isinstance(obj, Equity) and obj.user_id:
+            pending.add((obj.user_id, _day_of(obj.timestamp)))
+
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (Trade, Equity)) and obj.user_id:
+            stamp = obj.created_at if isinstance(obj, Trade) else obj.timestamp
+            pending.add((obj.user_id, _day_of(stamp)))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_days(session):
+    for user_id, day in session.info.pop("rollup_pending", ()):
+        mark_dirty(user_id, day)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changed_days(session, previous_transaction):
+    session.info.pop("rollup_pending", None)
+
+
+# ============================================================
+# 재집계
+# ============================================================
+
+
+def _day_bounds(day: date) -> Tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+async def recompute_day(session, user_id: int, day: date) -> Optional[DailyPerformanceRollup]:
+    """
+    하루치 원본 거래/자산 기록으로 롤업 재계산
+
+    Returns:
+        갱신된 롤업 (해당 일자에 데이터가 없으면 삭제 후 None)
+    """
+    start, end = _day_bounds(day)
+
+    trade_rows = (
+        await session.execute(
+            select(Trade.id, Trade.pnl).where(
+                Trade.user_id == user_id,
+                Trade.exit_price.isnot(None),
+                Trade.pnl.isnot(None),
+                Trade.created_at >= start,
+                Trade.created_at < end,
+            )
+        )
+    ).all()
+
+    equity_values = (
+        await session.execute(
+            select(Equity.value)
+            .where(
+                Equity.user_id == user_id,
+                Equity.timestamp >= start,
+                Equity.timestamp < end,
+            )
+            .order_by(Equity.timestamp.asc(), Equity.id.asc())
+        )
+    ).scalars().all()
+
+    existing = (
+        await session.execute(
+            select(DailyPerformanceRollup).where(
+                DailyPerformanceRollup.user_id == user_id,
+                DailyPerformanceRollup.day == day,
+            )
+        )
+    ).scalars().first()
+
+    if not trade_rows and not equity_values:
+        if existing is not None:
+            await session.delete(existing)
+        return None
+
+    rollup = existing or DailyPerformanceRollup(user_id=user_id, day=day)
+
+    # 거래 집계
+    rollup.trade_count = len(trade_rows)
+    rollup.winning_trades = sum(1 for _, pnl in trade_rows if pnl > 0)
+    rollup.losing_trades = sum(1 for _, pnl in trade_rows if pnl < 0)
+    rollup.gross_profit = sum((pnl for _, pnl in trade_rows if pnl > 0), 0)
+    rollup.gross_loss = sum((pnl for _, pnl in trade_rows if pnl < 0), 0)
+    if trade_rows:
+        best_id, best_pnl = max(trade_rows, key=lambda row: row[1])
+        worst_id, worst_pnl = min(trade_rows, key=lambda row: row[1])
+        rollup.best_trade_id, rollup.best_pnl = best_id, best_pnl
+        rollup.worst_trade_id, rollup.worst_pnl = worst_id, worst_pnl
+    else:
+        rollup.best_trade_id = rollup.best_pnl = None
+        rollup.worst_trade_id = rollup.worst_pnl = None
+
+    # 자산 곡선 집계 (전일 마지막 기록과의 수익률 포함)
+    return_count, return_sum, return_sq_sum = 0, 0.0, 0.0
+    intraday_dd = 0.0
+    if equity_values:
+        prev_value = (
+            await session.execute(
+                select(Equity.value)
+                .where(Equity.user_id == user_id, Equity.timestamp < start)
+                .order_by(Equity.timestamp.desc(), Equity.id.desc())
+                .limit(1)
+            )
+        ).scalar()
+        last = float(prev_value) if prev_value is not None else None
+        values = [float(v) for v in equity_values]
+        high = values[0]
+
+        for value in values:
+            if last is not None and last > 0:
+                ret = (value - last) / last * 100
+                return_count += 1
+                return_sum += ret
+                return_sq_sum += ret * ret
+            last = value
+
+            if value > high:
+                high = value
+            if high > 0:
+                intraday_dd = min(intraday_dd, (value - high) / high * 100)
+
+        rollup.open_equity = equity_values[0]
+        rollup.high_equity = max(equity_values)
+        rollup.low_equity = min(equity_values)
+        rollup.closing_equity = equity_values[-1]
+    else:
+        rollup.open_equity = rollup.high_equity = None
+        rollup.low_equity = rollup.closing_equity = None
+
+    rollup.return_count = return_count
+    rollup.return_sum = return_sum
+    rollup.return_sq_sum = return_sq_sum
+    rollup.intraday_max_drawdown = intraday_dd
+    rollup.updated_at = datetime.utcnow()
+
+    if existing is None:
+        session.add(rollup)
+
+    return rollup
+
+
+async def refresh_dirty_rollups(session, user_id: Optional[int] = None) -> int:
+    """
+    변경된 일자의 롤업 재집계
+
+    Args:
+        session: DB 세션
+        user_id: 특정 사용자만 처리 (None이면 전체)
+
+    Returns:
+        재집계한 일자 수
+    """
+    async with _refresh_lock:
+        user_ids = [user_id] if user_id is not None else list(_dirty_days)
+        targets = [(uid, sorted(_dirty_days.pop(uid, ()))) for uid in user_ids]
+        targets = [(uid, days) for uid, days in targets if days]
+        if not targets:
+            return 0
+
+        refreshed = 0
+        try:
+            for uid, days in targets:
+                for day in days:
+                    await recompute_day(session, uid, day)
+                    refreshed += 1
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            # 다음 플러시에서 재시도
+            for uid, days in targets:
+                _dirty_days[uid].update(days)
+            raise
+
+        return refreshed
+
+
+async def backfill_rollups(
+    session,
+    user_ids: Optional[Iterable[int]] = None,
+    since: Optional[date] = None,
+) -> int:
+    """
+    원본 거래/자산 기록으로부터 롤업 재구성
+
+    Args:
+        session: DB 세션
+        user_ids: 대상 사용자 (None이면 거래/자산 기록이 있는 전체 사용자)
+        since: 이 일자 이후만 재구성 (None이면 전체 히스토리)
+
+    Returns:
+        재집계한 일자 수
+    """
+    day_sets: Dict[int, Set[date]] = defaultdict(set)
+    sources = (
+        (Trade.user_id, Trade.created_at, Trade.exit_price.isnot(None)),
+        (Equity.user_id, Equity.timestamp, None),
+    )
+    for user_col, time_col, extra in sources:
+        stmt = select(user_col, func.date(time_col)).distinct()
+        if extra is not None:
+            stmt = stmt.where(extra)
+        if user_ids is not None:
+            stmt = stmt.where(user_col.in_(list(user_ids)))
+        if since is not None:
+            stmt = stmt.where(time_col >= datetime.combine(since, time.min))
+        for uid, day in (await session.execute(stmt)).all():
+            if uid is not None and day is not None:
+                day_sets[uid].add(_as_date(day))
+
+    # 원본이 사라진 일자의 롤업도 정리
+    stmt = select(DailyPerformanceRollup.user_id, DailyPerformanceRollup.day)
+    if user_ids is not None:
+        stmt = stmt.where(DailyPerformanceRollup.user_id.in_(list(user_ids)))
+    if since is not None:
+        stmt = stmt.where(DailyPerformanceRollup.day >= since)
+    for uid, day in (await session.execute(stmt)).all():
+        day_sets[uid].add(day)
+
+    refreshed = 0
+    async with _refresh_lock:
+        for uid, days in day_sets.items():
+            for day in sorted(days):
+                await recompute_day(session, uid, day)
+                refreshed += 1
+            await session.commit()
+
+    logger.info(f"Performance rollup backfill complete: {refreshed} user-days")
+    return refreshed
+
+
+def _as_date(value) -> date:
+    # SQLite returns date() as a 'YYYY-MM-DD' string
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+async def delete_user_rollups(session, user_id: int):
+    """사용자 롤업 전체 삭제"""
+    await session.execute(
+        delete(DailyPerformanceRollup).where(DailyPerformanceRollup.user_id == user_id)
+    )
+    _dirty_days.pop(user_id, None)
+
+
+# ============================================================
+# 프로세스 간 전달 (분산 모드)
+# ============================================================
+
+
+async def publish_dirty_days(redis_client) -> int:
+    """
+    로컬 변경 일자를 공유 집합으로 이동 (봇 워커 프로세스)
+
+    Returns:
+        올린 (사용자, 일자) 수 (실패 시 로컬에 되돌리고 예외 전파)
+    """
+    targets = [(uid, _dirty_days.pop(uid)) for uid in list(_dirty_days)]
+    members = [f"{uid}:{day.isoformat()}" for uid, days in targets for day in days]
+    if not members:
+        return 0
+    try:
+        await redis_client.sadd(SHARED_DIRTY_KEY, *members)
+    except Exception:
+        for uid, days in targets:
+            _dirty_days[uid].update(days)
+        raise
+    return len(members)
+
+
+async def drain_shared_dirty_days(redis_client) -> int:
+    """
+    공유 집합의 변경 일자를 로컬 재집계 대상으로 가져옴 (롤업 워커 프로세스)
+
+    Returns:
+        가져온 (사용자, 일자) 수
+    """
+    members = await redis_client.spop(SHARED_DIRTY_KEY, SHARED_DRAIN_BATCH) or []
+    for member in members:
+        uid, _, day = member.partition(":")
+        mark_dirty(int(uid), date.fromisoformat(day))
+    return len(members)
+
+
+async def rollup_publisher_loop(redis_client):
+    """봇 워커 프로세스용: 주기적으로 변경 일자를 공유 집합에 올림"""
+    while True:
+        try:
+            await asyncio.sleep(ROLLUP_FLUSH_INTERVAL_SECONDS)
+            await publish_dirty_days(redis_client)
+        except asyncio.CancelledError:
+            # 종료 직전 남은 변경도 전달
+            try:
+                await publish_dirty_days(redis_client)
+            except Exception as e:
+                logger.warning(f"Final rollup publish failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error publishing rollup dirty days: {e}", exc_info=True)
+
+
+async def rollup_worker_loop():
+    """
+    롤업 백그라운드 워커
+
+    시작 시 최근 2일을 재구성(재시작 중 유실된 변경 반영)하고,
+    이후 주기적으로 변경된 일자만 재집계합니다.
+    분산 모드에서는 봇 워커들이 공유 집합에 올린 변경 일자도 함께 처리합니다.
+    """
+    logger.info("🚀 Performance rollup worker started")
+
+    redis_client = None
+    if SchedulerConfig.DISTRIBUTED:
+        from ..utils.redis_client import get_redis_client
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            logger.warning("Redis unavailable: bot worker rollup changes are only picked up by backfill")
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await backfill_rollups(session, since=datetime.utcnow().date() - timedelta(days=1))
+    except Exception as e:
+        logger.error(f"❌ Initial rollup backfill failed: {e}", exc_info=True)
+
+    while True:
+        try:
+            await asyncio.sleep(ROLLUP_FLUSH_INTERVAL_SECONDS)
+            if redis_client is not None:
+                await drain_shared_dirty_days(redis_client)
+            if not _dirty_days:
+                continue
+            async with AsyncSessionLocal() as session:
+                refreshed = await refresh_dirty_rollups(session)
+            logger.debug(f"Refreshed {refreshed} performance rollup days")
+        except asyncio.CancelledError:
+            logger.info("🛑 Performance rollup worker stopped")
+            break
+        except Exception as e:
+            logger.error(f"❌ Error in rollup worker loop: {e}", exc_info=True)
+
+
+# ============================================================
+# 조회
+# ============================================================
+
+
+async def load_rollups(
+    session, user_id: int, since_day: Optional[date] = None
+) -> List[DailyPerformanceRollup]:
+    """사용자 롤업 조회 (일자 오름차순)"""
+    stmt = select(DailyPerformanceRollup).where(DailyPerformanceRollup.user_id == user_id)
+    if since_day is not None:
+        stmt = stmt.where(DailyPerformanceRollup.day >= since_day)
+    result = await session.execute(stmt.order_by(DailyPerformanceRollup.day.asc()))
+    return list(result.scalars().all())
+
+
+async def load_trade_tail(session, user_id: int, cutoff: datetime) -> List[Tuple[int, Any]]:
+    """기간 경계일(cutoff ~ 다음 자정)의 청산 거래 (id, pnl)"""
+    _, end = _day_bounds(cutoff.date())
+    result = await session.execute(
+        select(Trade.id, Trade.pnl).where(
+            Trade.user_id == user_id,
+            Trade.exit_price.isnot(None),
+            Trade.pnl.isnot(None),
+            Trade.created_at >= cutoff,
+            Trade.created_at < end,
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+
+def summarize_trades(
+    rollups: Sequence[DailyPerformanceRollup],
+    tail: Sequence[Tuple[int, Any]] = (),
+    cutoff: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    롤업 + 경계일 원본으로 거래 성과 집계
+
+    Args:
+        rollups: 일자 오름차순 롤업
+        tail: 경계일 원본 거래 (load_trade_tail)
+        cutoff: 기간 시작 시각 (None이면 전체, 이때 tail은 무시)
+
+    Returns:
+        total_trades, winning_trades, losing_trades, total_pnl, gross_profit,
+        gross_loss, best (trade_id, pnl), worst (trade_id, pnl)
+    """
+    boundary = cutoff.date() if cutoff is not None else None
+    summary = {
+        "total_trades": 0,
+        "winning_trades": 0,
+        "losing_trades": 0,
+        "gross_profit": 0.0,
+        "gross_loss": 0.0,
+        "best": None,
+        "worst": None,
+    }
+    candidates: List[Tuple[int, float]] = []
+
+    for rollup in rollups:
+        if boundary is not None and rollup.day <= boundary:
+            continue
+        summary["total_trades"] += rollup.trade_count
+        summary["winning_trades"] += rollup.winning_trades
+        summary["losing_trades"] += rollup.losing_trades
+        summary["gross_profit"] += float(rollup.gross_profit or 0)
+        summary["gross_loss"] += float(rollup.gross_loss or 0)
+        if rollup.best_trade_id is not None:
+            candidates.append((rollup.best_trade_id, float(rollup.best_pnl)))
+            candidates.append((rollup.worst_trade_id, float(rollup.worst_pnl)))
+
+    if boundary is not None:
+        for trade_id, pnl in tail:
+            pnl = float(pnl)
+            summary["total_trades"] += 1
+            if pnl > 0:
+                summary["winning_trades"] += 1
+                summary["gross_profit"] += pnl
+            elif pnl < 0:
+                summary["losing_trades"] += 1
+                summary["gross_loss"] += pnl
+            candidates.append((trade_id, pnl))
+
+    summary["total_pnl"] = summary["gross_profit"] + summary["gross_loss"]
+    if candidates:
+        summary["best"] = max(candidates, key=lambda c: c[1])
+        summary["worst"] = min(candidates, key=lambda c: c[1])
+
+    return summary
+
+
+async def resolve_trade_details(session, summaries: Iterable[Dict[str, Any]]):
+    """
+    summarize_trades() 결과의 best/worst를 API 응답 형식으로 변환
+
+    best_trade/worst_trade 키에 {symbol, pnl, pnl_percent}를 채웁니다 (한 번의 조회).
+    """
+    summaries = list(summaries)
+    trade_ids = {
+        s[key][0] for s in summaries for key in ("best", "worst") if s.get(key)
+    }
+    details = {}
+    if trade_ids:
+        result = await session.execute(
+            select(Trade.id, Trade.symbol, Trade.pnl, Trade.pnl_percent).where(
+                Trade.id.in_(trade_ids)
+            )
+        )
+        details = {row[0]: row for row in result.all()}
+
+    for summary in summaries:
+        for key in ("best", "worst"):
+            row = details.get(summary[key][0]) if summary.get(key) else None
+            summary[f"{key}_trade"] = (
+                {
+                    "symbol": row[1],
+                    "pnl": float(row[2]) if row[2] else 0.0,
+                    "pnl_percent": float(row[3]) if row[3] else 0.0,
+                }
+                if row is not None
+                else None
+            )
+
+
+def summarize_equity_risk(rollups: Sequence[DailyPerformanceRollup]) -> Dict[str, float]:
+    """
+    롤업으로 최대 낙폭 / 변동성 / 샤프 비율 계산
+
+    원본 자산 기록 전체를 순회한 결과와 동일:
+    - 일자별 저점을 직전까지의 고점과 비교 + 일중 낙폭
+    - 수익률 합/제곱합으로 모분산 계산
+    """
+    peak: Optional[float] = None
+    max_drawdown = 0.0
+    count, total, total_sq = 0, 0.0, 0.0
+
+    for rollup in rollups:
+        count += rollup.return_count
+        total += rollup.return_sum
+        total_sq += rollup.return_sq_sum
+
+        if rollup.open_equity is None:
+            continue
+        if peak is None:
+            peak = float(rollup.open_equity)
+        if peak > 0:
+            max_drawdown = min(max_drawdown, (float(rollup.low_equity) - peak) / peak * 100)
+        max_drawdown = min(max_drawdown, rollup.intraday_max_drawdown)
+        peak = max(peak, float(rollup.high_equity))
+
+    daily_volatility = 0.0
+    sharpe_ratio = 0.0
+    if count > 1:
+        mean = total / count
+        daily_volatility = math.sqrt(max(total_sq / count - mean * mean, 0.0))
+        sharpe_ratio = mean / daily_volatility if daily_volatility > 0 else 0.0
+
+    return {
+        "max_drawdown": max_drawdown,
+        "daily_volatility": daily_volatility,
+        "sharpe_ratio": sharpe_ratio,
+    }
+
+
+async def load_window_return(session, user_id: int, cutoff: Optional[datetime] = None) -> float:
+    """
+    기간 내 첫/마지막 자산 기록으로 총 수익률(%) 계산
+
+    기록이 2개 미만이면 0.0
+    """
+    conditions = [Equity.user_id == user_id]
+    if cutoff is not None:
+        conditions.append(Equity.timestamp >= cutoff)
+
+    first = (
+        await session.execute(
+            select(Equity.id, Equity.value)
+            .where(*conditions)
+            .order_by(Equity.timestamp.asc(), Equity.id.asc())
+            .limit(1)
+        )
+    ).first()
+    last = (
+        await session.execute(
+            select(Equity.id, Equity.value)
+            .where(*conditions)
+            .order_by(Equity.timestamp.desc(), Equity.id.desc())
+            .limit(1)
+        )
+    ).first()
+
+    if first is None or last is None or first[0] == last[0]:
+        return 0.0
+
+    initial, final = float(first[1] or 0), float(last[1] or 0)
+    if initial <= 0:
+        return 0.0
+    return (final - initial) / initial * 100
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daily performance rollup maintenance")
+    parser.add_argument("--backfill", action="store_true", help="Rebuild rollups from raw rows")
+    parser.add_argument("--user-id", type=int, action="append", help="Limit to user id(s)")
+    parser.add_argument("--since", type=date.fromisoformat, help="Only rebuild from this day")
+    args = parser.parse_args()
+
+    async def _main():
+        async with AsyncSessionLocal() as session:
+            await backfill_rollups(session, user_ids=args.user_id, since=args.since)
+
+    if args.backfill:
+        logging.basicConfig(level=logging.INFO)
+        asyncio.run(_main())
+    else:
+        parser.print_help()
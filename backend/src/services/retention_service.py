@@ -0,0 +1,228 @@
+"""
+Time-series Retention Service
+
+고용량 시계열 테이블(bot_logs, trading_signals, equities) 유지보수 작업.
+
+- 월 파티션 선생성 (PostgreSQL, 다음 DEFAULT_MONTHS_AHEAD개월)
+- 보존 기간 경과 데이터 정리
+  - 파티션 테이블: 월 파티션 DROP (+ DEFAULT 파티션 잔여 행 DELETE)
+  - 일반 테이블(SQLite 등): 시간 범위 DELETE (배치)
+- 자산 기록 다운샘플링: EQUITY_RAW_RETENTION_DAYS 이전 자산 기록은
+  (사용자, 시간) 단위로 마지막 값 하나만 남김
+
+일간 성과 롤업(performance_rollup)은 원본 해상도로 이미 계산된 상태이므로
+다운샘플링 후에도 그대로 유지됩니다 (해당 일자를 다시 backfill 하면 시간 단위 값으로 계산).
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import delete, func, select
+
+from ..database.db import AsyncSessionLocal, engine
+from ..database.models import BotLog, Equity, TradingSignal
+from ..database.partitioning import (
+    PARTITIONED_TABLES,
+    drop_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+# 보존 정책 (일)
+BOT_LOG_RETENTION_DAYS = int(os.getenv("BOT_LOG_RETENTION_DAYS", "90"))
+SIGNAL_RETENTION_DAYS = int(os.getenv("SIGNAL_RETENTION_DAYS", "180"))
+EQUITY_RAW_RETENTION_DAYS = int(os.getenv("EQUITY_RAW_RETENTION_DAYS", "30"))
+
+# 매 실행마다 다운샘플링하는 구간 (재시작 등으로 건너뛴 일자 보정)
+EQUITY_COMPACTION_LOOKBACK_DAYS = 3
+DELETE_BATCH_SIZE = 5000
+MAINTENANCE_INTERVAL_SECONDS = 6 * 3600
+
+# (모델, 시간 컬럼, 보존 일수)
+RETENTION_POLICIES = (
+    (BotLog, BotLog.created_at, BOT_LOG_RETENTION_DAYS),
+    (TradingSignal, TradingSignal.timestamp, SIGNAL_RETENTION_DAYS),
+)
+
+
+# ============================================================
+# 파티션
+# ============================================================
+
+
+async def ensure_future_partitions(now: Optional[datetime] = None) -> Dict[str, list]:
+    """파티션 테이블의 현재~미래 월 파티션 보장 (파티션 테이블이 아니면 건너뜀)"""
+    now = now or datetime.utcnow()
+    created: Dict[str, list] = {}
+
+    def _ensure(sync_conn):
+        for spec in PARTITIONED_TABLES.values():
+            if is_partitioned(sync_conn, spec.table):
+                created[spec.table] = ensure_partitions(sync_conn, spec, now, now=now)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_ensure)
+    return created
+
+
+# ============================================================
+# 보존 정책
+# ============================================================
+
+
+async def _delete_before(session, model, time_col, cutoff: datetime) -> int:
+    """cutoff 이전 행을 배치 단위로 삭제 (긴 트랜잭션/락 방지)"""
+    total = 0
+    while True:
+        ids = select(model.id).where(time_col < cutoff).limit(DELETE_BATCH_SIZE)
+        result = await session.execute(
+            delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        total += result.rowcount or 0
+        if (result.rowcount or 0) < DELETE_BATCH_SIZE:
+            return total
+
+
+async def apply_retention(session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    보존 기간이 지난 로그/시그널 정리
+
+    Returns:
+        테이블별 DELETE 행 수 (DROP한 파티션은 로그로만 기록)
+    """
+    now = now or datetime.utcnow()
+    removed: Dict[str, int] = {}
+
+    for model, time_col, days in RETENTION_POLICIES:
+        table = model.__tablename__
+        cutoff = now - timedelta(days=days)
+        spec = PARTITIONED_TABLES[table]
+
+        connection = await session.connection()
+        partitioned = await connection.run_sync(lambda conn: is_partitioned(conn, spec.table))
+        if partitioned:
+            dropped = await connection.run_sync(
+                lambda conn: drop_partitions_before(conn, spec, cutoff)
+            )
+            await session.commit()
+            if dropped:
+                logger.info(f"🗑️ Dropped {table} partitions: {', '.join(dropped)}")
+
+        # 파티션 테이블은 cutoff가 걸친 월/DEFAULT 파티션의 잔여 행만 남아 있음
+        removed[table] = await _delete_before(session, model, time_col, cutoff)
+
+    return removed
+
+
+# ============================================================
+# 자산 기록 다운샘플링
+# ============================================================
+
+
+def _hour_bucket(session, column):
+    if session.bind.dialect.name == "postgresql":
+        return func.date_trunc("hour", column)
+    return func.strftime("%Y-%m-%d %H", column)
+
+
+async def compact_equity(session, before: datetime, since: datetime) -> int:
+    """
+    [since, before) 구간 자산 기록을 (사용자, 시간)당 마지막 기록 하나로 압축
+
+    일 단위로 나눠 처리하므로 구간이 길어도 문장 하나가 커지지 않습니다.
+    이미 압축된 구간을 다시 실행해도 결과는 같습니다.
+
+    Returns:
+        삭제한 행 수
+    """
+    removed = 0
+    day = datetime(since.year, since.month, since.day)
+    while day < before:
+        window_end = min(day + timedelta(days=1), before)
+        in_window = (Equity.timestamp >= day) & (Equity.timestamp < window_end)
+        keep = (
+            select(func.max(Equity.id))
+            .where(in_window)
+            .group_by(Equity.user_id, _hour_bucket(session, Equity.timestamp))
+        )
+        result = await session.execute(
+            delete(Equity)
+            .where(in_window, Equity.id.not_in(keep))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        removed += result.rowcount or 0
+        day = window_end
+    return removed
+
+
+# ============================================================
+# 백그라운드 작업
+# ============================================================
+
+
+async def run_maintenance(now: Optional[datetime] = None) -> Dict[str, int]:
+    """파티션 선생성 + 보존 정책 + 자산 다운샘플링 1회 실행"""
+    now = now or datetime.utcnow()
+    created = await ensure_future_partitions(now)
+    if any(created.values()):
+        logger.info(f"📅 Created partitions: {created}")
+
+    async with AsyncSessionLocal() as session:
+        removed = await apply_retention(session, now)
+        before = now - timedelta(days=EQUITY_RAW_RETENTION_DAYS)
+        removed["equities"] = await compact_equity(
+            session, before, before - timedelta(days=EQUITY_COMPACTION_LOOKBACK_DAYS)
+        )
+
+    logger.info(f"🧹 Time-series maintenance done: {removed}")
+    return removed
+
+
+async def retention_worker_loop():
+    """유지보수 백그라운드 워커 (시작 시 1회, 이후 MAINTENANCE_INTERVAL_SECONDS마다)"""
+    logger.info("🚀 Time-series retention worker started")
+    while True:
+        try:
+            await run_maintenance()
+            await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            logger.info("🛑 Time-series retention worker stopped")
+            break
+        except Exception as e:
+            logger.error(f"❌ Error in retention worker loop: {e}", exc_info=True)
+            await asyncio.sleep(60)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time-series retention maintenance")
+    parser.add_argument("--run", action="store_true", help="Run maintenance once")
+    parser.add_argument(
+        "--compact-equity-since",
+        type=datetime.fromisoformat,
+        help="Downsample equity history from this date (one-off backlog compaction)",
+    )
+    args = parser.parse_args()
+
+    async def _main():
+        if args.compact_equity_since:
+            async with AsyncSessionLocal() as session:
+                before = datetime.utcnow() - timedelta(days=EQUITY_RAW_RETENTION_DAYS)
+                removed = await compact_equity(session, before, args.compact_equity_since)
+            logger.info(f"Compacted {removed} equity rows")
+        if args.run:
+            await run_maintenance()
+
+    if args.run or args.compact_equity_since:
+        logging.basicConfig(level=logging.INFO)
+        asyncio.run(_main())
+    else:
+        parser.print_help()
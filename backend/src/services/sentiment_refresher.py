@@ -0,0 +1,216 @@
+"""
+Sentiment Refresher - 심볼별 시장 감성 백그라운드 갱신
+
+전략이 관심 심볼을 등록하면, 백그라운드 루프가 주기적으로
+뉴스 수집(CryptoPanic/Reddit 동시) -> FinBERT 배치 스코어링을 수행하고
+결과 스냅샷을 프로세스 메모리와 캐시(Redis)에 게시합니다.
+
+전략 핫패스는 get_sentiment_snapshot()으로 dict 조회만 합니다
+(네트워크/모델 작업 없음).
+
+다른 프로세스가 이미 갱신한 스냅샷이 캐시에 있으면 그대로 사용해
+뉴스 API 호출 한도를 아낍니다.
+
+스냅샷 조회는 프로세스 메모리만 보므로 전략을 실행하는 프로세스마다
+(API 프로세스, 분산 모드의 각 봇 워커) sentiment_refresh_loop()를 띄웁니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..agents.sentiment_analyzer.models import MarketSentiment, SentimentStrength
+from ..utils.cache_manager import cache_manager
+
+logger = logging.getLogger(__name__)
+
+# 갱신 주기 (CryptoPanic 무료 플랜 100 req/day 고려)
+SENTIMENT_REFRESH_INTERVAL_SECONDS = int(os.getenv("SENTIMENT_REFRESH_INTERVAL_SECONDS", "900"))
+SENTIMENT_WINDOW_HOURS = 24
+SENTIMENT_REFRESH_CONCURRENCY = 4
+
+CACHE_KEY_PREFIX = "sentiment:snapshot"
+
+
+@dataclass(frozen=True)
+class SentimentSnapshot:
+    """게시된 심볼 감성 (뉴스 본문 제외)"""
+    symbol: str
+    sentiment: MarketSentiment
+    refreshed_at: datetime
+
+    def age_seconds(self, now: Optional[datetime] = None) -> float:
+        return ((now or datetime.utcnow()) - self.refreshed_at).total_seconds()
+
+    def to_dict(self) -> dict:
+        return {**self.sentiment.to_dict(), "refreshed_at": self.refreshed_at.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SentimentSnapshot":
+        sentiment = MarketSentiment(
+            symbol=data["symbol"],
+            score=data["score"],
+            strength=SentimentStrength(data["strength"]),
+            confidence=data["confidence"],
+            news_count=data["news_count"],
+            positive_count=data["positive_count"],
+            negative_count=data["negative_count"],
+            neutral_count=data["neutral_count"],
+            news_items=[],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+        return cls(
+            symbol=data["symbol"],
+            sentiment=sentiment,
+            refreshed_at=datetime.fromisoformat(data["refreshed_at"]),
+        )
+
+
+# 심볼 -> 최신 스냅샷 (전략이 O(1)로 조회)
+_snapshots: Dict[str, SentimentSnapshot] = {}
+
+# 갱신 대상 심볼 / 마지막 갱신 시도 시각 (monotonic)
+_symbols: Set[str] = set()
+_last_attempt: Dict[str, float] = {}
+
+_agent = None
+
+
+def _normalize(symbol: str) -> str:
+    """'ETH/USDT', 'ETHUSDT', 'eth' -> 'ETH'"""
+    symbol = symbol.upper().split("/")[0].split(":")[0]
+    if symbol.endswith("USDT") and len(symbol) > 4:
+        symbol = symbol[:-4]
+    return symbol
+
+
+def register_symbol(symbol: str) -> str:
+    """갱신 대상 심볼 등록 (정규화된 심볼 반환)"""
+    normalized = _normalize(symbol)
+    _symbols.add(normalized)
+    return normalized
+
+
+def get_sentiment_snapshot(symbol: str) -> Optional[SentimentSnapshot]:
+    """최신 감성 스냅샷 조회 (메모리 dict 조회만 수행)"""
+    return _snapshots.get(_normalize(symbol))
+
+
+def _get_agent():
+    """갱신 전용 감성 분석 에이전트 (FinBERT는 프로세스 공유 서비스 사용)"""
+    global _agent
+    if _agent is None:
+        from ..agents.sentiment_analyzer import SentimentAnalyzerAgent
+
+        _agent = SentimentAnalyzerAgent(agent_id="sentiment_refresher", name="SentimentRefresher")
+    return _agent
+
+
+def _publish(snapshot: SentimentSnapshot) -> None:
+    current = _snapshots.get(snapshot.symbol)
+    if current is None or current.refreshed_at <= snapshot.refreshed_at:
+        _snapshots[snapshot.symbol] = snapshot
+
+
+async def refresh_symbol(
+    symbol: str,
+    interval_seconds: int = SENTIMENT_REFRESH_INTERVAL_SECONDS,
+    hours: int = SENTIMENT_WINDOW_HOURS,
+) -> SentimentSnapshot:
+    """
+    심볼 감성 갱신 및 게시
+
+    캐시에 interval 이내의 스냅샷이 있으면(다른 프로세스가 갱신) 재사용합니다.
+    """
+    symbol = _normalize(symbol)
+    cache_key = f"{CACHE_KEY_PREFIX}:{symbol}"
+
+    shared = await cache_manager.get(cache_key)
+    if isinstance(shared, dict):
+        try:
+            snapshot = SentimentSnapshot.from_dict(shared)
+            if snapshot.age_seconds() < interval_seconds:
+                _publish(snapshot)
+                return snapshot
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Invalid shared sentiment snapshot for {symbol}: {e}")
+
+    sentiment = await _get_agent().analyze_market_sentiment(symbol, hours=hours, use_cache=False)
+    snapshot = SentimentSnapshot(
+        symbol=symbol,
+        sentiment=replace(sentiment, news_items=[]),
+        refreshed_at=datetime.utcnow(),
+    )
+    _publish(snapshot)
+    await cache_manager.set(cache_key, snapshot.to_dict(), ttl=interval_seconds * 2)
+
+    logger.debug(
+        f"Sentiment refreshed: {symbol} score={sentiment.score:.3f} news={sentiment.news_count}"
+    )
+    return snapshot
+
+
+async def refresh_all(
+    symbols: Optional[Iterable[str]] = None,
+    interval_seconds: int = SENTIMENT_REFRESH_INTERVAL_SECONDS,
+) -> List[SentimentSnapshot]:
+    """등록된 전체 심볼 동시 갱신 (개별 실패는 이전 스냅샷 유지)"""
+    targets = sorted({_normalize(s) for s in symbols} if symbols is not None else _symbols)
+    semaphore = asyncio.Semaphore(SENTIMENT_REFRESH_CONCURRENCY)
+
+    async def _refresh(symbol: str) -> Optional[SentimentSnapshot]:
+        async with semaphore:
+            try:
+                return await refresh_symbol(symbol, interval_seconds)
+            except Exception as e:
+                logger.error(f"❌ Sentiment refresh failed for {symbol}: {e}")
+                return None
+
+    results = await asyncio.gather(*[_refresh(symbol) for symbol in targets])
+    return [snapshot for snapshot in results if snapshot is not None]
+
+
+def is_fresh(snapshot: Optional[SentimentSnapshot], max_age_seconds: float) -> bool:
+    return snapshot is not None and snapshot.age_seconds() <= max_age_seconds
+
+
+def due_symbols(interval_seconds: int = SENTIMENT_REFRESH_INTERVAL_SECONDS) -> List[str]:
+    """갱신 시도 후 interval이 지난 (또는 한 번도 시도하지 않은) 심볼"""
+    now = time.monotonic()
+    return sorted(
+        symbol for symbol in _symbols
+        if now - _last_attempt.get(symbol, float("-inf")) >= interval_seconds
+    )
+
+
+async def sentiment_refresh_loop(
+    interval_seconds: int = SENTIMENT_REFRESH_INTERVAL_SECONDS,
+    poll_seconds: float = 15.0,
+):
+    """
+    감성 갱신 백그라운드 루프
+
+    poll_seconds마다 갱신 기한이 된 심볼만 갱신합니다
+    (새로 등록된 심볼은 다음 poll에서 바로 갱신).
+    """
+    logger.info(f"🚀 Sentiment refresher started (interval={interval_seconds}s)")
+
+    while True:
+        try:
+            due = due_symbols(interval_seconds)
+            if due:
+                now = time.monotonic()
+                for symbol in due:
+                    _last_attempt[symbol] = now
+                await refresh_all(due, interval_seconds=interval_seconds)
+            await asyncio.sleep(poll_seconds)
+        except asyncio.CancelledError:
+            logger.info("🛑 Sentiment refresher stopped")
+            break
+        except Exception as e:
+            logger.error(f"❌ Error in sentiment refresher loop: {e}", exc_info=True)
+            await asyncio.sleep(poll_seconds)
@@ -5,13 +5,14 @@ Signal Tracker Service
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.models import TradingSignal
 from ..utils.structured_logging import get_logger
+from .write_behind import write_behind
 
 logger = logging.getLogger(__name__)
 structured_logger = get_logger(__name__)
@@ -50,41 +51,10 @@ class SignalTracker:
             생성된 TradingSignal 객체 또는 None (에러 발생 시)
         """
         try:
-            # 입력 검증
-            valid_signal_types = ['BUY', 'SELL', 'HOLD']
-            signal_type_upper = signal_type.upper()
-
-            if signal_type_upper not in valid_signal_types:
-                structured_logger.warning(
-                    "signal_invalid_type",
-                    f"Invalid signal type: {signal_type}",
-                    user_id=user_id,
-                    signal_type=signal_type,
-                    symbol=symbol
-                )
+            validated = SignalTracker._validate(user_id, symbol, signal_type, price, confidence)
+            if validated is None:
                 return None
-
-            # Confidence 검증 (0.0 ~ 1.0)
-            if confidence is not None and (confidence < 0.0 or confidence > 1.0):
-                structured_logger.warning(
-                    "signal_invalid_confidence",
-                    f"Invalid confidence value: {confidence}",
-                    user_id=user_id,
-                    confidence=confidence,
-                    symbol=symbol
-                )
-                confidence = max(0.0, min(1.0, confidence))  # Clamp to valid range
-
-            # Price 검증
-            if price is not None and price <= 0:
-                structured_logger.warning(
-                    "signal_invalid_price",
-                    f"Invalid price value: {price}",
-                    user_id=user_id,
-                    price=price,
-                    symbol=symbol
-                )
-                price = None
+            signal_type_upper, price, confidence = validated
 
             signal = TradingSignal(
                 user_id=user_id,
@@ -128,6 +98,92 @@ class SignalTracker:
             )
             return None
 
+    @staticmethod
+    def _validate(
+        user_id: int,
+        symbol: str,
+        signal_type: str,
+        price: Optional[float],
+        confidence: Optional[float],
+    ) -> Optional[Tuple[str, Optional[float], Optional[float]]]:
+        """시그널 입력 검증 -> (signal_type, price, confidence), 잘못된 타입이면 None"""
+        # 입력 검증
+        valid_signal_types = ['BUY', 'SELL', 'HOLD']
+        signal_type_upper = signal_type.upper()
+
+        if signal_type_upper not in valid_signal_types:
+            structured_logger.warning(
+                "signal_invalid_type",
+                f"Invalid signal type: {signal_type}",
+                user_id=user_id,
+                signal_type=signal_type,
+                symbol=symbol
+            )
+            return None
+
+        # Confidence 검증 (0.0 ~ 1.0)
+        if confidence is not None and (confidence < 0.0 or confidence > 1.0):
+            structured_logger.warning(
+                "signal_invalid_confidence",
+                f"Invalid confidence value: {confidence}",
+                user_id=user_id,
+                confidence=confidence,
+                symbol=symbol
+            )
+            confidence = max(0.0, min(1.0, confidence))  # Clamp to valid range
+
+        # Price 검증
+        if price is not None and price <= 0:
+            structured_logger.warning(
+                "signal_invalid_price",
+                f"Invalid price value: {price}",
+                user_id=user_id,
+                price=price,
+                symbol=symbol
+            )
+            price = None
+
+        return signal_type_upper, price, confidence
+
+    @staticmethod
+    def enqueue_signal(
+        user_id: int,
+        symbol: str,
+        signal_type: str,
+        timeframe: str,
+        strategy_id: Optional[int] = None,
+        price: Optional[float] = None,
+        indicators: Optional[dict] = None,
+        confidence: Optional[float] = None,
+    ) -> bool:
+        """
+        시그널 기록 (write-behind 배치 저장, 트레이딩 경로용)
+
+        record_signal과 같은 검증을 거치지만 DB 왕복 없이 대기열에만 넣습니다.
+
+        Returns:
+            대기열에 들어갔으면 True (검증 실패/버퍼 초과 시 False)
+        """
+        validated = SignalTracker._validate(user_id, symbol, signal_type, price, confidence)
+        if validated is None:
+            return False
+        signal_type_upper, price, confidence = validated
+
+        return write_behind.enqueue(
+            TradingSignal,
+            {
+                "user_id": user_id,
+                "strategy_id": strategy_id,
+                "symbol": symbol,
+                "signal_type": signal_type_upper,
+                "timeframe": timeframe,
+                "price": price,
+                "indicators": indicators,
+                "confidence": confidence,
+                "timestamp": datetime.utcnow(),
+            },
+        )
+
     @staticmethod
     async def get_latest_signal(
         session: AsyncSession, user_id: int, symbol: Optional[str] = None
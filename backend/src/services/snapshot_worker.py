@@ -9,6 +9,16 @@ Purpose:
 - Reduce database load during user requests
 - Provide fast dashboard loading experience
 
+Incremental engine:
+- One grouped query per pass fingerprints every user's trades
+  (count, max(id), closed count); users whose fingerprint is unchanged reuse
+  their cached trade aggregates instead of reloading trades.
+- Changed users are re-aggregated with a single SQL aggregate query
+  (no ORM hydration of trade rows).
+- Bot and position summaries for all users come from two grouped queries.
+- Users are processed concurrently under a bounded semaphore, and pass
+  duration metrics are exposed via get_snapshot_metrics().
+
 Cache Key Pattern: dashboard_snapshot:{user_id}
 TTL: 300 seconds (5 minutes)
 Update Interval: 60 seconds
@@ -16,10 +26,12 @@ Update Interval: 60 seconds
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 
 from ..database.db import AsyncSessionLocal
 from ..database.models import BotInstance, Position, Trade, User
@@ -27,6 +39,44 @@ from ..utils.cache_manager import cache_manager
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_INTERVAL_SECONDS = 60
+SNAPSHOT_TTL_SECONDS = 300
+SNAPSHOT_CONCURRENCY = 20
+
+# 기간별 수익 윈도우 (calculate_period_profits와 동일)
+PERIOD_WINDOWS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(days=7),
+    "monthly": timedelta(days=30),
+}
+
+# (전체 거래 수, 최대 거래 ID, 청산된 거래 수)
+TradeFingerprint = Tuple[int, int, int]
+
+
+@dataclass
+class UserSnapshotState:
+    """사용자별 증분 집계 상태"""
+
+    fingerprint: Optional[TradeFingerprint] = None
+    stats: Dict[str, Any] = field(default_factory=dict)
+    profits: Dict[str, float] = field(default_factory=dict)
+    # 기간 윈도우에서 가장 오래된 거래가 빠져나가는 시각 (이후 재집계 필요)
+    profits_valid_until: Optional[datetime] = None
+
+
+_user_states: Dict[int, UserSnapshotState] = {}
+
+snapshot_metrics: Dict[str, Any] = {
+    "passes": 0,
+    "last_pass_seconds": 0.0,
+    "max_pass_seconds": 0.0,
+    "last_users": 0,
+    "last_recomputed": 0,
+    "last_failed": 0,
+    "last_pass_at": None,
+}
+
 
 def calculate_trade_stats(trades: List[Trade]) -> Dict[str, Any]:
     """
@@ -155,104 +205,256 @@ def calculate_period_profits(trades: List[Trade]) -> Dict[str, float]:
     }
 
 
-async def update_user_snapshot(user_id: int) -> bool:
-    """
-    Update dashboard snapshot for a specific user.
+def _empty_trade_stats(total_trades: int = 0) -> Dict[str, Any]:
+    return {
+        "totalTrades": total_trades,
+        "winningTrades": 0,
+        "losingTrades": 0,
+        "winRate": 0.0,
+        "avgPnl": 0.0,
+        "totalReturn": 0.0,
+        "bestTrade": 0.0,
+        "worstTrade": 0.0,
+    }
 
-    Queries:
-    1. All trades for the user
-    2. Active bot instances
-    3. Current positions
 
-    Calculates:
-    - Trade statistics (win rate, avg PnL, etc.)
-    - Period profits (daily, weekly, monthly)
-    - Bot status
-    - Position summary
+async def _load_trade_fingerprints(session) -> Dict[int, TradeFingerprint]:
+    """Fingerprint every user's trades with one grouped query."""
+    stmt = select(
+        Trade.user_id,
+        func.count(Trade.id),
+        func.max(Trade.id),
+        func.count(Trade.exit_price),
+    ).group_by(Trade.user_id)
+    result = await session.execute(stmt)
+    return {
+        row[0]: (int(row[1]), int(row[2] or 0), int(row[3]))
+        for row in result.all()
+    }
 
-    Stores result in Redis with key: dashboard_snapshot:{user_id}
 
-    Args:
-        user_id: User ID to update snapshot for
+async def _load_trade_fingerprints_for_user(session, user_id: int) -> TradeFingerprint:
+    stmt = select(
+        func.count(Trade.id), func.max(Trade.id), func.count(Trade.exit_price)
+    ).where(Trade.user_id == user_id)
+    row = (await session.execute(stmt)).one()
+    return int(row[0]), int(row[1] or 0), int(row[2])
+
+
+async def _load_position_summaries(
+    session, user_id: Optional[int] = None
+) -> Dict[int, Dict[str, Any]]:
+    """Position count and unrealized PnL per user."""
+    stmt = select(
+        Position.user_id,
+        func.count(Position.id),
+        func.coalesce(func.sum(Position.pnl), 0),
+    ).group_by(Position.user_id)
+    if user_id is not None:
+        stmt = stmt.where(Position.user_id == user_id)
+    result = await session.execute(stmt)
+    return {
+        row[0]: {"total": int(row[1]), "totalPnl": round(float(row[2]), 2)}
+        for row in result.all()
+    }
 
-    Returns:
-        True if snapshot updated successfully, False otherwise
-    """
-    try:
-        async with AsyncSessionLocal() as session:
-            # Query trades
-            trades_stmt = (
-                select(Trade)
-                .where(Trade.user_id == user_id)
-                .order_by(Trade.created_at.desc())
-                .limit(1000)  # Limit to last 1000 trades for performance
-            )
-            trades_result = await session.execute(trades_stmt)
-            trades = list(trades_result.scalars().all())
 
-            # Query bot instances
-            bots_stmt = select(BotInstance).where(
-                BotInstance.user_id == user_id, BotInstance.is_active is True
-            )
-            bots_result = await session.execute(bots_stmt)
-            bot_instances = list(bots_result.scalars().all())
+async def _load_bot_summaries(
+    session, user_id: Optional[int] = None
+) -> Dict[int, Dict[str, Any]]:
+    """Active bot instance counts per user."""
+    stmt = (
+        select(
+            BotInstance.user_id,
+            func.count(BotInstance.id),
+            func.coalesce(
+                func.sum(case((BotInstance.is_running.is_(True), 1), else_=0)), 0
+            ),
+        )
+        .where(BotInstance.is_active.is_(True))
+        .group_by(BotInstance.user_id)
+    )
+    if user_id is not None:
+        stmt = stmt.where(BotInstance.user_id == user_id)
+    result = await session.execute(stmt)
+    summaries = {}
+    for row in result.all():
+        total, running = int(row[1]), int(row[2])
+        summaries[row[0]] = {
+            "total": total,
+            "running": running,
+            "stopped": total - running,
+        }
+    return summaries
 
-            # Query positions
-            positions_stmt = select(Position).where(Position.user_id == user_id)
-            positions_result = await session.execute(positions_stmt)
-            positions = list(positions_result.scalars().all())
 
-        # Calculate trade statistics
-        trade_stats = calculate_trade_stats(trades)
+async def _aggregate_closed_trades(
+    session, user_id: int, total_trades: int, now: datetime
+) -> Tuple[Dict[str, Any], Dict[str, float], Optional[datetime]]:
+    """
+    Aggregate a user's closed trades in SQL.
 
-        # Calculate period profits
-        period_profits = calculate_period_profits(trades)
+    Produces the same values as calculate_trade_stats() and
+    calculate_period_profits(), plus the time at which the oldest trade in
+    any period window expires (after which period profits must be recomputed).
+    """
+    pnl = func.coalesce(Trade.pnl, 0)
+    columns = [
+        func.count(Trade.id),
+        func.coalesce(func.sum(case((pnl > 0, 1), else_=0)), 0),
+        func.coalesce(func.sum(pnl), 0),
+        func.max(pnl),
+        func.min(pnl),
+    ]
+    cutoffs = {name: now - window for name, window in PERIOD_WINDOWS.items()}
+    for cutoff in cutoffs.values():
+        in_window = Trade.created_at >= cutoff
+        columns.append(func.coalesce(func.sum(case((in_window, pnl), else_=0)), 0))
+        columns.append(func.min(case((in_window, Trade.created_at), else_=None)))
+
+    stmt = select(*columns).where(
+        Trade.user_id == user_id, Trade.exit_price.isnot(None)
+    )
+    row = (await session.execute(stmt)).one()
 
-        # Bot status
-        running_bots = [b for b in bot_instances if b.is_running]
-        total_bots = len(bot_instances)
-        running_bots_count = len(running_bots)
+    closed_count = int(row[0])
+    if closed_count == 0:
+        empty_profits = {"daily": 0.0, "weekly": 0.0, "monthly": 0.0, "allTime": 0.0}
+        return _empty_trade_stats(total_trades), empty_profits, None
 
+    winning_count = int(row[1])
+    total_return = float(row[2])
+    stats = {
+        "totalTrades": closed_count,
+        "winningTrades": winning_count,
+        "losingTrades": closed_count - winning_count,
+        "winRate": round(winning_count / closed_count * 100, 2),
+        "avgPnl": round(total_return / closed_count, 2),
+        "totalReturn": round(total_return, 2),
+        "bestTrade": round(float(row[3]), 2),
+        "worstTrade": round(float(row[4]), 2),
+    }
+
+    profits: Dict[str, float] = {}
+    valid_until: Optional[datetime] = None
+    for index, (name, window) in enumerate(PERIOD_WINDOWS.items()):
+        profits[name] = round(float(row[5 + index * 2]), 2)
+        oldest = row[6 + index * 2]
+        if isinstance(oldest, str):
+            # SQLite returns MIN() over CASE as a raw string
+            oldest = datetime.fromisoformat(oldest)
+        if oldest is not None:
+            expires_at = oldest + window
+            if valid_until is None or expires_at < valid_until:
+                valid_until = expires_at
+    profits["allTime"] = round(total_return, 2)
+
+    return stats, profits, valid_until
+
+
+def _build_snapshot(
+    user_id: int,
+    state: UserSnapshotState,
+    bots: Optional[Dict[str, Any]],
+    positions: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        # Trade statistics
+        "stats": state.stats,
+        # Period profits
+        "profits": state.profits,
+        # Bot status
+        "bots": bots or {"total": 0, "running": 0, "stopped": 0},
         # Position summary
-        total_positions = len(positions)
-        total_position_pnl = sum(float(p.pnl) for p in positions)
-
-        # Build snapshot
-        snapshot = {
-            # Trade statistics
-            "stats": trade_stats,
-            # Period profits
-            "profits": period_profits,
-            # Bot status
-            "bots": {
-                "total": total_bots,
-                "running": running_bots_count,
-                "stopped": total_bots - running_bots_count,
-            },
-            # Position summary
-            "positions": {
-                "total": total_positions,
-                "totalPnl": round(total_position_pnl, 2),
-            },
-            # Metadata
-            "updatedAt": datetime.utcnow().isoformat(),
-            "userId": user_id,
-        }
+        "positions": positions or {"total": 0, "totalPnl": 0.0},
+        # Metadata
+        "updatedAt": datetime.utcnow().isoformat(),
+        "userId": user_id,
+    }
+
+
+async def _refresh_user(
+    user_id: int,
+    fingerprint: TradeFingerprint,
+    bots: Optional[Dict[str, Any]],
+    positions: Optional[Dict[str, Any]],
+    now: datetime,
+    session_factory=AsyncSessionLocal,
+    force: bool = False,
+) -> Tuple[bool, bool]:
+    """
+    Refresh one user's snapshot, re-aggregating trades only when needed.
+
+    Returns:
+        (success, recomputed)
+    """
+    state = _user_states.setdefault(user_id, UserSnapshotState())
+    recomputed = (
+        force
+        or state.fingerprint != fingerprint
+        or (state.profits_valid_until is not None and now >= state.profits_valid_until)
+    )
+
+    try:
+        if recomputed:
+            async with session_factory() as session:
+                stats, profits, valid_until = await _aggregate_closed_trades(
+                    session, user_id, fingerprint[0], now
+                )
+            state.fingerprint = fingerprint
+            state.stats = stats
+            state.profits = profits
+            state.profits_valid_until = valid_until
+
+        snapshot = _build_snapshot(user_id, state, bots, positions)
 
         # Store in cache (Redis or in-memory fallback)
         cache_key = f"dashboard_snapshot:{user_id}"
-        success = await cache_manager.set(cache_key, snapshot, ttl=300)
+        success = await cache_manager.set(cache_key, snapshot, ttl=SNAPSHOT_TTL_SECONDS)
 
         if success:
             logger.debug(
                 f"✅ Dashboard snapshot updated for user {user_id} "
-                f"(trades: {trade_stats['totalTrades']}, bots: {running_bots_count}/{total_bots})"
+                f"(trades: {state.stats['totalTrades']}, recomputed: {recomputed})"
             )
         else:
             logger.warning(f"⚠️ Failed to cache dashboard snapshot for user {user_id}")
 
-        return success
+        return success, recomputed
+
+    except Exception as e:
+        # 다음 패스에서 다시 집계하도록 상태 초기화
+        _user_states.pop(user_id, None)
+        logger.error(
+            f"❌ Error updating dashboard snapshot for user {user_id}: {e}",
+            exc_info=True,
+        )
+        return False, recomputed
+
+
+async def update_user_snapshot(user_id: int, session_factory=AsyncSessionLocal) -> bool:
+    """
+    Update dashboard snapshot for a specific user (full recompute).
+
+    Calculates:
+    - Trade statistics (win rate, avg PnL, etc.)
+    - Period profits (daily, weekly, monthly)
+    - Bot status
+    - Position summary
+
+    Stores result in Redis with key: dashboard_snapshot:{user_id}
+
+    Args:
+        user_id: User ID to update snapshot for
 
+    Returns:
+        True if snapshot updated successfully, False otherwise
+    """
+    try:
+        async with session_factory() as session:
+            fingerprint = (await _load_trade_fingerprints_for_user(session, user_id))
+            bots = (await _load_bot_summaries(session, user_id)).get(user_id)
+            positions = (await _load_position_summaries(session, user_id)).get(user_id)
     except Exception as e:
         logger.error(
             f"❌ Error updating dashboard snapshot for user {user_id}: {e}",
@@ -260,8 +462,19 @@ async def update_user_snapshot(user_id: int) -> bool:
         )
         return False
 
+    success, _ = await _refresh_user(
+        user_id,
+        fingerprint,
+        bots,
+        positions,
+        datetime.utcnow(),
+        session_factory=session_factory,
+        force=True,
+    )
+    return success
+
 
-async def get_all_active_users() -> List[int]:
+async def get_all_active_users(session_factory=AsyncSessionLocal) -> List[int]:
     """
     Get list of all active user IDs.
 
@@ -269,8 +482,8 @@ async def get_all_active_users() -> List[int]:
         List of user IDs with is_active=True
     """
     try:
-        async with AsyncSessionLocal() as session:
-            stmt = select(User.id).where(User.is_active is True)
+        async with session_factory() as session:
+            stmt = select(User.id).where(User.is_active.is_(True))
             result = await session.execute(stmt)
             user_ids = [row[0] for row in result.all()]
             return user_ids
@@ -279,6 +492,83 @@ async def get_all_active_users() -> List[int]:
         return []
 
 
+async def run_snapshot_pass(
+    concurrency: int = SNAPSHOT_CONCURRENCY, session_factory=AsyncSessionLocal
+) -> Dict[str, Any]:
+    """
+    Run one snapshot pass over all active users.
+
+    Args:
+        concurrency: Maximum number of users processed at once
+        session_factory: Async session factory (overridable for tests)
+
+    Returns:
+        Pass summary (users, succeeded, failed, recomputed, duration)
+    """
+    started = time.perf_counter()
+    user_ids = await get_all_active_users(session_factory)
+
+    succeeded = failed = recomputed = 0
+
+    if user_ids:
+        async with session_factory() as session:
+            fingerprints = await _load_trade_fingerprints(session)
+            bots = await _load_bot_summaries(session)
+            positions = await _load_position_summaries(session)
+
+        now = datetime.utcnow()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(user_id: int) -> Tuple[bool, bool]:
+            async with semaphore:
+                return await _refresh_user(
+                    user_id,
+                    fingerprints.get(user_id, (0, 0, 0)),
+                    bots.get(user_id),
+                    positions.get(user_id),
+                    now,
+                    session_factory=session_factory,
+                )
+
+        results = await asyncio.gather(*(process(user_id) for user_id in user_ids))
+        for success, was_recomputed in results:
+            if success:
+                succeeded += 1
+            else:
+                failed += 1
+            if was_recomputed:
+                recomputed += 1
+
+    # 비활성화된 사용자의 상태 정리
+    active = set(user_ids)
+    for user_id in [uid for uid in _user_states if uid not in active]:
+        del _user_states[user_id]
+
+    duration = time.perf_counter() - started
+    snapshot_metrics["passes"] += 1
+    snapshot_metrics["last_pass_seconds"] = round(duration, 4)
+    snapshot_metrics["max_pass_seconds"] = max(
+        snapshot_metrics["max_pass_seconds"], round(duration, 4)
+    )
+    snapshot_metrics["last_users"] = len(user_ids)
+    snapshot_metrics["last_recomputed"] = recomputed
+    snapshot_metrics["last_failed"] = failed
+    snapshot_metrics["last_pass_at"] = datetime.utcnow().isoformat()
+
+    return {
+        "users": len(user_ids),
+        "succeeded": succeeded,
+        "failed": failed,
+        "recomputed": recomputed,
+        "duration_seconds": duration,
+    }
+
+
+def get_snapshot_metrics() -> Dict[str, Any]:
+    """Snapshot worker pass metrics (duration, users, recomputed count)."""
+    return dict(snapshot_metrics, tracked_users=len(_user_states))
+
+
 async def snapshot_worker_loop():
     """
     Main snapshot worker loop.
@@ -286,10 +576,10 @@ async def snapshot_worker_loop():
     Runs continuously and updates snapshots for all active users every 60 seconds.
 
     Workflow:
-    1. Wait 60 seconds
-    2. Get all active users
-    3. Update snapshot for each user (sequentially to avoid DB overload)
-    4. Log summary statistics
+    1. Wait until the next 60-second tick
+    2. Fingerprint all users' trades and load bot/position summaries
+    3. Refresh users concurrently (bounded), re-aggregating only changed users
+    4. Record pass metrics and log summary
     5. Repeat
 
     Note:
@@ -299,38 +589,31 @@ async def snapshot_worker_loop():
     """
     logger.info("🚀 Dashboard snapshot worker started")
 
+    last_duration = 0.0
+
     while True:
         try:
-            # Wait before next update cycle
-            await asyncio.sleep(60)
+            # Wait before next update cycle (fixed cadence, pass time included)
+            await asyncio.sleep(max(SNAPSHOT_INTERVAL_SECONDS - last_duration, 1))
 
-            # Get all active users
-            user_ids = await get_all_active_users()
+            summary = await run_snapshot_pass()
+            last_duration = summary["duration_seconds"]
 
-            if not user_ids:
+            if not summary["users"]:
                 logger.debug("⏭️ No active users found, skipping snapshot update")
                 continue
 
-            logger.info(f"🔄 Updating snapshots for {len(user_ids)} active users...")
-
-            # Update snapshots for each user
-            success_count = 0
-            fail_count = 0
-
-            for user_id in user_ids:
-                success = await update_user_snapshot(user_id)
-                if success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-                # Small delay to avoid overwhelming the database
-                await asyncio.sleep(0.1)
-
             # Log summary
             logger.info(
-                f"✅ Snapshot update complete: {success_count} succeeded, {fail_count} failed"
+                f"✅ Snapshot update complete: {summary['succeeded']} succeeded, "
+                f"{summary['failed']} failed, {summary['recomputed']} recomputed "
+                f"in {last_duration:.2f}s"
             )
+            if last_duration > SNAPSHOT_INTERVAL_SECONDS:
+                logger.warning(
+                    f"⚠️ Snapshot pass ({last_duration:.1f}s) exceeded interval "
+                    f"({SNAPSHOT_INTERVAL_SECONDS}s)"
+                )
 
         except asyncio.CancelledError:
             logger.info("🛑 Dashboard snapshot worker stopped")
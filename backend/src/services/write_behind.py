@@ -0,0 +1,405 @@
+"""
+Write-behind persistence pipeline
+
+트레이딩 경로의 비핵심 기록(시그널, 자산 기록, 봇 통계 카운터, 봇 로그)을
+메모리 버퍼에 넣고 백그라운드 writer가 배치로 저장합니다.
+
+- enqueue / increment는 동기 O(1) (이벤트 루프 양보/DB 왕복 없음)
+- 테이블별 multi-row INSERT (executemany), 카운터는 (테이블, PK)별로 합쳐 UPDATE 1회
+- 버퍼 상한 초과 시 새 기록 드롭 + 카운트 (주문/포지션 상태는 여기로 보내지 않음)
+- 주기(flush_interval) 또는 배치 크기 도달 시 flush, 종료 시 남은 기록 flush
+- 실패한 배치는 버퍼 앞에 되돌려 다음 flush에서 재시도
+- 연결 장애가 아닌 실패(제약 조건 위반 등)는 배치를 반으로 나눠 다시 저장해 문제 row만 격리,
+  격리된 row는 MAX_ROW_ATTEMPTS번 실패하면 드롭 + stats["poisoned"] 집계
+  (poison row 하나 때문에 버퍼가 가득 차 정상 기록까지 드롭되지 않도록)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Tuple, Type
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from ..database.db import AsyncSessionLocal
+from ..database.models import BotInstance, BotLog, Equity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BUFFER = int(os.getenv("WRITE_BEHIND_MAX_BUFFER", "20000"))
+DEFAULT_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "500"))
+DEFAULT_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))
+MAX_ROW_ATTEMPTS = int(os.getenv("WRITE_BEHIND_MAX_ROW_ATTEMPTS", "3"))
+
+CounterKey = Tuple[Type, Any]
+# (enqueue 시각, row, 격리 후 실패 횟수)
+RowEntry = Tuple[float, dict, int]
+
+
+def _is_transient(error: Exception) -> bool:
+    """연결/타임아웃 계열 (배치 전체를 그대로 재시도) 여부"""
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, (OperationalError, InterfaceError, ConnectionError, asyncio.TimeoutError))
+
+
+class WriteBehindWriter:
+    """
+    배치 저장 writer
+
+    사용법:
+    ```python
+    write_behind.enqueue(Equity, {"user_id": 1, "value": Decimal("100"), "timestamp": now})
+    write_behind.increment(BotInstance, bot_id, {"total_trades": 1}, {"last_trade_at": now})
+    ```
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # 모델 -> (enqueue 시각, row, 실패 횟수) 대기열
+        self._rows: Dict[Type, Deque[RowEntry]] = defaultdict(deque)
+        self._pending_rows = 0
+        # (모델, PK) -> (증가분, 대입값, 최초 enqueue 시각)
+        self._counters: Dict[CounterKey, Tuple[Dict[str, float], Dict[str, Any], float]] = {}
+        # 격리 후 실패한 카운터 (모델, PK) -> 실패 횟수
+        self._counter_failures: Dict[CounterKey, int] = {}
+
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._last_drop_warning = 0.0
+
+        self.stats = {
+            "enqueued": 0,
+            "written": 0,
+            "counters_written": 0,
+            "dropped": 0,
+            "poisoned": 0,
+            "isolated_flushes": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "last_flush_ms": 0.0,
+            "last_error": None,
+        }
+
+    # ------------------------------------------------------------
+    # 입력 (트레이딩 경로)
+    # ------------------------------------------------------------
+
+    def enqueue(self, model: Type, row: dict) -> bool:
+        """
+        INSERT 대기열에 추가
+
+        Returns:
+            False면 버퍼가 가득 차서 드롭됨
+        """
+        if self._pending_rows >= self.max_buffer:
+            self._drop()
+            return False
+
+        self._rows[model].append((time.monotonic(), row, 0))
+        self._pending_rows += 1
+        self.stats["enqueued"] += 1
+
+        if self._pending_rows >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def increment(
+        self,
+        model: Type,
+        pk: Any,
+        deltas: Dict[str, float],
+        assign: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """카운터 증가 (다음 flush에서 PK별 UPDATE 1회로 합쳐짐)"""
+        key = (model, pk)
+        existing = self._counters.get(key)
+        if existing is None:
+            self._counters[key] = (dict(deltas), dict(assign or {}), time.monotonic())
+            return
+
+        totals, values, first_seen = existing
+        for column, delta in deltas.items():
+            totals[column] = totals.get(column, 0) + delta
+        values.update(assign or {})
+
+    def _drop(self) -> None:
+        self.stats["dropped"] += 1
+        now = time.monotonic()
+        if now - self._last_drop_warning > 10:
+            self._last_drop_warning = now
+            logger.warning(
+                f"Write-behind buffer full ({self.max_buffer}); "
+                f"dropped {self.stats['dropped']} records so far"
+            )
+
+    # ------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """대기 중인 기록 저장 (저장된 row + 카운터 수 반환)"""
+        async with self._flush_lock:
+            if not self._pending_rows and not self._counters:
+                return 0
+
+            rows, self._rows = self._rows, defaultdict(deque)
+            counters, self._counters = self._counters, {}
+            row_count, self._pending_rows = self._pending_rows, 0
+
+            started = time.perf_counter()
+            try:
+                async with self.session_factory() as session:
+                    for model, queued in rows.items():
+                        batch = [entry[1] for entry in queued]
+                        for i in range(0, len(batch), self.batch_size):
+                            await session.execute(insert(model.__table__), batch[i:i + self.batch_size])
+
+                    for key, (deltas, values, _) in counters.items():
+                        await session.execute(self._counter_update(key, deltas, values))
+
+                    await session.commit()
+            except Exception as e:
+                self.stats["failed_flushes"] += 1
+                self.stats["last_error"] = str(e)[:200]
+                if _is_transient(e):
+                    self._requeue(rows, counters, row_count)
+                    logger.error(f"Write-behind flush failed ({row_count} rows pending): {e}")
+                    return 0
+                logger.warning(f"Write-behind batch rejected, isolating bad records: {e}")
+                return await self._flush_isolated(rows, counters, started)
+
+            self._counter_failures.clear()
+            self.stats["flushes"] += 1
+            self.stats["written"] += row_count
+            self.stats["counters_written"] += len(counters)
+            self.stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            self._after_commit(rows)
+            return row_count + len(counters)
+
+    @staticmethod
+    def _counter_update(key: CounterKey, deltas: Dict[str, float], values: Dict[str, Any]):
+        model, pk = key
+        changes = {
+            column: func.coalesce(getattr(model, column), 0) + delta
+            for column, delta in deltas.items()
+        }
+        changes.update(values)
+        return update(model).where(model.id == pk).values(**changes)
+
+    async def _flush_isolated(self, rows, counters, started: float) -> int:
+        """
+        배치를 반씩 나눠 저장해 실패 row만 골라냄
+
+        혼자서도 실패하는 row/카운터는 실패 횟수를 올려 되돌리고, MAX_ROW_ATTEMPTS번째 실패 시 드롭.
+        도중에 연결 장애가 나면 아직 저장 안 된 나머지를 그대로 되돌림.
+        """
+        committed: Dict[Type, Deque[RowEntry]] = defaultdict(deque)
+        retry: Dict[Type, Deque[RowEntry]] = defaultdict(deque)
+        retry_counters = {}
+        written_counters = 0
+        remaining = dict(rows)
+
+        try:
+            for model, queued in rows.items():
+                failed: list = []
+                await self._insert_bisect(model, list(queued), committed[model], failed)
+                for enqueued_at, row, attempts in failed:
+                    if attempts + 1 >= MAX_ROW_ATTEMPTS:
+                        self.stats["poisoned"] += 1
+                        logger.error(
+                            f"Write-behind dropped poison row for {model.__tablename__} "
+                            f"after {attempts + 1} attempts: {row}"
+                        )
+                    else:
+                        retry[model].append((enqueued_at, row, attempts + 1))
+                del remaining[model]
+
+            for key, (deltas, values, first_seen) in list(counters.items()):
+                try:
+                    async with self.session_factory() as session:
+                        await session.execute(self._counter_update(key, deltas, values))
+                        await session.commit()
+                    written_counters += 1
+                    self._counter_failures.pop(key, None)
+                except Exception as e:
+                    if _is_transient(e):
+                        raise
+                    failures = self._counter_failures.get(key, 0) + 1
+                    if failures >= MAX_ROW_ATTEMPTS:
+                        self._counter_failures.pop(key, None)
+                        self.stats["poisoned"] += 1
+                        logger.error(f"Write-behind dropped counter update {key[0].__tablename__}#{key[1]}: {e}")
+                    else:
+                        self._counter_failures[key] = failures
+                        retry_counters[key] = (deltas, values, first_seen)
+                counters.pop(key)
+        except Exception as e:
+            # 연결 장애: 아직 시도 안 한 모델 / 카운터는 그대로 재시도
+            logger.error(f"Write-behind isolation interrupted: {e}")
+            for model, queued in remaining.items():
+                done = {id(entry[1]) for entry in committed.get(model, ())}
+                retry[model].extend(entry for entry in queued if id(entry[1]) not in done)
+            retry_counters.update(counters)
+
+        written = sum(len(queued) for queued in committed.values())
+        self._requeue(retry, retry_counters, sum(len(queued) for queued in retry.values()))
+        self.stats["isolated_flushes"] += 1
+        self.stats["written"] += written
+        self.stats["counters_written"] += written_counters
+        self.stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        self._after_commit(committed)
+        return written + written_counters
+
+    async def _insert_bisect(self, model: Type, entries: list, committed: Deque, failed: list) -> None:
+        """entries를 저장, 실패하면 반으로 나눠 재귀 (단일 row 실패는 failed로)"""
+        if not entries:
+            return
+        try:
+            async with self.session_factory() as session:
+                await session.execute(insert(model.__table__), [entry[1] for entry in entries])
+                await session.commit()
+        except Exception as e:
+            if _is_transient(e):
+                raise
+            if len(entries) == 1:
+                self.stats["last_error"] = str(e)[:200]
+                failed.extend(entries)
+                return
+            mid = len(entries) // 2
+            await self._insert_bisect(model, entries[:mid], committed, failed)
+            await self._insert_bisect(model, entries[mid:], committed, failed)
+            return
+        committed.extend(entries)
+
+    def _requeue(self, rows, counters, row_count: int) -> None:
+        """실패한 배치를 대기열 앞에 되돌림 (버퍼 상한 초과분은 드롭)"""
+        for model, queued in rows.items():
+            current = self._rows[model]
+            queued.extend(current)
+            self._rows[model] = queued
+        self._pending_rows += row_count
+
+        overflow = self._pending_rows - self.max_buffer
+        for queued in self._rows.values():
+            while overflow > 0 and queued:
+                queued.pop()
+                overflow -= 1
+                self._pending_rows -= 1
+                self.stats["dropped"] += 1
+
+        for key, (deltas, values, first_seen) in counters.items():
+            if key in self._counters:
+                newer_deltas, newer_values, _ = self._counters[key]
+                for column, delta in newer_deltas.items():
+                    deltas[column] = deltas.get(column, 0) + delta
+                values.update(newer_values)
+            self._counters[key] = (deltas, values, first_seen)
+
+    @staticmethod
+    def _after_commit(rows) -> None:
+        """커밋된 자산 기록의 일간 성과 롤업 갱신 예약"""
+        equities = rows.get(Equity)
+        if not equities:
+            return
+        from .performance_rollup import mark_dirty
+
+        for _, row, _ in equities:
+            mark_dirty(row["user_id"], row["timestamp"].date())
+
+    # ------------------------------------------------------------
+    # 백그라운드 writer
+    # ------------------------------------------------------------
+
+    async def run(self) -> None:
+        """flush 루프 (lifespan에서 시작)"""
+        self._wakeup = asyncio.Event()
+        logger.info(
+            f"Write-behind writer started (batch={self.batch_size}, "
+            f"interval={self.flush_interval}s, max_buffer={self.max_buffer})"
+        )
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        """writer 정지 후 남은 기록 flush"""
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=self.flush_interval + 5)
+            except Exception:
+                self._task.cancel()
+        await self.flush()
+        logger.info(f"Write-behind writer stopped ({self.get_status()['pending']} records left)")
+
+    def get_status(self) -> Dict[str, Any]:
+        """지연/유실 지표"""
+        oldest = [queued[0][0] for queued in self._rows.values() if queued]
+        oldest += [first_seen for _, _, first_seen in self._counters.values()]
+        return {
+            "pending": self._pending_rows,
+            "pending_counters": len(self._counters),
+            "pending_by_table": {
+                model.__tablename__: len(queued) for model, queued in self._rows.items() if queued
+            },
+            "oldest_pending_seconds": round(time.monotonic() - min(oldest), 3) if oldest else 0.0,
+            "max_buffer": self.max_buffer,
+            "running": self._task is not None and not self._task.done(),
+            **self.stats,
+        }
+
+
+# 싱글톤 인스턴스
+write_behind = WriteBehindWriter()
+
+
+def record_bot_stats(bot_instance_id: int, pnl: float, is_win: bool) -> None:
+    """봇 인스턴스 거래 통계 누적 (write-behind)"""
+    write_behind.increment(
+        BotInstance,
+        bot_instance_id,
+        {"total_trades": 1, "winning_trades": 1 if is_win else 0, "total_pnl": pnl},
+        {"last_trade_at": datetime.utcnow()},
+    )
+
+
+def record_bot_log(user_id: Optional[int], event_type: str, message: str) -> bool:
+    """봇 이벤트 로그 (write-behind)"""
+    return write_behind.enqueue(
+        BotLog,
+        {
+            "user_id": user_id,
+            "event_type": event_type,
+            "message": message[:2000],
+            "created_at": datetime.utcnow(),
+        },
+    )
+
@@ -16,6 +16,12 @@ except Exception:
 # FinBERT 감성 분석 에이전트 (선택적)
 try:
     from src.agents.sentiment_analyzer import SentimentAnalyzerAgent
+    from src.services.sentiment_refresher import (
+        SENTIMENT_REFRESH_INTERVAL_SECONDS,
+        get_sentiment_snapshot,
+        is_fresh,
+        register_symbol,
+    )
     SENTIMENT_AVAILABLE = True
 except Exception:
     SentimentAnalyzerAgent = None
@@ -66,6 +72,11 @@ class ETHAIFusionStrategy:
                         "cache_ttl_minutes": 30,
                     }
                 )
+                # 뉴스 수집/스코어링은 백그라운드 갱신 루프가 담당
+                self._sentiment_symbol = register_symbol(self.symbol)
+                self._sentiment_max_age = float(
+                    self.params.get("sentiment_max_age_seconds", SENTIMENT_REFRESH_INTERVAL_SECONDS * 3)
+                )
                 logger.info(f"✅ 감성 분석 에이전트 초기화 완료 (user_id={user_id})")
             except Exception as e:
                 logger.error(f"❌ 감성 분석 에이전트 초기화 실패: {e}")
@@ -74,6 +85,7 @@ class ETHAIFusionStrategy:
 
         self._state = PositionState()
         self._feature_pipeline = FeaturePipeline() if self.enable_ml and FeaturePipeline else None
+        # 모델 객체는 프로세스 공유 ModelRegistry에서 참조 (사용자별 로드 없음)
         self._ml_predictor = EnsemblePredictor() if self.enable_ml and EnsemblePredictor else None
 
         self._ema_fast = int(self.params.get("ema_fast", 9))
@@ -175,49 +187,30 @@ class ETHAIFusionStrategy:
 
     def _get_sentiment_signal(self) -> Optional[Dict[str, Any]]:
         """
-        감성 분석 시그널 가져오기 (동기 래퍼)
+        감성 분석 시그널 가져오기
+
+        백그라운드 갱신 루프가 게시한 스냅샷만 조회합니다 (네트워크/모델 호출 없음).
 
         Returns:
-            감성 시그널 또는 None
+            감성 시그널 또는 None (스냅샷 없음/오래됨)
         """
         if not self._sentiment_agent:
             return None
 
         try:
-            import asyncio
-
-            # 심볼에서 코인 이름 추출 (ETH/USDT -> ETH)
-            coin_symbol = self.symbol.split("/")[0] if "/" in self.symbol else self.symbol
-
-            # 비동기 메서드를 동기적으로 호출
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # 이미 이벤트 루프가 실행 중이면 캐시된 값 사용
-                cached = getattr(self, "_cached_sentiment", None)
-                if cached:
-                    return cached
+            snapshot = get_sentiment_snapshot(self._sentiment_symbol)
+            if not is_fresh(snapshot, self._sentiment_max_age):
                 return None
-            else:
-                # 새 이벤트 루프 생성
-                sentiment = asyncio.run(
-                    self._sentiment_agent.analyze_market_sentiment(coin_symbol, hours=24)
-                )
 
-            if sentiment:
-                signal = self._sentiment_agent.generate_sentiment_signal(sentiment)
-                result = {
-                    "score": sentiment.score,
-                    "strength": sentiment.strength.value if sentiment.strength else "unknown",
-                    "should_block": signal.should_block if signal else False,
-                    "confidence_multiplier": signal.confidence_multiplier if signal else 1.0,
-                    "reason": signal.reason if signal else None,
-                }
-                self._cached_sentiment = result  # 캐싱
-                return result
+            sentiment = snapshot.sentiment
+            signal = self._sentiment_agent.generate_sentiment_signal(sentiment)
+            return {
+                "score": sentiment.score,
+                "strength": sentiment.strength.value if sentiment.strength else "unknown",
+                "should_block": signal.should_block if signal else False,
+                "confidence_multiplier": signal.confidence_multiplier if signal else 1.0,
+                "reason": signal.reason if signal else None,
+            }
 
         except Exception as e:
             logger.debug(f"감성 분석 실패 (무시됨): {e}")
@@ -1,6 +1,8 @@
 """
 캐싱 매니저 - Redis와 In-Memory 캐싱 지원
 Redis가 없어도 In-Memory 캐시로 작동 (Graceful Degradation)
+
+Redis 값 직렬화는 utils.codec (버전 헤더 + orjson/msgpack, 헤더 없는 레거시 JSON도 읽음)
 """
 import asyncio
 import json
@@ -10,11 +12,13 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
+from .codec import decode, encode
+
 logger = logging.getLogger(__name__)
 
 
 class DecimalEncoder(json.JSONEncoder):
-    """Decimal 타입을 JSON으로 직렬화하는 커스텀 인코더"""
+    """Decimal 타입을 JSON으로 직렬화하는 커스텀 인코더 (레거시 포맷, 캐시는 utils.codec 사용)"""
     def default(self, obj):
         if isinstance(obj, Decimal):
             return float(obj)
@@ -156,11 +160,8 @@ class CacheManager:
             if self.use_redis and self.redis_client:
                 value = await self.redis_client.get(key)
                 if value:
-                    # JSON 역직렬화
-                    try:
-                        return json.loads(value)
-                    except json.JSONDecodeError:
-                        return value
+                    # 코덱 헤더로 역직렬화 (헤더 없으면 레거시 JSON, JSON도 아니면 원본 문자열)
+                    return decode(value)
                 return None
             else:
                 return await self.memory_cache.get(key)
@@ -172,13 +173,13 @@ class CacheManager:
         """캐시에 값 저장"""
         try:
             if self.use_redis and self.redis_client:
-                # JSON 직렬화 (DecimalEncoder 사용)
+                # 코덱 직렬화 (Decimal/datetime 포함), decode_responses=True라 JSON 본문
                 if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value, cls=DecimalEncoder)
+                    payload = encode(value)
                 else:
-                    value_str = str(value)
+                    payload = str(value)
 
-                await self.redis_client.setex(key, ttl, value_str)
+                await self.redis_client.setex(key, ttl, payload)
                 return True
             else:
                 return await self.memory_cache.set(key, value, ttl)
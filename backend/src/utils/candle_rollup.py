@@ -0,0 +1,187 @@
+"""
+Candle rollup engine
+
+1m 기준 캔들에서 상위 타임프레임(5m/15m/30m/1h/4h/1D) 캔들을 로컬에서 만듭니다.
+상위 타임프레임을 따로 받거나 pandas로 매번 리샘플하지 않고 numpy reduceat 한 번으로 집계합니다.
+
+- rollup_arrays: 컬럼 배열 -> 상위 타임프레임 컬럼 배열
+- rollup_candles: list[dict] (timestamp ms 또는 time 초) -> list[dict] (같은 단위 유지)
+- rollup_frame: DataFrame (DatetimeIndex / timestamp / time) -> 상위 타임프레임 DataFrame
+
+버킷은 UTC epoch 기준으로 정렬합니다 (거래소 캔들과 동일: 4h = 00/04/08.., 1D = 00:00 UTC).
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BASE_TIMEFRAME = "1m"
+ROLLUP_TIMEFRAMES = ("5m", "15m", "30m", "1h", "4h", "1D")
+
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+    "1D": 86400,
+}
+
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """'5m' -> 300 (지원하지 않는 타임프레임은 ValueError)"""
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}") from None
+
+
+def can_rollup(source_timeframe: str, target_timeframe: str) -> bool:
+    """source 캔들로 target 캔들을 만들 수 있는지 (배수 관계)"""
+    source = TIMEFRAME_SECONDS.get(source_timeframe)
+    target = TIMEFRAME_SECONDS.get(target_timeframe)
+    return bool(source and target and target > source and target % source == 0)
+
+
+def rollup_arrays(
+    times: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    interval: int,
+    drop_partial_head: bool = True,
+) -> Columns:
+    """
+    시간순 캔들 컬럼을 interval 버킷으로 집계
+
+    Args:
+        times: 캔들 시작 시각 (interval과 같은 단위)
+        interval: 상위 타임프레임 길이 (times와 같은 단위)
+        drop_partial_head: 첫 버킷이 중간부터 시작하면 제외
+
+    Returns:
+        (times, opens, highs, lows, closes, volumes)
+    """
+    times = np.asarray(times, dtype=np.int64)
+    if len(times) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return times, empty, empty, empty, empty, empty
+
+    buckets = times - times % interval
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(times)] - 1
+
+    result = (
+        buckets[starts],
+        np.asarray(opens, dtype=np.float64)[starts],
+        np.maximum.reduceat(np.asarray(highs, dtype=np.float64), starts),
+        np.minimum.reduceat(np.asarray(lows, dtype=np.float64), starts),
+        np.asarray(closes, dtype=np.float64)[ends],
+        np.add.reduceat(np.asarray(volumes, dtype=np.float64), starts),
+    )
+
+    if drop_partial_head and times[0] != buckets[0]:
+        result = tuple(column[1:] for column in result)
+    return result
+
+
+def rollup_candles(
+    candles: Sequence[dict],
+    timeframe: str,
+    drop_partial_head: bool = True,
+) -> List[Dict[str, float]]:
+    """
+    list[dict] 캔들 집계
+
+    'timestamp'(ms) 키가 있으면 ms, 없으면 'time'(초)을 사용하고 같은 키/단위로 반환합니다.
+    """
+    if not candles:
+        return []
+
+    time_key = "timestamp" if "timestamp" in candles[0] else "time"
+    interval = timeframe_seconds(timeframe) * (1000 if time_key == "timestamp" else 1)
+    count = len(candles)
+
+    def column(key: str, dtype=np.float64) -> np.ndarray:
+        return np.fromiter((c[key] for c in candles), dtype=dtype, count=count)
+
+    times = column(time_key, np.int64)
+    order = np.argsort(times, kind="stable")
+    columns = rollup_arrays(
+        times[order],
+        column("open")[order],
+        column("high")[order],
+        column("low")[order],
+        column("close")[order],
+        np.fromiter((c.get("volume", 0) or 0 for c in candles), dtype=np.float64, count=count)[order],
+        interval,
+        drop_partial_head=drop_partial_head,
+    )
+
+    t, o, h, l, c, v = (col.tolist() for col in columns)
+    return [
+        {time_key: t[i], "open": o[i], "high": h[i], "low": l[i], "close": c[i], "volume": v[i]}
+        for i in range(len(t))
+    ]
+
+
+def _frame_times_seconds(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """DataFrame의 캔들 시각 (초), 없으면 None"""
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df.index.to_numpy(dtype="datetime64[s]").astype(np.int64)
+    for key in ("timestamp", "time"):
+        if key not in df.columns:
+            continue
+        values = df[key]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values.to_numpy(dtype="datetime64[s]").astype(np.int64)
+        raw = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+        if np.isnan(raw).any():
+            return None
+        raw = raw.astype(np.int64)
+        return raw // 1000 if len(raw) and raw.max() > 10**12 else raw
+    return None
+
+
+def rollup_frame(df: pd.DataFrame, timeframe: str, drop_partial_head: bool = True) -> Optional[pd.DataFrame]:
+    """
+    OHLCV DataFrame 집계
+
+    Returns:
+        'timestamp'(datetime64, UTC naive) + OHLCV 컬럼 DataFrame
+        (시각/OHLCV 컬럼이 없으면 None)
+    """
+    required = ("open", "high", "low", "close", "volume")
+    if any(col not in df.columns for col in required):
+        return None
+
+    times = _frame_times_seconds(df)
+    if times is None:
+        return None
+
+    order = np.argsort(times, kind="stable")
+    t, o, h, l, c, v = rollup_arrays(
+        times[order],
+        *(df[col].to_numpy(dtype=np.float64)[order] for col in required),
+        interval=timeframe_seconds(timeframe),
+        drop_partial_head=drop_partial_head,
+    )
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(t, unit="s"),
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": v,
+    })
@@ -0,0 +1,203 @@
+"""
+페이로드 코덱 (Payload Codec)
+
+Redis에 저장/발행하는 내부 페이로드(시장 레짐, 대시보드 스냅샷, 계정/시세 API 캐시,
+AI 응답 캐시)의 직렬화 계층.
+
+- orjson (설치 시): JSON 호환 경로의 기본값. datetime/date/Enum은 네이티브, Decimal은 float
+- msgpack (설치 시): 바이너리 안전한 경로(decode_responses=False 클라이언트)에서만 사용
+- json (표준 라이브러리): 위 둘이 없을 때의 폴백, 기존 DecimalEncoder와 같은 결과
+
+와이어 포맷: MAGIC("\\x1e") + 코덱 ID 1글자 + 포맷 버전 1글자 + 본문
+
+    b"\\x1ej1{...}"   JSON 본문 (orjson / json 어느 쪽으로 만들었든 동일)
+    b"\\x1em1..."     msgpack 본문
+
+헤더가 없는 값은 레거시 JSON으로 읽는다. 롤아웃 순서:
+1) 이 버전을 전체 배포 (기본값 PAYLOAD_CODEC=legacy: 쓰기는 기존 포맷, 읽기만 새 포맷 지원)
+2) 모든 프로세스가 1)의 버전이 된 뒤 PAYLOAD_CODEC=auto 로 전환 (새 포맷 쓰기는 opt-in)
+구/신 버전 프로세스가 섞여 있어도 서로 쓴 값을 읽을 수 있다.
+
+모든 코덱이 Decimal → float, datetime/date → ISO 문자열로 같은 값을 돌려주므로
+코덱을 바꿔도 호출부가 받는 타입은 바뀌지 않는다.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+Payload = Union[str, bytes]
+
+MAGIC = "\x1e"  # ASCII record separator: JSON 텍스트나 일반 문자열의 첫 글자로 나오지 않음
+FORMAT_VERSION = "1"
+HEADER_SIZE = 3
+
+CODEC_NAMES = ("auto", "json", "msgpack", "legacy")
+# 기본은 레거시 쓰기 (새 포맷을 못 읽는 이전 버전과 공존 가능)
+PAYLOAD_CODEC = os.getenv("PAYLOAD_CODEC", "legacy").lower()
+
+
+class CodecError(ValueError):
+    """헤더는 있지만 해석할 수 없는 페이로드 (알 수 없는 코덱/버전, 손상된 본문)"""
+
+
+def _default(obj: Any) -> Any:
+    """orjson/json/msgpack이 모르는 타입 변환 (DecimalEncoder와 동일한 규칙)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class JsonCodec:
+    """JSON 본문 (orjson 우선, 없거나 orjson이 거부하면 표준 json)"""
+
+    name = "json"
+    codec_id = "j"
+    binary = False
+
+    def __init__(self):
+        self.header = f"{MAGIC}{self.codec_id}{FORMAT_VERSION}".encode()
+
+    def dumps(self, obj: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # 64비트 초과 정수 등 orjson 미지원 값 → 표준 json
+        return json.dumps(obj, default=_default).encode()
+
+    def loads(self, body: Payload) -> Any:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(body)
+        return json.loads(body)
+
+
+class MsgpackCodec:
+    """msgpack 본문 (바이너리 안전한 클라이언트 전용)"""
+
+    name = "msgpack"
+    codec_id = "m"
+    binary = True
+
+    def __init__(self):
+        self.header = f"{MAGIC}{self.codec_id}{FORMAT_VERSION}".encode()
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+    def loads(self, body: Payload) -> Any:
+        if isinstance(body, str):
+            raise CodecError("msgpack payload was decoded as text (decode_responses=True client)")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+_JSON = JsonCodec()
+_MSGPACK = MsgpackCodec() if MSGPACK_AVAILABLE else None
+
+_BY_HEADER: Dict[str, Any] = {f"{MAGIC}j{FORMAT_VERSION}": _JSON}
+if _MSGPACK is not None:
+    _BY_HEADER[f"{MAGIC}m{FORMAT_VERSION}"] = _MSGPACK
+
+
+def select_codec(codec: Optional[str] = None, binary_safe: bool = False):
+    """
+    쓰기에 사용할 코덱 선택
+
+    Args:
+        codec: auto | json | msgpack | legacy (None이면 PAYLOAD_CODEC 환경변수)
+        binary_safe: 읽는 쪽이 bytes를 그대로 받는 경로인지 여부
+
+    Returns:
+        코덱 인스턴스, legacy면 None (헤더 없이 JSON)
+    """
+    codec = (codec or PAYLOAD_CODEC).lower()
+    if codec not in CODEC_NAMES:
+        raise ValueError(f"Unknown payload codec '{codec}' (expected one of {CODEC_NAMES})")
+    if codec == "legacy":
+        return None
+    if codec in ("auto", "msgpack") and binary_safe and _MSGPACK is not None:
+        return _MSGPACK
+    return _JSON
+
+
+def encode(obj: Any, *, binary_safe: bool = False, codec: Optional[str] = None) -> bytes:
+    """
+    헤더 + 본문으로 직렬화
+
+    Args:
+        obj: 직렬화할 값
+        binary_safe: True면 msgpack 사용 가능 (decode_responses=False 클라이언트)
+        codec: 코덱 이름 강제 (기본: PAYLOAD_CODEC)
+    """
+    impl = select_codec(codec, binary_safe)
+    if impl is None:
+        return _JSON.dumps(obj)
+    return impl.header + impl.dumps(obj)
+
+
+def encode_json(obj: Any) -> bytes:
+    """헤더 없는 JSON (Pub/Sub처럼 외부 소비자가 JSON을 기대하는 경로)"""
+    return _JSON.dumps(obj)
+
+
+def decode(data: Payload, strict: bool = False) -> Any:
+    """
+    헤더를 보고 코덱을 골라 역직렬화, 헤더가 없으면 레거시 JSON
+
+    Args:
+        data: Redis에서 읽은 값 (str 또는 bytes)
+        strict: False면 JSON이 아닌 레거시 값을 원본 그대로 반환 (기존 json.loads 폴백과 동일),
+                True면 ValueError
+
+    Raises:
+        CodecError: 헤더가 있지만 지원하지 않는 코덱/버전이거나 본문이 손상됨
+    """
+    prefix = data[:HEADER_SIZE]
+    if isinstance(prefix, bytes):
+        prefix = prefix.decode("latin-1")
+
+    if prefix[:1] == MAGIC:
+        impl = _BY_HEADER.get(prefix)
+        if impl is None:
+            raise CodecError(f"Unsupported payload header {prefix!r}")
+        try:
+            return impl.loads(data[HEADER_SIZE:])
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt {impl.name} payload: {e}") from e
+
+    try:
+        return _JSON.loads(data)
+    except ValueError:
+        if strict:
+            raise
+        return data
+
+
+def codec_info() -> Dict[str, Any]:
+    """현재 코덱 설정 (진단용)"""
+    return {
+        "configured": PAYLOAD_CODEC,
+        "json_backend": "orjson" if ORJSON_AVAILABLE else "json",
+        "msgpack_available": MSGPACK_AVAILABLE,
+        "format_version": FORMAT_VERSION,
+    }
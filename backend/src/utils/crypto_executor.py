@@ -0,0 +1,103 @@
+"""
+인증 암호 연산 전용 워커 풀
+
+bcrypt 해싱/검증(수백 ms CPU), TOTP QR 생성, Fernet 일괄 복호화 같은
+CPU 작업을 이벤트 루프 밖의 전용 스레드에서 실행합니다.
+(bcrypt/cryptography는 연산 중 GIL을 해제하므로 스레드로 충분)
+
+- 워커 수 제한: 로그인 폭주 시에도 봇 루프/WebSocket이 쓸 CPU를 남김
+- 대기열 제한: 실행 중 + 대기 작업이 한도를 넘으면 즉시 503 (ServiceBusyError)
+  -> 무한 대기열로 모든 요청이 타임아웃되는 대신 일부만 빠르게 거절
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .exceptions import ServiceBusyError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+AUTH_CRYPTO_WORKERS = int(os.getenv("AUTH_CRYPTO_WORKERS", str(min(4, os.cpu_count() or 1))))
+AUTH_CRYPTO_MAX_QUEUE = int(os.getenv("AUTH_CRYPTO_MAX_QUEUE", "32"))
+
+
+class CryptoExecutor:
+    """
+    대기열 한도가 있는 암호 연산 실행기
+
+    사용법:
+    ```python
+    ok = await auth_crypto.run(pwd_context.verify, password, password_hash)
+    ```
+    """
+
+    def __init__(self, max_workers: int = AUTH_CRYPTO_WORKERS, max_queue: int = AUTH_CRYPTO_MAX_QUEUE):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight = 0
+
+        self.stats = {
+            "completed": 0,
+            "rejected": 0,
+            "peak_inflight": 0,
+        }
+
+    @property
+    def capacity(self) -> int:
+        """동시에 받을 수 있는 최대 작업 수 (실행 + 대기)"""
+        return self.max_workers + self.max_queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="auth-crypto"
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        워커 스레드에서 fn 실행
+
+        Raises:
+            ServiceBusyError: 대기열이 가득 찬 경우 (503)
+        """
+        if self._inflight >= self.capacity:
+            self.stats["rejected"] += 1
+            logger.warning(
+                f"Auth crypto pool saturated ({self._inflight}/{self.capacity}), rejecting request"
+            )
+            raise ServiceBusyError("Authentication service")
+
+        self._inflight += 1
+        self.stats["peak_inflight"] = max(self.stats["peak_inflight"], self._inflight)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), partial(fn, *args, **kwargs))
+            self.stats["completed"] += 1
+            return result
+        finally:
+            self._inflight -= 1
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "inflight": self._inflight,
+            **self.stats,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+auth_crypto = CryptoExecutor()
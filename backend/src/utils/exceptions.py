@@ -196,6 +196,18 @@ class RateLimitExceededError(AppException):
         )
 
 
+class ServiceBusyError(AppException):
+    """서버 작업 큐 포화 (503)"""
+
+    def __init__(self, resource: str, retry_after: int = 1):
+        super().__init__(
+            message=f"{resource} is busy, please retry shortly",
+            status_code=503,
+            error_code="SERVICE_BUSY",
+            details={"resource": resource, "retry_after": retry_after},
+        )
+
+
 class ResourceLimitExceededError(AppException):
     """리소스 제한 초과 (429)"""
 
@@ -13,6 +13,7 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from ..config import settings
+from .crypto_executor import auth_crypto
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -46,6 +47,16 @@ class JWTAuth:
         """비밀번호 해싱"""
         return pwd_context.hash(password)
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (인증 워커 풀에서 실행, 포화 시 ServiceBusyError)"""
+        return await auth_crypto.run(pwd_context.verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """비밀번호 해싱 (인증 워커 풀에서 실행, 포화 시 ServiceBusyError)"""
+        return await auth_crypto.run(pwd_context.hash, password)
+
     @staticmethod
     def create_access_token(
         data: dict, expires_delta: Optional[timedelta] = None
@@ -0,0 +1,441 @@
+"""
+Prometheus 메트릭 (핫패스 지연 계측)
+
+/metrics 엔드포인트(text exposition format 0.0.4)로 노출하는 경량 메트릭 모듈.
+prometheus_client 의존성 없이 Histogram / Gauge / Counter 만 구현.
+
+계측 항목:
+- event_loop_lag_seconds: 이벤트 루프 지연 (sleep 초과 시간)
+- bot_tick_to_decision_seconds / bot_decision_to_order_seconds: 봇별 틱→판단, 판단→주문
+- agent_queue_wait_seconds / agent_service_seconds: 에이전트 큐 대기 / 처리 시간
+- exchange_request_seconds: 거래소 REST 지연 (exchange, endpoint, status)
+- db_query_seconds: DB 쿼리 시간 (statement 이름)
+- websocket_send_queue_depth / websocket_send_wait_seconds: WS 전송 대기열
+
+핫패스 원칙:
+- labels()는 자식 메트릭을 캐시, 호출부는 루프/인스턴스 시작 시 한 번 바인딩해서 재사용
+- observe()는 bisect + 정수 증가뿐 (락 없음, 이벤트 루프 스레드에서 호출)
+- 렌더링(문자열 생성)은 스크레이프 시에만
+
+사용 예시:
+    tick_child = bot_tick_to_decision_seconds.labels(str(bot_id))
+    tick_child.observe(time.perf_counter() - tick_at)
+"""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 지연 버킷 (1ms ~ 10s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 이벤트 루프 지연은 더 촘촘하게
+LOOP_LAG_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# 대기열 길이
+DEPTH_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """메트릭 모음 + 텍스트 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, "_Metric"] = {}
+
+    def register(self, metric: "_Metric"):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional["_Metric"]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[MetricsRegistry] = REGISTRY,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+        if registry is not None:
+            registry.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        """라벨 값에 해당하는 자식 (없으면 생성 후 캐시)"""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def remove(self, *values):
+        """라벨 세트 제거 (봇 종료 등으로 더 안 쓰는 시리즈)"""
+        self._children.pop(tuple(str(v) for v in values), None)
+
+    def _label_str(self, key: Tuple[str, ...], extra: Iterable[Tuple[str, str]] = ()) -> str:
+        pairs = [*zip(self.labelnames, key), *extra]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for key, child in list(self._children.items()):
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key, child) -> List[str]:
+        raise NotImplementedError
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "_counts", "_sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._upper_bounds = upper_bounds
+        # 버킷별(누적 아님) 개수, 마지막은 +Inf
+        self._counts = [0] * (len(upper_bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._upper_bounds, value)] += 1
+        self._sum += value
+
+    def time(self) -> "_Timer":
+        return _Timer(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+
+class _Timer:
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child: _HistogramChild):
+        self._child = child
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._child.observe(time.perf_counter() - self._start)
+        return False
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry: Optional[MetricsRegistry] = REGISTRY,
+    ):
+        self.upper_bounds = tuple(sorted(float(b) for b in buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.upper_bounds)
+
+    def labels(self, *values) -> _HistogramChild:
+        return super().labels(*values)
+
+    def observe(self, value: float):
+        self._children[()].observe(value)
+
+    def time(self) -> _Timer:
+        return self._children[()].time()
+
+    def _render_child(self, key, child: _HistogramChild) -> List[str]:
+        lines = []
+        cumulative = 0
+        bounds = (*self.upper_bounds, math.inf)
+        for bound, count in zip(bounds, list(child._counts)):
+            cumulative += count
+            labels = self._label_str(key, [("le", _format_value(bound))])
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = self._label_str(key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child._sum)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _ValueChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def labels(self, *values) -> _ValueChild:
+        return super().labels(*values)
+
+    def inc(self, amount: float = 1.0):
+        self._children[()].inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._children[()].dec(amount)
+
+    def set(self, value: float):
+        self._children[()].set(value)
+
+    def _render_child(self, key, child: _ValueChild) -> List[str]:
+        return [f"{self.name}{self._label_str(key)} {_format_value(child.value)}"]
+
+
+class Counter(Gauge):
+    type_name = "counter"
+
+    def dec(self, amount: float = 1.0):
+        raise ValueError("Counters can only increase")
+
+    def set(self, value: float):
+        raise ValueError("Counters can only increase")
+
+
+# ============================================================
+# 메트릭 정의
+# ============================================================
+
+event_loop_lag_seconds = Histogram(
+    "event_loop_lag_seconds",
+    "Event loop scheduling lag (sleep overshoot)",
+    buckets=LOOP_LAG_BUCKETS,
+)
+bot_tick_to_decision_seconds = Histogram(
+    "bot_tick_to_decision_seconds",
+    "Time from market tick dequeue to strategy decision per bot",
+    ["bot_id"],
+)
+bot_decision_to_order_seconds = Histogram(
+    "bot_decision_to_order_seconds",
+    "Time from strategy decision to exchange order acknowledgement per bot",
+    ["bot_id"],
+)
+agent_queue_wait_seconds = Histogram(
+    "agent_queue_wait_seconds",
+    "Time an agent task waits in the agent queue",
+    ["agent"],
+)
+agent_service_seconds = Histogram(
+    "agent_service_seconds",
+    "Agent task processing time",
+    ["agent"],
+)
+exchange_request_seconds = Histogram(
+    "exchange_request_seconds",
+    "Exchange REST request latency",
+    ["exchange", "endpoint", "status"],
+)
+db_query_seconds = Histogram(
+    "db_query_seconds",
+    "Database statement execution time",
+    ["statement"],
+)
+websocket_send_queue_depth = Gauge(
+    "websocket_send_queue_depth",
+    "WebSocket broadcasts waiting for or holding the send lock",
+)
+websocket_send_queue_depth_observed = Histogram(
+    "websocket_send_queue_depth_observed",
+    "WebSocket broadcasts ahead of each new broadcast in the send queue",
+    buckets=DEPTH_BUCKETS,
+)
+websocket_send_wait_seconds = Histogram(
+    "websocket_send_wait_seconds",
+    "Time a WebSocket message waits for the send lock",
+)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+# ============================================================
+# 이벤트 루프 지연 모니터
+# ============================================================
+
+
+class EventLoopLagMonitor:
+    """
+    interval마다 sleep 후 실제로 깨어난 시각과의 차이를 기록
+
+    블로킹 호출(동기 I/O, 무거운 CPU 작업)이 루프를 잡고 있으면 값이 커진다.
+    """
+
+    def __init__(self, interval: float = 0.25, histogram: Histogram = event_loop_lag_seconds):
+        self.interval = interval
+        self.histogram = histogram
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.histogram.observe(max(0.0, loop.time() - expected))
+
+
+loop_lag_monitor = EventLoopLagMonitor()
+
+
+# ============================================================
+# DB 쿼리 계측 (SQLAlchemy 이벤트)
+# ============================================================
+
+_FROM = re.compile(r"\bFROM\s+[\"`]?(\w+)", re.IGNORECASE)
+_STATEMENT_TABLE = {
+    "select": _FROM,
+    "delete": _FROM,
+    "insert": re.compile(r"\bINTO\s+[\"`]?(\w+)", re.IGNORECASE),
+    "update": re.compile(r"^\s*UPDATE\s+[\"`]?(\w+)", re.IGNORECASE),
+}
+_MAX_STATEMENT_NAMES = 1000
+_statement_names: Dict[str, str] = {}
+
+
+def statement_name(statement: str) -> str:
+    """SQL → 'select_trades' 같은 저카디널리티 이름 (SQLAlchemy가 같은 문자열을 재사용하므로 캐시)"""
+    name = _statement_names.get(statement)
+    if name is not None:
+        return name
+
+    head = statement.lstrip()[:16].lower().split(None, 1)
+    verb = head[0] if head else "unknown"
+    pattern = _STATEMENT_TABLE.get(verb)
+    if pattern is None:
+        name = verb if verb.isalpha() else "other"
+    else:
+        match = pattern.search(statement)
+        name = f"{verb}_{match.group(1).lower()}" if match else verb
+
+    if len(_statement_names) < _MAX_STATEMENT_NAMES:
+        _statement_names[statement] = name
+    return name
+
+
+_statement_children: Dict[str, _HistogramChild] = {}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    name = context.execution_options.get("statement_name") if context is not None else None
+    name = name or statement_name(statement)
+    child = _statement_children.get(name)
+    if child is None:
+        child = _statement_children[name] = db_query_seconds.labels(name)
+    child.observe(elapsed)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine) -> None:
+    """
+    AsyncEngine/Engine의 모든 쿼리 시간을 db_query_seconds에 기록
+
+    이름은 execution_options(statement_name="...")가 있으면 그것을, 없으면 SQL에서 추출.
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,173 @@
+"""
+Keyset (cursor) 페이지네이션 유틸리티
+
+(created_at, id) 내림차순 정렬 기준의 커서 페이지네이션.
+OFFSET 없이 인덱스 범위 스캔만으로 다음 페이지를 조회하므로
+페이지 깊이와 무관하게 일정한 비용으로 동작합니다.
+
+커서 형식: base64url("<created_at ISO8601>|<id>")
+"""
+import base64
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from .exceptions import InvalidParameterError
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id)를 불투명 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열 디코딩
+
+    Raises:
+        InvalidParameterError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeError) as e:
+        raise InvalidParameterError("cursor", "malformed pagination cursor") from e
+
+
+def apply_keyset(stmt, created_col, id_col, cursor: Optional[str]):
+    """
+    (created_at, id) 내림차순 정렬과 커서 조건 적용
+
+    Args:
+        stmt: select 문
+        created_col: 정렬 기준 시각 컬럼
+        id_col: 동률 해소용 PK 컬럼
+        cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                created_col < created_at,
+                and_(created_col == created_at, id_col < row_id),
+            )
+        )
+    return stmt.order_by(created_col.desc(), id_col.desc())
+
+
+def paginate_rows(
+    rows: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], Tuple[datetime, int]],
+) -> Tuple[Sequence[Any], Optional[str]]:
+    """
+    limit + 1 건 조회 결과를 페이지와 next_cursor로 분리
+
+    Args:
+        rows: limit + 1 건까지 조회한 행
+        limit: 페이지 크기
+        key: 행 -> (created_at, id)
+
+    Returns:
+        (페이지 행, 다음 페이지 커서 또는 None)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    created_at, row_id = key(page[-1])
+    if created_at is None:
+        return page, None
+    return page, encode_cursor(created_at, row_id)
+
+
+def _json_default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def stream_ndjson(
+    session_factory,
+    stmt,
+    serialize: Callable[[Any], dict],
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    서버 사이드 커서로 조회 결과를 NDJSON으로 스트리밍
+
+    응답 스트리밍 중에도 유효한 자체 세션을 사용합니다
+    (요청 의존성 세션은 응답 전송 전에 닫힘).
+
+    Args:
+        session_factory: AsyncSession 팩토리
+        stmt: select 문 (Core 컬럼 select 권장)
+        serialize: 행 -> dict
+        batch_size: 커서 fetch 단위
+    """
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            chunk = "".join(
+                json.dumps(serialize(row), default=_json_default, ensure_ascii=False) + "\n"
+                for row in partition
+            )
+            yield chunk.encode("utf-8")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def stream_csv(
+    session_factory,
+    stmt,
+    serialize: Callable[[Any], dict],
+    fieldnames: List[str],
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    서버 사이드 커서로 조회 결과를 CSV로 스트리밍
+
+    stream_ndjson과 같은 방식 (자체 세션, yield_per 배치)으로
+    헤더 한 줄 후 fetch 단위마다 CSV 청크를 내보냅니다.
+
+    Args:
+        session_factory: AsyncSession 팩토리
+        stmt: select 문 (Core 컬럼 select 권장)
+        serialize: 행 -> dict (fieldnames 키 사용)
+        fieldnames: CSV 헤더 순서
+        batch_size: 커서 fetch 단위
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fieldnames)
+    yield buffer.getvalue().encode("utf-8")
+
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            buffer.seek(0)
+            buffer.truncate()
+            for row in partition:
+                record = serialize(row)
+                writer.writerow([_csv_value(record.get(name)) for name in fieldnames])
+            yield buffer.getvalue().encode("utf-8")
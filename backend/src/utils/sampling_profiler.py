@@ -0,0 +1,368 @@
+"""
+인프로세스 샘플링 프로파일러 (운영 핫패스 분석)
+
+재배포 없이 bot_runner / FeaturePipeline / 미들웨어에서 CPU가 어디에 쓰이는지 보기 위한 도구.
+관리자 API(api/admin_diagnostics.py)에서 N초 동안만 실행합니다.
+분산 모드에서 봇을 실행하는 워커 프로세스는 worker_id를 주면 BotScheduler가 명령으로 받아 실행합니다.
+
+- 샘플러 스레드가 interval마다 sys._current_frames()로 모든 스레드 스택을 수집
+  → collapsed stack 형식 ("thread;outer;...;inner count", flamegraph.pl / speedscope 호환)
+- 샘플링에 쓴 시간이 max_overhead 비율을 넘으면 간격을 2배로 늘림 (오버헤드 상한)
+- 세션 동안 loop.call_soon을 감싸 태스크별 마지막 wakeup 시각 기록
+  (call_soon을 바꿀 수 없는 루프(uvloop 등)는 샘플 시점에 실행 중인 태스크로 근사)
+- 동시에 한 세션만 (ProfilerBusyError)
+
+사용 예시:
+    result = await run_profile(seconds=10)
+    open("profile.folded", "w").write(result.collapsed())
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.01  # 100Hz
+MAX_INTERVAL = 0.1
+MAX_DURATION = 60.0
+MAX_DEPTH = 128
+MAX_STACKS = 20_000  # 고유 스택 수 상한 (메모리 제한)
+MAX_OVERHEAD = 0.05  # 샘플링 시간 / 경과 시간
+TRUNCATED_STACK = "[truncated]"
+
+_SRC_MARKER = os.sep + "src" + os.sep
+_SITE_MARKER = "site-packages" + os.sep
+
+
+class ProfilerBusyError(RuntimeError):
+    """이미 프로파일링 세션이 실행 중"""
+
+
+def _short_path(filename: str) -> str:
+    """src/... 또는 site-packages 이후 경로만 (라벨 길이 축소)"""
+    index = filename.rfind(_SRC_MARKER)
+    if index >= 0:
+        return filename[index + 1:]
+    index = filename.rfind(_SITE_MARKER)
+    if index >= 0:
+        return filename[index + len(_SITE_MARKER):]
+    return os.path.basename(filename)
+
+
+def _location(frame) -> str:
+    return f"{_short_path(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+# ============================================================
+# 태스크 wakeup 추적
+# ============================================================
+
+
+class TaskWakeupTracker:
+    """세션 동안 태스크별 마지막 wakeup(monotonic) 시각 기록"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.last_wakeup: Dict[asyncio.Task, float] = {}
+        self.source = "sampled"
+        self._installed = False
+
+    def install(self):
+        original = self.loop.call_soon
+        last_wakeup = self.last_wakeup
+
+        def call_soon(callback, *args, context=None):
+            # Task의 __step / __wakeup 콜백은 __self__가 태스크
+            task = getattr(callback, "__self__", None)
+            if isinstance(task, asyncio.Task):
+                last_wakeup[task] = time.monotonic()
+            return original(callback, *args, context=context)
+
+        try:
+            self.loop.call_soon = call_soon
+        except AttributeError:
+            logger.debug("Event loop does not allow call_soon hook; wakeups are sampled")
+            return
+        self._installed = True
+        self.source = "call_soon"
+
+    def uninstall(self):
+        if self._installed:
+            del self.loop.call_soon
+            self._installed = False
+
+    def observe_running(self, now: float):
+        """샘플러 스레드에서 호출: 지금 실행 중인 태스크를 wakeup으로 기록"""
+        task = asyncio.current_task(self.loop)
+        if task is not None:
+            self.last_wakeup[task] = now
+
+
+def _coroutine_chain(coro) -> List[Any]:
+    """태스크 코루틴 → await 중인 가장 안쪽 객체까지"""
+    chain = []
+    while coro is not None and len(chain) < 64:
+        chain.append(coro)
+        coro = (
+            getattr(coro, "cr_await", None)
+            or getattr(coro, "ag_await", None)
+            or getattr(coro, "gi_yieldfrom", None)
+        )
+    return chain
+
+
+def _frame_of(coro):
+    return getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+
+
+def dump_tasks(
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    tracker: Optional[TaskWakeupTracker] = None,
+    limit: int = 200,
+) -> List[Dict[str, Any]]:
+    """
+    asyncio 태스크 덤프 (루프 스레드에서 호출)
+
+    since_wakeup_in_session: tracker(프로파일링 세션)가 있을 때만 포함. 마지막 wakeup 이후 초,
+    세션 중 한 번도 깨지 않았으면 None (세션 시간 이상 대기 중이라는 뜻).
+    세션 밖에서는 wakeup을 추적하지 않으므로 필드 자체가 없음.
+    """
+    loop = loop or asyncio.get_running_loop()
+    now = time.monotonic()
+    current = asyncio.current_task(loop)
+    entries = []
+
+    for task in asyncio.all_tasks(loop):
+        chain = _coroutine_chain(task.get_coro())
+        # 프레임이 있는 가장 안쪽 코루틴 = 지금 멈춰 있는 위치
+        innermost, frame = None, None
+        for coro in reversed(chain):
+            frame = _frame_of(coro)
+            if frame is not None:
+                innermost = coro
+                break
+        # Task가 기다리는 Future (C 구현의 FutureIter 대신 실제 Future)
+        awaiting = getattr(task, "_fut_waiter", None)
+        if awaiting is None and chain and chain[-1] is not innermost:
+            awaiting = chain[-1]
+
+        entry: Dict[str, Any] = {
+            "name": task.get_name(),
+            "coroutine": getattr(chain[0], "__qualname__", type(chain[0]).__name__) if chain else None,
+            "current": getattr(innermost, "__qualname__", None),
+            "location": _location(frame) if frame is not None else None,
+            "awaiting": type(awaiting).__name__ if awaiting is not None else None,
+            "state": "running" if task is current else "pending",
+        }
+        if tracker is not None:
+            woke = tracker.last_wakeup.get(task)
+            entry["since_wakeup_in_session"] = round(now - woke, 6) if woke is not None else None
+        entries.append(entry)
+
+    if tracker is not None:
+        # 오래 안 깬 태스크가 위로 (세션 중 한 번도 안 깬 태스크가 가장 위)
+        entries.sort(key=lambda e: (
+            e["since_wakeup_in_session"] is not None, -(e["since_wakeup_in_session"] or 0.0)
+        ))
+    return entries[:limit]
+
+
+# ============================================================
+# 샘플링 프로파일러
+# ============================================================
+
+
+@dataclass
+class ProfileResult:
+    """프로파일 결과 (collapsed stack + 태스크 덤프)"""
+
+    duration: float
+    samples: int
+    interval: float
+    overhead: float
+    stacks: Dict[str, int]
+    truncated: int = 0
+    tasks: List[Dict[str, Any]] = field(default_factory=list)
+    wakeup_source: str = "sampled"
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 입력 형식"""
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items(), key=lambda kv: -kv[1])]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def top_functions(self, limit: int = 30) -> List[Dict[str, Any]]:
+        """스택 맨 안쪽 프레임 기준 self 샘플 상위"""
+        leaf = Counter()
+        for stack, count in self.stacks.items():
+            leaf[stack.rsplit(";", 1)[-1]] += count
+        total = sum(leaf.values()) or 1
+        return [
+            {"frame": frame, "samples": count, "percent": round(100.0 * count / total, 2)}
+            for frame, count in leaf.most_common(limit)
+        ]
+
+    def to_dict(self, top: int = 30) -> Dict[str, Any]:
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "samples": self.samples,
+            "interval_seconds": self.interval,
+            "overhead": round(self.overhead, 4),
+            "unique_stacks": len(self.stacks),
+            "truncated_samples": self.truncated,
+            "top_functions": self.top_functions(top),
+            "collapsed": self.collapsed(),
+            "wakeup_source": self.wakeup_source,
+            "tasks": self.tasks,
+        }
+
+
+class SamplingProfiler:
+    """
+    스레드 기반 스택 샘플러
+
+    사용 예시:
+        profiler = SamplingProfiler(interval=0.01)
+        profiler.start()
+        ...
+        result = profiler.stop()
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        max_depth: int = MAX_DEPTH,
+        max_stacks: int = MAX_STACKS,
+        max_overhead: float = MAX_OVERHEAD,
+        tracker: Optional[TaskWakeupTracker] = None,
+    ):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self.max_overhead = max_overhead
+        self.tracker = tracker
+        self._stacks: Counter = Counter()
+        self._labels: Dict[Any, str] = {}
+        self._samples = 0
+        self._truncated = 0
+        self._sampling_time = 0.0
+        self._avg_cost = 0.0
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+    def _sample_once(self):
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(self._label(frame.f_code))
+                frame = frame.f_back
+            labels.append(names.get(thread_id, f"thread-{thread_id}").replace(";", ","))
+            stack = ";".join(reversed(labels))
+            if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                self._stacks[stack] += 1
+            else:
+                self._stacks[TRUNCATED_STACK] += 1
+                self._truncated += 1
+        self._samples += 1
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            self._sample_once()
+            if self.tracker is not None:
+                self.tracker.observe_running(time.monotonic())
+            cost = time.perf_counter() - started
+            self._sampling_time += cost
+            self._avg_cost = cost if not self._avg_cost else 0.9 * self._avg_cost + 0.1 * cost
+
+            # 오버헤드 상한: 샘플 1회 비용(이동평균)이 간격의 max_overhead를 넘으면 간격을 늘림
+            if (
+                self._samples >= 10
+                and self._avg_cost > self.max_overhead * self.interval
+                and self.interval < MAX_INTERVAL
+            ):
+                self.interval = min(self.interval * 2, MAX_INTERVAL)
+                logger.info(f"Sampling profiler overhead high, interval -> {self.interval * 1000:.0f}ms")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> ProfileResult:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        duration = time.perf_counter() - self._started
+        return ProfileResult(
+            duration=duration,
+            samples=self._samples,
+            interval=self.interval,
+            overhead=self._sampling_time / duration if duration > 0 else 0.0,
+            stacks=dict(self._stacks),
+            truncated=self._truncated,
+        )
+
+
+_active = False
+
+
+def is_profiling() -> bool:
+    return _active
+
+
+async def run_profile(
+    seconds: float,
+    interval: float = DEFAULT_INTERVAL,
+    task_limit: int = 200,
+) -> ProfileResult:
+    """
+    seconds 동안 샘플링 후 결과 + 세션 종료 시점 태스크 덤프
+
+    Raises:
+        ProfilerBusyError: 다른 세션이 실행 중
+    """
+    global _active
+    if _active:
+        raise ProfilerBusyError("A profiling session is already running")
+    _active = True
+
+    loop = asyncio.get_running_loop()
+    tracker = TaskWakeupTracker(loop)
+    profiler = SamplingProfiler(interval=max(interval, 0.001), tracker=tracker)
+    try:
+        tracker.install()
+        profiler.start()
+        await asyncio.sleep(min(max(seconds, 0.0), MAX_DURATION))
+    finally:
+        result = profiler.stop()
+        tracker.uninstall()
+        _active = False
+
+    result.tasks = dump_tasks(loop, tracker, limit=task_limit)
+    result.wakeup_source = tracker.source
+    logger.info(
+        f"🔬 Profile finished: {result.samples} samples in {result.duration:.1f}s, "
+        f"overhead {result.overhead * 100:.2f}%, {len(result.stacks)} unique stacks"
+    )
+    return result
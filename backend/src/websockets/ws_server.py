@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Set
@@ -9,6 +11,11 @@ from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
 from ..database.db import AsyncSessionLocal
 from ..services.exchange_service import ExchangeService
 from ..utils.jwt_auth import JWTAuth
+from ..utils.metrics import (
+    websocket_send_queue_depth,
+    websocket_send_queue_depth_observed,
+    websocket_send_wait_seconds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,7 @@ class ConnectionState:
 # 연결된 WebSocket 관리 (개선됨)
 connections: Dict[int, List[ConnectionState]] = {}
 send_lock = asyncio.Lock()
+_pending_sends = 0  # send_lock 대기 + 전송 중인 브로드캐스트 수 (/metrics)
 
 # 구독 관리
 subscriptions: Dict[int, Set[str]] = {}  # user_id -> {channels}
@@ -51,6 +59,23 @@ async def broadcast_to_all(data: dict):
     return await WebSocketManager.broadcast_to_all(data)
 
 
+@asynccontextmanager
+async def _send_slot():
+    """send_lock 획득 (전송 대기열 깊이 / 대기 시간 계측)"""
+    global _pending_sends
+    websocket_send_queue_depth_observed.observe(_pending_sends)
+    _pending_sends += 1
+    websocket_send_queue_depth.set(_pending_sends)
+    queued_at = time.perf_counter()
+    try:
+        async with send_lock:
+            websocket_send_wait_seconds.observe(time.perf_counter() - queued_at)
+            yield
+    finally:
+        _pending_sends -= 1
+        websocket_send_queue_depth.set(_pending_sends)
+
+
 async def connection_health_monitor():
     """
     주기적으로 연결 상태를 체크하고 죽은 연결을 제거
@@ -111,7 +136,7 @@ class WebSocketManager:
     @staticmethod
     async def broadcast_to_user(user_id: int, data: dict):
         """특정 사용자에게 메시지 전송 (에러 처리 강화)"""
-        async with send_lock:
+        async with _send_slot():
             conn_states = connections.get(user_id, [])
             for conn_state in conn_states[:]:  # 복사본으로 순회
                 if not conn_state.is_alive:
@@ -134,7 +159,7 @@ class WebSocketManager:
     @staticmethod
     async def broadcast_to_all(data: dict):
         """모든 연결된 사용자에게 메시지 전송 (에러 처리 강화)"""
-        async with send_lock:
+        async with _send_slot():
             for user_id, conn_states in list(connections.items()):
                 for conn_state in conn_states[:]:  # 복사본으로 순회
                     if not conn_state.is_alive:
@@ -0,0 +1,89 @@
+"""
+봇 워커 프로세스 (Bot Worker)
+
+분산 모드(BOT_SCHEDULER_MODE=distributed)에서 봇 인스턴스를 실행하는 프로세스.
+여러 개를 띄우면 BotScheduler가 Redis 리스로 봇을 나눠 가진다.
+
+    python -m src.workers.bot_worker --worker-id worker-1
+
+워커마다 자체 가격 수집기와 BotRunner를 가지므로 프로세스 간 공유 상태는 Redis를 거친다.
+- 봇 소유권: Redis 리스 (BotScheduler)
+- 성과 롤업: 커밋된 거래/자산의 변경 일자를 rollup:dirty 집합에 올리면 API 프로세스가 재집계
+- 감성: 전략이 등록한 심볼은 이 프로세스의 갱신 루프가 게시 (공유 캐시에 신선한 스냅샷이 있으면 재사용)
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from ..config import SchedulerConfig
+from ..database.db import AsyncSessionLocal, engine
+from ..services.bot_runner import BotRunner
+from ..services.grid_bot_runner import get_grid_bot_runner
+from .scheduler import BotScheduler, create_lease_backend, default_worker_id
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(worker_id: str, lease_ttl: float):
+    from ..services.bitget_rest import close_all_rest_clients
+    from ..services.ccxt_price_collector import ccxt_price_collector
+    from ..services.performance_rollup import rollup_publisher_loop
+    from ..services.sentiment_refresher import sentiment_refresh_loop
+    from ..services.write_behind import write_behind
+    from ..utils.redis_client import get_redis_client
+
+    market_queue: asyncio.Queue = asyncio.Queue()
+    collector = asyncio.create_task(ccxt_price_collector(market_queue))
+    write_behind.start()
+
+    runner = BotRunner(market_queue)
+    scheduler = BotScheduler(
+        runner,
+        AsyncSessionLocal,
+        await create_lease_backend(),
+        worker_id=worker_id,
+        lease_ttl=lease_ttl,
+    )
+    # 그리드 봇도 같은 리스 / 펜싱 확인
+    grid_runner = get_grid_bot_runner(market_queue)
+    grid_runner.lease_guard = scheduler.holds
+    grid_runner.fence_guard = scheduler.fence
+    # create_lease_backend가 연결을 확인한 클라이언트 재사용
+    rollup_publisher = asyncio.create_task(rollup_publisher_loop(await get_redis_client()))
+    # 전략은 get_sentiment_snapshot()으로 이 프로세스 메모리만 조회
+    sentiment_refresher = asyncio.create_task(sentiment_refresh_loop())
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass  # Windows
+
+    scheduler.start()
+    logger.info(f"🤖 Bot worker {worker_id} running")
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info(f"🛑 Bot worker {worker_id} shutting down")
+        await scheduler.stop()
+        collector.cancel()
+        sentiment_refresher.cancel()
+        await write_behind.close()
+        rollup_publisher.cancel()
+        await asyncio.gather(rollup_publisher, return_exceptions=True)
+        await close_all_rest_clients()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distributed bot worker")
+    parser.add_argument("--worker-id", default=SchedulerConfig.WORKER_ID or default_worker_id())
+    parser.add_argument("--lease-ttl", type=float, default=SchedulerConfig.LEASE_TTL_SECONDS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_worker(args.worker_id, args.lease_ttl))
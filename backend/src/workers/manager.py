@@ -10,12 +10,14 @@
 
 import asyncio
 import logging
-from typing import List, Set
+from typing import List, Optional, Set
 
 from sqlalchemy import and_, select
 
+from ..config import SchedulerConfig
 from ..database.models import BotInstance, BotStatus
 from ..services.bot_runner import BotRunner
+from .scheduler import BotCommandRouter, create_lease_backend
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +30,28 @@ class BotManager:
     1. 서버 시작 시 실행 중이던 봇 복구 (bootstrap)
     2. 봇 시작/정지 API 처리
     3. 다중 봇 인스턴스 관리 (NEW)
+
+    분산 모드 (router 설정 또는 BOT_SCHEDULER_MODE=distributed):
+    - 봇 인스턴스는 워커 프로세스(src/workers/bot_worker.py)가 실행
+    - start/stop은 BotCommandRouter로 소유 워커에 전달
+    - 실행 상태 조회는 라우터의 리스/하트비트 스냅샷 기준 (refresh_interval만큼 늦을 수 있음)
+    - 기존 user_id 기반 봇은 계속 이 프로세스에서 실행
     """
 
-    def __init__(self, market_queue: asyncio.Queue, session_factory):
+    def __init__(
+        self,
+        market_queue: asyncio.Queue,
+        session_factory,
+        router: Optional[BotCommandRouter] = None,
+    ):
         self.market_queue = market_queue
         self.runner = BotRunner(market_queue)
         self.session_factory = session_factory
+        self.router = router
+
+    @property
+    def distributed(self) -> bool:
+        return self.router is not None
 
     async def bootstrap(self):
         """
@@ -44,7 +62,15 @@ class BotManager:
         # 1. 기존 시스템 복구 (BotStatus)
         await self._bootstrap_legacy_bots()
 
-        # 2. 다중 봇 시스템 복구 (BotInstance)
+        if self.router is None and SchedulerConfig.DISTRIBUTED:
+            self.router = BotCommandRouter(await create_lease_backend())
+
+        # 2. 다중 봇 시스템 복구 (BotInstance) - 분산 모드에서는 워커가 DB에서 직접 가져감
+        if self.distributed:
+            self.router.start()
+            logger.info("Bot instances are scheduled by bot workers (distributed mode)")
+            return
+
         await self._bootstrap_bot_instances()
 
     async def _bootstrap_legacy_bots(self):
@@ -161,6 +187,11 @@ class BotManager:
             bot_instance_id: 봇 인스턴스 ID
             user_id: 사용자 ID
         """
+        if self.distributed:
+            worker_id = await self.router.route_start(bot_instance_id, user_id)
+            logger.info(f"Bot instance {bot_instance_id} start routed to worker {worker_id}")
+            return
+
         from ..utils.log_broadcaster import attach_log_handler
         attach_log_handler(user_id)
 
@@ -179,28 +210,50 @@ class BotManager:
             bot_instance_id: 봇 인스턴스 ID
             user_id: 사용자 ID
         """
+        if self.distributed:
+            worker_id = await self.router.route_stop(bot_instance_id, user_id)
+            logger.info(f"Bot instance {bot_instance_id} stop routed to worker {worker_id}")
+            return
+
         self.runner.stop_instance(bot_instance_id, user_id)
         logger.info(f"Bot instance {bot_instance_id} stopped for user {user_id}")
 
         # 사용자의 모든 봇이 정지되면 로그 핸들러 제거
-        if self.runner.get_running_instance_count(user_id) == 0:
+        if self.get_running_instance_count(user_id) == 0:
             from ..utils.log_broadcaster import detach_log_handler
             detach_log_handler(user_id)
 
     def is_instance_running(self, bot_instance_id: int) -> bool:
-        """봇 인스턴스 실행 상태 확인"""
+        """봇 인스턴스 실행 상태 확인 (분산 모드는 최근 리스 스냅샷 기준)"""
+        if self.distributed:
+            return self.router.owner_of(bot_instance_id) is not None
         return self.runner.is_instance_running(bot_instance_id)
 
     def get_user_running_instances(self, user_id: int) -> Set[int]:
-        """사용자의 실행 중인 봇 인스턴스 ID 목록"""
+        """사용자의 실행 중인 봇 인스턴스 ID 목록 (분산 모드는 최근 리스 스냅샷 기준)"""
+        if self.distributed:
+            return self.router.user_bots(user_id)
         return self.runner.get_user_running_bots(user_id)
 
     def get_running_instance_count(self, user_id: int) -> int:
         """사용자의 실행 중인 봇 인스턴스 수"""
+        if self.distributed:
+            return len(self.router.user_bots(user_id))
         return self.runner.get_running_instance_count(user_id)
 
     async def stop_all_user_instances(self, user_id: int):
         """사용자의 모든 봇 인스턴스 정지"""
+        if self.distributed:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(BotInstance.id).where(BotInstance.user_id == user_id)
+                )
+                bot_ids = list(result.scalars())
+            for bot_id in bot_ids:
+                await self.router.route_stop(bot_id, user_id)
+            logger.info(f"Stop routed for {len(bot_ids)} bot instances of user {user_id}")
+            return
+
         await self.runner.stop_all_user_instances(user_id)
 
         from ..utils.log_broadcaster import detach_log_handler
@@ -214,19 +267,23 @@ class BotManager:
         user_id: int
     ):
         """여러 봇 인스턴스 동시 시작"""
-        from ..utils.log_broadcaster import attach_log_handler
-        attach_log_handler(user_id)
+        if not self.distributed:
+            from ..utils.log_broadcaster import attach_log_handler
+            attach_log_handler(user_id)
 
         started = 0
         failed = 0
 
         for bot_id in bot_instance_ids:
             try:
-                await self.runner.start_instance(
-                    self.session_factory,
-                    bot_id,
-                    user_id
-                )
+                if self.distributed:
+                    await self.router.route_start(bot_id, user_id)
+                else:
+                    await self.runner.start_instance(
+                        self.session_factory,
+                        bot_id,
+                        user_id
+                    )
                 started += 1
             except Exception as e:
                 failed += 1
@@ -0,0 +1,812 @@
+"""
+분산 봇 스케줄러 (Distributed Bot Scheduler)
+
+관련 문서: docs/MULTI_BOT_03_IMPLEMENTATION.md
+
+기존에는 uvicorn 프로세스 하나가 모든 봇 인스턴스를 실행했음 (BotRunner 상태가 프로세스 전역).
+분산 모드(BOT_SCHEDULER_MODE=distributed)에서는 N개의 워커 프로세스
+(python -m src.workers.bot_worker)가 Redis 리스로 봇을 나눠 소유한다.
+
+동작:
+1. 하트비트: 워커는 bot:worker:{worker_id} 키를 TTL로 갱신하고 bot:workers 집합에 등록
+   (값은 보유 봇 → user_id 맵, API 프로세스의 사용자별 실행 봇 조회에 사용)
+2. 리스: bot:lease:{bot_id} = "{worker_id}|{token}" (PX TTL)
+   - token은 bot:token:{bot_id} INCR 값 (펜싱 토큰, 소유권이 바뀔 때마다 증가)
+   - 갱신/해제는 값이 정확히 일치할 때만 (Lua) → 리스를 잃은 워커는 되살릴 수 없음
+   - BotRunner.lease_guard로 틱마다 로컬 만료 시각을 확인, 만료되면 거래 없이 루프 종료
+   - BotRunner.fence_guard로 주문 / 거래·포지션 DB 쓰기 직전마다 로컬 만료 + Redis의 현재
+     리스 값("{worker_id}|{token}")을 확인 → 새 소유자가 인수한 뒤 깨어난 옛 소유자의 쓰기는 버림
+3. 배치: DB의 is_running 봇을 rendezvous 해시로 선호 워커에 배정하고
+   워커당 ceil(봇 수 / 워커 수)까지만 보유 → 워커 수에 비례해 처리량 확장
+4. 장애 인수: 워커가 죽으면 리스가 만료되고, 주인 없는 봇은 유예 시간 후 여유 있는 워커가 인수
+5. 명령: API 프로세스(BotCommandRouter)가 bot:commands:{worker_id} 리스트로 start/stop 전달
+6. 진단: 같은 명령 리스트로 profile/tasks 요청 → 워커가 별도 태스크로 실행하고
+   bot:diagnostics:{request_id}에 결과를 남기면 API가 가져감 (관리자 프로파일 API의 worker_id)
+
+로컬 테스트는 InMemoryLeaseBackend (Redis 대역, 시계 주입 가능)를 여러 스케줄러가 공유해서 사용.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, select
+
+from ..database.models import BotInstance
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "bot:lease:{}"
+TOKEN_KEY = "bot:token:{}"
+WORKER_KEY = "bot:worker:{}"
+WORKERS_KEY = "bot:workers"
+COMMANDS_KEY = "bot:commands:{}"
+RESULT_KEY = "bot:diagnostics:{}"
+
+DIAGNOSTIC_OPS = ("profile", "tasks")
+DIAGNOSTIC_RESULT_TTL_SECONDS = 120
+
+# 죽은 워커 앞으로 쌓인 명령은 이 시간 뒤 버림 (DB reconcile이 어차피 따라잡음)
+COMMAND_TTL_SECONDS = 60
+
+
+def default_worker_id() -> str:
+    """hostname-pid (리스 값 구분자 '|'는 포함하지 않음)"""
+    return f"{socket.gethostname()}-{os.getpid()}".replace("|", "-")
+
+
+def rendezvous_owner(bot_id: int, workers: Iterable[str]) -> Optional[str]:
+    """
+    Highest-random-weight 해시로 봇의 선호 워커 선택
+
+    워커가 추가/제거돼도 해당 워커 몫의 봇만 이동한다.
+    """
+    best: Optional[str] = None
+    best_score = -1
+    for worker in sorted(workers):
+        digest = hashlib.blake2b(f"{worker}:{bot_id}".encode(), digest_size=8).digest()
+        score = int.from_bytes(digest, "big")
+        if score > best_score:
+            best, best_score = worker, score
+    return best
+
+
+# ============================================================
+# 리스 저장소
+# ============================================================
+
+
+class LeaseBackend:
+    """리스 / 워커 하트비트 / 명령 큐 저장소 인터페이스"""
+
+    async def acquire(self, bot_id: int, worker_id: str, ttl: float) -> Optional[int]:
+        """비어 있으면 리스 획득 후 새 토큰 반환 (이미 내 리스면 연장 후 기존 토큰)"""
+        raise NotImplementedError
+
+    async def renew(self, bot_id: int, worker_id: str, token: int, ttl: float) -> bool:
+        raise NotImplementedError
+
+    async def release(self, bot_id: int, worker_id: str, token: int) -> bool:
+        raise NotImplementedError
+
+    async def is_current(self, bot_id: int, worker_id: str, token: int) -> bool:
+        """펜싱 확인: 리스가 아직 (worker_id, token) 소유인지"""
+        raise NotImplementedError
+
+    async def owners(self, bot_ids: Optional[List[int]] = None) -> Dict[int, Tuple[str, int]]:
+        """bot_id → (worker_id, token), bot_ids가 없으면 전체"""
+        raise NotImplementedError
+
+    async def heartbeat(self, worker_id: str, ttl: float, info: Optional[dict] = None) -> None:
+        raise NotImplementedError
+
+    async def leave(self, worker_id: str) -> None:
+        raise NotImplementedError
+
+    async def live_workers(self) -> List[str]:
+        raise NotImplementedError
+
+    async def worker_info(self) -> Dict[str, dict]:
+        """살아 있는 워커 → 마지막 하트비트 info"""
+        raise NotImplementedError
+
+    async def push_command(self, worker_id: str, command: dict) -> None:
+        raise NotImplementedError
+
+    async def pop_commands(self, worker_id: str, limit: int = 100) -> List[dict]:
+        raise NotImplementedError
+
+    async def put_result(self, request_id: str, result: dict, ttl: float) -> None:
+        """진단 명령 결과 저장 (워커 → API)"""
+        raise NotImplementedError
+
+    async def take_result(self, request_id: str) -> Optional[dict]:
+        """진단 명령 결과를 꺼내고 삭제 (아직 없으면 None)"""
+        raise NotImplementedError
+
+
+class InMemoryLeaseBackend(LeaseBackend):
+    """
+    프로세스 내 Redis 대역 (테스트 / 단일 호스트 개발용)
+
+    RedisLeaseBackend와 같은 의미론 (만료, 토큰 단조 증가, 값 일치 시에만 갱신/해제).
+    clock을 주입하면 TTL 만료를 시간 지연 없이 재현할 수 있다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._leases: Dict[int, Tuple[str, int, float]] = {}
+        self._tokens: Dict[int, int] = {}
+        self._workers: Dict[str, Tuple[float, dict]] = {}
+        self._commands: Dict[str, List[dict]] = {}
+        self._results: Dict[str, Tuple[float, dict]] = {}
+
+    def _lease(self, bot_id: int) -> Optional[Tuple[str, int, float]]:
+        lease = self._leases.get(bot_id)
+        if lease is not None and lease[2] <= self.clock():
+            del self._leases[bot_id]
+            return None
+        return lease
+
+    async def acquire(self, bot_id: int, worker_id: str, ttl: float) -> Optional[int]:
+        lease = self._lease(bot_id)
+        if lease is not None:
+            if lease[0] != worker_id:
+                return None
+            token = lease[1]
+        else:
+            token = self._tokens.get(bot_id, 0) + 1
+            self._tokens[bot_id] = token
+        self._leases[bot_id] = (worker_id, token, self.clock() + ttl)
+        return token
+
+    async def renew(self, bot_id: int, worker_id: str, token: int, ttl: float) -> bool:
+        lease = self._lease(bot_id)
+        if lease is None or lease[:2] != (worker_id, token):
+            return False
+        self._leases[bot_id] = (worker_id, token, self.clock() + ttl)
+        return True
+
+    async def release(self, bot_id: int, worker_id: str, token: int) -> bool:
+        lease = self._lease(bot_id)
+        if lease is None or lease[:2] != (worker_id, token):
+            return False
+        del self._leases[bot_id]
+        return True
+
+    async def is_current(self, bot_id: int, worker_id: str, token: int) -> bool:
+        lease = self._lease(bot_id)
+        return lease is not None and lease[:2] == (worker_id, token)
+
+    async def owners(self, bot_ids: Optional[List[int]] = None) -> Dict[int, Tuple[str, int]]:
+        ids = list(self._leases) if bot_ids is None else bot_ids
+        result = {}
+        for bot_id in ids:
+            lease = self._lease(bot_id)
+            if lease is not None:
+                result[bot_id] = (lease[0], lease[1])
+        return result
+
+    async def heartbeat(self, worker_id: str, ttl: float, info: Optional[dict] = None) -> None:
+        self._workers[worker_id] = (self.clock() + ttl, info or {})
+
+    async def leave(self, worker_id: str) -> None:
+        self._workers.pop(worker_id, None)
+        self._commands.pop(worker_id, None)
+
+    async def live_workers(self) -> List[str]:
+        now = self.clock()
+        for worker_id in [w for w, (expires, _) in self._workers.items() if expires <= now]:
+            del self._workers[worker_id]
+        return sorted(self._workers)
+
+    async def worker_info(self) -> Dict[str, dict]:
+        return {worker_id: dict(self._workers[worker_id][1]) for worker_id in await self.live_workers()}
+
+    async def push_command(self, worker_id: str, command: dict) -> None:
+        self._commands.setdefault(worker_id, []).append(dict(command))
+
+    async def pop_commands(self, worker_id: str, limit: int = 100) -> List[dict]:
+        queue = self._commands.get(worker_id, [])
+        commands, self._commands[worker_id] = queue[:limit], queue[limit:]
+        return commands
+
+    async def put_result(self, request_id: str, result: dict, ttl: float) -> None:
+        self._results[request_id] = (self.clock() + ttl, dict(result))
+
+    async def take_result(self, request_id: str) -> Optional[dict]:
+        expires, result = self._results.pop(request_id, (0.0, None))
+        return result if expires > self.clock() else None
+
+
+# KEYS[1]=lease, KEYS[2]=token / ARGV[1]=worker_id, ARGV[2]=ttl(ms)
+_ACQUIRE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+  local prefix = ARGV[1] .. '|'
+  if string.sub(current, 1, #prefix) == prefix then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return tonumber(string.sub(current, #prefix + 1))
+  end
+  return false
+end
+local token = redis.call('INCR', KEYS[2])
+redis.call('SET', KEYS[1], ARGV[1] .. '|' .. token, 'PX', ARGV[2])
+return token
+"""
+
+# KEYS[1]=lease / ARGV[1]="worker|token", ARGV[2]=ttl(ms)
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1]=lease / ARGV[1]="worker|token"
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _parse_lease(value: Optional[str]) -> Optional[Tuple[str, int]]:
+    if not value:
+        return None
+    worker_id, _, token = value.rpartition("|")
+    return worker_id, int(token)
+
+
+class RedisLeaseBackend(LeaseBackend):
+    """Redis 리스 저장소 (redis.asyncio, decode_responses=True 클라이언트)"""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self._acquire = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._renew = redis_client.register_script(_RENEW_SCRIPT)
+        self._release = redis_client.register_script(_RELEASE_SCRIPT)
+
+    async def acquire(self, bot_id: int, worker_id: str, ttl: float) -> Optional[int]:
+        token = await self._acquire(
+            keys=[LEASE_KEY.format(bot_id), TOKEN_KEY.format(bot_id)],
+            args=[worker_id, int(ttl * 1000)],
+        )
+        return int(token) if token is not None else None
+
+    async def renew(self, bot_id: int, worker_id: str, token: int, ttl: float) -> bool:
+        renewed = await self._renew(
+            keys=[LEASE_KEY.format(bot_id)], args=[f"{worker_id}|{token}", int(ttl * 1000)]
+        )
+        return bool(renewed)
+
+    async def release(self, bot_id: int, worker_id: str, token: int) -> bool:
+        released = await self._release(
+            keys=[LEASE_KEY.format(bot_id)], args=[f"{worker_id}|{token}"]
+        )
+        return bool(released)
+
+    async def is_current(self, bot_id: int, worker_id: str, token: int) -> bool:
+        return await self.redis.get(LEASE_KEY.format(bot_id)) == f"{worker_id}|{token}"
+
+    async def owners(self, bot_ids: Optional[List[int]] = None) -> Dict[int, Tuple[str, int]]:
+        if bot_ids is None:
+            prefix = LEASE_KEY.format("")
+            bot_ids = [
+                int(key[len(prefix):])
+                async for key in self.redis.scan_iter(match=LEASE_KEY.format("*"), count=500)
+            ]
+        if not bot_ids:
+            return {}
+        values = await self.redis.mget([LEASE_KEY.format(bot_id) for bot_id in bot_ids])
+        result = {}
+        for bot_id, value in zip(bot_ids, values):
+            lease = _parse_lease(value)
+            if lease is not None:
+                result[bot_id] = lease
+        return result
+
+    async def heartbeat(self, worker_id: str, ttl: float, info: Optional[dict] = None) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(WORKER_KEY.format(worker_id), json.dumps(info or {}), px=int(ttl * 1000))
+            pipe.sadd(WORKERS_KEY, worker_id)
+            await pipe.execute()
+
+    async def leave(self, worker_id: str) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(WORKER_KEY.format(worker_id), COMMANDS_KEY.format(worker_id))
+            pipe.srem(WORKERS_KEY, worker_id)
+            await pipe.execute()
+
+    async def live_workers(self) -> List[str]:
+        members = sorted(await self.redis.smembers(WORKERS_KEY))
+        if not members:
+            return []
+        beats = await self.redis.mget([WORKER_KEY.format(worker_id) for worker_id in members])
+        dead = [worker_id for worker_id, beat in zip(members, beats) if beat is None]
+        if dead:
+            await self.redis.srem(WORKERS_KEY, *dead)
+        return [worker_id for worker_id, beat in zip(members, beats) if beat is not None]
+
+    async def worker_info(self) -> Dict[str, dict]:
+        workers = await self.live_workers()
+        if not workers:
+            return {}
+        beats = await self.redis.mget([WORKER_KEY.format(worker_id) for worker_id in workers])
+        return {
+            worker_id: json.loads(beat)
+            for worker_id, beat in zip(workers, beats)
+            if beat is not None
+        }
+
+    async def push_command(self, worker_id: str, command: dict) -> None:
+        key = COMMANDS_KEY.format(worker_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, json.dumps(command))
+            pipe.expire(key, COMMAND_TTL_SECONDS)
+            await pipe.execute()
+
+    async def pop_commands(self, worker_id: str, limit: int = 100) -> List[dict]:
+        key = COMMANDS_KEY.format(worker_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(key, 0, limit - 1)
+            pipe.ltrim(key, limit, -1)
+            raw, _ = await pipe.execute()
+        return [json.loads(item) for item in raw]
+
+    async def put_result(self, request_id: str, result: dict, ttl: float) -> None:
+        await self.redis.set(RESULT_KEY.format(request_id), json.dumps(result), px=int(ttl * 1000))
+
+    async def take_result(self, request_id: str) -> Optional[dict]:
+        key = RESULT_KEY.format(request_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.get(key)
+            pipe.delete(key)
+            raw, _ = await pipe.execute()
+        return json.loads(raw) if raw is not None else None
+
+
+async def create_lease_backend() -> LeaseBackend:
+    """
+    분산 모드용 리스 저장소 생성
+
+    프로세스 간 공유가 필요하므로 Redis가 없으면 실패한다 (인메모리 폴백 없음).
+    """
+    from ..utils.redis_client import get_redis_client
+
+    redis_client = await get_redis_client()
+    if redis_client is None:
+        raise RuntimeError("Distributed bot scheduling requires Redis (REDIS_URL)")
+    return RedisLeaseBackend(redis_client)
+
+
+# ============================================================
+# 워커 측 스케줄러
+# ============================================================
+
+
+@dataclass
+class Lease:
+    """워커가 보유한 봇 리스"""
+
+    bot_id: int
+    user_id: int
+    token: int
+    expires_at: float  # 로컬 시계 기준 (갱신 요청 직전 시각 + TTL)
+
+
+class BotScheduler:
+    """
+    워커 프로세스의 봇 소유권 관리자
+
+    tick()마다 하트비트 → 리스 갱신 → 명령 처리 → DB와 reconcile 순으로 실행.
+    runner는 BotRunner 인터페이스
+    (start_instance / stop_instance / is_instance_running / lease_guard / fence_guard).
+    """
+
+    def __init__(
+        self,
+        runner,
+        session_factory,
+        backend: LeaseBackend,
+        worker_id: Optional[str] = None,
+        lease_ttl: float = 15.0,
+        interval: Optional[float] = None,
+        takeover_grace: Optional[float] = None,
+        rebalance_batch: int = 1,
+        stop_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        desired_bots: Optional[Callable[[], Awaitable[Dict[int, int]]]] = None,
+    ):
+        self.runner = runner
+        self.session_factory = session_factory
+        self.backend = backend
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_ttl = lease_ttl
+        self.interval = interval if interval is not None else lease_ttl / 3
+        # 선호 워커가 먼저 가져갈 기회를 준 뒤 주인 없는 봇을 인수
+        self.takeover_grace = takeover_grace if takeover_grace is not None else lease_ttl
+        self.rebalance_batch = rebalance_batch
+        self.stop_timeout = stop_timeout
+        self.clock = clock
+        self._desired_bots = desired_bots or self._load_desired_bots
+
+        self.leases: Dict[int, Lease] = {}
+        self._unowned_since: Dict[int, float] = {}
+        self._commanded_at: Dict[int, float] = {}  # start 명령 ~ API의 DB 커밋 사이 보호
+        self._cooldown_until: Dict[int, float] = {}  # 스스로 종료한 봇 재시작 대기
+        self._diagnostics: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+        runner.lease_guard = self.holds
+        runner.fence_guard = self.fence
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def holds(self, bot_id: int) -> bool:
+        """리스가 로컬 기준으로 유효한지 (BotRunner.lease_guard)"""
+        lease = self.leases.get(bot_id)
+        return lease is not None and self.clock() < lease.expires_at
+
+    async def fence(self, bot_id: int) -> bool:
+        """
+        주문 / DB 쓰기 직전 펜싱 확인 (BotRunner.fence_guard)
+
+        로컬 만료만으로는 멈췄다 깨어난 옛 소유자를 막을 수 없으므로 저장소의 현재 리스가
+        이 워커의 토큰인지 확인한다. 토큰이 바뀌었으면 로컬 리스도 만료 처리해
+        lease_guard가 루프를 끝내게 하고, 저장소 오류면 쓰기를 막는 쪽으로 판단한다.
+        """
+        lease = self.leases.get(bot_id)
+        if lease is None or self.clock() >= lease.expires_at:
+            return False
+        try:
+            current = await self.backend.is_current(bot_id, self.worker_id, lease.token)
+        except Exception as e:
+            logger.error(f"Fencing check failed for bot {bot_id} on worker {self.worker_id}: {e}")
+            return False
+        if not current:
+            logger.warning(
+                f"Worker {self.worker_id} holds a stale fencing token for bot {bot_id} (token {lease.token})"
+            )
+            lease.expires_at = self.clock()
+        return current
+
+    def status(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "bots": {bot_id: lease.token for bot_id, lease in sorted(self.leases.items())},
+        }
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def run(self):
+        logger.info(f"Bot scheduler started (worker={self.worker_id}, ttl={self.lease_ttl}s)")
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Bot scheduler tick failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        """정상 종료: 봇을 넘기고 리스 반납 → 다른 워커가 TTL 대기 없이 인수"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._diagnostics):
+            task.cancel()
+        for lease in list(self.leases.values()):
+            await self._drop(lease, handoff=True)
+        await self.backend.leave(self.worker_id)
+        logger.info(f"Bot scheduler stopped (worker={self.worker_id})")
+
+    async def tick(self):
+        await self.backend.heartbeat(
+            self.worker_id,
+            self.lease_ttl,
+            {
+                "bots": len(self.leases),
+                "leases": {str(bot_id): lease.user_id for bot_id, lease in self.leases.items()},
+                "at": time.time(),
+            },
+        )
+        await self._renew_leases()
+        await self._handle_commands()
+        await self._reconcile()
+
+    # ------------------------------------------------------------
+    # 단계별 처리
+    # ------------------------------------------------------------
+
+    async def _renew_leases(self):
+        for lease in list(self.leases.values()):
+            if not self.runner.is_instance_running(lease.bot_id):
+                # 에러 등으로 스스로 종료 → 반납하고 잠시 재시작 보류
+                logger.info(f"Bot {lease.bot_id} exited on worker {self.worker_id}, releasing lease")
+                self._cooldown_until[lease.bot_id] = self.clock() + 2 * self.lease_ttl
+                await self._drop(lease, handoff=True)
+                continue
+
+            requested_at = self.clock()
+            if await self.backend.renew(lease.bot_id, self.worker_id, lease.token, self.lease_ttl):
+                lease.expires_at = requested_at + self.lease_ttl
+            else:
+                logger.warning(
+                    f"Worker {self.worker_id} lost lease for bot {lease.bot_id} (token {lease.token})"
+                )
+                await self._drop(lease, handoff=True, release=False)
+
+    async def _handle_commands(self):
+        for command in await self.backend.pop_commands(self.worker_id):
+            if command.get("op") in DIAGNOSTIC_OPS:
+                # 프로파일은 수 초 걸리므로 틱(리스 갱신)을 막지 않도록 별도 태스크
+                task = asyncio.create_task(self._run_diagnostics(command))
+                self._diagnostics.add(task)
+                task.add_done_callback(self._diagnostics.discard)
+                continue
+            bot_id, user_id = int(command["bot_id"]), int(command["user_id"])
+            if command.get("op") == "start":
+                self._commanded_at[bot_id] = self.clock()
+                self._cooldown_until.pop(bot_id, None)
+                if bot_id not in self.leases:
+                    await self._claim(bot_id, user_id)
+            elif command.get("op") == "stop":
+                self._commanded_at.pop(bot_id, None)
+                lease = self.leases.get(bot_id)
+                if lease is not None:
+                    await self._drop(lease, handoff=False)
+            else:
+                logger.warning(f"Unknown bot scheduler command: {command}")
+
+    async def _run_diagnostics(self, command: dict):
+        """관리자 진단 명령 실행 (이 워커 프로세스의 프로파일 / 태스크 덤프)"""
+        from ..utils.sampling_profiler import DEFAULT_INTERVAL, ProfilerBusyError, dump_tasks, run_profile
+
+        try:
+            if command["op"] == "profile":
+                profile = await run_profile(
+                    float(command.get("seconds", 10.0)),
+                    interval=float(command.get("interval", DEFAULT_INTERVAL)),
+                )
+                result = profile.to_dict(top=int(command.get("top", 30)))
+            else:
+                tasks = dump_tasks(limit=int(command.get("limit", 200)))
+                result = {"count": len(tasks), "tasks": tasks}
+        except ProfilerBusyError as e:
+            result = {"error": "busy", "detail": str(e)}
+        except Exception as e:
+            logger.error(f"Diagnostics command failed on worker {self.worker_id}: {e}", exc_info=True)
+            result = {"error": "failed", "detail": str(e)}
+
+        result["worker_id"] = self.worker_id
+        await self.backend.put_result(command["request_id"], result, DIAGNOSTIC_RESULT_TTL_SECONDS)
+
+    async def _reconcile(self):
+        desired = await self._desired_bots()
+        workers = await self.backend.live_workers()
+        if self.worker_id not in workers:
+            workers.append(self.worker_id)
+        now = self.clock()
+
+        # 1. DB에서 정지된 봇 (정지 명령을 놓친 경우)
+        for bot_id in [b for b, at in self._commanded_at.items() if now - at > self.lease_ttl]:
+            del self._commanded_at[bot_id]
+        for bot_id, lease in list(self.leases.items()):
+            if bot_id not in desired and bot_id not in self._commanded_at:
+                await self._drop(lease, handoff=True)
+
+        for bot_id in [b for b in self._unowned_since if b not in desired]:
+            del self._unowned_since[bot_id]
+
+        # 2. 인수: 내가 선호 워커인 봇 먼저, 그다음 유예가 지난 주인 없는 봇
+        scheduled = set(desired) | set(self.leases)
+        cap = math.ceil(len(scheduled) / len(workers))
+        owners = await self.backend.owners(sorted(desired))
+        candidates = []
+        for bot_id in sorted(desired):
+            if bot_id in self.leases:
+                continue
+            if bot_id in owners:
+                self._unowned_since.pop(bot_id, None)
+                continue
+            if self._cooldown_until.get(bot_id, 0.0) > now:
+                continue
+            first_seen = self._unowned_since.setdefault(bot_id, now)
+            if rendezvous_owner(bot_id, workers) == self.worker_id:
+                candidates.append((0, bot_id))
+            elif now - first_seen >= self.takeover_grace:
+                candidates.append((1, bot_id))
+
+        for _, bot_id in sorted(candidates):
+            if len(self.leases) >= cap:
+                break
+            await self._claim(bot_id, desired[bot_id])
+
+        # 3. 재분배: 상한 초과분은 다른 워커가 선호하는 봇부터 틱당 rebalance_batch개씩 반납
+        excess = len(self.leases) - cap
+        if excess > 0 and len(workers) > 1:
+            movable = sorted(
+                self.leases,
+                key=lambda b: (rendezvous_owner(b, workers) == self.worker_id, b),
+            )
+            for bot_id in movable[: min(excess, self.rebalance_batch)]:
+                logger.info(f"Rebalancing bot {bot_id} away from worker {self.worker_id}")
+                await self._drop(self.leases[bot_id], handoff=True)
+
+    # ------------------------------------------------------------
+    # 리스 획득 / 반납
+    # ------------------------------------------------------------
+
+    async def _claim(self, bot_id: int, user_id: int) -> bool:
+        requested_at = self.clock()
+        token = await self.backend.acquire(bot_id, self.worker_id, self.lease_ttl)
+        if token is None:
+            return False
+
+        lease = Lease(bot_id, user_id, token, requested_at + self.lease_ttl)
+        self.leases[bot_id] = lease
+        self._unowned_since.pop(bot_id, None)
+        try:
+            await self.runner.start_instance(self.session_factory, bot_id, user_id)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} failed to start bot {bot_id}: {e}")
+            await self._drop(lease, handoff=True)
+            return False
+
+        logger.info(f"Worker {self.worker_id} claimed bot {bot_id} (token {token})")
+        return True
+
+    async def _drop(self, lease: Lease, handoff: bool, release: bool = True):
+        """
+        로컬 실행 정지 후 리스 반납
+
+        lease_guard가 즉시 False가 되도록 먼저 leases에서 제거하고,
+        새 소유 워커와 겹치지 않도록 태스크 종료를 기다린 뒤 반납한다.
+        """
+        self.leases.pop(lease.bot_id, None)
+        if self.runner.is_instance_running(lease.bot_id):
+            self.runner.stop_instance(lease.bot_id, lease.user_id, handoff=handoff)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.stop_timeout
+            while self.runner.is_instance_running(lease.bot_id) and loop.time() < deadline:
+                await asyncio.sleep(0.05)
+        if release:
+            await self.backend.release(lease.bot_id, self.worker_id, lease.token)
+
+    async def _load_desired_bots(self) -> Dict[int, int]:
+        """DB에서 실행되어야 하는 봇 (bot_id → user_id)"""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(BotInstance.id, BotInstance.user_id).where(
+                    and_(
+                        BotInstance.is_running.is_(True),
+                        BotInstance.is_active.is_(True),
+                    )
+                )
+            )
+            return {bot_id: user_id for bot_id, user_id in result.all()}
+
+
+# ============================================================
+# API 측 라우터
+# ============================================================
+
+
+class BotCommandRouter:
+    """
+    API 프로세스 → 소유 워커로 start/stop 명령 전달
+
+    소유 워커가 없으면 선호 워커(rendezvous)에 보낸다.
+    워커가 하나도 없어도 DB is_running이 진실이므로 워커가 뜨면 reconcile로 시작된다.
+    """
+
+    def __init__(self, backend: LeaseBackend, refresh_interval: float = 2.0):
+        self.backend = backend
+        self.refresh_interval = refresh_interval
+        self._owners: Dict[int, Tuple[str, int]] = {}
+        self._users: Dict[int, int] = {}  # bot_id → user_id (워커 하트비트 기준)
+        self._task: Optional[asyncio.Task] = None
+
+    async def route_start(self, bot_id: int, user_id: int) -> Optional[str]:
+        owner = (await self.backend.owners([bot_id])).get(bot_id)
+        target = owner[0] if owner else rendezvous_owner(bot_id, await self.backend.live_workers())
+        if target is None:
+            logger.warning(f"No live bot workers; bot {bot_id} will start when a worker joins")
+            return None
+        await self.backend.push_command(target, {"op": "start", "bot_id": bot_id, "user_id": user_id})
+        return target
+
+    async def route_stop(self, bot_id: int, user_id: int) -> Optional[str]:
+        owner = (await self.backend.owners([bot_id])).get(bot_id)
+        self._owners.pop(bot_id, None)
+        self._users.pop(bot_id, None)
+        if owner is None:
+            return None
+        await self.backend.push_command(owner[0], {"op": "stop", "bot_id": bot_id, "user_id": user_id})
+        return owner[0]
+
+    async def request_diagnostics(
+        self,
+        worker_id: str,
+        op: str,
+        timeout: float,
+        poll_interval: float = 0.1,
+        **params,
+    ) -> dict:
+        """
+        워커에 진단 명령(profile / tasks)을 보내고 결과 대기
+
+        워커는 스케줄러 틱마다 명령을 가져가므로 timeout에는 틱 간격(lease_ttl / 3)을 포함해야 한다.
+
+        Raises:
+            LookupError: 살아 있는 워커가 아님
+            asyncio.TimeoutError: timeout 안에 결과가 없음
+        """
+        if op not in DIAGNOSTIC_OPS:
+            raise ValueError(f"Unknown diagnostics op: {op}")
+        if worker_id not in await self.backend.live_workers():
+            raise LookupError(f"Bot worker {worker_id} is not alive")
+
+        request_id = uuid.uuid4().hex
+        await self.backend.push_command(worker_id, {"op": op, "request_id": request_id, **params})
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            result = await self.backend.take_result(request_id)
+            if result is not None:
+                return result
+            await asyncio.sleep(poll_interval)
+        raise asyncio.TimeoutError(f"No diagnostics result from worker {worker_id} within {timeout:.0f}s")
+
+    def owner_of(self, bot_id: int) -> Optional[str]:
+        """최근 스냅샷 기준 소유 워커 (동기 조회용)"""
+        owner = self._owners.get(bot_id)
+        return owner[0] if owner else None
+
+    def user_bots(self, user_id: int) -> Set[int]:
+        """최근 스냅샷 기준 사용자의 실행 중인 봇 (리스가 있고 소유 워커가 보고한 봇)"""
+        return {bot_id for bot_id in self._owners if self._users.get(bot_id) == user_id}
+
+    async def refresh(self):
+        owners = await self.backend.owners()
+        users = {}
+        for info in (await self.backend.worker_info()).values():
+            for bot_id, user_id in info.get("leases", {}).items():
+                users[int(bot_id)] = int(user_id)
+        self._owners, self._users = owners, users
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+        return self._task
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Bot ownership refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
@@ -0,0 +1,122 @@
+"""
+Test ML validation Backtester
+
+Tests:
+- run_vectorized()가 run()과 같은 거래/자산 곡선/지표를 내는지
+- predict_batch()가 행별 predict()와 같은 결과를 내는지
+"""
+
+from dataclasses import astuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml.models.ensemble_predictor import EnsemblePredictor
+from src.ml.validation import Backtester, signals_from_batch
+
+
+def _candles(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    spread = np.abs(rng.normal(0, 0.003, n)) * close
+    index = pd.date_range("2025-01-01", periods=n, freq="5min")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(100, 1000, n),
+        },
+        index=index,
+    )
+
+
+def _predictions(index: pd.DatetimeIndex, seed: int = 11) -> list:
+    rng = np.random.default_rng(seed)
+    preds = []
+    for ts in index[rng.random(len(index)) < 0.2]:
+        preds.append({
+            "timestamp": ts if rng.random() < 0.5 else str(ts),
+            "recommended_action": rng.choice(["buy", "sell", "hold"]),
+            "confidence": {"overall": float(rng.uniform(0.4, 0.95))},
+            "timing": rng.choice(["good", "ok", "bad"]),
+            "position_size_percent": float(rng.uniform(5, 60)),
+            "stop_loss_percent": float(rng.uniform(0.3, 2.0)),
+        })
+    return preds
+
+
+def _assert_same_result(expected, actual):
+    assert [astuple(t) for t in actual.trades] == [astuple(t) for t in expected.trades]
+    assert actual.equity_curve == expected.equity_curve
+    assert actual.daily_returns == expected.daily_returns
+    assert actual.to_dict() == expected.to_dict()
+    assert actual.final_capital == expected.final_capital
+    assert actual.max_drawdown == expected.max_drawdown
+
+
+class TestVectorizedBacktest:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_row_loop(self, seed):
+        candles = _candles(3000, seed=seed)
+        predictions = _predictions(candles.index, seed=seed + 10)
+        backtester = Backtester(initial_capital=10000)
+
+        expected = backtester.run(candles, predictions)
+        actual = backtester.run_vectorized(candles, predictions)
+
+        assert expected.total_trades > 10
+        _assert_same_result(expected, actual)
+
+    def test_batch_prediction_matches_row_predict(self):
+        rng = np.random.default_rng(5)
+        n = 60
+        features = pd.DataFrame(
+            {
+                "ema_cross_5_20": rng.choice([-1.0, 0.0, 1.0], n),
+                "rsi_14": rng.uniform(5, 95, n),
+                "macd_histogram": rng.normal(0, 2, n),
+                "atr_ratio": rng.uniform(0.3, 3.5, n),
+                "atr_14": rng.uniform(5, 60, n),
+                "close": rng.uniform(1500, 2500, n),
+                "volume_ma_ratio": rng.uniform(0.2, 2.0, n),
+                "bb_position": rng.uniform(-0.2, 1.2, n),
+            },
+            index=pd.date_range("2025-01-01", periods=n, freq="5min"),
+        )
+        predictor = EnsemblePredictor(models_dir=Path("/tmp/test_models"))
+
+        batch = predictor.predict_batch(features)
+
+        for i in range(n):
+            row = predictor.predict(features.iloc[: i + 1])
+            got = batch.iloc[i]
+            assert got["direction"] == row.direction.direction.value
+            assert got["direction_confidence"] == row.direction.confidence
+            assert got["volatility_level"] == row.volatility.level.value
+            assert bool(got["timing_good"]) == row.timing.is_good_entry
+            assert bool(got["timing_waiting"]) == row.timing.waiting_recommended
+            assert got["timing_score"] == row.timing.score
+            assert got["stop_loss_percent"] == row.stoploss.optimal_sl_percent
+            assert got["position_size_percent"] == row.position_size.optimal_size_percent
+            assert got["combined_confidence"] == row.combined_confidence
+
+        # 일괄 예측 시그널은 리스트 입력과 같은 백테스트 결과
+        candles = _candles(n, seed=9)
+        signals = signals_from_batch(batch.set_axis(candles.index))
+        as_list = [
+            {
+                "timestamp": ts,
+                "recommended_action": sig.recommended_action,
+                "confidence": {"overall": sig.confidence},
+                "timing": sig.timing,
+                "position_size_percent": sig.position_size_percent,
+                "stop_loss_percent": sig.stop_loss_percent,
+            }
+            for ts, sig in signals.iterrows()
+        ]
+        backtester = Backtester()
+        _assert_same_result(backtester.run(candles, as_list), backtester.run_vectorized(candles, signals))
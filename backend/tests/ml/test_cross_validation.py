@@ -0,0 +1,108 @@
+"""
+Test ML cross validation
+
+Tests:
+- 워크포워드 / Purged K-Fold 폴드가 라벨 겹침 구간을 학습에서 제외하는지
+- 리포트가 모델별 최적 후보와 폴드 평균 지표를 고르는지
+- 배포 판단 지표가 후보 선택에 쓰이지 않은 홀드아웃 구간에서 나오는지
+"""
+
+import numpy as np
+import pytest
+
+from src.ml.validation import (
+    CrossValidationReport,
+    CrossValidator,
+    holdout_fold,
+    purged_kfold_folds,
+    walk_forward_folds,
+)
+from src.ml.validation.cross_validation import FoldResult
+
+
+class TestFolds:
+    def test_walk_forward_trains_only_on_purged_past(self):
+        folds = walk_forward_folds(1200, n_folds=5, purge=6)
+
+        assert len(folds) == 5
+        assert [f.test_size for f in folds] == [200] * 5
+        assert folds[-1].test.stop == 1200
+        for fold in folds:
+            assert fold.train[0] == 0
+            assert fold.train[-1] == fold.test.start - 7
+        # 확장 윈도우
+        assert all(len(a.train) < len(b.train) for a, b in zip(folds, folds[1:]))
+
+        sliding = walk_forward_folds(1200, n_folds=5, purge=6, max_train_size=300)
+        assert [len(f.train) for f in sliding] == [194, 300, 300, 300, 300]
+
+    def test_purged_kfold_drops_overlap_and_embargo(self):
+        folds = purged_kfold_folds(1000, n_folds=4, purge=6, embargo=10)
+
+        assert [(f.test.start, f.test.stop) for f in folds] == [(0, 250), (250, 500), (500, 750), (750, 1000)]
+        middle = folds[1]
+        removed = np.setdiff1d(np.arange(1000), middle.train)
+        np.testing.assert_array_equal(removed, np.arange(244, 510))
+        # 첫/마지막 블록은 한쪽만 제외
+        assert folds[0].train[0] == 260
+        assert folds[-1].train[-1] == 743
+
+    def test_holdout_is_outside_selection_folds(self):
+        n_selection, holdout = holdout_fold(1000, 0.2, purge=6)
+
+        assert (holdout.test.start, holdout.test.stop) == (800, 1000)
+        assert n_selection == 794
+        assert holdout.train[-1] == 793
+        for fold in walk_forward_folds(n_selection, n_folds=4, purge=6) + purged_kfold_folds(n_selection, 4, 6, 6):
+            assert fold.test.stop <= n_selection and fold.train.max() < n_selection
+
+        assert holdout_fold(1000, 0.0) == (1000, None)
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError):
+            CrossValidator(method="random")
+
+
+class TestReport:
+    def test_best_candidate_and_fold_metrics(self):
+        report = CrossValidationReport(
+            method="walk_forward", n_folds=2,
+            candidates=[{}, {"num_leaves": 15}],
+        )
+        rows = {
+            ("direction", 0): [0.50, 0.54],
+            ("direction", 1): [0.58, 0.56],
+            ("stop_loss", 0): [0.40, 0.30],
+            ("stop_loss", 1): [0.45, 0.45],
+        }
+        for (model, candidate), values in rows.items():
+            for fold, value in enumerate(values):
+                metrics = {"accuracy": value} if model == "direction" else {"rmse": value, "mae": value / 2}
+                report.results.append(FoldResult(model, candidate, fold, 800, 200, metrics))
+
+        summary = report.summary()
+        assert summary["direction"]["candidate"] == 1
+        assert summary["direction"]["mean"] == pytest.approx(0.57)
+        assert summary["stop_loss"]["candidate"] == 0
+        assert [f["rmse"] for f in summary["stop_loss"]["folds"]] == [0.40, 0.30]
+
+        assert report.best_params() == {"direction": {"num_leaves": 15}, "stop_loss": {}}
+        metrics = report.metrics()
+        assert metrics["direction"] == {"accuracy": pytest.approx(0.57), "worst_accuracy": 0.56}
+        assert metrics["stop_loss"]["rmse"] == pytest.approx(0.35)
+        assert metrics["stop_loss"]["worst_rmse"] == 0.40
+        assert report.to_dict()["metrics"] == metrics
+
+    def test_metrics_gate_on_holdout(self):
+        report = CrossValidationReport(method="walk_forward", n_folds=2, candidates=[{}, {"num_leaves": 15}])
+        for candidate, values in enumerate([[0.50, 0.54], [0.60, 0.58]]):
+            for fold, value in enumerate(values):
+                report.results.append(FoldResult("direction", candidate, fold, 800, 200, {"accuracy": value}))
+        # 선택 폴드에서는 좋아 보였지만 홀드아웃에서는 기준 미달
+        report.holdout.append(FoldResult("direction", 1, 0, 794, 200, {"accuracy": 0.49}))
+
+        metrics = report.metrics()["direction"]
+        assert metrics["accuracy"] == 0.49
+        assert metrics["cv_accuracy"] == pytest.approx(0.59)
+        assert metrics["worst_accuracy"] == 0.58
+        assert report.to_dict()["holdout"][0]["candidate"] == 1
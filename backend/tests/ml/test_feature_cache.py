@@ -0,0 +1,86 @@
+"""
+Test FeatureMatrixCache
+
+Tests:
+- 증분 갱신 결과가 전체 재계산과 같은지 (누적 지표 포함)
+- 학습 행렬 재사용 / 파이프라인 버전별 분리
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml.training import feature_cache as feature_cache_module
+from src.ml.training.feature_cache import (
+    FeatureMatrixCache,
+    LABEL_COLUMNS,
+    training_feature_columns,
+)
+from src.ml.training.labeler import Labeler
+
+
+def _candles(n: int, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.003, n)))
+    spread = np.abs(rng.normal(0, 0.002, n)) * close
+    index = pd.date_range("2025-01-01", periods=n, freq="5min", name="timestamp")
+    return pd.DataFrame(
+        {
+            "open": np.r_[close[0], close[:-1]],
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 1000, n),
+        },
+        index=index,
+    )
+
+
+class TestFeatureMatrixCache:
+    def test_incremental_update_matches_full_build(self, tmp_path):
+        candles = _candles(1600)
+
+        incremental = FeatureMatrixCache(tmp_path / "inc", warmup_candles=800)
+        assert incremental.update("ETHUSDT", "5m", candles.iloc[:1200]) == 1197
+        # 겹치는 구간은 무시되고 보류했던 3개 행부터 다시 계산
+        assert incremental.last_timestamp("ETHUSDT", "5m") == candles.index[1196]
+        assert incremental.update("ETHUSDT", "5m", candles.iloc[1100:]) == 400
+        assert incremental.update("ETHUSDT", "5m", candles.iloc[1100:]) == 0
+
+        full = FeatureMatrixCache(tmp_path / "full")
+        full.update("ETHUSDT", "5m", candles)
+
+        got = incremental.load_features("ETHUSDT", "5m")
+        expected = full.load_features("ETHUSDT", "5m")
+        assert got.index.equals(expected.index)
+
+        # MTF 피처는 계산 시점의 최신 상위 TF 봉 기준이라 비교에서 제외
+        columns = [c for c in expected.columns if not c.startswith(("htf_", "mtf_"))]
+        np.testing.assert_allclose(got["obv"], expected["obv"], rtol=1e-9)
+        np.testing.assert_allclose(got["vwap"], expected["vwap"], rtol=1e-9)
+        np.testing.assert_allclose(got[columns], expected[columns], rtol=1e-3, atol=1e-6)
+
+    def test_training_matrix_is_reused_per_range_and_version(self, tmp_path, monkeypatch):
+        candles = _candles(700)
+        cache = FeatureMatrixCache(tmp_path)
+        cache.update("ETHUSDT", "5m", candles)
+        labeler = Labeler()
+
+        start = candles.index[100]
+        matrix = cache.training_matrix("ETHUSDT", "5m", labeler, start=start)
+        assert matrix.index[0] == start
+        assert not matrix[LABEL_COLUMNS].isna().any().any()
+        features = training_feature_columns(matrix)
+        assert "future_return" not in features and "close" not in features
+
+        # 같은 구간은 저장된 행렬을 그대로 읽음
+        monkeypatch.setattr(labeler, "generate_all_labels", pytest.fail)
+        pd.testing.assert_frame_equal(
+            cache.training_matrix("ETHUSDT", "5m", labeler, start=start), matrix
+        )
+        assert len(list(cache.entry_dir("ETHUSDT", "5m").glob("labels-*"))) == 1
+
+        # 파이프라인 버전이 바뀌면 다른 캐시
+        monkeypatch.setattr(feature_cache_module, "FEATURE_PIPELINE_VERSION", "999")
+        assert cache.last_timestamp("ETHUSDT", "5m") is None
+        assert cache.training_matrix("ETHUSDT", "5m", labeler).empty
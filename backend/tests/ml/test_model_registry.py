@@ -0,0 +1,125 @@
+"""
+Test Model Registry (프로세스 공유 모델 저장소)
+
+Tests:
+- 같은 디렉토리의 예측기들이 한 번 로드된 번들을 공유
+- 매니페스트 변경 시 원자적 핫스왑
+- 매니페스트가 없을 때 파일 stat 기반 변경 감지
+"""
+
+import os
+
+import pytest
+
+from src.ml.models import model_registry
+from src.ml.models.ensemble_predictor import EnsemblePredictor
+from src.ml.models.model_registry import (
+    FEATURE_IMPORTANCE_FILE,
+    MODEL_FILES,
+    ModelRegistry,
+    write_manifest,
+)
+
+
+@pytest.fixture
+def models_dir(tmp_path):
+    for filename in MODEL_FILES.values():
+        (tmp_path / filename).write_text("v1")
+    (tmp_path / FEATURE_IMPORTANCE_FILE).write_text("feature,importance\nrsi_14,10\nclose,5\n")
+    return tmp_path
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def registry(models_dir, loads, monkeypatch):
+    def loader(path):
+        loads.append(path.name)
+        return {"file": path.name, "content": path.read_text()}
+
+    registry = ModelRegistry(models_dir, check_interval=0, loader=loader)
+    monkeypatch.setitem(model_registry._registries, models_dir.resolve(), registry)
+    return registry
+
+
+class TestSharedBundle:
+    def test_predictors_share_one_load(self, registry, models_dir, loads):
+        first = EnsemblePredictor(models_dir=models_dir)
+        second = EnsemblePredictor(models_dir=models_dir)
+
+        assert len(loads) == len(MODEL_FILES)
+        assert first.models is second.models
+        assert first.models_loaded and second.models_loaded
+        assert first.training_features == ["rsi_14", "close"]
+
+    def test_unchanged_files_are_not_reloaded(self, registry, loads):
+        bundle = registry.get_bundle()
+        assert registry.get_bundle() is bundle
+        assert registry.reload_count == 1
+        assert len(loads) == len(MODEL_FILES)
+
+
+class TestHotSwap:
+    def test_manifest_change_swaps_bundle(self, registry, models_dir):
+        old = registry.get_bundle()
+
+        for filename in MODEL_FILES.values():
+            (models_dir / filename).write_text("v2")
+        version = write_manifest(models_dir, list(MODEL_FILES.values()))
+
+        new = registry.get_bundle()
+        assert new is not old
+        assert new.version == version
+        assert new.models["direction"]["content"] == "v2"
+        # 이전 번들을 잡고 있던 호출자는 그대로 사용 가능
+        assert old.models["direction"]["content"] == "v1"
+
+    def test_file_change_without_manifest(self, registry, models_dir):
+        old = registry.get_bundle()
+
+        path = models_dir / MODEL_FILES["timing"]
+        path.write_text("v2-longer")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        new = registry.get_bundle()
+        assert new.version != old.version
+        assert new.models["timing"]["content"] == "v2-longer"
+
+
+class TestNonBlockingReload:
+    async def test_reload_on_event_loop_runs_in_thread(self, models_dir, monkeypatch):
+        import threading
+        import time
+
+        load_threads = []
+
+        def slow_loader(path):
+            load_threads.append(threading.current_thread())
+            time.sleep(0.02)
+            return {"content": path.read_text()}
+
+        registry = ModelRegistry(models_dir, check_interval=0, loader=slow_loader)
+        old = registry.get_bundle()  # 최초 로드는 동기
+        load_threads.clear()
+
+        for filename in MODEL_FILES.values():
+            (models_dir / filename).write_text("v2")
+        write_manifest(models_dir, list(MODEL_FILES.values()))
+
+        # 로드 중에도 즉시 현재 번들 반환
+        started = time.perf_counter()
+        assert registry.get_bundle() is old
+        assert registry.get_bundle() is old
+        assert time.perf_counter() - started < 0.02
+
+        await registry._pending_reload
+        assert registry.get_bundle().models["direction"]["content"] == "v2"
+        assert load_threads and threading.main_thread() not in load_threads
+
+        forced = await registry.reload_async(force=True)
+        assert forced is registry.get_bundle()
+        assert registry.reload_count == 3
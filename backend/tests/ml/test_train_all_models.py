@@ -0,0 +1,16 @@
+"""
+Test ModelTrainer 병렬 학습 설정
+"""
+
+from src.ml.training import train_all_models
+from src.ml.training.train_all_models import MODEL_SPECS, thread_plan
+
+
+def test_thread_plan_partitions_cores(monkeypatch):
+    monkeypatch.setattr(train_all_models.os, "cpu_count", lambda: 16)
+    assert thread_plan(len(MODEL_SPECS)) == (5, 3)
+    assert thread_plan(len(MODEL_SPECS), max_workers=1) == (1, 16)
+    assert thread_plan(2) == (2, 8)
+
+    monkeypatch.setattr(train_all_models.os, "cpu_count", lambda: 2)
+    assert thread_plan(len(MODEL_SPECS)) == (2, 1)
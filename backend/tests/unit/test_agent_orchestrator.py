@@ -0,0 +1,161 @@
+"""
+AgentOrchestrator 유닛 테스트
+
+- 규칙 인덱스 / 액션 DAG 병렬 실행 / 액션 타임아웃
+- 구독 이벤트 동시 처리 + 봇별 순서 보장
+"""
+import asyncio
+import time
+
+import pytest
+
+from src.agents.orchestrator import AgentOrchestrator, OrchestrationEvent
+from src.agents.orchestrator.models import AgentAction, EventType, OrchestrationRule
+
+
+class SlowAgent:
+    """BaseAgent처럼 process_task(AgentTask)를 받는 테스트용 에이전트"""
+
+    def __init__(self, name, log, delay=0.1):
+        self.name = name
+        self.log = log
+        self.delay = delay
+
+    async def process_task(self, task):
+        seq = task.params.get("seq")
+        self.log.append(("start", self.name, seq))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.name, seq))
+        return {"agent": self.name, "upstream": sorted(task.params.get("upstream_results", {}))}
+
+
+def _rule(rule_id, actions, event_type=EventType.VOLUME_SPIKE, priority=1):
+    return OrchestrationRule(
+        rule_id=rule_id, name=rule_id, description=rule_id,
+        trigger_event_types=[event_type], actions=actions, priority=priority,
+    )
+
+
+def _event(event_id, bot_id=None, event_type=EventType.VOLUME_SPIKE):
+    return OrchestrationEvent(
+        event_id=event_id, event_type=event_type, source_agent="test", bot_instance_id=bot_id,
+    )
+
+
+@pytest.fixture
+def orchestrator():
+    return AgentOrchestrator()
+
+
+class TestActionGraph:
+    async def test_independent_actions_run_concurrently(self, orchestrator):
+        log = []
+        for name in ("a", "b", "c"):
+            orchestrator.register_agent(name, SlowAgent(name, log))
+        orchestrator.add_rule(_rule("graph", [
+            AgentAction(agent_id="a", action="run"),
+            AgentAction(agent_id="b", action="run"),
+            AgentAction(agent_id="c", action="run", depends_on=["a", "b"]),
+        ]))
+
+        started = time.perf_counter()
+        result = await orchestrator.handle_event(_event("e1"))
+        elapsed = time.perf_counter() - started
+
+        # a, b 병렬 (0.1) + c (0.1) ≈ 0.2, 순차였다면 0.3
+        assert elapsed < 0.28
+        assert [a.agent_id for a in result.actions_executed] == ["a", "b", "c"]
+        assert result.action_results["c"]["upstream"] == ["a", "b"]
+        assert result.action_results["a"]["upstream"] == []
+        starts = [entry[1] for entry in log if entry[0] == "start"]
+        assert starts[-1] == "c"
+        assert log.index(("start", "c", None)) > log.index(("end", "a", None))
+
+    async def test_timeout_only_fails_the_slow_action(self, orchestrator):
+        log = []
+        orchestrator.register_agent("fast", SlowAgent("fast", log, delay=0.01))
+        orchestrator.register_agent("slow", SlowAgent("slow", log, delay=5))
+        orchestrator.add_rule(_rule("timeouts", [
+            AgentAction(agent_id="fast", action="run"),
+            AgentAction(agent_id="slow", action="run", timeout_seconds=0.05),
+        ]))
+
+        started = time.perf_counter()
+        result = await orchestrator.handle_event(_event("e2"))
+
+        assert time.perf_counter() - started < 1
+        assert result.action_results["fast"]["agent"] == "fast"
+        assert result.action_results["slow"] == {"error": "timeout"}
+
+    def test_invalid_graphs_rejected(self, orchestrator):
+        with pytest.raises(ValueError, match="cycle"):
+            orchestrator.add_rule(_rule("cycle", [
+                AgentAction(agent_id="a", action="run", depends_on=["b"]),
+                AgentAction(agent_id="b", action="run", depends_on=["a"]),
+            ]))
+        with pytest.raises(ValueError, match="unknown"):
+            orchestrator.add_rule(_rule("missing", [
+                AgentAction(agent_id="a", action="run", depends_on=["z"]),
+            ]))
+        assert "cycle" not in {r.rule_id for r in orchestrator._rules}
+
+    def test_rules_indexed_by_event_type_in_priority_order(self, orchestrator):
+        orchestrator.add_rule(_rule("low", [AgentAction(agent_id="a", action="run")], priority=1))
+        orchestrator.add_rule(_rule("high", [AgentAction(agent_id="a", action="run")], priority=9))
+
+        rules = orchestrator._find_matching_rules(_event("e3"))
+        assert [r.rule_id for r in rules] == ["high", "low"]
+        assert orchestrator._find_matching_rules(_event("e4", event_type=EventType.PRICE_ALERT)) == []
+
+
+class TestDispatch:
+    async def test_same_bot_events_keep_order_across_bots_concurrent(self, orchestrator):
+        log = []
+        orchestrator.register_agent("a", SlowAgent("a", log, delay=0.05))
+        orchestrator.add_rule(_rule("seq", [AgentAction(agent_id="a", action="run")]))
+
+        started = time.perf_counter()
+        for seq in range(3):
+            for bot_id in (1, 2):
+                event = _event(f"e{bot_id}-{seq}", bot_id=bot_id)
+                event.data["seq"] = (bot_id, seq)
+                await orchestrator.dispatch_event(event)
+        await orchestrator.drain()
+        elapsed = time.perf_counter() - started
+
+        # 봇 2개가 동시에, 각 봇 안에서는 3개가 순서대로 (≈0.15, 완전 순차면 0.3)
+        assert elapsed < 0.27
+        for bot_id in (1, 2):
+            ends = [entry[2][1] for entry in log if entry[0] == "end" and entry[2][0] == bot_id]
+            assert ends == [0, 1, 2]
+            # 같은 봇 이벤트는 겹치지 않음 (start/end 교대)
+            phases = [entry[0] for entry in log if entry[2][0] == bot_id]
+            assert phases == ["start", "end"] * 3
+        assert orchestrator._ordering_tails == {}
+
+    async def test_custom_handlers_run_sequentially_in_registration_order(self, orchestrator):
+        log = []
+        orchestrator.register_agent("a", SlowAgent("a", log, delay=0))
+        orchestrator.add_rule(_rule("one", [AgentAction(agent_id="a", action="run")]))
+
+        def handler(name, delay):
+            async def _handle(event, result):
+                log.append(("handler-start", name))
+                await asyncio.sleep(delay)
+                log.append(("handler-end", name))
+                if name == "failing":
+                    raise RuntimeError("boom")
+            return _handle
+
+        # 먼저 등록된 느린 핸들러가 끝나야 다음 핸들러 시작, 예외가 나도 다음 핸들러는 실행
+        orchestrator.add_event_handler(EventType.VOLUME_SPIKE, handler("slow", 0.05))
+        orchestrator.add_event_handler(EventType.VOLUME_SPIKE, handler("failing", 0))
+        orchestrator.add_event_handler(EventType.VOLUME_SPIKE, handler("fast", 0))
+
+        await orchestrator.handle_event(_event("h1"))
+
+        assert [entry for entry in log if entry[0].startswith("handler")] == [
+            ("handler-start", "slow"), ("handler-end", "slow"),
+            ("handler-start", "failing"), ("handler-end", "failing"),
+            ("handler-start", "fast"), ("handler-end", "fast"),
+        ]
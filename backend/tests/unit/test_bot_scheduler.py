@@ -0,0 +1,267 @@
+"""
+분산 봇 스케줄러 유닛 테스트
+
+InMemoryLeaseBackend를 Redis 대역으로 공유하고 시계를 직접 움직여 TTL 만료를 재현한다.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.bot_runner import BotRunner
+from src.workers.manager import BotManager
+from src.workers.scheduler import BotCommandRouter, BotScheduler, InMemoryLeaseBackend
+
+TTL = 10.0
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRunner:
+    """BotRunner 인스턴스 API만 흉내 (실행 중인 봇 / 정지 방식 기록)"""
+
+    def __init__(self):
+        self.lease_guard = None
+        self.fence_guard = None
+        self.running = {}
+        self.stopped = []
+
+    async def start_instance(self, session_factory, bot_instance_id, user_id):
+        self.running[bot_instance_id] = user_id
+
+    def stop_instance(self, bot_instance_id, user_id, handoff=False):
+        self.running.pop(bot_instance_id, None)
+        self.stopped.append((bot_instance_id, handoff))
+
+    def is_instance_running(self, bot_instance_id):
+        return bot_instance_id in self.running
+
+
+@pytest.fixture
+def cluster():
+    clock = Clock()
+    backend = InMemoryLeaseBackend(clock=clock)
+    desired = {bot_id: 1 for bot_id in range(1, 13)}
+
+    async def desired_bots():
+        return dict(desired)
+
+    def make(worker_id):
+        return BotScheduler(
+            FakeRunner(), None, backend, worker_id=worker_id, lease_ttl=TTL,
+            takeover_grace=TTL, clock=clock, desired_bots=desired_bots,
+        )
+
+    return clock, backend, desired, make
+
+
+async def _rounds(schedulers, n=3):
+    for _ in range(n):
+        for scheduler in schedulers:
+            await scheduler.tick()
+
+
+def _assert_exclusive(schedulers, expected):
+    owned = [set(s.leases) for s in schedulers]
+    assert sum(len(o) for o in owned) == len(set().union(*owned))
+    assert set().union(*owned) == set(expected)
+    for scheduler in schedulers:
+        assert set(scheduler.runner.running) == set(scheduler.leases)
+
+
+class TestInMemoryLeaseBackend:
+    async def test_expiry_and_token(self):
+        clock = Clock()
+        backend = InMemoryLeaseBackend(clock=clock)
+
+        assert await backend.acquire(7, "a", TTL) == 1
+        assert await backend.acquire(7, "b", TTL) is None
+        assert await backend.acquire(7, "a", TTL) == 1  # 재진입은 같은 토큰
+
+        clock.now += TTL
+        assert await backend.acquire(7, "b", TTL) == 2
+        # 만료된 예전 소유자는 갱신/해제 불가
+        assert not await backend.renew(7, "a", 1, TTL)
+        assert not await backend.release(7, "a", 1)
+        assert await backend.owners() == {7: ("b", 2)}
+        assert await backend.is_current(7, "b", 2)
+        assert not await backend.is_current(7, "a", 1)
+
+
+class TestBotScheduler:
+    async def test_bots_split_evenly_without_double_ownership(self, cluster):
+        clock, backend, desired, make = cluster
+        schedulers = [make(f"w{i}") for i in range(3)]
+
+        # 먼저 뜬 워커가 많이 가져가도 틱마다 상한 초과분을 넘기며 수렴
+        for _ in range(12):
+            await _rounds(schedulers, n=1)
+            clock.now += TTL / 3
+
+        assert [len(s.leases) for s in schedulers] == [4, 4, 4]
+        _assert_exclusive(schedulers, desired)
+        assert all(s.holds(b) for s in schedulers for b in s.leases)
+
+    async def test_dead_worker_bots_move_with_new_token(self, cluster):
+        clock, backend, desired, make = cluster
+        a, b, c = make("a"), make("b"), make("c")
+        await _rounds([a, b, c])
+        clock.now += 2 * TTL
+        await _rounds([a, b, c])
+        before = {bot_id: lease.token for bot_id, lease in c.leases.items()}
+        assert before
+
+        # c 프로세스가 멈춤: 하트비트/갱신 없음
+        for _ in range(4):
+            clock.now += TTL / 2
+            await _rounds([a, b], n=1)
+
+        assert not any(c.holds(bot_id) for bot_id in before)  # 옛 소유자는 거래 중단
+        _assert_exclusive([a, b], desired)
+        for scheduler in (a, b):
+            for bot_id, lease in scheduler.leases.items():
+                if bot_id in before:
+                    assert lease.token > before[bot_id]
+
+        # 되살아난 c는 리스를 잃었음을 알고 핸드오프로 정지 (DB 상태 유지)
+        await c.tick()
+        assert not set(before) & set(c.leases)
+        assert all(handoff for _, handoff in c.runner.stopped)
+
+    async def test_joining_worker_gets_its_share_gradually(self, cluster):
+        clock, backend, desired, make = cluster
+        a = make("a")
+        await _rounds([a])
+        assert len(a.leases) == 12
+
+        b = make("b")
+        for _ in range(10):
+            clock.now += TTL / 3
+            await _rounds([a, b], n=1)
+
+        assert (len(a.leases), len(b.leases)) == (6, 6)
+        _assert_exclusive([a, b], desired)
+
+    async def test_stopped_in_db_is_released(self, cluster):
+        clock, backend, desired, make = cluster
+        a = make("a")
+        await _rounds([a])
+        del desired[3]
+        await a.tick()
+        assert 3 not in a.leases and 3 not in await backend.owners()
+
+    async def test_graceful_stop_hands_bots_over(self, cluster):
+        clock, backend, desired, make = cluster
+        a, b = make("a"), make("b")
+        await _rounds([a, b])
+        clock.now += 2 * TTL
+        await _rounds([a, b])
+
+        await a.stop()
+        await b.tick()
+        assert len(b.leases) == 12
+        assert await backend.live_workers() == ["b"]
+
+
+class OrderClient:
+    """place_market_order 호출만 기록하는 거래소 클라이언트"""
+
+    def __init__(self):
+        self.orders = []
+
+    async def place_market_order(self, **kwargs):
+        self.orders.append(kwargs)
+        return {"data": {"orderId": str(len(self.orders))}}
+
+
+class TestFencing:
+    async def test_stale_owner_order_is_rejected_after_takeover(self, cluster):
+        clock, backend, desired, make = cluster
+        desired.clear()
+        desired[7] = 1
+        a = make("a")
+        await a.tick()
+        assert await a.fence(7)
+
+        # a가 멈춘 사이 리스 만료 → b가 새 토큰으로 인수
+        clock.now += TTL
+        b = make("b")
+        await b.tick()
+        assert b.leases[7].token > a.leases[7].token
+
+        # 로컬 만료 시각을 믿을 수 없는 경우(시계 지연)에도 저장소 토큰으로 거부
+        a.leases[7].expires_at = clock.now + TTL
+        assert a.holds(7)
+        assert not await a.fence(7)
+        assert not a.holds(7)  # 루프도 다음 틱에 종료
+        assert await b.fence(7)
+
+        runner = BotRunner(asyncio.Queue())
+        runner.fence_guard = a.fence
+        client = OrderClient()
+        bot_instance = SimpleNamespace(id=7, telegram_notify=False)
+        position = {"side": "long", "symbol": "BTCUSDT", "size": 0.01, "entry_price": 100.0}
+
+        closed = await runner._close_instance_position(
+            None, client, bot_instance, 1, position, 110.0, "signal"
+        )
+        assert closed is False
+        assert client.orders == []
+
+        runner.fence_guard = b.fence
+        assert await runner._fenced(7, "close order")
+
+
+class TestCommandRouting:
+    async def test_start_and_stop_go_to_the_owner(self, cluster):
+        clock, backend, desired, make = cluster
+        desired.clear()
+        a, b = make("a"), make("b")
+        await _rounds([a, b], n=1)
+
+        manager = BotManager(asyncio.Queue(), None, router=BotCommandRouter(backend))
+        await manager.start_bot_instance(42, 9)
+        # API가 DB에 is_running을 커밋하기 전에도 명령으로 시작한 봇은 유지
+        await _rounds([a, b], n=1)
+        owner = a if 42 in a.leases else b
+        assert owner.runner.running == {42: 9}
+
+        await manager.router.refresh()
+        assert manager.is_instance_running(42)
+
+        await manager.stop_bot_instance(42, 9)
+        await _rounds([a, b], n=1)
+        assert owner.runner.stopped == [(42, False)]
+        assert await backend.owners() == {}
+
+    async def test_user_queries_use_worker_ownership(self, cluster):
+        """분산 모드의 사용자별 조회는 API 프로세스의 로컬 BotRunner가 아니라 워커 리스 기준"""
+        clock, backend, desired, make = cluster
+        desired.clear()
+        desired.update({1: 7, 2: 7, 3: 8})
+        a, b = make("a"), make("b")
+        await _rounds([a, b])
+        clock.now += 2 * TTL
+        await _rounds([a, b])
+
+        manager = BotManager(asyncio.Queue(), None, router=BotCommandRouter(backend))
+        await manager.router.refresh()
+        assert manager.get_user_running_instances(7) == {1, 2}
+        assert manager.get_running_instance_count(8) == 1
+        assert manager.runner.get_running_instance_count(7) == 0
+
+        # 워커가 죽어 리스가 만료되면 스냅샷에서도 빠짐
+        dead = a if 1 in a.leases else b
+        alive = b if dead is a else a
+        lost = set(dead.leases)
+        clock.now += TTL / 2
+        await alive.tick()
+        clock.now += TTL / 2 + 1
+        await manager.router.refresh()
+        assert manager.get_user_running_instances(7) == {1, 2} - lost
@@ -0,0 +1,97 @@
+"""
+공유 캔들 집계기 유닛 테스트
+"""
+import numpy as np
+import pytest
+
+from src.services.candle_aggregator import CandleAggregator
+
+INTERVAL = 60
+START = 1_700_000_040  # 1m 경계
+
+
+def history(count=10, end=START):
+    return [
+        {
+            "timestamp": (end - (count - i) * INTERVAL) * 1000,
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 10.0,
+        }
+        for i in range(count)
+    ]
+
+
+class FakeClient:
+    def __init__(self, candles):
+        self.candles = candles
+        self.calls = 0
+
+    async def get_historical_candles(self, symbol, interval, limit):
+        self.calls += 1
+        return self.candles
+
+
+class TestCandleAggregator:
+    async def test_backfills_once_per_series(self):
+        aggregator = CandleAggregator()
+        client = FakeClient(history())
+
+        first = await aggregator.subscribe("ETH/USDT:USDT", "1m", client=client)
+        second = await aggregator.subscribe("ETHUSDT", "1m", client=client)
+        await aggregator.subscribe("ETHUSDT", "5m", client=client)
+
+        assert first is second
+        assert client.calls == 2  # (심볼, 타임프레임)당 1회
+        assert len(first) == 10
+        assert first.view()[-1]["close"] == 109.5
+
+    async def test_ticks_build_ohlcv_and_notify_on_close(self):
+        aggregator = CandleAggregator()
+        closed = []
+        aggregator.add_close_listener(lambda s, tf, c: closed.append((s, tf, c)))
+        series = await aggregator.subscribe("ETHUSDT", "1m", seed_candles=history())
+
+        aggregator.on_tick("ETHUSDT", 110.0, 1000.0, START + 5)   # 첫 틱: 부분 캔들
+        aggregator.on_tick("ETHUSDT", 111.0, 1002.0, START + 60)  # 부분 캔들 마감 (알림 없음)
+        aggregator.on_tick("ETHUSDT", 113.0, 1005.0, START + 90)
+        aggregator.on_tick("ETHUSDT", 109.0, 1006.0, START + 100)
+        assert closed == []
+
+        current = series.view()[-1]
+        assert (current["open"], current["high"], current["low"], current["close"]) == (111.0, 113.0, 109.0, 109.0)
+        assert current["volume"] == pytest.approx(6.0)
+
+        aggregator.on_tick("ETHUSDT", 112.0, 1007.0, START + 120)
+        assert len(closed) == 1
+        assert closed[0][:2] == ("ETHUSDT", "1m")
+        assert closed[0][2]["time"] == START + 60
+        assert len(series) == 13
+
+    async def test_views_are_read_only_and_zero_copy(self):
+        aggregator = CandleAggregator(capacity=8)
+        series = await aggregator.subscribe("BTCUSDT", "1m", seed_candles=history(count=20))
+
+        view = series.view()
+        assert len(view) == 8
+        assert np.shares_memory(view.close, series._buf)
+        with pytest.raises(ValueError):
+            view.close[0] = 0.0
+
+        # 링버퍼가 돌아도 최근 N개는 시간순 연속 구간
+        aggregator.on_tick("BTCUSDT", 150.0, None, START + 1)
+        times = series.view().time
+        assert np.all(np.diff(times) == INTERVAL)
+        assert series.view(3)[1:].close.tolist() == [119.5, 150.0]
+
+    async def test_get_candles_excludes_current_on_request(self):
+        aggregator = CandleAggregator()
+        await aggregator.subscribe("SOLUSDT", "1m", seed_candles=history(count=5))
+        aggregator.on_tick("SOLUSDT", 50.0, None, START + 1)
+
+        assert len(aggregator.get_candles("SOLUSDT", "1m", limit=3)) == 3
+        without_current = aggregator.get_candles("SOLUSDT", "1m", limit=3, include_current=False)
+        assert [c["time"] for c in without_current] == [START - 3 * INTERVAL, START - 2 * INTERVAL, START - INTERVAL]
+        assert aggregator.get_candles("DOGEUSDT", "1m") == []
@@ -0,0 +1,91 @@
+"""
+1m 기준 캔들 롤업 유닛 테스트
+"""
+import csv
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.cache_backtest_service import CacheBacktestService
+from src.services.candle_aggregator import CandleAggregator
+from src.utils.candle_rollup import rollup_candles, rollup_frame
+
+DAY_START = 1_700_006_400  # 2023-11-15 00:00 UTC
+
+
+def minute_candles(count, start=DAY_START, ms=True):
+    rng = np.random.default_rng(7)
+    closes = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    candles = []
+    for i, close in enumerate(closes):
+        ts = start + i * 60
+        candles.append({
+            ("timestamp" if ms else "time"): ts * 1000 if ms else ts,
+            "open": float(close - 0.1),
+            "high": float(close + 0.3),
+            "low": float(close - 0.4),
+            "close": float(close),
+            "volume": float(i % 7 + 1),
+        })
+    return candles
+
+
+class TestCandleRollup:
+    def test_rollup_matches_pandas_resample(self):
+        candles = minute_candles(3 * 24 * 60)
+        df = pd.DataFrame(candles)
+        df.index = pd.to_datetime(df.pop("timestamp"), unit="ms")
+
+        for timeframe, rule in (("5m", "5min"), ("1h", "1h"), ("4h", "4h"), ("1D", "1D")):
+            expected = df.resample(rule).agg(
+                {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+            ).dropna()
+            rolled = rollup_frame(df, timeframe)
+
+            assert len(rolled) == len(expected)
+            np.testing.assert_allclose(
+                rolled[["open", "high", "low", "close", "volume"]].to_numpy(), expected.to_numpy()
+            )
+
+    def test_partial_head_bucket_is_dropped_and_units_kept(self):
+        candles = minute_candles(13, start=DAY_START + 120, ms=False)  # 00:02 ~ 00:14
+
+        rolled = rollup_candles(candles, "5m")
+
+        assert [c["time"] for c in rolled] == [DAY_START + 300, DAY_START + 600]
+        first = rolled[0]
+        window = candles[3:8]
+        assert first["open"] == window[0]["open"]
+        assert first["close"] == window[-1]["close"]
+        assert first["high"] == max(c["high"] for c in window)
+        assert first["volume"] == pytest.approx(sum(c["volume"] for c in window))
+
+    async def test_aggregator_derives_higher_timeframe_without_rest(self):
+        class FailingClient:
+            async def get_historical_candles(self, symbol, interval, limit):
+                raise AssertionError("higher timeframe should be rolled up locally")
+
+        aggregator = CandleAggregator(capacity=1000)
+        await aggregator.subscribe("ETHUSDT", "1m", seed_candles=minute_candles(1000))
+        series = await aggregator.subscribe("ETHUSDT", "5m", client=FailingClient())
+
+        assert len(series) == 200
+        assert aggregator.stats["derived_backfills"] == 1
+        assert series.view()[-1]["close"] == pytest.approx(aggregator.get_series("ETHUSDT", "1m").view()[-1]["close"])
+
+    def test_backtest_cache_reads_higher_timeframe_from_1m_file(self, tmp_path):
+        with open(tmp_path / "BTCUSDT_1m.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["timestamp", "open", "high", "low", "close", "volume"])
+            writer.writeheader()
+            writer.writerows(minute_candles(24 * 60))
+
+        service = CacheBacktestService(cache_dir=str(tmp_path))
+        hourly = service.load_candles("BTCUSDT", "1h")
+        arrays = service.load_candle_arrays("BTCUSDT", "1h")
+
+        assert len(hourly) == len(arrays) == 24
+        assert hourly[1].timestamp - hourly[0].timestamp == 3600 * 1000
+        assert float(hourly[-1].close) == pytest.approx(arrays.closes[-1])
+        assert any(d["timeframe"] == "4h" and d.get("derived_from") == "1m"
+                   for d in service.get_available_data()["data"])
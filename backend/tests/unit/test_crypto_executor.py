@@ -0,0 +1,56 @@
+"""
+인증 암호 연산 워커 풀 유닛 테스트
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.crypto_executor import CryptoExecutor
+from src.utils.exceptions import ServiceBusyError
+from src.utils.jwt_auth import JWTAuth
+
+
+class TestCryptoExecutor:
+    async def test_blocking_work_does_not_stall_event_loop(self):
+        executor = CryptoExecutor(max_workers=1, max_queue=4)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.1)
+        task.cancel()
+        executor.shutdown()
+
+        assert ticks >= 5
+        assert executor.stats["completed"] == 1
+
+    async def test_saturated_pool_rejects_with_503(self):
+        executor = CryptoExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceBusyError) as exc_info:
+            await executor.run(lambda: None)
+        assert exc_info.value.status_code == 503
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert executor.get_status()["inflight"] == 0
+        assert executor.stats["rejected"] == 1
+        executor.shutdown()
+
+    async def test_async_password_helpers_match_sync(self):
+        hashed = await JWTAuth.get_password_hash_async("S3cure!pass")
+
+        assert JWTAuth.verify_password("S3cure!pass", hashed)
+        assert await JWTAuth.verify_password_async("S3cure!pass", hashed)
+        assert not await JWTAuth.verify_password_async("wrong", hashed)
@@ -0,0 +1,93 @@
+"""
+공유 FinBERT 서비스 유닛 테스트
+
+모델 대신 가짜 추론 함수를 사용해 배치/캐시/병합 동작만 검증.
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.agents.sentiment_analyzer import SentimentAnalyzerAgent
+from src.agents.sentiment_analyzer.finbert_service import FinBERTService, headline_key
+from src.agents.sentiment_analyzer.models import NewsItem, SentimentLabel
+
+
+class FakeFinBERT(FinBERTService):
+    """'up' 포함 시 긍정, 'down' 포함 시 부정"""
+
+    def __init__(self, **kwargs):
+        super().__init__(quantize=False, **kwargs)
+        self.model = object()
+        self.inferred = []
+
+    def _ensure_model(self):
+        return True
+
+    def _infer_probs(self, texts):
+        self.inferred.append(list(texts))
+        self.stats["batches"] += -(-len(texts) // self.batch_size)
+        probs = []
+        for text in texts:
+            if "up" in text:
+                probs.append((0.8, 0.1, 0.1))
+            elif "down" in text:
+                probs.append((0.1, 0.7, 0.2))
+            else:
+                probs.append((0.2, 0.2, 0.6))
+        return probs
+
+
+class FakeSource:
+    def __init__(self, titles):
+        self.titles = titles
+
+    async def fetch_news(self, symbols, hours=24):
+        return [
+            NewsItem(title=t, url="", source="fake", published_at=datetime.utcnow(), currencies=symbols)
+            for t in self.titles
+        ]
+
+
+class TestFinBERTService:
+    async def test_cached_headlines_are_not_rescored(self):
+        service = FakeFinBERT()
+
+        first = await service.score_texts(["ETH up", "ETH down", "ETH flat"])
+        second = await service.score_texts(["  eth   UP ", "ETH down", "new: BTC up"])
+
+        assert [label for _, label, _ in first] == [
+            SentimentLabel.POSITIVE, SentimentLabel.NEGATIVE, SentimentLabel.NEUTRAL,
+        ]
+        assert second[0] == first[0]
+        assert service.inferred == [["ETH up", "ETH down", "ETH flat"], ["new: BTC up"]]
+        assert service.stats["cache_hits"] == 2
+
+    async def test_duplicates_and_concurrent_calls_share_inference(self):
+        service = FakeFinBERT()
+        titles = ["ETH up", "ETH up", "ETH down"]
+
+        results = await asyncio.gather(service.score_texts(titles), service.score_texts(titles))
+
+        assert results[0] == results[1]
+        assert results[0][0] == results[0][1]
+        assert sum(len(batch) for batch in service.inferred) == 2
+        assert service._pending == {}
+
+    def test_headline_key_normalizes_whitespace_and_case(self):
+        assert headline_key("ETH  ETF\napproved") == headline_key("eth etf approved")
+
+
+class TestAgentUsesSharedService:
+    async def test_market_sentiment_from_batched_scores(self):
+        agent = SentimentAnalyzerAgent(agent_id="sentiment_test", name="SentimentAnalyzer")
+        agent.finbert = FakeFinBERT()
+        agent.cryptopanic = FakeSource(["ETH up", "ETH up again", "ETH down"])
+
+        sentiment = await agent.analyze_market_sentiment("ETH", use_cache=False)
+
+        assert sentiment.news_count == 3
+        assert sentiment.positive_count == 2
+        assert sentiment.negative_count == 1
+        assert sentiment.score == pytest.approx((0.7 + 0.7 - 0.6) / 3)
+        assert len(agent.finbert.inferred) == 1
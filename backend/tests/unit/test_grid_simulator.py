@@ -0,0 +1,110 @@
+"""
+벡터화 그리드 시뮬레이터 유닛 테스트
+
+float64 경로가 Decimal 기준 구현과 허용 오차 내에서 일치하는지 검증.
+"""
+import random
+from decimal import Decimal
+
+import pytest
+
+from src.database.models import GridMode, PositionDirection
+from src.services import grid_simulator
+from src.services.cache_backtest_service import CacheBacktestService, CachedCandle
+from src.services.candle_data_service import Candle
+from src.services.grid_backtester import GridBacktester
+from src.services.grid_simulator import CandleArrays, run_parameter_sweep
+
+
+def _random_walk(candle_cls, count=1500, seed=7):
+    rng = random.Random(seed)
+    ts = 1_735_689_600_000  # 2025-01-01 UTC
+    price = 100.0
+    candles = []
+    for _ in range(count):
+        open_ = price
+        price = max(50.0, price * (1 + rng.gauss(0, 0.01)))
+        high = max(open_, price) * (1 + abs(rng.gauss(0, 0.004)))
+        low = min(open_, price) * (1 - abs(rng.gauss(0, 0.004)))
+        candles.append(candle_cls(
+            timestamp=ts,
+            open=Decimal(str(round(open_, 4))),
+            high=Decimal(str(round(high, 4))),
+            low=Decimal(str(round(low, 4))),
+            close=Decimal(str(round(price, 4))),
+            volume=Decimal("1"),
+        ))
+        ts += 15 * 60 * 1000
+    return candles
+
+
+CASES = [
+    (direction, mode)
+    for direction in (PositionDirection.LONG, PositionDirection.SHORT)
+    for mode in (GridMode.ARITHMETIC, GridMode.GEOMETRIC)
+]
+
+
+@pytest.fixture
+def cache_service(tmp_path):
+    return CacheBacktestService(cache_dir=str(tmp_path))
+
+
+class TestParity:
+    @pytest.mark.parametrize("direction,mode", CASES)
+    def test_cache_service_matches_decimal_reference(self, cache_service, direction, mode):
+        candles = _random_walk(CachedCandle)
+        grid_prices = cache_service._calculate_grid_prices(
+            Decimal("85"), Decimal("115"), 30, mode
+        )
+        args = (candles, grid_prices, direction, Decimal("5000") / 30, Decimal("1000"))
+
+        reference = cache_service._run_simulation_reference(*args)
+        fast = cache_service._run_simulation(*args)
+
+        assert reference["total_trades"] > 0
+        for key in ("total_trades", "winning_trades", "losing_trades", "daily_roi"):
+            assert fast[key] == reference[key]
+        for key in ("total_profit", "max_drawdown", "win_rate", "roi_30d"):
+            assert fast[key] == pytest.approx(reference[key], abs=0.011)
+        assert fast["equity_curve"] == pytest.approx(reference["equity_curve"])
+        assert [t["time"] for t in fast["trades"]] == [t["time"] for t in reference["trades"]]
+
+    @pytest.mark.parametrize("direction,mode", CASES)
+    def test_grid_backtester_matches_decimal_reference(self, direction, mode, monkeypatch):
+        # 작은 청크로 청크 경계 상태 전달까지 검증
+        monkeypatch.setattr(grid_simulator, "CHUNK_CELLS", 64)
+        backtester = GridBacktester(candle_service=object())
+        candles = _random_walk(Candle, seed=11)
+        grid_prices = backtester._calculate_grid_prices(Decimal("80"), Decimal("120"), 25, mode)
+        args = (candles, grid_prices, direction, Decimal("2000") / 25, 2, Decimal("1000"))
+
+        reference = backtester._simulate_reference(*args)
+        fast = backtester._simulate(*args)
+
+        assert fast.total_trades == reference.total_trades > 0
+        assert fast.winning_trades == reference.winning_trades
+        assert float(fast.total_profit) == pytest.approx(float(reference.total_profit), abs=0.011)
+        assert float(fast.max_drawdown) == pytest.approx(float(reference.max_drawdown), abs=0.011)
+        assert float(fast.max_profit_trade) == pytest.approx(float(reference.max_profit_trade))
+        assert fast.daily_roi == pytest.approx(reference.daily_roi, abs=0.011)
+
+
+class TestSweep:
+    async def test_sweep_matches_single_runs(self, cache_service):
+        candles = CandleArrays.from_candles(_random_walk(CachedCandle))
+        combos = [(85.0, 115.0, 10, True), (90.0, 110.0, 20, False)]
+
+        results = await run_parameter_sweep(candles, combos, long=True, investment=1000, leverage=5)
+
+        for (lower, upper, count, arithmetic), result in zip(combos, results):
+            mode = GridMode.ARITHMETIC if arithmetic else GridMode.GEOMETRIC
+            grid_prices = cache_service._calculate_grid_prices(
+                Decimal(str(lower)), Decimal(str(upper)), count, mode
+            )
+            single = cache_service._run_simulation(
+                candles, grid_prices, PositionDirection.LONG,
+                Decimal("5000") / count, Decimal("1000"),
+            )
+            assert result["total_trades"] == single["total_trades"]
+            assert result["roi_30d"] == pytest.approx(single["roi_30d"], abs=0.011)
@@ -0,0 +1,144 @@
+"""
+과거 캔들 다운로더 유닛 테스트
+
+로컬 FakeExchangeServer(429/500 주입)에서 받아 컬럼형 저장소에 쓰고,
+체크포인트로 재시작 / 캔들 캐시 연동을 확인한다.
+"""
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from src.services.candle_cache import CandleCacheManager
+from src.services.candle_store import ColumnarCandleStore, month_partitions
+from src.services.fake_exchange import FakeExchangeServer, expected_candle
+from src.services.historical_downloader import (
+    HistoricalCandleDownloader,
+    TokenBucket,
+    create_candle_source,
+)
+
+MINUTE = 60_000
+
+
+def _ms(value: str) -> int:
+    return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+@pytest.fixture
+async def exchange():
+    server = FakeExchangeServer(rate_limit_every=3, fail_every=5, retry_after=0.01)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _downloader(server, store, exchange_name="binance"):
+    source = create_candle_source(exchange_name, base_url=server.base_url)
+    return HistoricalCandleDownloader(
+        source, store, concurrency=4, requests_per_second=1000, retry_backoff=0.001,
+    )
+
+
+class TestTokenBucket:
+    async def test_limits_rate_after_burst(self):
+        bucket = TokenBucket(rate=50, capacity=2)
+        started = time.perf_counter()
+        for _ in range(7):
+            await bucket.acquire()
+        # 버스트 2개 이후 5개는 20ms 간격
+        assert time.perf_counter() - started >= 0.09
+
+
+class TestHistoricalDownloader:
+    @pytest.mark.parametrize("exchange_name", ["binance", "bitget"])
+    async def test_downloads_across_months_despite_injected_errors(self, exchange, tmp_path, exchange_name):
+        store = ColumnarCandleStore(str(tmp_path))
+        downloader = _downloader(exchange, store, exchange_name)
+        start, end = _ms("2024-01-30"), _ms("2024-02-02")
+
+        result = await downloader.download("BTCUSDT", "1m", start, end)
+        await downloader.source.close()
+
+        assert result.ok and result.retries > 0
+        assert result.candles == (end - start) // MINUTE
+        columns = store.read_columns(exchange_name, "BTCUSDT", "1m", start, end)
+        expected = np.array([expected_candle(ts, MINUTE) for ts in range(start, end, MINUTE)])
+        assert np.array_equal(columns["timestamp"], expected[:, 0].astype(np.int64))
+        assert np.allclose(columns["close"], expected[:, 4])
+        # 월 일부만 받았으므로 미완료 파티션
+        checkpoint = store.load_checkpoint(exchange_name, "BTCUSDT", "1m")
+        assert {name: p["complete"] for name, p in checkpoint.items()} == {"2024-01": False, "2024-02": False}
+
+    async def test_restart_skips_completed_months_and_resumes_failed_one(self, exchange, tmp_path):
+        store = ColumnarCandleStore(str(tmp_path))
+        downloader = _downloader(exchange, store)
+        start, end = _ms("2024-01-01"), _ms("2024-04-01")
+
+        # 3월 페이지는 첫 실행에서 계속 실패 (프로세스가 중간에 죽은 것과 같음)
+        fetch_page = downloader.source.fetch_page
+        march = _ms("2024-03-01")
+
+        async def flaky(symbol, timeframe, page_start, page_end):
+            if page_start >= march:
+                raise ConnectionError("network down")
+            return await fetch_page(symbol, timeframe, page_start, page_end)
+
+        downloader.source.fetch_page = flaky
+        first = await downloader.download("BTCUSDT", "1h", start, end)
+        assert first.failed_partitions == ["2024-03"]
+        assert first.partitions_written == 2
+
+        downloader.source.fetch_page = fetch_page
+        second = await downloader.download("BTCUSDT", "1h", start, end)
+        assert (second.partitions_skipped, second.partitions_written) == (2, 1)
+        assert second.ok
+
+        requests = exchange.requests
+        third = await downloader.download("BTCUSDT", "1h", start, end)
+        await downloader.source.close()
+        assert third.partitions_skipped == 3 and exchange.requests == requests
+
+        assert store.covers("binance", "BTCUSDT", "1h", start, end)
+        assert len(store.read_columns("binance", "BTCUSDT", "1h", start, end)["timestamp"]) == (end - start) // (60 * MINUTE)
+
+    async def test_disjoint_partial_ranges_in_same_month_both_survive(self, exchange, tmp_path):
+        store = ColumnarCandleStore(str(tmp_path))
+        downloader = _downloader(exchange, store)
+        hour = 60 * MINUTE
+
+        await downloader.download("BTCUSDT", "1h", _ms("2024-01-01"), _ms("2024-01-05"))
+        result = await downloader.download("BTCUSDT", "1h", _ms("2024-01-20"), _ms("2024-01-25"))
+        await downloader.source.close()
+        assert result.ok
+
+        for start, end in ((_ms("2024-01-01"), _ms("2024-01-05")), (_ms("2024-01-20"), _ms("2024-01-25"))):
+            timestamps = store.read_columns("binance", "BTCUSDT", "1h", start, end)["timestamp"]
+            assert np.array_equal(timestamps, np.arange(start, end, hour))
+        checkpoint = store.load_checkpoint("binance", "BTCUSDT", "1h")["2024-01"]
+        assert (checkpoint["from"], checkpoint["to"], checkpoint["complete"]) == (
+            _ms("2024-01-01"), _ms("2024-01-25"), False,
+        )
+
+    def test_month_partitions(self):
+        parts = month_partitions(_ms("2023-12-15"), _ms("2024-02-01"))
+        assert [p[0] for p in parts] == ["2023-12", "2024-01"]
+        assert parts[1][1:] == (_ms("2024-01-01"), _ms("2024-02-01"))
+
+
+class TestCandleCacheIntegration:
+    async def test_backtest_cache_reads_and_rolls_up_from_store(self, exchange, tmp_path):
+        cache = CandleCacheManager(cache_dir=str(tmp_path))
+        downloader = _downloader(exchange, cache.columnar_store)
+        # 캔들 캐시는 로컬 자정 기준으로 기간을 계산하므로 앞뒤 하루 여유
+        await downloader.download("ETHUSDT", "1m", _ms("2024-05-01"), _ms("2024-05-05"))
+        await downloader.source.close()
+        requests = exchange.requests
+
+        candles = await cache.get_candles("ETHUSDT", "1m", "2024-05-02", "2024-05-03", source="binance")
+        assert len(candles) == 2 * 24 * 60
+        hourly = await cache.get_candles("ETHUSDT", "1h", "2024-05-02", "2024-05-03", source="binance")
+        assert len(hourly) == 48
+        assert hourly[0]["open"] == candles[0]["open"]
+        assert exchange.requests == requests
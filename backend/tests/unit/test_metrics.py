@@ -0,0 +1,153 @@
+"""
+Prometheus 메트릭 유닛 테스트
+
+텍스트 노출 형식, 라벨 캐시, DB/에이전트/WebSocket/이벤트 루프 계측과 /metrics 엔드포인트 확인.
+"""
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.agents.base import AgentTask, BaseAgent
+from src.api import metrics as metrics_api
+from src.utils.metrics import (
+    Counter,
+    EventLoopLagMonitor,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    agent_queue_wait_seconds,
+    agent_service_seconds,
+    db_query_seconds,
+    instrument_engine,
+    statement_name,
+    websocket_send_queue_depth_observed,
+)
+from src.websockets import ws_server
+
+
+class TestExposition:
+    def test_histogram_renders_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        hist = Histogram("req_seconds", "Request time", ["path"], buckets=(0.1, 1.0), registry=registry)
+        child = hist.labels("/a")
+        for value in (0.05, 0.1, 0.5, 3.0):
+            child.observe(value)
+
+        lines = registry.render().splitlines()
+        assert "# TYPE req_seconds histogram" in lines
+        assert 'req_seconds_bucket{path="/a",le="0.1"} 2' in lines
+        assert 'req_seconds_bucket{path="/a",le="1"} 3' in lines
+        assert 'req_seconds_bucket{path="/a",le="+Inf"} 4' in lines
+        assert 'req_seconds_sum{path="/a"} 3.65' in lines
+        assert 'req_seconds_count{path="/a"} 4' in lines
+
+    def test_labels_are_cached_escaped_and_removable(self):
+        registry = MetricsRegistry()
+        gauge = Gauge("depth", "Depth", ["name"], registry=registry)
+        assert gauge.labels(7) is gauge.labels("7")
+        gauge.labels('a"b').set(3)
+        assert 'depth{name="a\\"b"} 3' in registry.render()
+
+        gauge.remove('a"b')
+        assert 'a\\"b' not in registry.render()
+
+    def test_counter_and_duplicate_registration(self):
+        registry = MetricsRegistry()
+        counter = Counter("events_total", "Events", registry=registry)
+        counter.inc()
+        counter.inc(2)
+        assert "events_total 3" in registry.render()
+        try:
+            Counter("events_total", "Events", registry=registry)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("duplicate metric must be rejected")
+
+
+class TestInstrumentation:
+    def test_statement_name(self):
+        assert statement_name("SELECT trades.id FROM trades WHERE trades.user_id = ?") == "select_trades"
+        assert statement_name('INSERT INTO "bot_logs" (a) VALUES (?)') == "insert_bot_logs"
+        assert statement_name("UPDATE bot_instances SET x=? WHERE id=?") == "update_bot_instances"
+        assert statement_name("  delete from equity where id=?") == "delete_equity"
+        assert statement_name("PRAGMA table_info(x)") == "pragma"
+
+    async def test_db_query_time_by_statement_name(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        instrument_engine(engine)
+        instrument_engine(engine)  # 중복 등록 무시
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE candles (ts INTEGER)"))
+            await conn.execute(text("SELECT ts FROM candles"))
+            await conn.execute(
+                text("SELECT count(*) FROM candles").execution_options(statement_name="count_candles")
+            )
+        await engine.dispose()
+
+        assert db_query_seconds.labels("select_candles").count == 1
+        assert db_query_seconds.labels("count_candles").count == 1
+
+    async def test_agent_queue_wait_and_service_time(self):
+        class SleepyAgent(BaseAgent):
+            async def process_task(self, task):
+                await asyncio.sleep(0.02)
+
+        agent = SleepyAgent("sleepy-1", "metrics_test_agent")
+        await agent.submit_task(AgentTask(task_id="t1", task_type="noop"))
+        await asyncio.sleep(0.05)  # 시작 전 큐 대기
+        await agent.start()
+        for _ in range(100):
+            if agent.metrics.completed_tasks:
+                break
+            await asyncio.sleep(0.01)
+        await agent.stop()
+
+        wait = agent_queue_wait_seconds.labels("metrics_test_agent")
+        service = agent_service_seconds.labels("metrics_test_agent")
+        assert wait.count == 1 and wait.sum >= 0.05
+        assert service.count == 1 and service.sum >= 0.02
+
+    async def test_websocket_send_queue_depth(self):
+        before = websocket_send_queue_depth_observed.labels().count
+        await asyncio.gather(*(ws_server.broadcast_to_all({"n": i}) for i in range(3)))
+
+        assert websocket_send_queue_depth_observed.labels().count == before + 3
+        assert ws_server._pending_sends == 0
+
+    async def test_event_loop_lag_monitor_sees_blocking_call(self):
+        hist = Histogram("lag_test_seconds", "lag", registry=None)
+        monitor = EventLoopLagMonitor(interval=0.01, histogram=hist)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # 루프 블로킹
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        assert not monitor.running
+        assert hist.labels().count >= 2
+        assert hist.labels().sum >= 0.08
+
+
+class TestMetricsEndpoint:
+    def test_serves_prometheus_text(self):
+        app = FastAPI()
+        app.include_router(metrics_api.router)
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        for name in (
+            "event_loop_lag_seconds",
+            "bot_tick_to_decision_seconds",
+            "bot_decision_to_order_seconds",
+            "agent_queue_wait_seconds",
+            "exchange_request_seconds",
+            "db_query_seconds",
+            "websocket_send_queue_depth",
+        ):
+            assert f"# TYPE {name} " in response.text
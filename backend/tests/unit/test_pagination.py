@@ -0,0 +1,118 @@
+"""
+Keyset 페이지네이션 유닛 테스트
+
+커서 왕복, (created_at, id) 동률 처리, NDJSON/CSV 스트리밍 검증.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotLog, User
+from src.utils.exceptions import InvalidParameterError
+from src.utils.pagination import (
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    paginate_rows,
+    stream_csv,
+    stream_ndjson,
+)
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _seed_logs(session_factory, count=7):
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    async with session_factory() as session:
+        user = User(email="logs@example.com", password_hash="x")
+        session.add(user)
+        await session.flush()
+        # 두 건씩 같은 created_at -> id로 동률 해소
+        for i in range(count):
+            session.add(BotLog(
+                user_id=user.id, event_type="bot_start", message=f"log {i}",
+                created_at=base + timedelta(minutes=i // 2),
+            ))
+        await session.commit()
+
+
+def _key(row):
+    return row.created_at, row.id
+
+
+class TestCursor:
+    def test_round_trip(self):
+        created_at = datetime(2025, 3, 1, 9, 30, 15, 123456)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_malformed_cursor_raises(self):
+        with pytest.raises(InvalidParameterError):
+            decode_cursor("not-a-cursor")
+
+
+class TestKeysetPagination:
+    async def test_pages_cover_all_rows_once(self, session_factory):
+        """페이지를 이어 붙이면 중복/누락 없이 최신순 전체 결과"""
+        await _seed_logs(session_factory)
+        base = select(BotLog.id, BotLog.created_at, BotLog.message)
+
+        seen, cursor = [], None
+        async with session_factory() as session:
+            while True:
+                stmt = apply_keyset(base, BotLog.created_at, BotLog.id, cursor)
+                rows = (await session.execute(stmt.limit(3 + 1))).all()
+                page, cursor = paginate_rows(rows, 3, _key)
+                seen.extend(row.id for row in page)
+                if cursor is None:
+                    break
+
+            expected = (await session.execute(
+                select(BotLog.id).order_by(BotLog.created_at.desc(), BotLog.id.desc())
+            )).scalars().all()
+
+        assert seen == list(expected)
+
+    async def test_stream_ndjson(self, session_factory):
+        """NDJSON 스트리밍은 한 줄에 한 행"""
+        await _seed_logs(session_factory, count=5)
+        stmt = select(BotLog.id, BotLog.created_at).order_by(BotLog.id)
+
+        chunks = [
+            chunk async for chunk in stream_ndjson(
+                session_factory, stmt, lambda row: {"id": row.id, "created_at": row.created_at},
+                batch_size=2,
+            )
+        ]
+        lines = b"".join(chunks).decode().splitlines()
+
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4, 5]
+        assert json.loads(lines[0])["created_at"] == "2025-01-01T12:00:00"
+
+    async def test_stream_csv(self, session_factory):
+        """CSV 스트리밍은 헤더 한 줄 + 행마다 한 줄 (None은 빈 값)"""
+        await _seed_logs(session_factory, count=5)
+        stmt = select(BotLog.id, BotLog.created_at, BotLog.message).order_by(BotLog.id)
+
+        chunks = [
+            chunk async for chunk in stream_csv(
+                session_factory, stmt,
+                lambda row: {"id": row.id, "created_at": row.created_at, "message": None},
+                ["id", "created_at", "message"],
+                batch_size=2,
+            )
+        ]
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+
+        # 헤더 + 배치(2, 2, 1)
+        assert len(chunks) == 4
+        assert rows[0] == ["id", "created_at", "message"]
+        assert [row[0] for row in rows[1:]] == ["1", "2", "3", "4", "5"]
+        assert rows[1][1:] == ["2025-01-01T12:00:00", ""]
@@ -0,0 +1,138 @@
+"""
+페이로드 코덱 유닛 테스트
+
+- 버전 헤더 / 레거시 JSON 읽기 호환 (롤아웃 중 구/신 버전 혼재)
+- Decimal/datetime 변환이 기존 DecimalEncoder와 동일
+- CacheManager / RedisClient 경로 연동
+"""
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.agents.config import RedisConfig
+from src.agents.redis_client import RedisClient
+from src.utils import codec
+from src.utils.cache_manager import CacheManager, DecimalEncoder
+
+SNAPSHOT = {
+    "stats": {"totalTrades": 12, "winRate": 58.33, "avgPnl": Decimal("1.25")},
+    "profits": {"daily": Decimal("-3.50"), "allTime": 41.0},
+    "updatedAt": datetime(2026, 1, 2, 3, 4, 5, 678901),
+    "openedAt": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "day": date(2026, 1, 2),
+    "userId": 42,
+    "note": "상승 추세",
+}
+
+
+class TextRedis:
+    """decode_responses=True 클라이언트처럼 bytes로 저장된 값을 str로 돌려줌"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    async def set(self, key, value):
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        value = self.data.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+
+class TestCodec:
+    def test_header_and_same_values_as_decimal_encoder(self):
+        payload = codec.encode(SNAPSHOT, codec="json")
+
+        assert payload.startswith(b"\x1ej1")
+        legacy = json.loads(json.dumps({**SNAPSHOT, "day": "2026-01-02"}, cls=DecimalEncoder))
+        assert codec.decode(payload) == legacy
+        assert codec.decode(payload.decode()) == legacy  # decode_responses=True 경로
+
+    def test_legacy_values_still_readable(self):
+        assert codec.decode(json.dumps({"a": 1})) == {"a": 1}
+        assert codec.decode("5") == 5
+        assert codec.decode("not json") == "not json"
+        with pytest.raises(ValueError):
+            codec.decode("not json", strict=True)
+
+    def test_legacy_mode_writes_headerless_json(self):
+        payload = codec.encode({"price": Decimal("1.5")}, codec="legacy")
+        assert json.loads(payload) == {"price": 1.5}
+
+    def test_default_writes_legacy_until_opted_in(self, monkeypatch):
+        # 롤아웃 1단계: 설정 없이 배포하면 이전 버전도 읽을 수 있는 포맷만 씀
+        assert codec.PAYLOAD_CODEC == "legacy"
+        assert not codec.encode({"a": 1}).startswith(b"\x1e")
+
+        monkeypatch.setattr(codec, "PAYLOAD_CODEC", "auto")
+        assert codec.encode({"a": 1}).startswith(b"\x1ej1")
+
+    def test_unknown_header_or_codec_rejected(self):
+        with pytest.raises(codec.CodecError):
+            codec.decode(b"\x1ez9{}")
+        with pytest.raises(codec.CodecError):
+            codec.decode(b"\x1ej1{broken")
+        with pytest.raises(ValueError, match="Unknown payload codec"):
+            codec.encode({}, codec="pickle")
+
+    def test_text_paths_never_get_msgpack(self):
+        payload = codec.encode({"a": 1}, codec="msgpack", binary_safe=False)
+        assert payload.startswith(b"\x1ej1")
+
+    @pytest.mark.skipif(not codec.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_roundtrip_matches_json(self):
+        payload = codec.encode(SNAPSHOT, codec="msgpack", binary_safe=True)
+        assert payload.startswith(b"\x1em1")
+        assert codec.decode(payload) == codec.decode(codec.encode(SNAPSHOT, codec="json"))
+
+
+@pytest.fixture
+def new_format(monkeypatch):
+    """롤아웃 2단계 (PAYLOAD_CODEC=auto)"""
+    monkeypatch.setattr(codec, "PAYLOAD_CODEC", "auto")
+
+
+class TestRedisPaths:
+    async def test_cache_manager_roundtrip_and_legacy_read(self, new_format):
+        cache = CacheManager()
+        cache.redis_client = TextRedis()
+        cache.use_redis = True
+
+        assert await cache.set("dashboard_snapshot:42", SNAPSHOT, ttl=300)
+        assert cache.redis_client.data["dashboard_snapshot:42"].startswith(b"\x1ej1")
+        snapshot = await cache.get("dashboard_snapshot:42")
+        assert snapshot["profits"]["daily"] == -3.5
+        assert snapshot["updatedAt"] == "2026-01-02T03:04:05.678901"
+
+        # 이전 버전이 쓴 값
+        cache.redis_client.data["old"] = json.dumps({"a": 1})
+        cache.redis_client.data["count"] = "3"
+        assert await cache.get("old") == {"a": 1}
+        assert await cache.get("count") == 3
+
+    async def test_redis_client_set_get(self, new_format):
+        client = RedisClient(RedisConfig())
+        client._client = TextRedis()
+
+        assert await client.set("agent:market_regime:current:BTCUSDT", {"confidence": Decimal("0.8")})
+        assert await client.get("agent:market_regime:current:BTCUSDT") == {"confidence": 0.8}
+        raw = await client.get("agent:market_regime:current:BTCUSDT", deserialize=False)
+        assert raw.startswith("\x1ej1")
+
+    async def test_default_cache_write_is_readable_by_old_versions(self):
+        cache = CacheManager()
+        cache.redis_client = TextRedis()
+        cache.use_redis = True
+
+        assert await cache.set("dashboard_snapshot:42", SNAPSHOT, ttl=300)
+        # 이전 버전의 json.loads 경로
+        raw = cache.redis_client.data["dashboard_snapshot:42"]
+        assert json.loads(raw)["profits"]["daily"] == -3.5
+        assert (await cache.get("dashboard_snapshot:42"))["userId"] == 42
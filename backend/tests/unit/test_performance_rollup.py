@@ -0,0 +1,215 @@
+"""
+Daily performance rollup 유닛 테스트
+
+롤업 기반 집계가 원본 거래/자산 기록 전체를 순회한 결과와 일치하는지 검증.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import DailyPerformanceRollup, Equity, Trade, User
+from src.services import performance_rollup
+from src.services.performance_rollup import (
+    SHARED_DIRTY_KEY,
+    backfill_rollups,
+    drain_shared_dirty_days,
+    load_rollups,
+    load_trade_tail,
+    load_window_return,
+    publish_dirty_days,
+    refresh_dirty_rollups,
+    resolve_trade_details,
+    summarize_equity_risk,
+    summarize_trades,
+)
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_dirty():
+    performance_rollup._dirty_days.clear()
+    yield
+    performance_rollup._dirty_days.clear()
+
+
+class SetRedis:
+    """SADD / SPOP만 지원하는 Redis 대역 (프로세스 간 공유 집합)"""
+
+    def __init__(self):
+        self.sets = {}
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def spop(self, key, count=None):
+        members = self.sets.get(key, set())
+        popped = [members.pop() for _ in range(min(count or 1, len(members)))]
+        return popped
+
+
+def _reference_risk(values):
+    """analytics API의 기존 원본 순회 계산"""
+    peak = values[0]
+    max_drawdown = 0.0
+    for val in values:
+        peak = max(peak, val)
+        max_drawdown = min(max_drawdown, (val - peak) / peak * 100)
+
+    returns = [(values[i] - values[i - 1]) / values[i - 1] * 100 for i in range(1, len(values))]
+    mean = sum(returns) / len(returns)
+    volatility = (sum((r - mean) ** 2 for r in returns) / len(returns)) ** 0.5
+    return max_drawdown, volatility, mean / volatility
+
+
+async def _seed(session_factory):
+    now = datetime.utcnow()
+    pnls = [12.5, -3.0, 7.25, -8.0, 0.0, 20.0, -1.5]
+    equity_values = [1000, 1020, 990, 1050, 1010, 980, 1100, 1075, 1120, 1060]
+
+    async with session_factory() as session:
+        user = User(email="rollup@example.com", password_hash="x")
+        session.add(user)
+        await session.flush()
+
+        for i, pnl in enumerate(pnls):
+            session.add(Trade(
+                user_id=user.id, symbol="BTCUSDT" if i % 2 else "ETHUSDT", side="BUY",
+                qty=1, entry_price=Decimal("100"), exit_price=Decimal("101"),
+                pnl=Decimal(str(pnl)), pnl_percent=pnl / 10,
+                created_at=now - timedelta(days=i * 2, hours=1),
+            ))
+        # 미청산 거래는 집계 제외
+        session.add(Trade(user_id=user.id, symbol="BTCUSDT", side="BUY", qty=1,
+                          entry_price=Decimal("100"), created_at=now))
+        for i, value in enumerate(equity_values):
+            session.add(Equity(
+                user_id=user.id, value=Decimal(str(value)),
+                timestamp=now - timedelta(days=9) + timedelta(hours=i * 22),
+            ))
+        await session.commit()
+
+    return user.id, now, pnls, [float(v) for v in equity_values]
+
+
+class TestPerformanceRollup:
+    async def test_commit_marks_days_dirty(self, session_factory):
+        """거래/자산 커밋 시 해당 일자가 재집계 대상으로 등록"""
+        user_id, _, _, _ = await _seed(session_factory)
+
+        assert performance_rollup._dirty_days[user_id]
+
+        async with session_factory() as session:
+            refreshed = await refresh_dirty_rollups(session, user_id)
+            rollups = await load_rollups(session, user_id)
+
+        assert refreshed == len(rollups) > 0
+        assert user_id not in performance_rollup._dirty_days
+
+    async def test_summary_matches_raw_rows(self, session_factory):
+        """롤업 집계 == 원본 전체 순회 결과"""
+        user_id, now, pnls, values = await _seed(session_factory)
+
+        async with session_factory() as session:
+            await refresh_dirty_rollups(session, user_id)
+            rollups = await load_rollups(session, user_id)
+
+            summary = summarize_trades(rollups)
+            await resolve_trade_details(session, [summary])
+            risk = summarize_equity_risk(rollups)
+
+        assert summary["total_trades"] == len(pnls)
+        assert summary["winning_trades"] == sum(1 for p in pnls if p > 0)
+        assert summary["losing_trades"] == sum(1 for p in pnls if p < 0)
+        assert summary["total_pnl"] == pytest.approx(sum(pnls))
+        assert summary["best_trade"]["pnl"] == max(pnls)
+        assert summary["worst_trade"]["pnl"] == min(pnls)
+
+        max_drawdown, volatility, sharpe = _reference_risk(values)
+        assert risk["max_drawdown"] == pytest.approx(max_drawdown)
+        assert risk["daily_volatility"] == pytest.approx(volatility)
+        assert risk["sharpe_ratio"] == pytest.approx(sharpe)
+
+    async def test_window_uses_boundary_tail(self, session_factory):
+        """기간 집계는 경계일 원본 + 이후 롤업으로 계산"""
+        user_id, now, pnls, values = await _seed(session_factory)
+        cutoff = now - timedelta(days=7)
+
+        async with session_factory() as session:
+            await refresh_dirty_rollups(session, user_id)
+            rollups = await load_rollups(session, user_id, since_day=cutoff.date())
+            tail = await load_trade_tail(session, user_id, cutoff)
+            summary = summarize_trades(rollups, tail, cutoff)
+            total_return = await load_window_return(session, user_id, cutoff)
+
+        expected = [p for i, p in enumerate(pnls) if now - timedelta(days=i * 2, hours=1) >= cutoff]
+        assert summary["total_trades"] == len(expected)
+        assert summary["total_pnl"] == pytest.approx(sum(expected))
+
+        in_window = [
+            v for i, v in enumerate(values)
+            if now - timedelta(days=9) + timedelta(hours=i * 22) >= cutoff
+        ]
+        assert total_return == pytest.approx((in_window[-1] - in_window[0]) / in_window[0] * 100)
+
+    async def test_backfill_rebuilds_and_prunes(self, session_factory):
+        """백필은 원본으로 롤업을 재구성하고 원본이 없는 일자는 삭제"""
+        user_id, _, _, _ = await _seed(session_factory)
+        performance_rollup._dirty_days.clear()
+
+        async with session_factory() as session:
+            await backfill_rollups(session)
+            before = await load_rollups(session, user_id)
+
+            for equity in (await session.execute(select(Equity))).scalars().all():
+                await session.delete(equity)
+            for trade in (await session.execute(select(Trade))).scalars().all():
+                await session.delete(trade)
+            await session.commit()
+            performance_rollup._dirty_days.clear()
+
+            await backfill_rollups(session, user_ids=[user_id])
+            after = (await session.execute(select(DailyPerformanceRollup))).scalars().all()
+
+        assert before
+        assert after == []
+
+    async def test_worker_dirty_days_rolled_up_by_api_process(self, session_factory):
+        """봇 워커가 커밋한 변경 일자를 공유 집합으로 넘기면 API 프로세스가 재집계"""
+        shared = SetRedis()
+
+        # 워커 프로세스: 커밋 → 로컬 dirty → 공유 집합으로 이동
+        user_id, _, _, _ = await _seed(session_factory)
+        worker_days = set(performance_rollup._dirty_days[user_id])
+        published = await publish_dirty_days(shared)
+        assert published == len(worker_days)
+        assert not performance_rollup._dirty_days
+        assert len(shared.sets[SHARED_DIRTY_KEY]) == published
+
+        # API 프로세스: 공유 집합만 보고 재집계
+        assert await drain_shared_dirty_days(shared) == published
+        assert not shared.sets[SHARED_DIRTY_KEY]
+        async with session_factory() as session:
+            refreshed = await refresh_dirty_rollups(session)
+            rollups = await load_rollups(session, user_id)
+
+        assert refreshed == published
+        assert {r.day for r in rollups} == worker_days
+
+    async def test_publish_failure_keeps_days_local(self, session_factory):
+        class DownRedis:
+            async def sadd(self, key, *members):
+                raise ConnectionError("redis down")
+
+        user_id, _, _, _ = await _seed(session_factory)
+        days = set(performance_rollup._dirty_days[user_id])
+        with pytest.raises(ConnectionError):
+            await publish_dirty_days(DownRedis())
+        assert performance_rollup._dirty_days[user_id] == days
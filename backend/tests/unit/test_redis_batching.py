@@ -0,0 +1,135 @@
+"""
+Redis 파이프라인 / 쓰기 합치기 유닛 테스트
+
+왕복 수를 세는 최소한의 Redis 대역(FakeRedis)으로 핫 패스 RTT를 검증한다.
+"""
+import asyncio
+
+import pytest
+
+from src.agents.redis_client import RedisBatchWriter, get_batch_writer
+from src.services.ai_optimization.cost_tracker import CostTracker
+from src.services.ai_optimization.smart_sampling import SmartSamplingManager
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """문자열/해시/리스트 명령 몇 개만 지원, 파이프라인 execute 1회 = 왕복 1회"""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        return self._setex(key, ttl, value)
+
+    def _setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    def _set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _hincrby(self, key, field, amount):
+        bucket = self.data.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+        return bucket[field]
+
+    _hincrbyfloat = _hincrby
+
+    def _expire(self, key, seconds):
+        return key in self.data
+
+    def _lpush(self, key, value):
+        self.data.setdefault(key, []).insert(0, value)
+        return len(self.data[key])
+
+    def _ltrim(self, key, start, stop):
+        self.data[key] = self.data.get(key, [])[start:stop + 1]
+        return True
+
+
+class TestRedisBatchWriter:
+    async def test_enqueued_writes_coalesce_into_one_round_trip(self):
+        redis = FakeRedis()
+        tracker = CostTracker(redis_client=redis)
+
+        for _ in range(50):
+            await tracker.track_api_call("deepseek-v3", "market_regime", 1_000_000, 0)
+        assert redis.round_trips == 0  # 핫 패스는 버퍼에만 기록
+
+        writer = get_batch_writer(redis)
+        await asyncio.sleep(writer.flush_interval * 4)
+
+        assert redis.round_trips == 1
+        daily = next(v for k, v in redis.data.items() if k.startswith("ai:cost:daily:"))
+        assert daily["calls"] == 50
+        assert daily["cost"] == pytest.approx(50 * 0.27)
+        assert writer.get_stats()["coalesced_ops"] == 50
+        assert writer.get_stats()["buffered"] == 0
+
+    async def test_execute_groups_commands_and_close_flushes(self):
+        redis = FakeRedis()
+        writer = RedisBatchWriter(redis, flush_interval_ms=10_000, max_batch=1000)
+
+        results = await writer.execute(lambda pipe: pipe.lpush("l", "a").lpush("l", "b").ltrim("l", 0, 0))
+        assert results == [1, 2, True]
+        assert redis.data["l"] == ["b"]
+        assert redis.round_trips == 1
+
+        writer.enqueue(lambda pipe: pipe.setex("k", 60, "v"))
+        await writer.close()
+        assert redis.data["k"] == "v"
+        assert writer.stats == {
+            "round_trips": 2, "commands": 4, "flushes": 1, "coalesced_ops": 1, "errors": 0,
+        }
+
+
+class TestSmartSamplingRoundTrips:
+    async def test_periodic_check_is_one_round_trip_then_zero(self):
+        redis = FakeRedis()
+        sampling = SmartSamplingManager(redis_client=redis)
+
+        assert (await sampling.should_sample("portfolio_optimizer", {}))[0] is True
+        assert redis.round_trips == 1
+
+        for _ in range(5):
+            assert (await sampling.should_sample("portfolio_optimizer", {}))[0] is False
+        assert redis.round_trips == 1
+        assert sampling.stats["redis_round_trips"] == 1
+
+        # 다른 프로세스가 이미 샘플링한 경우도 왕복 1회로 대기 판정
+        other = SmartSamplingManager(redis_client=redis)
+        assert (await other.should_sample("portfolio_optimizer", {}))[0] is False
+        assert redis.round_trips == 2
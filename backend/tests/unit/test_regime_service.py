@@ -0,0 +1,99 @@
+"""
+다중 심볼 시장 환경 서비스 유닛 테스트
+"""
+import time
+
+import pytest
+
+from src.agents.market_regime.models import RegimeType
+from src.agents.market_regime.regime_service import RegimeService, compute_regime
+from src.services.candle_aggregator import CandleAggregator
+
+INTERVAL = 300
+
+
+def trending_candles(count=120, start_price=100.0, step=0.8, end_ts=None):
+    end_ts = end_ts or (int(time.time()) // INTERVAL * INTERVAL - INTERVAL)
+    candles = []
+    for i in range(count):
+        price = start_price + i * step
+        candles.append({
+            "timestamp": (end_ts - (count - 1 - i) * INTERVAL) * 1000,
+            "open": price - step / 2,
+            "high": price + abs(step),
+            "low": price - abs(step) * 0.2,
+            "close": price,
+            "volume": 1000.0,
+        })
+    return candles
+
+
+def ranging_candles(count=120, end_ts=None):
+    candles = trending_candles(count, step=0.0, end_ts=end_ts)
+    for i, candle in enumerate(candles):
+        offset = 0.5 if i % 2 else -0.5
+        candle.update(open=100 - offset, close=100 + offset, high=101.0, low=99.0)
+    candles[-1]["close"] = 100.0  # 밴드 중앙
+    return candles
+
+
+class FakeClient:
+    def __init__(self, candles):
+        self.candles = candles
+        self.calls = 0
+
+    async def get_historical_candles(self, symbol, interval, limit):
+        self.calls += 1
+        return self.candles
+
+
+class TestRegimeService:
+    async def test_regimes_are_tracked_per_symbol(self):
+        service = RegimeService(aggregator=CandleAggregator())
+        await service.track("ETH/USDT", seed_candles=trending_candles())
+        await service.track("BTCUSDT", seed_candles=ranging_candles())
+
+        assert service.get_regime("ETHUSDT").regime_type == RegimeType.TRENDING_UP
+        assert service.get_regime("BTC/USDT:USDT").regime_type == RegimeType.RANGING
+        assert service.get_regime("SOLUSDT") is None
+
+    async def test_warm_up_fetches_once_per_symbol(self):
+        service = RegimeService(aggregator=CandleAggregator())
+        client = FakeClient(trending_candles())
+
+        await service.track("ETHUSDT", client=client)
+        await service.track("ETHUSDT", client=client)
+        for _ in range(100):
+            service.get_regime("ETHUSDT")
+
+        assert client.calls == 1
+        assert service.get_regime("ETHUSDT") is not None
+
+    async def test_ticks_close_candles_and_recompute(self):
+        aggregator = CandleAggregator()
+        service = RegimeService(aggregator=aggregator)
+        last_closed = int(time.time()) // INTERVAL * INTERVAL - INTERVAL
+        await service.track("ETHUSDT", seed_candles=trending_candles(end_ts=last_closed))
+        recomputes = service.stats["recomputes"]
+
+        bucket = last_closed + INTERVAL
+        # 첫 (부분) 캔들은 마감 알림 없음
+        aggregator.on_tick("ETHUSDT", 200.0, 5000.0, bucket + 10)
+        aggregator.on_tick("ETHUSDT", 201.0, 5010.0, bucket + INTERVAL + 1)
+        assert service.stats["recomputes"] == recomputes
+        aggregator.on_tick("ETHUSDT", 203.0, 5030.0, bucket + INTERVAL + 100)
+        aggregator.on_tick("ETHUSDT", 204.0, 5040.0, bucket + 2 * INTERVAL + 1)
+
+        assert service.stats["candles_closed"] == 1
+        assert service.stats["recomputes"] == recomputes + 1
+        closed = aggregator.get_series("ETHUSDT", "5m").view(2)[0]
+        assert (closed["open"], closed["high"], closed["close"]) == (201.0, 203.0, 203.0)
+        assert closed["volume"] == pytest.approx(30.0)
+
+        # 추적하지 않는 심볼은 무시
+        aggregator.on_tick("DOGEUSDT", 1.0, 1.0, bucket)
+        assert service.get_regime("DOGEUSDT") is None
+
+    def test_insufficient_candles_is_unknown(self):
+        regime = compute_regime("ETHUSDT", trending_candles(count=10))
+        assert regime.regime_type == RegimeType.UNKNOWN
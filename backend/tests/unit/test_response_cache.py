@@ -0,0 +1,141 @@
+"""
+ResponseCacheManager 유닛 테스트
+
+L1(프로세스 내 LRU) 캐시와 동시 호출 병합(singleflight) 동작 검증.
+"""
+import asyncio
+import time
+
+import pytest
+
+from src.services.ai_optimization.response_cache import ResponseCacheManager
+
+
+QUERY = {"prompt": "analyze", "context": {"symbol": "ETHUSDT", "timeframe": "5m"}}
+
+
+class TestL1Cache:
+    """L1 캐시 테스트"""
+
+    async def test_hit_without_redis(self):
+        """Redis 없이도 L1에서 응답 재사용"""
+        cache = ResponseCacheManager()
+
+        assert await cache.get_cached_response("market_analysis", QUERY) is None
+
+        await cache.set_cached_response("market_analysis", QUERY, {"response": "BULL"})
+        cached = await cache.get_cached_response("market_analysis", QUERY)
+
+        assert cached == {"response": "BULL"}
+        assert cache.stats["l1_hits"] == 1
+        assert cache.stats["cache_misses"] == 1
+
+    async def test_entry_expires_with_type_ttl(self):
+        """응답 타입별 TTL 경과 시 L1 엔트리 만료"""
+        cache = ResponseCacheManager()
+        await cache.set_cached_response("signal_validation", QUERY, {"response": "HOLD"})
+
+        key = cache.get_cache_key("signal_validation", QUERY)
+        expires_at, _ = cache._l1[key]
+        assert expires_at - time.monotonic() == pytest.approx(
+            cache.cache_ttl["signal_validation"], abs=1
+        )
+
+        cache._l1[key] = (time.monotonic() - 1, {"response": "HOLD"})
+        assert await cache.get_cached_response("signal_validation", QUERY) is None
+        assert key not in cache._l1
+
+    async def test_lru_eviction(self):
+        """최대 엔트리 초과 시 가장 오래된 엔트리 제거"""
+        cache = ResponseCacheManager(l1_max_entries=2)
+
+        for i in range(3):
+            await cache.set_cached_response("general", {"i": i}, {"response": i})
+
+        assert await cache.get_cached_response("general", {"i": 0}) is None
+        assert await cache.get_cached_response("general", {"i": 2}) == {"response": 2}
+
+    async def test_invalidate_clears_l1(self):
+        """캐시 무효화 시 L1도 함께 제거"""
+        cache = ResponseCacheManager()
+        await cache.set_cached_response("market_analysis", QUERY, {"response": "BULL"})
+
+        await cache.invalidate_cache("market_analysis")
+
+        assert await cache.get_cached_response("market_analysis", QUERY) is None
+
+
+class TestCoalesce:
+    """동시 호출 병합 테스트"""
+
+    async def test_concurrent_calls_share_one_fetch(self):
+        """동일 키의 동시 호출은 업스트림을 한 번만 호출"""
+        cache = ResponseCacheManager()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"response": "BULL"}
+
+        results = await asyncio.gather(*[cache.coalesce("k", fetch) for _ in range(10)])
+
+        assert calls == 1
+        assert all(result == {"response": "BULL"} for result, _ in results)
+        assert [coalesced for _, coalesced in results].count(False) == 1
+        assert cache.stats["coalesced_calls"] == 9
+        assert cache._inflight == {}
+
+    async def test_error_propagates_to_waiters(self):
+        """업스트림 실패 시 대기자 모두에게 예외 전달 후 재시도 가능"""
+        cache = ResponseCacheManager()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *[cache.coalesce("k", failing) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache._inflight == {}
+
+        async def ok():
+            return {"response": "OK"}
+
+        assert await cache.coalesce("k", ok) == ({"response": "OK"}, False)
+
+
+class TestCoalescedErrors:
+    """병합된 호출의 업스트림 실패 전달"""
+
+    async def test_followers_get_leader_error_not_cache_hit(self, monkeypatch):
+        """리더 실패 시 대기자도 error를 그대로 받고 cache_hit으로 표시되지 않음"""
+        from src.services.ai_optimization import integrated_ai_service as module
+
+        monkeypatch.setattr(module.settings, "ai_provider", "gemini")
+        monkeypatch.setattr(module.settings, "gemini_api_key", "test-key-1234")
+        service = module.IntegratedAIService()
+        calls = 0
+
+        async def failing_gemini(**kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        monkeypatch.setattr(service, "_call_gemini_api", failing_gemini)
+
+        results = await asyncio.gather(*[
+            service.call_ai("market_regime", "analyze", QUERY["context"], enable_sampling=False)
+            for _ in range(3)
+        ])
+
+        assert calls == 1
+        assert all(r["error"] == "upstream down" for r in results)
+        assert not any(r["cache_hit"] for r in results)
+        assert [r.get("coalesced", False) for r in results].count(True) == 2
+        # 실패 결과는 캐시되지 않음
+        assert await service.response_cache.get_cached_response("general", QUERY) is None
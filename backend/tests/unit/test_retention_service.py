@@ -0,0 +1,96 @@
+"""
+시계열 보존 정책 유닛 테스트
+
+SQLite 폴백(범위 DELETE) 경로와 파티션 월 계산 검증.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotLog, Equity, TradingSignal, User
+from src.database.partitioning import (
+    add_months,
+    month_range,
+    partition_month,
+    partition_name,
+)
+from src.services.retention_service import apply_retention, compact_equity
+
+NOW = datetime(2026, 6, 15, 12, 0, 0)
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _user(session) -> int:
+    user = User(email="retention@example.com", password_hash="x")
+    session.add(user)
+    await session.flush()
+    return user.id
+
+
+class TestPartitionMonths:
+    def test_month_math_and_names(self):
+        assert add_months(datetime(2025, 11, 20), 3) == datetime(2026, 2, 1)
+        assert add_months(datetime(2026, 1, 5), -1) == datetime(2025, 12, 1)
+        assert month_range(datetime(2025, 12, 31), datetime(2026, 2, 1)) == [
+            datetime(2025, 12, 1), datetime(2026, 1, 1), datetime(2026, 2, 1),
+        ]
+
+        name = partition_name("bot_logs", datetime(2026, 3, 1))
+        assert name == "bot_logs_p202603"
+        assert partition_month("bot_logs", name) == datetime(2026, 3, 1)
+        assert partition_month("bot_logs", "bot_logs_default") is None
+
+
+class TestRetention:
+    async def test_old_logs_and_signals_are_deleted(self, session_factory):
+        async with session_factory() as session:
+            user_id = await _user(session)
+            for days in (200, 120, 10):
+                created = NOW - timedelta(days=days)
+                session.add(BotLog(user_id=user_id, event_type="bot_start", message="x", created_at=created))
+                session.add(TradingSignal(
+                    user_id=user_id, symbol="ETHUSDT", signal_type="BUY", timeframe="5m", timestamp=created,
+                ))
+            await session.commit()
+
+            removed = await apply_retention(session, NOW)
+
+            # 로그 90일, 시그널 180일 보존
+            assert removed == {"bot_logs": 2, "trading_signals": 1}
+            assert (await session.execute(select(func.count(BotLog.id)))).scalar() == 1
+            assert (await session.execute(select(func.count(TradingSignal.id)))).scalar() == 2
+
+    async def test_equity_is_compacted_to_last_point_per_hour(self, session_factory):
+        async with session_factory() as session:
+            user_id = await _user(session)
+            start = datetime(2026, 5, 1, 9, 0, 0)
+            # 3시간 x 시간당 6개 (10분 간격) + 구간 밖 최근 기록 6개
+            for i in range(18):
+                session.add(Equity(user_id=user_id, value=Decimal(1000 + i), timestamp=start + timedelta(minutes=10 * i)))
+            for i in range(6):
+                session.add(Equity(user_id=user_id, value=Decimal(2000 + i), timestamp=NOW + timedelta(minutes=i)))
+            await session.commit()
+
+            removed = await compact_equity(session, before=datetime(2026, 5, 2), since=datetime(2026, 4, 30))
+            assert removed == 15
+
+            rows = (await session.execute(
+                select(Equity.timestamp, Equity.value).order_by(Equity.timestamp)
+            )).all()
+            kept = [(ts, float(value)) for ts, value in rows if ts < datetime(2026, 5, 2)]
+            assert kept == [
+                (datetime(2026, 5, 1, 9, 50), 1005.0),
+                (datetime(2026, 5, 1, 10, 50), 1011.0),
+                (datetime(2026, 5, 1, 11, 50), 1017.0),
+            ]
+            assert len(rows) == 9
+
+            # 다시 실행해도 변화 없음
+            assert await compact_equity(session, before=datetime(2026, 5, 2), since=datetime(2026, 4, 30)) == 0
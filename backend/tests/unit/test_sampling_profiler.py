@@ -0,0 +1,197 @@
+"""
+샘플링 프로파일러 유닛 테스트
+
+collapsed stack 수집, 단일 세션 제한, asyncio 태스크 덤프(wakeup 추적), 관리자 엔드포인트,
+분산 모드 봇 워커 원격 프로파일 확인.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import admin_diagnostics
+from src.utils.auth_dependencies import require_admin
+from src.workers.manager import BotManager
+from src.workers.scheduler import BotCommandRouter, BotScheduler, InMemoryLeaseBackend
+from src.utils.sampling_profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    dump_tasks,
+    run_profile,
+)
+
+
+def busy_hot_path(seconds: float):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+class TestSamplingProfiler:
+    def test_collapsed_stacks_contain_hot_function(self):
+        profiler = SamplingProfiler(interval=0.002)
+        profiler.start()
+        busy_hot_path(0.2)
+        result = profiler.stop()
+
+        assert result.samples > 5
+        hot = sum(count for stack, count in result.stacks.items() if "busy_hot_path" in stack)
+        assert hot >= result.samples // 2
+        line = next(line for line in result.collapsed().splitlines() if "busy_hot_path" in line)
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("MainThread;") and int(count) > 0
+        assert any("busy_hot_path" in f["frame"] for f in result.top_functions(5))
+
+    def test_unique_stack_cap(self):
+        profiler = SamplingProfiler(interval=0.001, max_stacks=1)
+        profiler.start()
+        busy_hot_path(0.05)
+        result = profiler.stop()
+        assert len(result.stacks) <= 2  # 상한 1 + [truncated]
+
+    async def test_one_session_at_a_time(self):
+        first = asyncio.create_task(run_profile(0.2))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ProfilerBusyError):
+            await run_profile(0.1)
+        result = await first
+        assert result.samples > 0
+
+        # 끝난 뒤에는 다시 실행 가능
+        assert (await run_profile(0.05)).duration > 0
+
+
+class TestTaskDump:
+    async def test_wakeups_and_current_coroutine(self):
+        stuck = asyncio.Event()
+
+        async def waits_forever():
+            await stuck.wait()
+
+        async def ticks():
+            while True:
+                await asyncio.sleep(0.01)
+
+        blocked = asyncio.create_task(waits_forever(), name="blocked")
+        ticker = asyncio.create_task(ticks(), name="ticker")
+        await asyncio.sleep(0)
+        try:
+            result = await run_profile(0.2)
+        finally:
+            blocked.cancel()
+            ticker.cancel()
+
+        assert result.wakeup_source == "call_soon"
+        tasks = {t["name"]: t for t in result.tasks}
+        assert tasks["blocked"]["since_wakeup_in_session"] is None
+        assert tasks["blocked"]["coroutine"].endswith("waits_forever")
+        assert tasks["blocked"]["current"] == "Event.wait"
+        assert tasks["blocked"]["awaiting"] == "Future"
+        assert tasks["ticker"]["since_wakeup_in_session"] < 0.1
+        assert result.tasks[0]["since_wakeup_in_session"] is None  # 안 깬 태스크가 위로
+
+    async def test_dump_without_session(self):
+        tasks = dump_tasks()
+        assert any(t["state"] == "running" for t in tasks)
+        # 세션 밖에서는 wakeup을 추적하지 않으므로 항상 None인 필드를 내보내지 않음
+        assert all("since_wakeup_in_session" not in t for t in tasks)
+
+
+class TestProfileEndpoint:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(admin_diagnostics.router)
+        app.dependency_overrides[require_admin] = lambda: 1
+        return TestClient(app)
+
+    def test_profile_json_and_collapsed(self, client):
+        response = client.post("/admin/system/diagnostics/profile", params={"seconds": 0.5, "interval_ms": 5})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["samples"] > 0 and body["collapsed"]
+        assert {"top_functions", "tasks", "overhead"} <= body.keys()
+
+        response = client.post(
+            "/admin/system/diagnostics/profile", params={"seconds": 0.5, "format": "collapsed"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+    def test_rejects_unbounded_duration(self, client):
+        response = client.post("/admin/system/diagnostics/profile", params={"seconds": 3600})
+        assert response.status_code == 422
+
+    def test_requires_admin(self):
+        app = FastAPI()
+        app.include_router(admin_diagnostics.router)
+        response = TestClient(app).get("/admin/system/diagnostics/tasks")
+        assert response.status_code in (401, 403)
+
+
+class IdleRunner:
+    lease_guard = None
+
+    def is_instance_running(self, bot_instance_id):
+        return False
+
+
+class TestWorkerProfile:
+    """API 프로세스 → 명령 리스트 → 봇 워커 스케줄러가 실행 → 결과 키"""
+
+    @pytest.fixture
+    async def cluster(self):
+        backend = InMemoryLeaseBackend()
+
+        async def no_bots():
+            return {}
+
+        scheduler = BotScheduler(
+            IdleRunner(), None, backend, worker_id="worker-1", lease_ttl=1.0, interval=0.05,
+            desired_bots=no_bots,
+        )
+        scheduler.start()
+        app = FastAPI()
+        app.include_router(admin_diagnostics.router)
+        app.dependency_overrides[require_admin] = lambda: 1
+        app.state.bot_manager = BotManager(asyncio.Queue(), None, router=BotCommandRouter(backend))
+        await asyncio.sleep(0.1)  # 첫 하트비트
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+        await scheduler.stop()
+
+    async def test_profile_runs_in_worker(self, cluster):
+        workers = (await cluster.get("/admin/system/diagnostics/workers")).json()
+        assert workers == {"workers": [{"worker_id": "worker-1", "bots": 0}]}
+
+        response = await cluster.post(
+            "/admin/system/diagnostics/profile",
+            params={"seconds": 0.5, "interval_ms": 5, "worker_id": "worker-1"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["worker_id"] == "worker-1" and body["samples"] > 0
+        # 워커 쪽 세션이 수집한 태스크에 스케줄러 루프가 보임
+        assert any(t["coroutine"] == "BotScheduler.run" for t in body["tasks"])
+
+        response = await cluster.get(
+            "/admin/system/diagnostics/tasks", params={"worker_id": "worker-1", "limit": 50}
+        )
+        assert response.status_code == 200 and response.json()["count"] > 0
+
+    async def test_unknown_worker_and_local_mode(self, cluster):
+        response = await cluster.get("/admin/system/diagnostics/tasks", params={"worker_id": "nope"})
+        assert response.status_code == 404
+
+        app = FastAPI()
+        app.include_router(admin_diagnostics.router)
+        app.dependency_overrides[require_admin] = lambda: 1
+        response = TestClient(app).get("/admin/system/diagnostics/tasks", params={"worker_id": "worker-1"})
+        assert response.status_code == 400
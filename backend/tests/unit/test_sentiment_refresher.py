@@ -0,0 +1,87 @@
+"""
+감성 백그라운드 갱신 유닛 테스트
+
+가짜 에이전트로 갱신/게시, 공유 캐시 재사용, 전략의 스냅샷 조회만 검증.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.agents.sentiment_analyzer.models import MarketSentiment, SentimentStrength
+from src.services import sentiment_refresher
+from src.services.sentiment_refresher import SentimentSnapshot, get_sentiment_snapshot, refresh_all
+from src.strategies.eth_ai_fusion_strategy import ETHAIFusionStrategy
+from src.utils.cache_manager import cache_manager
+
+
+def make_sentiment(symbol="ETH", score=0.4):
+    return MarketSentiment(
+        symbol=symbol,
+        score=score,
+        strength=SentimentStrength.MODERATE_POSITIVE,
+        confidence=0.8,
+        news_count=5,
+        positive_count=4,
+        negative_count=1,
+        neutral_count=0,
+        news_items=[],
+    )
+
+
+class FakeAgent:
+    def __init__(self):
+        self.calls = []
+
+    async def analyze_market_sentiment(self, symbol, hours=24, use_cache=True):
+        self.calls.append(symbol)
+        if symbol == "FAIL":
+            raise RuntimeError("news api down")
+        return make_sentiment(symbol)
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    fake = FakeAgent()
+    monkeypatch.setattr(sentiment_refresher, "_agent", fake)
+    monkeypatch.setattr(sentiment_refresher, "_snapshots", {})
+    monkeypatch.setattr(sentiment_refresher, "_symbols", set())
+    monkeypatch.setattr(sentiment_refresher, "_last_attempt", {})
+    return fake
+
+
+class TestRefresh:
+    async def test_refresh_publishes_and_keeps_failures_isolated(self, agent):
+        await cache_manager.delete("sentiment:snapshot:SOL")
+        await cache_manager.delete("sentiment:snapshot:FAIL")
+
+        snapshots = await refresh_all(["SOL/USDT", "FAIL"])
+
+        assert [s.symbol for s in snapshots] == ["SOL"]
+        assert get_sentiment_snapshot("SOLUSDT").sentiment.score == 0.4
+        assert get_sentiment_snapshot("FAIL") is None
+        assert sorted(agent.calls) == ["FAIL", "SOL"]
+
+    async def test_fresh_shared_snapshot_is_adopted(self, agent):
+        shared = SentimentSnapshot("AVAX", make_sentiment("AVAX", -0.2), datetime.utcnow())
+        await cache_manager.set("sentiment:snapshot:AVAX", shared.to_dict(), ttl=60)
+
+        await refresh_all(["AVAX"])
+
+        assert agent.calls == []
+        assert get_sentiment_snapshot("AVAX").sentiment.score == pytest.approx(-0.2)
+
+
+class TestStrategyReadsSnapshot:
+    def test_strategy_uses_fresh_snapshot_and_ignores_stale(self, agent):
+        strategy = ETHAIFusionStrategy({"enable_ml": False, "sentiment_max_age_seconds": 600})
+        assert "ETH" in sentiment_refresher._symbols
+
+        sentiment_refresher._publish(SentimentSnapshot("ETH", make_sentiment(), datetime.utcnow()))
+        signal = strategy._get_sentiment_signal()
+        assert signal["score"] == 0.4
+        assert signal["should_block"] is False
+
+        stale = datetime.utcnow() - timedelta(hours=1)
+        sentiment_refresher._snapshots["ETH"] = SentimentSnapshot("ETH", make_sentiment(), stale)
+        assert strategy._get_sentiment_signal() is None
+        assert agent.calls == []
@@ -0,0 +1,109 @@
+"""
+Dashboard snapshot worker 유닛 테스트
+
+SQL 집계 결과가 기존 Python 계산(calculate_trade_stats/calculate_period_profits)과
+일치하는지, 변경이 없는 사용자는 재집계하지 않는지 검증.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import Position, Trade, User
+from src.services import snapshot_worker
+from src.services.snapshot_worker import (
+    calculate_period_profits,
+    calculate_trade_stats,
+    get_user_snapshot,
+    run_snapshot_pass,
+)
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_states():
+    snapshot_worker._user_states.clear()
+    yield
+    snapshot_worker._user_states.clear()
+
+
+async def _seed(session_factory):
+    now = datetime.utcnow()
+    async with session_factory() as session:
+        user = User(email="snap@example.com", password_hash="x")
+        session.add(user)
+        await session.flush()
+
+        trades = [
+            Trade(user_id=user.id, symbol="BTCUSDT", side="BUY", qty=1,
+                  entry_price=Decimal("100"), exit_price=Decimal("110"),
+                  pnl=Decimal("10.5"), created_at=now - timedelta(hours=2)),
+            Trade(user_id=user.id, symbol="BTCUSDT", side="SELL", qty=1,
+                  entry_price=Decimal("100"), exit_price=Decimal("104"),
+                  pnl=Decimal("-4.25"), created_at=now - timedelta(days=3)),
+            Trade(user_id=user.id, symbol="ETHUSDT", side="BUY", qty=1,
+                  entry_price=Decimal("100"), exit_price=Decimal("120"),
+                  pnl=Decimal("20"), created_at=now - timedelta(days=20)),
+            Trade(user_id=user.id, symbol="ETHUSDT", side="BUY", qty=1,
+                  entry_price=Decimal("100"), exit_price=None, pnl=None,
+                  created_at=now),
+        ]
+        session.add_all(trades)
+        session.add(Position(user_id=user.id, symbol="BTCUSDT", entry_price=Decimal("100"),
+                             size=1, side="long", pnl=Decimal("3.5")))
+        await session.commit()
+        return user.id, trades
+
+
+class TestSnapshotPass:
+    async def test_matches_python_reference(self, session_factory):
+        """SQL 집계 결과가 기존 계산 함수와 동일"""
+        user_id, trades = await _seed(session_factory)
+
+        summary = await run_snapshot_pass(session_factory=session_factory)
+        snapshot = await get_user_snapshot(user_id)
+
+        assert summary["users"] == 1
+        assert summary["recomputed"] == 1
+        assert snapshot["stats"] == calculate_trade_stats(trades)
+        assert snapshot["profits"] == calculate_period_profits(trades)
+        assert snapshot["positions"] == {"total": 1, "totalPnl": 3.5}
+        assert snapshot["bots"] == {"total": 0, "running": 0, "stopped": 0}
+
+    async def test_unchanged_user_is_not_recomputed(self, session_factory):
+        """거래 변경이 없으면 재집계 생략, 청산 시 재집계"""
+        user_id, _ = await _seed(session_factory)
+
+        await run_snapshot_pass(session_factory=session_factory)
+        second = await run_snapshot_pass(session_factory=session_factory)
+        assert second["recomputed"] == 0
+        assert second["succeeded"] == 1
+
+        async with session_factory() as session:
+            open_trade = await session.get(Trade, 4)
+            open_trade.exit_price = Decimal("90")
+            open_trade.pnl = Decimal("-10")
+            await session.commit()
+
+        third = await run_snapshot_pass(session_factory=session_factory)
+        snapshot = await get_user_snapshot(user_id)
+        assert third["recomputed"] == 1
+        assert snapshot["stats"]["totalTrades"] == 4
+        assert snapshot["stats"]["losingTrades"] == 2
+
+    async def test_expired_period_window_triggers_recompute(self, session_factory):
+        """기간 윈도우에서 거래가 빠져나가는 시각이 지나면 재집계"""
+        user_id, _ = await _seed(session_factory)
+        await run_snapshot_pass(session_factory=session_factory)
+
+        state = snapshot_worker._user_states[user_id]
+        assert state.profits_valid_until is not None
+        state.profits_valid_until = datetime.utcnow() - timedelta(seconds=1)
+
+        summary = await run_snapshot_pass(session_factory=session_factory)
+        assert summary["recomputed"] == 1
@@ -0,0 +1,93 @@
+"""
+거래 내역 API 유닛 테스트
+
+커서 페이지네이션과 CSV/NDJSON 스트리밍 내보내기 검증.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.api import trades as trades_api
+from src.database.models import Trade, User
+
+
+class TestTradeHistoryAPI:
+    @pytest.fixture
+    async def auth_user(self, async_client: AsyncClient, async_engine):
+        payload = {
+            "email": "tradehist01",
+            "password": "Test1234!@#",
+            "password_confirm": "Test1234!@#",
+            "name": "Trade History User",
+            "phone": "01012345678",
+        }
+        response = await async_client.post("/auth/register", json=payload)
+        assert response.status_code == 200
+        token = response.cookies.get("access_token")
+        if not token:
+            pytest.skip("Token not available in cookies")
+
+        factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+        base = datetime(2025, 1, 1, 12, 0, 0)
+        async with factory() as session:
+            user_id = (await session.execute(
+                select(User.id).where(User.email == payload["email"])
+            )).scalar_one()
+            # 두 건씩 같은 created_at -> id로 동률 해소
+            for i in range(7):
+                session.add(Trade(
+                    user_id=user_id, symbol="ETHUSDT" if i % 2 else "BTCUSDT", side="BUY",
+                    qty=0.1, entry_price=Decimal("100") + i,
+                    exit_price=Decimal("110") if i < 4 else None,
+                    created_at=base + timedelta(minutes=i // 2),
+                ))
+            await session.commit()
+        return {"Authorization": f"Bearer {token}"}, factory
+
+    async def test_history_pages_cover_all_trades_once(self, async_client, auth_user):
+        headers, _ = auth_user
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = await async_client.get("/trades/history", params=params, headers=headers)
+            assert response.status_code == 200
+            body = response.json()
+            seen.extend(trade["id"] for trade in body["trades"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+        response = await async_client.get(
+            "/trades/recent-trades", params={"limit": 2}, headers=headers
+        )
+        assert [t["id"] for t in response.json()["trades"]] == [7, 6]
+        assert response.json()["next_cursor"] is not None
+
+    async def test_export_streams_csv_and_ndjson(self, async_client, auth_user, monkeypatch):
+        headers, factory = auth_user
+        monkeypatch.setattr(trades_api, "AsyncSessionLocal", factory)
+
+        response = await async_client.get(
+            "/trades/export", params={"format": "csv", "symbol": "ethusdt"}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["id"] for row in rows] == ["6", "4", "2"]
+        assert rows[0]["exit_price"] == ""
+
+        response = await async_client.get(
+            "/trades/export", params={"format": "ndjson"}, headers=headers
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 7
+        assert lines[-1]["exit_price"] == 110.0
@@ -0,0 +1,131 @@
+"""
+Write-behind 배치 저장 유닛 테스트
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotInstance, Equity, TradingSignal, User
+from src.services import performance_rollup
+from src.services.write_behind import MAX_ROW_ATTEMPTS, WriteBehindWriter
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_dirty():
+    performance_rollup._dirty_days.clear()
+    yield
+    performance_rollup._dirty_days.clear()
+
+
+async def _create_user(session_factory) -> int:
+    async with session_factory() as session:
+        user = User(email="writer@example.com", password_hash="x")
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+async def _count(session_factory, model) -> int:
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestWriteBehindWriter:
+    async def test_rows_are_batched_into_one_flush(self, session_factory):
+        user_id = await _create_user(session_factory)
+        writer = WriteBehindWriter(session_factory=session_factory, batch_size=4)
+        now = datetime.utcnow()
+
+        for i in range(10):
+            assert writer.enqueue(Equity, {"user_id": user_id, "value": Decimal(1000 + i), "timestamp": now})
+        for i in range(3):
+            writer.enqueue(
+                TradingSignal,
+                {"user_id": user_id, "symbol": "ETHUSDT", "signal_type": "BUY", "timeframe": "5m",
+                 "price": 2000.0 + i, "timestamp": now},
+            )
+        assert writer.get_status()["pending_by_table"] == {"equities": 10, "trading_signals": 3}
+
+        assert await writer.flush() == 13
+        assert writer.stats["flushes"] == 1
+        assert writer.get_status()["pending"] == 0
+        assert await _count(session_factory, Equity) == 10
+        assert await _count(session_factory, TradingSignal) == 3
+        # 자산 기록은 일간 롤업 갱신 대상으로 표시
+        assert now.date() in performance_rollup._dirty_days[user_id]
+
+    async def test_counters_coalesce_into_single_update(self, session_factory):
+        user_id = await _create_user(session_factory)
+        async with session_factory() as session:
+            bot = BotInstance(user_id=user_id, name="bot", allocation_percent=10)
+            session.add(bot)
+            await session.commit()
+            bot_id = bot.id
+
+        writer = WriteBehindWriter(session_factory=session_factory)
+        last = datetime(2026, 1, 1, 12, 0)
+        for pnl in (10.0, -4.0, 6.5):
+            writer.increment(
+                BotInstance, bot_id,
+                {"total_trades": 1, "winning_trades": 1 if pnl > 0 else 0, "total_pnl": pnl},
+                {"last_trade_at": last},
+            )
+        assert writer.get_status()["pending_counters"] == 1
+
+        assert await writer.flush() == 1
+        async with session_factory() as session:
+            bot = await session.get(BotInstance, bot_id)
+            assert (bot.total_trades, bot.winning_trades) == (3, 2)
+            assert float(bot.total_pnl) == pytest.approx(12.5)
+            assert bot.last_trade_at == last
+
+    async def test_buffer_bound_drops_and_close_flushes(self, session_factory):
+        user_id = await _create_user(session_factory)
+        writer = WriteBehindWriter(session_factory=session_factory, max_buffer=5, flush_interval=60)
+        writer.start()
+        now = datetime.utcnow()
+
+        accepted = [
+            writer.enqueue(Equity, {"user_id": user_id, "value": Decimal(i), "timestamp": now})
+            for i in range(8)
+        ]
+        assert accepted.count(True) == 5
+        assert writer.get_status()["dropped"] == 3
+
+        await writer.close()
+        assert await _count(session_factory, Equity) == 5
+        assert writer.get_status()["running"] is False
+
+    async def test_poison_row_is_isolated_and_dropped(self, session_factory):
+        user_id = await _create_user(session_factory)
+        writer = WriteBehindWriter(session_factory=session_factory)
+        now = datetime.utcnow()
+
+        for i in range(9):
+            # value NOT NULL 위반 row 하나를 정상 row 사이에 섞음
+            value = None if i == 4 else Decimal(i)
+            writer.enqueue(Equity, {"user_id": user_id, "value": value, "timestamp": now})
+
+        # 정상 row 8개는 첫 flush에서 저장, 문제 row만 대기열에 남음
+        assert await writer.flush() == 8
+        assert await _count(session_factory, Equity) == 8
+        assert writer.get_status()["pending"] == 1
+
+        # 이후 들어온 기록은 문제 row에 막히지 않음
+        writer.enqueue(Equity, {"user_id": user_id, "value": Decimal(100), "timestamp": now})
+        assert await writer.flush() == 1
+        for _ in range(MAX_ROW_ATTEMPTS):
+            await writer.flush()
+
+        status = writer.get_status()
+        assert status["pending"] == 0
+        assert status["poisoned"] == 1
+        assert await _count(session_factory, Equity) == 9